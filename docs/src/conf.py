@@ -83,6 +83,10 @@ intersphinx_mapping: Final[dict[str, tuple[str, str | None]]] = {
         None,
     ),
     "pytest": ("https://docs.pytest.org/en/latest/", None),
+    "pytest-benchmark": (
+        "https://pytest-benchmark.readthedocs.io/en/latest/",
+        None,
+    ),
     "pytest-cov": ("https://pytest-cov.readthedocs.io/en/latest/", None),
     "pytest-django": ("https://pytest-django.readthedocs.io/en/latest/", None),
     "pytest-httpserver": ("https://pytest-httpserver.readthedocs.io/en/latest/", None),
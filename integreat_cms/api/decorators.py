@@ -6,24 +6,33 @@ from __future__ import annotations
 import json
 import logging
 import random
-import re
-import threading
 from functools import wraps
 from typing import TYPE_CHECKING
-from urllib import error, parse, request
 
 from django.conf import settings
-from django.http import Http404, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 
 from ..cms.constants import feedback_ratings
 from ..cms.models import Language, Region
+from ..core.utils.version_cache import is_version_cache_shared
+from ..matomo_api.matomo_tracking_dispatcher import get_matomo_tracking_dispatcher
+from .utils.content_version_utils import get_content_validators
+from .utils.response_store_utils import (
+    get_accepted_encodings,
+    get_stored_response,
+    IDENTITY,
+    store_response,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from datetime import datetime
     from typing import Any
 
-    from django.http import HttpRequest, HttpResponseRedirect
+    from django.http import HttpRequest, HttpResponseRedirect, StreamingHttpResponse
 
 logger = logging.getLogger(__name__)
 
@@ -122,8 +131,9 @@ def json_response(function: Callable) -> Callable:
 def matomo_tracking(func: Callable) -> Callable:
     """
     This decorator is supposed to be applied to API content endpoints. It will track
-    the request in Matomo. The request to the Matomo API is executed asynchronously in its
-    own thread to not block the Integreat CMS API request.
+    the request in Matomo. The request to the Matomo API is queued and sent asynchronously by
+    the :class:`~integreat_cms.matomo_api.matomo_tracking_dispatcher.MatomoTrackingDispatcher`
+    to not block the Integreat CMS API request.
 
     Only the URL and the User Agent will be sent to Matomo.
 
@@ -131,27 +141,6 @@ def matomo_tracking(func: Callable) -> Callable:
     :return: The decorated feedback view function
     """
 
-    def matomo_request(host: str, data: dict) -> None:
-        """
-        Wrap HTTP request to Matomo in threaded function.
-
-        :param host: Hostname + protocol of Matomo installation
-        :param data: Data to send to Matomo API
-        """
-        data_str = parse.urlencode(data)
-        url = f"{host}/matomo.php?{data_str}"
-        req = request.Request(url)
-        try:
-            with request.urlopen(req):
-                pass
-        except error.HTTPError as e:
-            logger.error(
-                "Matomo Tracking API request to %r failed with: %s",
-                # Mask auth token in log
-                re.sub(r"&token_auth=[^&]+", "&token_auth=********", url),
-                e,
-            )
-
     @wraps(func)
     def wrap(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         r"""
@@ -177,10 +166,164 @@ def matomo_tracking(func: Callable) -> Callable:
             "ua": request.META.get("HTTP_USER_AGENT", "unknown user agent"),
             "cip": f"{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}",
         }
-
-        t = threading.Thread(target=matomo_request, args=(settings.MATOMO_URL, data))
-        t.daemon = True
-        t.start()
+        get_matomo_tracking_dispatcher().track(data)
         return func(request, *args, **kwargs)
 
     return wrap
+
+
+def conditional_response(endpoint: str, time_dependent: bool = False) -> Callable:
+    """
+    This decorator can be applied to API content endpoints to support conditional requests.
+    It adds the ``ETag`` and ``Last-Modified`` headers to the response and returns ``304 Not Modified`` without
+    executing the view function if the ``If-None-Match`` or ``If-Modified-Since`` headers of the request match.
+    The validators are derived from the content version stamps of the requested region and endpoint (see
+    :mod:`~integreat_cms.api.utils.content_version_utils`), so no database query is required.
+
+    :param endpoint: The endpoint whose content version should be used
+                     (see :data:`~integreat_cms.api.utils.content_version_utils.ENDPOINTS`)
+    :param time_dependent: Whether the response of the endpoint also depends on the current date
+    :return: The decorator
+    """
+
+    def etag_func(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+        r"""
+        Get the ETag of the current request
+
+        :param request: Django request
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        :return: The ETag
+        """
+        return get_content_validators(
+            request, endpoint, kwargs.get("language_slug"), time_dependent
+        )[0]
+
+    def last_modified_func(request: HttpRequest, *args: Any, **kwargs: Any) -> datetime:
+        r"""
+        Get the date of the last modification of the content of the current request
+
+        :param request: Django request
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        :return: The date of the last modification
+        """
+        return get_content_validators(
+            request, endpoint, kwargs.get("language_slug"), time_dependent
+        )[1]
+
+    return condition(etag_func=etag_func, last_modified_func=last_modified_func)
+
+
+def materialized_response(endpoint: str, time_dependent: bool = False) -> Callable:
+    """
+    This decorator can be applied to API content endpoints to store their serialized responses (see
+    :mod:`~integreat_cms.api.utils.response_store_utils`).
+    Subsequent requests for the same content version, language and query parameters are served from the store
+    without executing the view function. If the client accepts it, a pre-compressed variant of the stored response is
+    served. The store is bypassed if the content versions are not shared between processes (see
+    :func:`~integreat_cms.core.utils.version_cache.is_version_cache_shared`), because the stored responses of a
+    process would not be invalidated by changes made in other processes.
+
+    :param endpoint: The endpoint whose content version should be used
+                     (see :data:`~integreat_cms.api.utils.content_version_utils.ENDPOINTS`)
+    :param time_dependent: Whether the response of the endpoint also depends on the current date
+    :return: The decorator
+    """
+
+    def set_encoded_content(
+        response: HttpResponse, content: bytes, encoding: str, etag: str
+    ) -> None:
+        """
+        Set the content of a response in the given encoding
+
+        :param response: The response
+        :param content: The encoded content
+        :param encoding: The content encoding
+        :param etag: The ETag of the response
+        """
+        response.content = content
+        response["Content-Length"] = str(len(content))
+        if encoding != IDENTITY:
+            response["Content-Encoding"] = encoding
+            # The encoded content is not byte-for-byte identical to other variants, so the ETag is weak
+            response["ETag"] = f"W/{etag}"
+
+    def store_streaming_content(
+        region_id: int | None,
+        etag: str,
+        response: StreamingHttpResponse,
+        streaming_content: Iterator[bytes],
+    ) -> Iterator[bytes]:
+        """
+        Pass through the content of a streaming response and store it once it has been sent completely.
+        Content which was cut off by an error during the streaming is not stored.
+
+        :param region_id: The id of the region
+        :param etag: The ETag of the response
+        :param response: The streaming response
+        :param streaming_content: The content of the streaming response
+        :return: An iterator over the unaltered content
+        """
+        chunks = []
+        for chunk in streaming_content:
+            chunks.append(chunk)
+            yield chunk
+        if getattr(response, "complete", True):
+            store_response(region_id, etag, b"".join(chunks))
+
+    def decorator(function: Callable) -> Callable:
+        """
+        The actual decorator
+
+        :param function: The view function whose responses should be stored
+        :return: The decorated function
+        """
+
+        @wraps(function)
+        def wrap(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            r"""
+            The inner function for this decorator.
+
+            :param request: Django request
+            :param \*args: The supplied arguments
+            :param \**kwargs: The supplied kwargs
+            :return: The stored response or the response of the given function
+            """
+            if request.method != "GET" or not is_version_cache_shared():
+                return function(request, *args, **kwargs)
+            region = getattr(request, "region", None)
+            region_id = region.id if region else None
+            etag, _ = get_content_validators(
+                request, endpoint, kwargs.get("language_slug"), time_dependent
+            )
+            encodings = get_accepted_encodings(
+                request.META.get("HTTP_ACCEPT_ENCODING", "")
+            )
+            if stored := get_stored_response(region_id, etag, encodings):
+                logger.debug("Serving stored response %s (%s)", etag, stored[1])
+                # The content is already serialized, so JsonResponse cannot be used
+                # pylint: disable=http-response-with-content-type-json
+                response = HttpResponse(content_type="application/json")
+                set_encoded_content(response, *stored, etag)
+            else:
+                response = function(request, *args, **kwargs)
+                if response.status_code != 200 or response.has_header("Link"):
+                    # Paginated responses are not stored because their link to the next page is not part of the content
+                    return response
+                if response.streaming:
+                    response.streaming_content = store_streaming_content(
+                        region_id, etag, response, response.streaming_content
+                    )
+                elif variants := store_response(region_id, etag, response.content):
+                    encoding = next(
+                        (encoding for encoding in encodings if encoding in variants),
+                        IDENTITY,
+                    )
+                    set_encoded_content(response, variants[encoding], encoding, etag)
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+
+        return wrap
+
+    return decorator
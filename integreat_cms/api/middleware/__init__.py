@@ -1 +1,3 @@
 from .json_debug_toolbar_middleware import JsonDebugToolbarMiddleware
+from .metrics_middleware import MetricsMiddleware
+from .server_timing_middleware import ServerTimingMiddleware
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 
 from django.http import HttpResponse
 
+from ..utils.response_store_utils import decompress, IDENTITY
+
 if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any
@@ -41,7 +43,11 @@ class JsonDebugToolbarMiddleware:
         """
         response = self.get_response(request)
         if "debug" in request.GET and response["Content-Type"] == "application/json":
-            content = json.dumps(json.loads(response.content), sort_keys=True, indent=2)
+            # Stored responses might be compressed (see :mod:`~integreat_cms.api.utils.response_store_utils`)
+            content = decompress(
+                response.content, response.get("Content-Encoding", IDENTITY)
+            )
+            content = json.dumps(json.loads(content), sort_keys=True, indent=2)
             response = HttpResponse(
                 f"<!DOCTYPE html><html><body><pre>{content}</pre></body></html>"
             )
@@ -0,0 +1,71 @@
+"""
+This module contains a middleware which collects the metrics of API requests.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cacheops.signals import cache_read
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from ...core.utils.metrics import (
+    count_cacheops_read,
+    REQUEST_DURATION,
+    REQUEST_QUERIES,
+    RESPONSE_SIZE,
+)
+from .server_timing_middleware import count_cache_read, RequestTiming
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from asgiref.sync import AsyncToSync
+    from django.http import HttpRequest
+
+
+# pylint: disable=too-few-public-methods
+class MetricsMiddleware:
+    """
+    This middleware records the duration, the response size and the number of SQL queries of all API requests per url
+    name (see :mod:`~integreat_cms.core.utils.metrics`). It is only active if
+    :attr:`~integreat_cms.core.settings.METRICS_ENABLED` is set.
+    """
+
+    def __init__(self, get_response: Callable | AsyncToSync) -> None:
+        """
+        Initialize the middleware for the current view
+
+        :param get_response: A callable to get the response for the current request
+        :raises ~django.core.exceptions.MiddlewareNotUsed: When the metrics are disabled
+        """
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        cache_read.connect(count_cache_read, dispatch_uid="server_timing")
+        cache_read.connect(count_cacheops_read, dispatch_uid="metrics")
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """
+        Call the middleware for the current request
+
+        :param request: Django request
+        :return: The unmodified response
+        """
+        with RequestTiming().measure() as timing:
+            response = self.get_response(request)
+        resolver_match = request.resolver_match
+        if (
+            resolver_match
+            and resolver_match.app_name == "api"
+            and resolver_match.url_name != "metrics"
+        ):
+            view = resolver_match.view_name
+            REQUEST_DURATION.labels(view, request.method, response.status_code).observe(
+                timing.total_time
+            )
+            REQUEST_QUERIES.labels(view).observe(timing.queries)
+            if not response.streaming:
+                RESPONSE_SIZE.labels(view).observe(len(response.content))
+        return response
@@ -0,0 +1,206 @@
+"""
+This module contains a middleware which measures how much work is done to answer a request.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager, ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from cacheops.signals import cache_read
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any
+
+    from asgiref.sync import AsyncToSync
+    from django.http import HttpRequest
+
+logger = logging.getLogger(__name__)
+
+#: The measurements which are currently in progress (there can be several when multiple middlewares measure a request)
+current_request_timings: ContextVar[tuple[RequestTiming, ...]] = ContextVar(
+    "current_request_timings", default=()
+)
+
+
+@dataclass
+class RequestTiming:
+    """
+    The measurements of a single request
+    """
+
+    #: The number of executed SQL queries
+    queries: int = 0
+    #: The time spent waiting for the database in seconds
+    db_time: float = 0.0
+    #: The number of cacheops reads which were answered from the cache
+    cache_hits: int = 0
+    #: The number of cacheops reads which had to query the database
+    cache_misses: int = 0
+    #: The total time of the request in seconds
+    total_time: float = 0.0
+
+    @property
+    def python_time(self) -> float:
+        """
+        The time spent outside of the database
+
+        :return: The python time in seconds
+        """
+        return max(self.total_time - self.db_time, 0.0)
+
+    def execute_wrapper(
+        self,
+        execute: Callable,
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        """
+        Count and time a single SQL query (see :doc:`django:topics/db/instrumentation`)
+
+        :param execute: The function which executes the query
+        :param sql: The SQL query
+        :param params: The parameters of the query
+        :param many: Whether the query is executed with ``executemany()``
+        :param context: The context of the query
+        :return: The result of the query
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+    @contextmanager
+    def measure(self) -> Iterator[RequestTiming]:
+        """
+        Measure the SQL queries, the cacheops reads and the total time of the enclosed code
+
+        :return: A context manager which yields the measurements
+        """
+        token = current_request_timings.set(current_request_timings.get() + (self,))
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(self.execute_wrapper)
+                    )
+                yield self
+        finally:
+            self.total_time = time.perf_counter() - start
+            current_request_timings.reset(token)
+
+    def to_header(self) -> str:
+        """
+        Format the measurements as value of the ``Server-Timing`` header
+
+        :return: The header value
+        """
+        return ", ".join(
+            [
+                f'sql;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+                f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+                f"python;dur={self.python_time * 1000:.2f}",
+                f"total;dur={self.total_time * 1000:.2f}",
+            ]
+        )
+
+    def to_dict(self) -> dict[str, int | float]:
+        """
+        Get the measurements as structured data for log records
+
+        :return: The measurements with durations in milliseconds
+        """
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db_time * 1000, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "python_ms": round(self.python_time * 1000, 2),
+            "total_ms": round(self.total_time * 1000, 2),
+        }
+
+
+# pylint: disable=unused-argument
+def count_cache_read(
+    sender: Any, func: Callable | None, hit: bool, **kwargs: Any
+) -> None:
+    r"""
+    Count a cacheops read for the measurements in progress
+
+    :param sender: The model of the cached queryset
+    :param func: The cached function (if not a queryset)
+    :param hit: Whether the result was found in the cache
+    :param \**kwargs: The supplied keyword arguments
+    """
+    for timing in current_request_timings.get():
+        if hit:
+            timing.cache_hits += 1
+        else:
+            timing.cache_misses += 1
+
+
+# pylint: disable=too-few-public-methods
+class ServerTimingMiddleware:
+    """
+    This middleware counts the SQL queries, the database time, the cacheops hits and misses and the python time of each
+    request. The measurements are added to the response as ``Server-Timing`` header and logged, which makes N+1 query
+    regressions of single endpoints visible. It is only active if :attr:`~integreat_cms.core.settings.SERVER_TIMING` is
+    enabled. The content of streaming responses is generated after the middleware returned and is not measured.
+    """
+
+    def __init__(self, get_response: Callable | AsyncToSync) -> None:
+        """
+        Initialize the middleware for the current view
+
+        :param get_response: A callable to get the response for the current request
+        :raises ~django.core.exceptions.MiddlewareNotUsed: When the measurements are disabled
+        """
+        if not settings.SERVER_TIMING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        cache_read.connect(count_cache_read, dispatch_uid="server_timing")
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """
+        Call the middleware for the current request
+
+        :param request: Django request
+        :return: The response with the ``Server-Timing`` header
+        """
+        with RequestTiming().measure() as timing:
+            response = self.get_response(request)
+        response["Server-Timing"] = timing.to_header()
+        view_name = request.resolver_match.view_name if request.resolver_match else None
+        logger.info(
+            "%s %s (%s): %d queries in %.2fms, %d cache hits, %d cache misses, %.2fms total",
+            request.method,
+            request.path,
+            view_name,
+            timing.queries,
+            timing.db_time * 1000,
+            timing.cache_hits,
+            timing.cache_misses,
+            timing.total_time * 1000,
+            extra={
+                "server_timing": {
+                    "method": request.method,
+                    "path": request.path,
+                    "view": view_name,
+                    "status": response.status_code,
+                    **timing.to_dict(),
+                }
+            },
+        )
+        return response
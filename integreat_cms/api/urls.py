@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from django.urls import include, path, re_path
 
+from .v3.changes import changes
 from .v3.events import events
 from .v3.feedback import (
     event_feedback,
@@ -25,7 +26,9 @@ from .v3.imprint import imprint
 from .v3.languages import languages
 from .v3.location_categories import location_categories
 from .v3.locations import locations
+from .v3.metrics import metrics
 from .v3.offers import offers
+from .v3.offline_bundle import offline_bundle
 from .v3.pages import (
     children,
     pages,
@@ -33,7 +36,7 @@ from .v3.pages import (
     push_page_translation_content,
     single_page,
 )
-from .v3.pdf_export import pdf_export
+from .v3.pdf_export import pdf_export, pdf_job
 from .v3.push_notifications import sent_push_notifications
 from .v3.regions import region_by_slug, regions
 
@@ -50,11 +53,14 @@ content_api_urlpatterns: list[URLPattern] = [
     path("locations/", locations, name="locations"),
     path("location-categories/", location_categories, name="location_categories"),
     path("events/", events, name="events"),
+    path("changes/", changes, name="changes"),
     path("page/", single_page, name="single_page"),
     path("post/", single_page, name="single_page"),
     path("children/", children, name="children"),
     path("parents/", parents, name="parents"),
     path("pdf/", pdf_export, name="pdf_export"),
+    path("pdf/jobs/<slug:job_id>/", pdf_job, name="pdf_job"),
+    path("bundle/", offline_bundle, name="offline_bundle"),
     path(
         "fcm/",
         sent_push_notifications,
@@ -130,6 +136,7 @@ region_api_urlpatterns: list[URLPattern] = [
 
 #: The url patterns of this module (see :doc:`django:topics/http/urls`)
 urlpatterns: list[URLPattern] = [
+    path("metrics", metrics, name="metrics"),
     path("api/regions/", include(region_api_urlpatterns)),
     path("wp-json/extensions/v3/sites/", include(region_api_urlpatterns)),
     path(
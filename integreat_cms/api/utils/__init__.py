@@ -0,0 +1,3 @@
+"""
+This package contains utilities which are used by the API endpoints.
+"""
@@ -0,0 +1,139 @@
+"""
+This module contains helper functions to measure the size of the content which clients download for a language of a
+region (see :class:`~integreat_cms.cms.models.regions.app_size_measurement.AppSizeMeasurement`).
+
+The size is calculated from the offline bundle of the language (see
+:mod:`~integreat_cms.api.utils.offline_bundle_utils`), which contains the payloads of all content endpoints and all
+referenced media files and thumbnails. Since the bundles are only rebuilt when the content changes, repeated
+measurements of unchanged content are cheap.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import zipfile
+from typing import TYPE_CHECKING
+
+from ...cms.models import AppSizeMeasurement
+from .offline_bundle_utils import (
+    build_offline_bundle,
+    BUNDLE_ENDPOINTS,
+    bundle_storage,
+    get_referenced_media,
+    MANIFEST_NAME,
+    MEDIA_DIR,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+    from ...cms.models import Language, Region
+
+logger = logging.getLogger(__name__)
+
+#: The content type of media files
+MEDIA: Final = "media"
+#: The content type of the thumbnails of media files
+THUMBNAILS: Final = "thumbnails"
+
+#: All content types whose size is measured
+CONTENT_TYPES: Final[list[str]] = [*BUNDLE_ENDPOINTS, MEDIA, THUMBNAILS]
+
+#: The number of pages and media files which are stored as largest items of a measurement
+LARGEST_ITEMS_COUNT: Final[int] = 10
+
+
+def is_thumbnail(path: str) -> bool:
+    """
+    Check whether a media file is a thumbnail (see :func:`~integreat_cms.cms.models.media.media_file.upload_path_thumbnail`)
+
+    :param path: The path of the media file
+    :return: Whether the file is a thumbnail
+    """
+    return os.path.splitext(path)[0].endswith("_thumbnail")
+
+
+def get_largest_pages(
+    pages: list[dict[str, Any]], media_sizes: dict[str, int]
+) -> list[dict[str, Any]]:
+    """
+    Get the pages whose payload and referenced media files are the largest
+
+    :param pages: The payload of the pages endpoint
+    :param media_sizes: The sizes of the media files in the bundle by their paths in the archive
+    :return: The largest pages
+    """
+    items = []
+    for page in pages:
+        payload = json.dumps(page).encode()
+        media_size = sum(
+            media_sizes.get(f"{MEDIA_DIR}/{relative_path}", 0)
+            for relative_path in get_referenced_media([payload])
+        )
+        items.append(
+            {
+                "type": "page",
+                "title": page["title"],
+                "url": page["url"],
+                "size": len(payload),
+                "media_size": media_size,
+            }
+        )
+    items.sort(key=lambda item: item["size"] + item["media_size"], reverse=True)
+    return items[:LARGEST_ITEMS_COUNT]
+
+
+def get_largest_media(media: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Get the largest media files
+
+    :param media: The media entries of the manifest of the bundle
+    :return: The largest media files
+    """
+    return [
+        {
+            "type": "media",
+            "title": os.path.basename(entry["path"]),
+            "url": entry["url"],
+            "size": entry["size"],
+        }
+        for entry in sorted(media, key=lambda entry: entry["size"], reverse=True)[
+            :LARGEST_ITEMS_COUNT
+        ]
+    ]
+
+
+def measure_app_size(region: Region, language: Language) -> AppSizeMeasurement:
+    """
+    Measure and store the size of the content which clients download for a language of a region
+
+    :param region: The region
+    :param language: The language
+    :return: The new measurement
+    """
+    name, _ = build_offline_bundle(region, language.slug)
+    sizes = dict.fromkeys(CONTENT_TYPES, 0)
+    with zipfile.ZipFile(bundle_storage.path(name)) as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+        for endpoint, entry in manifest["endpoints"].items():
+            # The size of the serialized payload, independent of the compression of the archive
+            sizes[endpoint] = archive.getinfo(entry["path"]).file_size
+        pages = (
+            json.loads(archive.read(manifest["endpoints"]["pages"]["path"]))
+            if "pages" in manifest["endpoints"]
+            else []
+        )
+    for entry in manifest["media"]:
+        sizes[THUMBNAILS if is_thumbnail(entry["path"]) else MEDIA] += entry["size"]
+    measurement = AppSizeMeasurement.objects.create(
+        region=region,
+        language=language,
+        sizes=sizes,
+        largest_items=get_largest_pages(
+            pages, {entry["path"]: entry["size"] for entry in manifest["media"]}
+        )
+        + get_largest_media(manifest["media"]),
+    )
+    logger.info("Measured %r: %r", measurement, sizes)
+    return measurement
@@ -0,0 +1,184 @@
+"""
+This module contains helper functions to keep track of the version of the content which is delivered by the API.
+
+Each combination of region and API endpoint has a version stamp in the cache which is replaced whenever the underlying
+content changes (see :mod:`~integreat_cms.core.signals.content_version_signals`). Additionally, there is a global stamp
+which is replaced whenever content shared by all regions changes. These stamps can be used to derive cheap validators
+for conditional requests without querying the database. They are kept in the version cache which is shared between all
+processes (see :mod:`~integreat_cms.core.utils.version_cache`), so a change made in one process is noticed by all
+others.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+from datetime import datetime, time, timezone
+from typing import TYPE_CHECKING
+
+from django.utils import timezone as django_timezone
+
+from ...core.utils.version_cache import get_version_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Final
+
+    from django.http import HttpRequest
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of the cache keys of all content version stamps
+CONTENT_VERSION_PREFIX: Final[str] = "api_content_version"
+
+#: The pages endpoints (``pages``, ``page``, ``children`` and ``parents``)
+PAGES: Final = "pages"
+#: The events endpoint
+EVENTS: Final = "events"
+#: The locations endpoint
+LOCATIONS: Final = "locations"
+#: The location categories endpoint
+LOCATION_CATEGORIES: Final = "location_categories"
+#: The imprint endpoint
+IMPRINT: Final = "imprint"
+#: The offers endpoint
+OFFERS: Final = "offers"
+#: The languages endpoint
+LANGUAGES: Final = "languages"
+#: The regions endpoints
+REGIONS: Final = "regions"
+#: The push notifications endpoint
+PUSH_NOTIFICATIONS: Final = "push_notifications"
+
+#: All endpoints which are versioned
+ENDPOINTS: Final[list[str]] = [
+    PAGES,
+    EVENTS,
+    LOCATIONS,
+    LOCATION_CATEGORIES,
+    IMPRINT,
+    OFFERS,
+    LANGUAGES,
+    REGIONS,
+    PUSH_NOTIFICATIONS,
+]
+
+
+def get_cache_key(region_id: int | None, endpoint: str | None) -> str:
+    """
+    Get the cache key of the version stamp of an endpoint in a region
+
+    :param region_id: The id of the region (or ``None`` for endpoints which are not region specific)
+    :param endpoint: The endpoint (or ``None`` for the global version stamp)
+    :return: The cache key
+    """
+    return f"{CONTENT_VERSION_PREFIX}-{region_id or 'all'}-{endpoint or 'global'}"
+
+
+def create_version_stamp() -> tuple[str, float]:
+    """
+    Create a new unique version stamp
+
+    :return: A tuple of a random version identifier and the current timestamp
+    """
+    return uuid.uuid4().hex, django_timezone.now().timestamp()
+
+
+def get_content_version(region_id: int | None, endpoint: str) -> tuple[str, datetime]:
+    """
+    Get the current content version of an endpoint in a region.
+    If the version stamps are missing in the cache (e.g. after a restart of the cache backend), new ones are created.
+    This function does not perform any database queries.
+
+    :param region_id: The id of the region (or ``None`` for endpoints which are not region specific)
+    :param endpoint: The endpoint
+    :return: The combined version identifier and the date of the last content modification
+    """
+    cache = get_version_cache()
+    keys = [get_cache_key(None, None), get_cache_key(region_id, endpoint)]
+    stamps = cache.get_many(keys)
+    if missing_keys := [key for key in keys if key not in stamps]:
+        new_stamps = {key: create_version_stamp() for key in missing_keys}
+        for key, stamp in new_stamps.items():
+            # Only add the stamp if no other process created one in the meantime
+            cache.add(key, stamp, timeout=None)
+        stamps.update(cache.get_many(missing_keys))
+        # Fall back to the new stamps if the cache is not available
+        for key, stamp in new_stamps.items():
+            stamps.setdefault(key, stamp)
+    version = ":".join(stamps[key][0] for key in keys)
+    last_modified = datetime.fromtimestamp(
+        max(stamps[key][1] for key in keys), tz=timezone.utc
+    )
+    return version, last_modified
+
+
+def invalidate_content_versions(
+    region_ids: Iterable[int | None], endpoints: Iterable[str]
+) -> None:
+    """
+    Replace the version stamps of the given endpoints in the given regions
+
+    :param region_ids: The ids of the regions whose content changed
+    :param endpoints: The endpoints whose content changed
+    """
+    endpoints = list(endpoints)
+    new_stamps = {
+        get_cache_key(region_id, endpoint): create_version_stamp()
+        for region_id in set(region_ids)
+        for endpoint in endpoints
+    }
+    logger.debug("Invalidating content versions %r", list(new_stamps))
+    get_version_cache().set_many(new_stamps, timeout=None)
+
+
+def invalidate_all_content_versions() -> None:
+    """
+    Replace the global version stamp, which invalidates the content version of all endpoints in all regions
+    """
+    logger.debug("Invalidating all content versions")
+    get_version_cache().set(
+        get_cache_key(None, None), create_version_stamp(), timeout=None
+    )
+
+
+def get_content_validators(
+    request: HttpRequest,
+    endpoint: str,
+    language_slug: str | None = None,
+    time_dependent: bool = False,
+) -> tuple[str, datetime]:
+    """
+    Get the validators of the content which is delivered for the given request.
+    The ETag is unique for each combination of content version, language and query parameters, so it can also be used
+    to identify the response. The validators are cached on the request object.
+
+    :param request: Django request
+    :param endpoint: The requested endpoint
+    :param language_slug: The slug of the requested language
+    :param time_dependent: Whether the response of the endpoint also depends on the current date
+    :return: The quoted ETag and the date of the last modification
+    """
+    if not hasattr(request, "content_validators"):
+        region = getattr(request, "region", None)
+        version, last_modified = get_content_version(
+            region.id if region else None, endpoint
+        )
+        variant = [
+            endpoint,
+            version,
+            language_slug or "",
+            # Make sure different query parameters result in different validators
+            "&".join(sorted(f"{k}={v}" for k, v in request.GET.items())),
+        ]
+        if time_dependent:
+            today = django_timezone.now().date()
+            variant.append(str(today))
+            # The content changes at least once per day
+            last_modified = max(
+                last_modified,
+                datetime.combine(today, time.min, tzinfo=timezone.utc),
+            )
+        etag = hashlib.sha256(bytes("|".join(variant), "utf-8")).hexdigest()[:32]
+        request.content_validators = f'"{etag}"', last_modified
+    return request.content_validators
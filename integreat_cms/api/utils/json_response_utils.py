@@ -0,0 +1,152 @@
+"""
+This module contains helpers to deliver large lists as JSON.
+
+By default, the lists are serialized at once with :class:`~django.http.JsonResponse`.
+If :attr:`~integreat_cms.core.settings.API_STREAMING_RESPONSES` is enabled, the items are encoded one at a time with
+:class:`StreamingJsonResponse` and the underlying querysets are iterated in chunks, which reduces the peak memory usage
+and the time until the first byte is sent. Both modes produce the same output.
+"""
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+    from django.db.models.query import QuerySet
+
+    from ...cms.models.abstract_base_model import AbstractBaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    A streaming HTTP response which encodes a list of items one at a time.
+    The output is identical to a :class:`~django.http.JsonResponse` of the same list with ``safe=False``.
+
+    The first chunk is encoded before the response is returned, so errors which occur before (e.g. in the initial
+    database queries) still result in an error response. Since the status code cannot be changed once the streaming
+    started, later errors are raised again to abort the transfer, so clients see a failed download instead of an
+    incomplete list. In this case, :attr:`complete` is ``False``.
+    """
+
+    #: Whether all items have been encoded
+    complete: bool = True
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        encoder: type[json.JSONEncoder] = DjangoJSONEncoder,
+        json_dumps_params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        r"""
+        Initialize the streaming JSON response
+
+        :param items: The items of the list
+        :param encoder: The JSON encoder class
+        :param json_dumps_params: The keyword arguments which are passed to :func:`json.dumps`
+        :param \**kwargs: The supplied keyword arguments which are passed to :class:`~django.http.StreamingHttpResponse`
+        """
+        kwargs.setdefault("content_type", "application/json")
+        chunks = self.encode(items, encoder, json_dumps_params or {})
+        # Encode the first chunk right away to raise errors before the streaming started
+        super().__init__(itertools.chain([next(chunks)], chunks), **kwargs)
+
+    def encode(
+        self,
+        items: Iterable[Any],
+        encoder: type[json.JSONEncoder],
+        json_dumps_params: dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Encode the items and yield the output in chunks of approximately
+        :attr:`~integreat_cms.core.settings.API_STREAMING_BUFFER_SIZE` characters
+
+        :param items: The items of the list
+        :param encoder: The JSON encoder class
+        :param json_dumps_params: The keyword arguments which are passed to :func:`json.dumps`
+        :raises Exception: When an error occurs while the items are encoded
+        :return: An iterator over the encoded chunks
+        """
+        json_encoder = encoder(**json_dumps_params)
+        separator = json_encoder.item_separator
+        buffer = ["["]
+        buffer_size = 1
+        streaming = False
+        try:
+            for index, item in enumerate(items):
+                chunk = json_encoder.encode(item)
+                if index:
+                    buffer.append(separator)
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+                if buffer_size >= settings.API_STREAMING_BUFFER_SIZE:
+                    yield "".join(buffer)
+                    streaming = True
+                    buffer = []
+                    buffer_size = 0
+        except Exception:
+            self.complete = False
+            if streaming:
+                logger.exception(
+                    "Streaming JSON response failed, aborting the transfer"
+                )
+            raise
+        buffer.append("]")
+        yield "".join(buffer)
+
+
+def iterate_in_chunks(queryset: QuerySet) -> Iterable[AbstractBaseModel]:
+    """
+    Iterate over a queryset in chunks of :attr:`~integreat_cms.core.settings.API_STREAMING_CHUNK_SIZE` objects if
+    streaming responses are enabled. The prefetched relations are only loaded for the objects of the current chunk.
+    If streaming responses are disabled, the queryset is returned unaltered.
+
+    :param queryset: The queryset
+    :return: An iterable over the objects of the queryset in the original order
+    """
+    if not settings.API_STREAMING_RESPONSES:
+        return queryset
+    return _iterate_in_chunks(queryset)
+
+
+def _iterate_in_chunks(queryset: QuerySet) -> Iterator[AbstractBaseModel]:
+    """
+    Iterate over a queryset in chunks (see :func:`iterate_in_chunks`)
+
+    :param queryset: The queryset
+    :return: An iterator over the objects of the queryset in the original order
+    """
+    # Remove duplicates while retaining the order
+    ids = list(dict.fromkeys(queryset.values_list("id", flat=True)))
+    chunk_size = settings.API_STREAMING_CHUNK_SIZE
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start : start + chunk_size]
+        objects = {obj.id: obj for obj in queryset.filter(id__in=chunk)}
+        for object_id in chunk:
+            if obj := objects.get(object_id):
+                yield obj
+
+
+def list_response(items: Iterable[Any]) -> JsonResponse | StreamingJsonResponse:
+    """
+    Create a JSON response of a list which is streamed if
+    :attr:`~integreat_cms.core.settings.API_STREAMING_RESPONSES` is enabled
+
+    :param items: The items of the list
+    :return: The JSON response
+    """
+    if settings.API_STREAMING_RESPONSES:
+        return StreamingJsonResponse(items)
+    # Turn off Safe-Mode to allow serializing arrays
+    return JsonResponse(list(items), safe=False)
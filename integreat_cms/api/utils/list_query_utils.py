@@ -0,0 +1,138 @@
+"""
+This module contains helpers for the optional query parameters of the API list endpoints.
+
+* ``fields``: A comma-separated list of the fields which are returned for each item. The values of all other fields are
+  not computed at all, which allows clients to e.g. load the titles of all items first and their content lazily.
+* ``limit`` and ``after``: Keyset pagination. The items are returned in a stable order and each item has a cursor which
+  is derived from its sort key. If more items are available, the response contains a ``Link`` header with the url of
+  the next page (``rel="next"``), which is the same request with the cursor of the last item as ``after`` parameter.
+"""
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+from .json_response_utils import list_response
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Collection, Iterable, TypeVar
+
+    from django.http import HttpRequest, JsonResponse, QueryDict
+
+    from .json_response_utils import StreamingJsonResponse
+
+    T = TypeVar("T")
+
+
+def parse_fields(params: QueryDict) -> frozenset[str] | None:
+    """
+    Parse the ``fields`` query parameter. Unknown field names are ignored.
+
+    :param params: The query parameters
+    :return: The names of the requested fields or ``None`` if all fields are requested
+    """
+    if "fields" not in params:
+        return None
+    return frozenset(
+        field for field in map(str.strip, params["fields"].split(",")) if field
+    )
+
+
+def select_fields(
+    fields: Collection[str] | None, getters: dict[str, Callable[[], Any]]
+) -> dict[str, Any]:
+    """
+    Compute the values of the requested fields of an item
+
+    :param fields: The names of the requested fields (or ``None`` for all fields)
+    :param getters: The functions which compute the values of all fields of the item, in the order of the output
+    :return: The values of the requested fields
+    """
+    return {
+        field: getter()
+        for field, getter in getters.items()
+        if fields is None or field in fields
+    }
+
+
+def parse_limit(params: QueryDict) -> int | None:
+    """
+    Parse the ``limit`` query parameter
+
+    :param params: The query parameters
+    :raises ValueError: When the limit is not a positive integer
+    :return: The maximum number of returned items or ``None`` if all items are requested
+    """
+    if "limit" not in params:
+        return None
+    try:
+        limit = int(params["limit"])
+    except ValueError as e:
+        raise ValueError("The limit must be a positive integer.") from e
+    if limit < 1:
+        raise ValueError("The limit must be a positive integer.")
+    return limit
+
+
+def encode_cursor(key: tuple[int, ...]) -> str:
+    """
+    Encode the sort key of an item as cursor
+
+    :param key: The sort key of the item
+    :return: The cursor
+    """
+    return ".".join(map(str, key))
+
+
+def parse_cursor(params: QueryDict, length: int) -> tuple[int, ...] | None:
+    """
+    Parse the ``after`` query parameter
+
+    :param params: The query parameters
+    :param length: The number of components of the sort keys of the endpoint
+    :raises ValueError: When the cursor is invalid
+    :return: The sort key of the last item of the previous page or ``None`` if the first page is requested
+    """
+    if "after" not in params:
+        return None
+    try:
+        key = tuple(int(component) for component in params["after"].split("."))
+    except ValueError as e:
+        raise ValueError("The cursor is invalid.") from e
+    if len(key) != length:
+        raise ValueError("The cursor is invalid.")
+    return key
+
+
+def paginated_list_response(
+    request: HttpRequest,
+    items: Iterable[T],
+    transform: Callable[[T], Any],
+    key: Callable[[T], tuple[int, ...]],
+    limit: int | None = None,
+    after: tuple[int, ...] | None = None,
+) -> JsonResponse | StreamingJsonResponse:
+    """
+    Create a JSON response of one page of a list (see :func:`~integreat_cms.api.utils.json_response_utils.list_response`)
+
+    :param request: The current request
+    :param items: The items, ordered by their sort key
+    :param transform: The function which converts an item into its JSON representation
+    :param key: The function which returns the sort key of an item
+    :param limit: The maximum number of returned items (or ``None`` for all remaining items)
+    :param after: The sort key of the last item of the previous page (or ``None`` for the first page)
+    :return: The JSON response, with a ``Link`` header if more items are available
+    """
+    if after is not None:
+        items = itertools.dropwhile(lambda item: key(item) <= after, items)
+    if limit is None:
+        return list_response(map(transform, items))
+    # Fetch one more item than requested to check whether a next page exists
+    page = list(itertools.islice(items, limit + 1))
+    response = list_response(map(transform, page[:limit]))
+    if len(page) > limit:
+        params = request.GET.copy()
+        params["after"] = encode_cursor(key(page[limit - 1]))
+        next_url = request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+        response["Link"] = f'<{next_url}>; rel="next"'
+    return response
@@ -0,0 +1,413 @@
+"""
+This module contains helper functions to build the offline bundles of the API.
+
+An offline bundle is a zip archive which contains the JSON payloads of the content endpoints of one language of a region
+together with all media files which are referenced in these payloads, so clients can download the complete content with
+a single request. The ``manifest.json`` in the archive lists the contained payloads and media files with their
+SHA-256 hashes.
+
+The bundles are versioned by the content version stamps of their endpoints (see
+:mod:`~integreat_cms.api.utils.content_version_utils`), so the management command
+:mod:`~integreat_cms.core.management.commands.build_offline_bundles` builds a new bundle whenever the content of the
+region changed. Payloads whose endpoint did not change and the hashes of unchanged media files are taken over from the
+previous bundle. The bundles are stored in :attr:`~integreat_cms.core.settings.OFFLINE_BUNDLE_ROOT` and served as
+static files. The API only redirects to the latest bundle, so requests never wait for a bundle to be built.
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.http import HttpRequest
+from django.utils import timezone
+
+from ..v3.events import events
+from ..v3.imprint import imprint
+from ..v3.location_categories import location_categories
+from ..v3.locations import locations
+from ..v3.offers import offers
+from ..v3.pages import pages
+from .content_version_utils import (
+    EVENTS,
+    get_content_version,
+    IMPRINT,
+    LOCATION_CATEGORIES,
+    LOCATIONS,
+    OFFERS,
+    PAGES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any, Final
+
+    from ...cms.models import Region
+
+logger = logging.getLogger(__name__)
+
+#: The version of the archive format, which has to be increased whenever the structure of the bundles changes
+BUNDLE_FORMAT: Final[int] = 1
+
+#: The name of the manifest in the archive
+MANIFEST_NAME: Final[str] = "manifest.json"
+
+#: The name of the lock file in the directory of the bundles
+LOCK_FILENAME: Final[str] = ".lock"
+
+#: The directory of the media files in the archive
+MEDIA_DIR: Final[str] = "media"
+
+#: The endpoints which are contained in the bundles with their content version, their view and whether their content
+#: depends on the current date. The tracking of the pages endpoint is skipped, because building a bundle is no visit.
+BUNDLE_ENDPOINTS: Final[dict[str, tuple[str, Callable, bool]]] = {
+    "pages": (PAGES, pages.__wrapped__, False),
+    "events": (EVENTS, events, True),
+    "locations": (LOCATIONS, locations, False),
+    "location-categories": (LOCATION_CATEGORIES, location_categories, False),
+    "offers": (OFFERS, offers, False),
+    "imprint": (IMPRINT, imprint, False),
+}
+
+#: The pattern of links to local media files, either absolute or relative to the domain of the CMS
+MEDIA_URL_PATTERN: Final[re.Pattern] = re.compile(
+    rf"(?:{re.escape(settings.BASE_URL)}|(?<![\w.-])){re.escape(settings.MEDIA_URL)}"
+    r"(?P<path>[^\s\"'\\<>()?#]+)"
+)
+
+bundle_storage = FileSystemStorage(
+    location=settings.OFFLINE_BUNDLE_ROOT, base_url=settings.OFFLINE_BUNDLE_URL
+)
+
+
+def get_endpoint_versions(region: Region, language_slug: str) -> dict[str, str]:
+    """
+    Get the current content versions of all endpoints of a bundle
+
+    :param region: The region of the bundle
+    :param language_slug: The slug of the language of the bundle
+    :return: The content version of each endpoint
+    """
+    today = str(timezone.now().date())
+    return {
+        name: ":".join(
+            [
+                get_content_version(region.id, endpoint)[0],
+                language_slug,
+                *([today] if time_dependent else []),
+            ]
+        )
+        for name, (endpoint, _, time_dependent) in BUNDLE_ENDPOINTS.items()
+    }
+
+
+def get_bundle_version(endpoint_versions: dict[str, str]) -> str:
+    """
+    Get the version of a bundle with the given endpoint versions
+
+    :param endpoint_versions: The content version of each endpoint
+    :return: The version of the bundle
+    """
+    key = json.dumps([BUNDLE_FORMAT, endpoint_versions], sort_keys=True)
+    return hashlib.sha256(bytes(key, "utf-8")).hexdigest()[:16]
+
+
+def get_bundle_dir(region: Region, language_slug: str) -> str:
+    """
+    Get the directory of the bundles of a language of a region relative to the bundle storage
+
+    :param region: The region
+    :param language_slug: The slug of the language
+    :return: The directory of the bundles
+    """
+    return f"{region.slug}/{language_slug}"
+
+
+@contextmanager
+def lock_bundle_dir(bundle_dir: str) -> Iterator[None]:
+    """
+    Lock the directory of the bundles of a language of a region, so only one process at a time builds a bundle and no
+    process removes the bundle which was just built by another one. Waits until the lock is free.
+
+    :param bundle_dir: The directory of the bundles
+    :return: A context manager which holds the lock
+    """
+    path = bundle_storage.path(bundle_dir)
+    os.makedirs(path, exist_ok=True)
+    # The lock is released when the file is closed
+    with open(os.path.join(path, LOCK_FILENAME), "a", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def get_payload(region: Region, language_slug: str, name: str) -> bytes | None:
+    """
+    Get the JSON payload of an endpoint as it is delivered by the API
+
+    :param region: The region
+    :param language_slug: The slug of the language
+    :param name: The name of the endpoint (see :data:`BUNDLE_ENDPOINTS`)
+    :return: The serialized payload or ``None`` if the endpoint has no content (e.g. when there is no imprint)
+    """
+    request = HttpRequest()
+    request.method = "GET"
+    request.region = region
+    response = BUNDLE_ENDPOINTS[name][1](
+        request, region_slug=region.slug, language_slug=language_slug
+    )
+    if response.status_code != 200:
+        logger.debug("Skipping %r of %r in bundle: %r", name, region, response)
+        return None
+    # Iterating the response works for both streaming and regular responses
+    return b"".join(response)
+
+
+def get_referenced_media(payloads: Iterable[bytes]) -> dict[str, tuple[str, str]]:
+    """
+    Find the local media files which are referenced in the given payloads
+
+    :param payloads: The serialized payloads
+    :return: The url paths (as contained in the payloads) and absolute paths of the existing media files by their path
+             relative to the media root
+    """
+    media_root = os.path.join(os.path.abspath(settings.MEDIA_ROOT), "")
+    media_files = {}
+    for payload in payloads:
+        for match in MEDIA_URL_PATTERN.finditer(payload.decode()):
+            path = os.path.normpath(os.path.join(media_root, unquote(match["path"])))
+            # Make sure only files inside the media root are added
+            if path.startswith(media_root) and os.path.isfile(path):
+                media_files[os.path.relpath(path, media_root)] = (match["path"], path)
+    return media_files
+
+
+def get_file_hash(path: str) -> str:
+    """
+    Calculate the SHA-256 hash of a file
+
+    :param path: The path of the file
+    :return: The hex digest of the file content
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_latest_bundle(bundle_dir: str) -> str | None:
+    """
+    Get the most recently built bundle in the given directory
+
+    :param bundle_dir: The directory of the bundles
+    :return: The name of the latest bundle or ``None`` if there is none
+    """
+    if not bundle_storage.exists(bundle_dir):
+        return None
+    bundles = [
+        f"{bundle_dir}/{filename}"
+        for filename in bundle_storage.listdir(bundle_dir)[1]
+        if filename.endswith(".zip")
+    ]
+    return max(bundles, key=bundle_storage.get_modified_time, default=None)
+
+
+def read_previous_bundle(
+    name: str | None,
+) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """
+    Read the manifest and the payloads of a previous bundle
+
+    :param name: The name of the previous bundle
+    :return: The manifest and the payloads by their endpoint names
+    """
+    if not name:
+        return {}, {}
+    try:
+        with zipfile.ZipFile(bundle_storage.path(name)) as archive:
+            manifest = json.loads(archive.read(MANIFEST_NAME))
+            if manifest.get("format") != BUNDLE_FORMAT:
+                return {}, {}
+            return manifest, {
+                endpoint: archive.read(entry["path"])
+                for endpoint, entry in manifest["endpoints"].items()
+            }
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        logger.warning("Could not read previous bundle %r: %r", name, e)
+        return {}, {}
+
+
+def get_payloads(
+    region: Region,
+    language_slug: str,
+    endpoint_versions: dict[str, str],
+    previous_bundle: str | None,
+) -> tuple[dict[str, bytes], dict[str, Any]]:
+    """
+    Get the payloads of a bundle. The payloads of endpoints whose content version did not change are taken from the
+    previous bundle.
+
+    :param region: The region
+    :param language_slug: The slug of the language
+    :param endpoint_versions: The content version of each endpoint
+    :param previous_bundle: The name of the previous bundle
+    :return: The payloads by their endpoint names and the manifest of the previous bundle
+    """
+    previous_manifest, previous_payloads = read_previous_bundle(previous_bundle)
+    previous_versions = {
+        endpoint: entry["version"]
+        for endpoint, entry in previous_manifest.get("endpoints", {}).items()
+    }
+    payloads = {}
+    for endpoint, endpoint_version in endpoint_versions.items():
+        if previous_versions.get(endpoint) == endpoint_version:
+            logger.debug("Reusing %r of %r", endpoint, previous_bundle)
+            payloads[endpoint] = previous_payloads[endpoint]
+        elif (payload := get_payload(region, language_slug, endpoint)) is not None:
+            payloads[endpoint] = payload
+    return payloads, previous_manifest
+
+
+def get_media_entry(
+    url: str, path: str, previous_entries: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Get the manifest entry of a media file. The hash of the previous bundle is reused if the file was not modified.
+
+    :param url: The url of the media file
+    :param path: The absolute path of the media file
+    :param previous_entries: The media entries of the previous manifest by their urls
+    :return: The manifest entry without the path in the archive
+    """
+    stat = os.stat(path)
+    previous_entry = previous_entries.get(url, {})
+    unchanged = (previous_entry.get("size"), previous_entry.get("modified")) == (
+        stat.st_size,
+        stat.st_mtime,
+    )
+    return {
+        "url": url,
+        "size": stat.st_size,
+        "modified": stat.st_mtime,
+        "sha256": previous_entry["sha256"] if unchanged else get_file_hash(path),
+    }
+
+
+def write_bundle(
+    name: str,
+    manifest: dict[str, Any],
+    payloads: dict[str, bytes],
+    previous_manifest: dict[str, Any],
+) -> None:
+    """
+    Write a bundle with the given payloads and all referenced media files to the bundle storage.
+    The bundle is written to a temporary file first, so clients never download an incomplete bundle.
+
+    :param name: The name of the bundle
+    :param manifest: The manifest without the media files
+    :param payloads: The payloads by their endpoint names
+    :param previous_manifest: The manifest of the previous bundle
+    """
+    previous_entries = {
+        entry["url"]: entry for entry in previous_manifest.get("media", [])
+    }
+    bundle_dir = os.path.dirname(bundle_storage.path(name))
+    os.makedirs(bundle_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=bundle_dir, suffix=".tmp", delete=False
+    ) as tmp_file:
+        try:
+            with zipfile.ZipFile(tmp_file, "w", zipfile.ZIP_DEFLATED) as archive:
+                for endpoint, payload in payloads.items():
+                    archive.writestr(manifest["endpoints"][endpoint]["path"], payload)
+                for relative_path, (url_path, path) in sorted(
+                    get_referenced_media(payloads.values()).items()
+                ):
+                    entry = get_media_entry(
+                        f"{settings.BASE_URL}{settings.MEDIA_URL}{url_path}",
+                        path,
+                        previous_entries,
+                    )
+                    entry["path"] = f"{MEDIA_DIR}/{relative_path}"
+                    manifest["media"].append(entry)
+                    # Media files are usually compressed already
+                    archive.write(path, entry["path"], zipfile.ZIP_STORED)
+                archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        except BaseException:
+            os.remove(tmp_file.name)
+            raise
+    os.replace(tmp_file.name, bundle_storage.path(name))
+
+
+def build_offline_bundle(region: Region, language_slug: str) -> tuple[str, bool]:
+    """
+    Build the offline bundle of a language of a region if the latest bundle is outdated.
+    Concurrent builds of the same language are serialized (see :func:`lock_bundle_dir`).
+
+    :param region: The region
+    :param language_slug: The slug of the language
+    :return: The name of the current bundle in the bundle storage and whether it was built
+    """
+    endpoint_versions = get_endpoint_versions(region, language_slug)
+    version = get_bundle_version(endpoint_versions)
+    bundle_dir = get_bundle_dir(region, language_slug)
+    name = f"{bundle_dir}/{version}.zip"
+    with lock_bundle_dir(bundle_dir):
+        if bundle_storage.exists(name):
+            return name, False
+        previous_bundle = get_latest_bundle(bundle_dir)
+        payloads, previous_manifest = get_payloads(
+            region, language_slug, endpoint_versions, previous_bundle
+        )
+        manifest: dict[str, Any] = {
+            "format": BUNDLE_FORMAT,
+            "version": version,
+            "region": region.slug,
+            "language": language_slug,
+            "created": timezone.now().isoformat(),
+            "endpoints": {
+                endpoint: {
+                    "path": f"{endpoint}.json",
+                    "version": endpoint_versions[endpoint],
+                    "sha256": hashlib.sha256(payload).hexdigest(),
+                }
+                for endpoint, payload in payloads.items()
+            },
+            "media": [],
+        }
+        write_bundle(name, manifest, payloads, previous_manifest)
+        logger.info(
+            "Built offline bundle %r of %r with %d media files",
+            name,
+            region,
+            len(manifest["media"]),
+        )
+        remove_outdated_bundles(bundle_dir, keep={name, previous_bundle})
+    return name, True
+
+
+def remove_outdated_bundles(bundle_dir: str, keep: set[str | None]) -> None:
+    """
+    Remove the bundles in the given directory which are no longer needed.
+    The previous bundle is kept, so clients which were just redirected to it can still download it.
+    The directory has to be locked (see :func:`lock_bundle_dir`).
+
+    :param bundle_dir: The directory of the bundles
+    :param keep: The names of the bundles which should be kept
+    """
+    for filename in bundle_storage.listdir(bundle_dir)[1]:
+        if (name := f"{bundle_dir}/{filename}") not in keep and filename.endswith(
+            ".zip"
+        ):
+            logger.debug("Removing outdated offline bundle %r", name)
+            bundle_storage.delete(name)
@@ -0,0 +1,181 @@
+"""
+This module contains helper functions to store the serialized responses of the API endpoints.
+
+The responses are stored under the ETag of the request (see
+:func:`~integreat_cms.api.utils.content_version_utils.get_content_validators`), which contains the current content
+version of the requested region and endpoint. When the content changes, the signal handlers in
+:mod:`~integreat_cms.core.signals.content_version_signals` replace the content version, so the outdated responses are
+never served again and are rebuilt on the next request. Outdated responses are evicted by the cache backend.
+
+Besides the serialized content, gzip and brotli compressed variants of each response are stored, so the content is
+only compressed once per content version instead of once per request.
+"""
+from __future__ import annotations
+
+import gzip
+import logging
+from typing import TYPE_CHECKING
+
+import brotli
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+if TYPE_CHECKING:
+    from typing import Final, Iterable
+
+    from django.core.cache.backends.base import BaseCache
+
+logger = logging.getLogger(__name__)
+
+#: The alias of the cache which is used to store the responses (see :setting:`django:CACHES`)
+RESPONSE_CACHE_ALIAS: Final[str] = "api_responses"
+
+#: The prefix of the cache keys of all stored responses
+RESPONSE_PREFIX: Final[str] = "api_response"
+
+#: The encoding of the uncompressed content
+IDENTITY: Final[str] = "identity"
+
+#: The content encodings of the stored compressed variants in the order of preference
+ENCODINGS: Final[list[str]] = ["br", "gzip"]
+
+
+def get_response_cache() -> BaseCache:
+    """
+    Get the cache which is used to store the responses.
+    If the dedicated cache is not configured, the default cache is used.
+
+    :return: The response cache
+    """
+    try:
+        return caches[RESPONSE_CACHE_ALIAS]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_cache_key(region_id: int | None, etag: str, encoding: str = IDENTITY) -> str:
+    """
+    Get the cache key of a stored response
+
+    :param region_id: The id of the region (or ``None`` for endpoints which are not region specific)
+    :param etag: The ETag of the response
+    :param encoding: The content encoding of the variant
+    :return: The cache key
+    """
+    key = f"{RESPONSE_PREFIX}-{region_id or 'all'}-{etag.strip(chr(34))}"
+    return key if encoding == IDENTITY else f"{key}-{encoding}"
+
+
+def get_accepted_encodings(accept_encoding: str) -> list[str]:
+    """
+    Get the encodings of the stored variants which are accepted according to the ``Accept-Encoding`` header
+
+    :param accept_encoding: The value of the ``Accept-Encoding`` header
+    :return: The accepted encodings, ordered by their quality value and the preference of the server
+    """
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, parameters = coding.partition(";")
+        quality = 1.0
+        if (parameter := parameters.strip()).startswith("q="):
+            try:
+                quality = float(parameter[2:])
+            except ValueError:
+                continue
+        qualities[name.strip()] = quality
+    default = qualities.get("*", 0.0)
+    accepted = [
+        encoding for encoding in ENCODINGS if qualities.get(encoding, default) > 0
+    ]
+    return sorted(accepted, key=lambda encoding: -qualities.get(encoding, default))
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    """
+    Compress the content of a response
+
+    :param content: The serialized content of the response
+    :param encoding: The content encoding (one of :data:`ENCODINGS`)
+    :return: The compressed content
+    """
+    if encoding == "br":
+        return brotli.compress(
+            content,
+            mode=brotli.MODE_TEXT,
+            quality=settings.API_RESPONSE_STORE_BROTLI_QUALITY,
+        )
+    # Omit the modification time to get the same result for the same content
+    return gzip.compress(
+        content, compresslevel=settings.API_RESPONSE_STORE_GZIP_LEVEL, mtime=0
+    )
+
+
+def decompress(content: bytes, encoding: str) -> bytes:
+    """
+    Decompress the content of a response
+
+    :param content: The compressed content of the response
+    :param encoding: The content encoding (one of :data:`ENCODINGS` or :data:`IDENTITY`)
+    :return: The serialized content
+    """
+    if encoding == "br":
+        return brotli.decompress(content)
+    if encoding == "gzip":
+        return gzip.decompress(content)
+    return content
+
+
+def get_stored_response(
+    region_id: int | None, etag: str, encodings: Iterable[str] = ()
+) -> tuple[bytes, str] | None:
+    """
+    Get the stored content of a response in the preferred available encoding
+
+    :param region_id: The id of the region (or ``None`` for endpoints which are not region specific)
+    :param etag: The ETag of the response
+    :param encodings: The accepted encodings in the order of preference (see :func:`get_accepted_encodings`)
+    :return: The content of the response and its encoding or ``None`` if the response is not stored
+    """
+    keys = {
+        encoding: get_cache_key(region_id, etag, encoding)
+        for encoding in [*encodings, IDENTITY]
+    }
+    variants = get_response_cache().get_many(keys.values())
+    for encoding, key in keys.items():
+        if (content := variants.get(key)) is not None:
+            return content, encoding
+    return None
+
+
+def store_response(
+    region_id: int | None, etag: str, content: bytes
+) -> dict[str, bytes]:
+    """
+    Store the content of a response and its compressed variants
+
+    :param region_id: The id of the region (or ``None`` for endpoints which are not region specific)
+    :param etag: The ETag of the response
+    :param content: The serialized content of the response
+    :return: The stored variants of the content by their encodings
+    """
+    if len(content) > settings.API_RESPONSE_STORE_MAX_SIZE:
+        logger.debug(
+            "Not storing response %r because its size exceeds %d bytes",
+            etag,
+            settings.API_RESPONSE_STORE_MAX_SIZE,
+        )
+        return {}
+    variants = {IDENTITY: content}
+    # Small responses are not worth the overhead of the compression
+    if len(content) >= settings.API_RESPONSE_STORE_COMPRESSION_MIN_SIZE:
+        for encoding in ENCODINGS:
+            variants[encoding] = compress(content, encoding)
+    get_response_cache().set_many(
+        {
+            get_cache_key(region_id, etag, encoding): variant
+            for encoding, variant in variants.items()
+        },
+        timeout=settings.API_RESPONSE_STORE_TIMEOUT,
+    )
+    return variants
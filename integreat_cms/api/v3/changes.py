@@ -0,0 +1,279 @@
+"""
+This module includes functions related to the changes API endpoint, which allows clients to synchronize their local copy
+of the content incrementally. The changes are derived from the records of
+:class:`~integreat_cms.cms.models.content_changes.content_change.ContentChange`.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from django.db.models import Prefetch
+from django.http import JsonResponse
+from django.utils import timezone as django_timezone
+
+from ...cms.constants import content_change_types, status
+from ...cms.models import POICategoryTranslation
+from ..decorators import json_response
+from .events import transform_event_translation
+from .imprint import transform_imprint
+from .locations import transform_poi_translation
+from .pages import transform_page
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+    from django.http import HttpRequest
+
+    from ...cms.models import Region
+
+logger = logging.getLogger(__name__)
+
+#: The time span by which consecutive syncs overlap. Changes are recorded when the content is saved, but only become
+#: visible once the transaction is committed, so changes recorded shortly before the creation of a token might only be
+#: visible after the token has been delivered.
+SYNC_TOKEN_OVERLAP: Final[timedelta] = timedelta(minutes=1)
+
+
+def create_sync_token(timestamp: datetime) -> str:
+    """
+    Create the sync token for the given point in time
+
+    :param timestamp: The point in time up to which the client has received all changes
+    :return: The opaque sync token
+    """
+    return str(int(timestamp.timestamp() * 1_000_000))
+
+
+def parse_sync_token(token: str) -> datetime:
+    """
+    Get the point in time of the given sync token
+
+    :param token: The sync token
+    :raises ValueError: When the token is invalid
+    :return: The point in time up to which the client has received all changes
+    """
+    try:
+        return datetime.fromtimestamp(int(token) / 1_000_000, tz=timezone.utc)
+    except (ValueError, OverflowError, OSError) as e:
+        raise ValueError(f"Invalid sync token {token!r}") from e
+
+
+def get_changed_objects(region: Region, since: datetime) -> dict[str, dict[int, bool]]:
+    """
+    Get all content objects of a region which have been changed since the given point in time
+
+    :param region: The region
+    :param since: The point in time
+    :return: A dict which maps the content types to dicts of the ids of the changed objects and whether they have been
+             removed
+    """
+    changed_objects: dict[str, dict[int, bool]] = defaultdict(dict)
+    for content_type, object_id, removed in region.content_changes.filter(
+        timestamp__gte=since
+    ).values_list("content_type", "object_id", "removed"):
+        changed_objects[content_type][object_id] = removed
+    return changed_objects
+
+
+def get_page_payloads(
+    region: Region, language_slug: str, object_ids: set[int] | None
+) -> dict[int, tuple[datetime, dict[str, Any]]]:
+    """
+    Get the payloads of the visible pages of a region. Since the payload of a page depends on its ancestors, the whole
+    page tree is loaded.
+
+    :param region: The region
+    :param language_slug: The slug of the requested language
+    :param object_ids: The ids of the requested pages (or ``None`` for all pages)
+    :return: A dict which maps the ids of the visible pages to their creation date and their payload
+    """
+    return {
+        page.id: (page.created_date, transform_page(page_translation))
+        for page in region.pages.select_related("organization__icon")
+        .prefetch_related("embedded_offers")
+        .prefetch_paths()
+        .filter(explicitly_archived=False)
+        .cache_tree(
+            archived=False,
+            language_slug=language_slug,
+            translations=("public_translations",),
+        )
+        if (object_ids is None or page.id in object_ids)
+        and (page_translation := page.get_public_translation(language_slug))
+    }
+
+
+def get_event_payloads(
+    region: Region, language_slug: str, object_ids: set[int] | None
+) -> dict[int, tuple[datetime, dict[str, Any]]]:
+    """
+    Get the payloads of the visible events of a region. Recurring events are not split into their recurrences.
+
+    :param region: The region
+    :param language_slug: The slug of the requested language
+    :param object_ids: The ids of the requested events (or ``None`` for all events)
+    :return: A dict which maps the ids of the visible events to their creation date and their payload
+    """
+    events = region.events.prefetch_public_translations().filter(archived=False)
+    if object_ids is not None:
+        events = events.filter(id__in=object_ids)
+    payloads = {}
+    for event in events:
+        if not event.is_past and (
+            event_translation := event.get_public_translation(language_slug)
+        ):
+            poi_translation = (
+                event.location.get_public_translation(language_slug)
+                if event.location
+                else None
+            )
+            payloads[event.id] = (
+                event.created_date,
+                transform_event_translation(event_translation, poi_translation),
+            )
+    return payloads
+
+
+def get_poi_payloads(
+    region: Region, language_slug: str, object_ids: set[int] | None
+) -> dict[int, tuple[datetime, dict[str, Any]]]:
+    """
+    Get the payloads of the visible locations of a region
+
+    :param region: The region
+    :param language_slug: The slug of the requested language
+    :param object_ids: The ids of the requested locations (or ``None`` for all locations)
+    :return: A dict which maps the ids of the visible locations to their creation date and their payload
+    """
+    pois = (
+        region.pois.prefetch_public_translations()
+        .filter(
+            archived=False,
+            # Exclude locations without public translation in the default language
+            translations__language=region.default_language,
+            translations__status=status.PUBLIC,
+        )
+        .distinct()
+        .select_related("category", "organization__icon")
+        .prefetch_related(
+            Prefetch(
+                "category__translations",
+                queryset=POICategoryTranslation.objects.select_related("language"),
+            )
+        )
+    )
+    if object_ids is not None:
+        pois = pois.filter(id__in=object_ids)
+    return {
+        poi.id: (poi.created_date, transform_poi_translation(poi_translation))
+        for poi in pois
+        if (poi_translation := poi.get_public_translation(language_slug))
+    }
+
+
+def get_imprint_payloads(
+    region: Region, language_slug: str, object_ids: set[int] | None
+) -> dict[int, tuple[datetime, dict[str, Any]]]:
+    """
+    Get the payload of the imprint of a region
+
+    :param region: The region
+    :param language_slug: The slug of the requested language
+    :param object_ids: The ids of the requested imprints (or ``None`` for the current imprint)
+    :return: A dict which maps the id of the imprint to its creation date and its payload
+    """
+    if (
+        (imprint := region.imprint)
+        and (object_ids is None or imprint.id in object_ids)
+        and (imprint_translation := imprint.get_public_translation(language_slug))
+    ):
+        return {
+            imprint.id: (imprint.created_date, transform_imprint(imprint_translation))
+        }
+    return {}
+
+
+#: The keys of the content types in the response and the functions to get their payloads
+CONTENT_TYPES: Final = {
+    content_change_types.PAGE: ("pages", get_page_payloads),
+    content_change_types.EVENT: ("events", get_event_payloads),
+    content_change_types.POI: ("locations", get_poi_payloads),
+    content_change_types.IMPRINT: ("imprint", get_imprint_payloads),
+}
+
+
+def transform_changes(
+    payloads: dict[int, tuple[datetime, dict[str, Any]]],
+    changed_ids: dict[int, bool],
+    since: datetime | None,
+) -> dict[str, Any]:
+    """
+    Function to create a JSON from the changes of one content type
+
+    :param payloads: The creation dates and payloads of the visible changed objects
+    :param changed_ids: The ids of all changed objects and whether they have been removed
+    :param since: The point in time of the sync token (or ``None`` if the client has no local copy yet)
+    :return: data necessary for API
+    """
+    return {
+        "created": {
+            object_id: payload
+            for object_id, (created_date, payload) in payloads.items()
+            if not since or created_date >= since
+        },
+        "updated": {
+            object_id: payload
+            for object_id, (created_date, payload) in payloads.items()
+            if since and created_date < since
+        },
+        # Objects which are not visible anymore (e.g. because they were deleted, archived or unpublished)
+        "deleted": sorted(set(changed_ids) - set(payloads)),
+    }
+
+
+@json_response
+# pylint: disable=unused-argument
+def changes(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
+    """
+    Return the content which has been created, updated or removed since the given sync token.
+    Without a token, all current content is returned as created.
+    The payloads of the created and updated objects are identical to the ones of the respective list endpoints and
+    are mapped by the ids of the content objects.
+
+    :param request: Django request
+    :param region_slug: slug of a region
+    :param language_slug: language slug
+    :return: JSON object according to APIv3 changes endpoint definition
+    """
+    region = request.region
+    # Throw a 404 error when the language does not exist or is disabled
+    region.get_language_or_404(language_slug, only_active=True)
+    result: dict[str, Any] = {
+        "token": create_sync_token(django_timezone.now() - SYNC_TOKEN_OVERLAP)
+    }
+    if not (token := request.GET.get("since")):
+        for key, get_payloads in CONTENT_TYPES.values():
+            result[key] = transform_changes(
+                get_payloads(region, language_slug, None), {}, None
+            )
+        return JsonResponse(result)
+    try:
+        since = parse_sync_token(token)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    changed_objects = get_changed_objects(region, since)
+    for content_type, (key, get_payloads) in CONTENT_TYPES.items():
+        changed_ids = changed_objects.get(content_type, {})
+        # Removed objects do not have to be queried
+        object_ids = {
+            object_id for object_id, removed in changed_ids.items() if not removed
+        }
+        result[key] = transform_changes(
+            get_payloads(region, language_slug, object_ids) if object_ids else {},
+            changed_ids,
+            since,
+        )
+    return JsonResponse(result)
@@ -3,24 +3,38 @@ This module includes functions related to the event API endpoint.
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import heapq
+import operator
+import zoneinfo
+from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.db.models import Max, Q
 from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.html import strip_tags
 
-from ..decorators import json_response
+from ...cms.models import EventOccurrence
+from ..decorators import conditional_response, json_response, materialized_response
+from ..utils.content_version_utils import EVENTS
+from ..utils.json_response_utils import iterate_in_chunks, list_response
+from ..utils.list_query_utils import (
+    paginated_list_response,
+    parse_cursor,
+    parse_fields,
+    parse_limit,
+    select_fields,
+)
 from .locations import transform_poi
 
 if TYPE_CHECKING:
-    from datetime import date
-    from typing import Any, Iterator
+    from typing import Any, Collection, Iterable, Iterator
 
-    from django.http import HttpRequest
+    from django.http import HttpRequest, QueryDict
 
-    from ...cms.models import Event, EventTranslation, POITranslation
+    from ...cms.models import Event, EventTranslation, POITranslation, Region
+    from ..utils.json_response_utils import StreamingJsonResponse
 
 
 def transform_event(event: Event, custom_date: date | None = None) -> dict[str, Any]:
@@ -61,6 +75,7 @@ def transform_event_translation(
     event_translation: EventTranslation,
     poi_translation: POITranslation | None,
     recurrence_date: date | None = None,
+    fields: Collection[str] | None = None,
 ) -> dict[str, Any]:
     """
     Function to create a JSON from a single event_translation object.
@@ -68,6 +83,8 @@ def transform_event_translation(
     :param event_translation: The event translation object which should be converted
     :param poi_translation: The poi translation object which is associated to this event
     :param recurrence_date: The recurrence date for the event
+    :param fields: The names of the fields which should be returned (see
+                   :func:`~integreat_cms.api.utils.list_query_utils.parse_fields`, defaults to all fields)
     :return: data necessary for API
     """
     event = event_translation.event
@@ -77,31 +94,36 @@ def transform_event_translation(
         else f"{event_translation.slug}${recurrence_date}"
     )
     absolute_url = event_translation.url_prefix + slug + "/"
-    return {
-        "id": event_translation.id,
-        "url": settings.BASE_URL + absolute_url,
-        "path": absolute_url,
-        "title": event_translation.title,
-        "modified_gmt": event_translation.last_updated,  # deprecated field in the future
-        "last_updated": timezone.localtime(event_translation.last_updated),
-        "excerpt": strip_tags(event_translation.content),
-        "content": event_translation.content,
-        "available_languages": transform_available_languages(
-            event_translation, recurrence_date
-        )
-        if recurrence_date
-        else event_translation.available_languages_dict,
-        "thumbnail": event.icon.url if event.icon else None,
-        "location": transform_poi(event.location),
-        "location_url": settings.BASE_URL + poi_translation.get_absolute_url()
-        if poi_translation
-        else None,
-        "event": transform_event(event, recurrence_date),
-        "hash": None,
-        "recurrence_rule": event.recurrence_rule.to_ical_rrule_string()
-        if event.recurrence_rule
-        else None,
-    }
+    return select_fields(
+        fields,
+        {
+            "id": lambda: event_translation.id,
+            "url": lambda: settings.BASE_URL + absolute_url,
+            "path": lambda: absolute_url,
+            "title": lambda: event_translation.title,
+            # deprecated field in the future
+            "modified_gmt": lambda: event_translation.last_updated,
+            "last_updated": lambda: timezone.localtime(event_translation.last_updated),
+            "excerpt": lambda: strip_tags(event_translation.content),
+            "content": lambda: event_translation.content,
+            "available_languages": lambda: transform_available_languages(
+                event_translation, recurrence_date
+            )
+            if recurrence_date
+            else event_translation.available_languages_dict,
+            "thumbnail": lambda: event.icon.url if event.icon else None,
+            "location": lambda: transform_poi(event.location),
+            "location_url": lambda: settings.BASE_URL
+            + poi_translation.get_absolute_url()
+            if poi_translation
+            else None,
+            "event": lambda: transform_event(event, recurrence_date),
+            "hash": lambda: None,
+            "recurrence_rule": lambda: event.recurrence_rule.to_ical_rrule_string()
+            if event.recurrence_rule
+            else None,
+        },
+    )
 
 
 def transform_available_languages(
@@ -136,6 +158,7 @@ def transform_event_recurrences(
     event_translation: EventTranslation,
     poi_translation: POITranslation | None,
     today: date,
+    fields: Collection[str] | None = None,
 ) -> Iterator[dict[str, Any]]:
     """
     Yield all future recurrences of the event.
@@ -143,6 +166,7 @@ def transform_event_recurrences(
     :param event_translation: The event translation object which should be converted
     :param poi_translation: The poi translation object which is associated to this event
     :param today: The first date at which event may be yielded
+    :param fields: The names of the fields which should be returned (defaults to all fields)
     :return: An iterator over all future recurrences up to ``settings.API_EVENTS_MAX_TIME_SPAN_DAYS``
     """
 
@@ -157,39 +181,35 @@ def transform_event_recurrences(
     start_date = event.start_local.date()
     event_translation.id = None
 
-    # Calculate all recurrences of this event
-    for recurrence_date in event.recurrence_rule.iter_after(start_date):
+    # Calculate all recurrences of this event, skipping the past ones
+    for recurrence_date in event.recurrence_rule.iter_after(start_date, today):
         if recurrence_date - max(start_date, today) > timedelta(
             days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
         ):
             break
-        if recurrence_date < today:
-            continue
 
         yield transform_event_translation(
-            event_translation, poi_translation, recurrence_date
+            event_translation, poi_translation, recurrence_date, fields
         )
 
 
-@json_response
-# pylint: disable=unused-argument
-def events(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
+def transform_events(
+    region_events: Iterable[Event],
+    language_slug: str,
+    combine_recurring_events: bool,
+    fields: Collection[str] | None = None,
+) -> Iterator[dict[str, Any]]:
     """
-    List all events of the region and transform result into JSON
+    Yield the upcoming public translations of the given events as dicts
 
-    :param request: The current request
-    :param region_slug: The slug of the requested region
+    :param region_events: The events of the region
     :param language_slug: The slug of the requested language
-    :return: JSON object according to APIv3 events endpoint definition
+    :param combine_recurring_events: Whether recurring events should be returned as a single event
+    :param fields: The names of the fields which should be returned (defaults to all fields)
+    :return: An iterator over the dicts of all upcoming event translations and recurrences
     """
-    region = request.region
-    # Throw a 404 error when the language does not exist or is disabled
-    region.get_language_or_404(language_slug, only_active=True)
-
-    result: list[dict[str, str | int | None]] = []
     now = timezone.now().date()
-    combine_recurring_events = "combine_recurring" in request.GET
-    for event in region.events.prefetch_public_translations().filter(archived=False):
+    for event in region_events:
         if not event.is_past and (
             event_translation := event.get_public_translation(language_slug)
         ):
@@ -199,18 +219,304 @@ def events(request: HttpRequest, region_slug: str, language_slug: str) -> JsonRe
                 else None
             )
             if event.is_recurring and not combine_recurring_events:
-                result.extend(
-                    iter(
-                        transform_event_recurrences(
-                            event_translation, poi_translation, now
-                        )
-                    )
+                yield from transform_event_recurrences(
+                    event_translation, poi_translation, now, fields
                 )
             else:
-                result.append(
-                    transform_event_translation(event_translation, poi_translation)
+                yield transform_event_translation(
+                    event_translation, poi_translation, fields=fields
                 )
 
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+
+def parse_event_range_parameters(
+    params: QueryDict, region: Region
+) -> tuple[datetime, datetime, int | None]:
+    """
+    Parse the ``from``, ``to`` and ``limit`` query parameters of the events endpoint.
+    If ``to`` is not given, the time range ends :attr:`~integreat_cms.core.settings.API_EVENTS_MAX_TIME_SPAN_DAYS` days
+    after its beginning.
+
+    :param params: The query parameters
+    :param region: The requested region (the dates are interpreted in its timezone)
+    :raises ValueError: When one of the parameters is invalid
+    :return: The beginning and the end of the requested time range and the maximum number of results
+    """
+    tzinfo = zoneinfo.ZoneInfo(region.timezone)
+    try:
+        from_date = date.fromisoformat(params["from"]) if "from" in params else None
+        to_date = date.fromisoformat(params["to"]) if "to" in params else None
+    except ValueError as e:
+        raise ValueError("The dates must be in the format YYYY-MM-DD.") from e
+    limit = parse_limit(params)
+    from_date = from_date or timezone.now().astimezone(tzinfo).date()
+    to_date = to_date or from_date + timedelta(
+        days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+    )
+    if to_date < from_date:
+        raise ValueError("The end of the time range must not be before its beginning.")
+    return (
+        datetime.combine(from_date, time.min, tzinfo=tzinfo),
+        datetime.combine(to_date, time.max, tzinfo=tzinfo),
+        limit,
+    )
+
+
+def get_unstored_occurrences(
+    region: Region, from_datetime: datetime, to_datetime: datetime
+) -> list[tuple[int, datetime]]:
+    """
+    Compute the occurrences of recurring events in the given time range which lie beyond the horizon of the stored
+    occurrences (see :attr:`~integreat_cms.core.settings.EVENT_OCCURRENCES_HORIZON_DAYS`). Only the recurrences after
+    the last stored occurrence of each event are computed.
+
+    :param region: The requested region
+    :param from_datetime: The beginning of the time range
+    :param to_datetime: The end of the time range
+    :return: The ids of the events and the starts of their unstored occurrences
+    """
+    # Allow the daily update of the stored occurrences to be delayed by a day
+    if to_datetime.date() < timezone.now().date() + timedelta(
+        days=settings.EVENT_OCCURRENCES_HORIZON_DAYS
+    ):
+        return []
+    recurring_events = (
+        region.events.filter(archived=False, recurrence_rule__isnull=False)
+        .filter_upcoming(from_datetime.date())
+        .select_related("recurrence_rule")
+        .annotate(last_stored=Max("occurrences__start"))
+    )
+    return [
+        (event.id, start)
+        for event in recurring_events
+        for start, end in EventOccurrence.get_occurrence_periods(
+            event, from_datetime.date(), to_datetime.date()
+        )
+        if end >= from_datetime
+        and start <= to_datetime
+        and (not event.last_stored or start > event.last_stored)
+    ]
+
+
+def get_stored_occurrences(
+    region: Region,
+    from_datetime: datetime,
+    to_datetime: datetime,
+    min_start: datetime | None,
+    batch_size: int,
+) -> Iterator[tuple[int, datetime]]:
+    """
+    Iterate over the stored occurrences which overlap with the given time range, ordered by their start and the id of
+    their event. The occurrences are queried in batches with keyset pagination, so each query only reads the next
+    batch from the index on the region and the start.
+
+    :param region: The requested region
+    :param from_datetime: The beginning of the time range
+    :param to_datetime: The end of the time range
+    :param min_start: The earliest start of the returned occurrences (or ``None`` to return all occurrences)
+    :param batch_size: The number of occurrences which are queried at once
+    :return: An iterator over the ids of the events and the starts of their occurrences
+    """
+    occurrences = EventOccurrence.objects.filter(
+        region=region, end__gte=from_datetime, start__lte=to_datetime
+    ).order_by("start", "event_id")
+    if min_start:
+        occurrences = occurrences.filter(start__gte=min_start)
+    batch = list(occurrences.values_list("event_id", "start")[:batch_size])
+    while batch:
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        last_event_id, last_start = batch[-1]
+        batch = list(
+            occurrences.filter(
+                Q(start__gt=last_start)
+                | Q(start=last_start, event_id__gt=last_event_id)
+            ).values_list("event_id", "start")[:batch_size]
+        )
+
+
+def get_occurrence_batches(
+    region: Region,
+    from_datetime: datetime,
+    to_datetime: datetime,
+    combine_recurring_events: bool,
+    after: tuple[int, ...] | None,
+    batch_size: int,
+) -> Iterator[list[tuple[tuple[int, int], int, datetime]]]:
+    """
+    Iterate over the occurrences after the cursor in batches, ordered by their start and the id of their event.
+    Unless recurring events are combined, the occurrences before the cursor are not queried at all.
+
+    :param region: The requested region
+    :param from_datetime: The beginning of the time range
+    :param to_datetime: The end of the time range
+    :param combine_recurring_events: Whether only the first occurrence of each event should be returned
+    :param after: The sort key of the last occurrence of the previous page
+    :param batch_size: The number of occurrences per batch
+    :return: An iterator over the batches of the sort keys, event ids and starts of the occurrences
+    """
+    # The previous pages of combined events have to be read to know which events were already delivered
+    min_start = (
+        datetime.fromtimestamp(after[0], tz=zoneinfo.ZoneInfo("UTC"))
+        if after and not combine_recurring_events
+        else None
+    )
+    occurrences = heapq.merge(
+        get_stored_occurrences(
+            region, from_datetime, to_datetime, min_start, batch_size
+        ),
+        sorted(
+            (
+                occurrence
+                for occurrence in get_unstored_occurrences(
+                    region, from_datetime, to_datetime
+                )
+                if not min_start or occurrence[1] >= min_start
+            ),
+            key=operator.itemgetter(1, 0),
+        ),
+        # The occurrences are ordered by their start and the id of their event
+        key=operator.itemgetter(1, 0),
+    )
+    seen_events = set()
+    batch = []
+    for event_id, start in occurrences:
+        if combine_recurring_events and event_id in seen_events:
+            continue
+        seen_events.add(event_id)
+        key = (int(start.timestamp()), event_id)
+        # The sort key contains the start in whole seconds, so the occurrences which were already delivered on a
+        # previous page can also be contained in the query
+        if after and key <= after:
+            continue
+        batch.append((key, event_id, start))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def get_event_occurrences(
+    region: Region,
+    language_slug: str,
+    from_datetime: datetime,
+    to_datetime: datetime,
+    combine_recurring_events: bool,
+    after: tuple[int, ...] | None = None,
+    limit: int | None = None,
+) -> Iterator[
+    tuple[tuple[int, int], EventTranslation, POITranslation | None, date | None]
+]:
+    """
+    Yield the public translations of the event occurrences which overlap with the given time range, ordered by their
+    start. The occurrences are looked up in the stored
+    :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence` objects instead of expanding the
+    recurrence rules. Only the occurrences beyond the horizon of the stored occurrences are computed (see
+    :func:`get_unstored_occurrences`). The events are loaded per batch of occurrences (see
+    :func:`get_occurrence_batches`), so only the events of the requested page are loaded.
+
+    :param region: The requested region
+    :param language_slug: The slug of the requested language
+    :param from_datetime: The beginning of the time range
+    :param to_datetime: The end of the time range
+    :param combine_recurring_events: Whether recurring events should be returned as a single event
+    :param after: The sort key of the last occurrence of the previous page (see
+                  :func:`~integreat_cms.api.utils.list_query_utils.parse_cursor`)
+    :param limit: The number of occurrences of the requested page (or ``None`` for all occurrences)
+    :return: An iterator over the sort keys, event translations, location translations and recurrence dates of all
+             occurrences in the time range
+    """
+    for batch in get_occurrence_batches(
+        region,
+        from_datetime,
+        to_datetime,
+        combine_recurring_events,
+        after,
+        # Fetch one more occurrence than requested to check whether a next page exists
+        limit + 1 if limit else settings.API_STREAMING_CHUNK_SIZE,
+    ):
+        region_events = (
+            region.events.prefetch_public_translations()
+            .filter(archived=False)
+            .in_bulk({event_id for _, event_id, _ in batch})
+        )
+        for key, event_id, start in batch:
+            if not (event := region_events.get(event_id)) or not (
+                event_translation := event.get_public_translation(language_slug)
+            ):
+                continue
+            poi_translation = (
+                event.location.get_public_translation(language_slug)
+                if event.location
+                else None
+            )
+            if event.is_recurring and not combine_recurring_events:
+                event_translation.id = None
+                yield key, event_translation, poi_translation, timezone.localtime(
+                    start, zoneinfo.ZoneInfo(event.timezone)
+                ).date()
+            else:
+                yield key, event_translation, poi_translation, None
+
+
+@json_response
+@conditional_response(EVENTS, time_dependent=True)
+@materialized_response(EVENTS, time_dependent=True)
+# pylint: disable=unused-argument
+def events(
+    request: HttpRequest, region_slug: str, language_slug: str
+) -> JsonResponse | StreamingJsonResponse:
+    """
+    List all events of the region and transform result into JSON.
+    If one of the query parameters ``from``, ``to``, ``limit`` or ``after`` is given, only the events and recurrences
+    in the requested time range are returned (see :func:`get_event_occurrences`).
+
+    :param request: The current request
+    :param region_slug: The slug of the requested region
+    :param language_slug: The slug of the requested language
+    :return: JSON object according to APIv3 events endpoint definition
+    """
+    region = request.region
+    # Throw a 404 error when the language does not exist or is disabled
+    region.get_language_or_404(language_slug, only_active=True)
+
+    fields = parse_fields(request.GET)
+    if {"from", "to", "limit", "after"} & request.GET.keys():
+        try:
+            from_datetime, to_datetime, limit = parse_event_range_parameters(
+                request.GET, region
+            )
+            after = parse_cursor(request.GET, 2)
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        return paginated_list_response(
+            request,
+            get_event_occurrences(
+                region,
+                language_slug,
+                from_datetime,
+                to_datetime,
+                "combine_recurring" in request.GET,
+                after,
+                limit,
+            ),
+            lambda occurrence: transform_event_translation(
+                *occurrence[1:], fields=fields
+            ),
+            # The occurrences are ordered by their start and the id of their event
+            operator.itemgetter(0),
+            limit,
+            after,
+        )
+
+    return list_response(
+        transform_events(
+            iterate_in_chunks(
+                region.events.prefetch_public_translations().filter(archived=False)
+            ),
+            language_slug,
+            "combine_recurring" in request.GET,
+            fields,
+        )
+    )
@@ -17,7 +17,8 @@ if TYPE_CHECKING:
 
     from ...cms.models.pages.imprint_page_translation import ImprintPageTranslation
 
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response, materialized_response
+from ..utils.content_version_utils import IMPRINT
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,8 @@ def transform_imprint(imprint_translation: ImprintPageTranslation) -> dict[str,
 
 
 @json_response
+@conditional_response(IMPRINT)
+@materialized_response(IMPRINT)
 # pylint: disable=unused-argument
 def imprint(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
     """
@@ -8,7 +8,8 @@ from typing import TYPE_CHECKING
 from django.http import Http404, JsonResponse
 
 from ...cms.constants import region_status
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
+from ..utils.content_version_utils import LANGUAGES
 
 if TYPE_CHECKING:
     from typing import Any
@@ -35,6 +36,7 @@ def transform_language(language: Language) -> dict[str, Any]:
 
 
 @json_response
+@conditional_response(LANGUAGES)
 # pylint: disable=unused-argument
 def languages(request: HttpRequest, region_slug: str) -> JsonResponse:
     """
@@ -14,7 +14,8 @@ if TYPE_CHECKING:
     from django.http import HttpRequest
 
 from ...cms.models import POICategory
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
+from ..utils.content_version_utils import LOCATION_CATEGORIES
 
 
 def transform_location_category(
@@ -45,6 +46,7 @@ def transform_location_category(
 
 
 @json_response
+@conditional_response(LOCATION_CATEGORIES)
 # pylint: disable=unused-argument
 def location_categories(
     request: HttpRequest, region_slug: str, language_slug: str
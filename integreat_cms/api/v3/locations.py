@@ -3,10 +3,14 @@ This module includes functions related to the locations/POIs API endpoint.
 """
 from __future__ import annotations
 
+import math
+import operator
+from functools import partial, reduce
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.db.models import Prefetch
+from django.db.models import Prefetch, Q
 from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.html import strip_tags
@@ -14,16 +18,33 @@ from django.utils.html import strip_tags
 from ...cms.constants import status
 from ...cms.models import POICategoryTranslation
 from ...cms.models.pois.poi import get_default_opening_hours
+from ...cms.utils.geo_utils import (
+    get_bounding_box_around,
+    get_distance,
+    get_geohash_prefixes,
+)
 from ...core.utils.strtobool import strtobool
-from ..decorators import json_response
+from ...nominatim_api.utils import BoundingBox
+from ..decorators import conditional_response, json_response, materialized_response
+from ..utils.content_version_utils import LOCATIONS
+from ..utils.json_response_utils import iterate_in_chunks, list_response
+from ..utils.list_query_utils import (
+    paginated_list_response,
+    parse_cursor,
+    parse_fields,
+    parse_limit,
+    select_fields,
+)
 from .location_categories import transform_location_category
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Collection, Iterable, Iterator
 
-    from django.http import HttpRequest
+    from django.db.models.query import QuerySet
+    from django.http import HttpRequest, QueryDict
 
-    from ...cms.models import POI, POITranslation
+    from ...cms.models import POI, POITranslation, Region
+    from ..utils.json_response_utils import StreamingJsonResponse
 
 
 def transform_poi(poi: POI | None) -> dict[str, Any]:
@@ -60,62 +81,222 @@ def transform_poi(poi: POI | None) -> dict[str, Any]:
     }
 
 
-def transform_poi_translation(poi_translation: POITranslation) -> dict[str, Any]:
+def transform_poi_translation(
+    poi_translation: POITranslation, fields: Collection[str] | None = None
+) -> dict[str, Any]:
     """
     Function to create a JSON from a single poi_translation object.
 
     :param poi_translation: The poi translation object which should be converted
+    :param fields: The names of the fields which should be returned (see
+                   :func:`~integreat_cms.api.utils.list_query_utils.parse_fields`, defaults to all fields)
     :return: data necessary for API
     """
 
     poi = poi_translation.poi
-    # Only return opening hours if they differ from the default value and the location is not temporarily closed
-    opening_hours = None
-    if not poi.temporarily_closed and poi.opening_hours != get_default_opening_hours():
-        opening_hours = poi.opening_hours
-    return {
-        "id": poi_translation.id,
-        "url": settings.BASE_URL + poi_translation.get_absolute_url(),
-        "path": poi_translation.get_absolute_url(),
-        "title": poi_translation.title,
-        "modified_gmt": poi_translation.last_updated,  # deprecated field in the future
-        "last_updated": timezone.localtime(poi_translation.last_updated),
-        "meta_description": poi_translation.meta_description,
-        "excerpt": strip_tags(poi_translation.content),
-        "content": poi_translation.content,
-        "available_languages": poi_translation.available_languages_dict,
-        "icon": poi.icon.url if poi.icon else None,
-        "thumbnail": poi.icon.thumbnail_url if poi.icon else None,
-        "website": poi.website or None,
-        "email": poi.email or None,
-        "phone_number": poi.phone_number or None,
-        "category": transform_location_category(
-            poi.category, poi_translation.language.slug
-        ),
-        "temporarily_closed": poi.temporarily_closed,
-        # Only return opening hours if not temporarily closed and they differ from the default value
-        "opening_hours": opening_hours,
-        "appointment_url": poi.appointment_url or None,
-        "location": transform_poi(poi),
-        "hash": None,
-        "organization": {
-            "id": poi.organization.id,
-            "slug": poi.organization.slug,
-            "name": poi.organization.name,
-            "logo": poi.organization.icon.url,
-            "website": poi.organization.website,
-        }
-        if poi.organization
-        else None,
-        "barrier_free": poi.barrier_free,
-    }
+    return select_fields(
+        fields,
+        {
+            "id": lambda: poi_translation.id,
+            "url": lambda: settings.BASE_URL + poi_translation.get_absolute_url(),
+            "path": poi_translation.get_absolute_url,
+            "title": lambda: poi_translation.title,
+            # deprecated field in the future
+            "modified_gmt": lambda: poi_translation.last_updated,
+            "last_updated": lambda: timezone.localtime(poi_translation.last_updated),
+            "meta_description": lambda: poi_translation.meta_description,
+            "excerpt": lambda: strip_tags(poi_translation.content),
+            "content": lambda: poi_translation.content,
+            "available_languages": lambda: poi_translation.available_languages_dict,
+            "icon": lambda: poi.icon.url if poi.icon else None,
+            "thumbnail": lambda: poi.icon.thumbnail_url if poi.icon else None,
+            "website": lambda: poi.website or None,
+            "email": lambda: poi.email or None,
+            "phone_number": lambda: poi.phone_number or None,
+            "category": lambda: transform_location_category(
+                poi.category, poi_translation.language.slug
+            ),
+            "temporarily_closed": lambda: poi.temporarily_closed,
+            # Only return opening hours if not temporarily closed and they differ from the default value
+            "opening_hours": lambda: poi.opening_hours
+            if not poi.temporarily_closed
+            and poi.opening_hours != get_default_opening_hours()
+            else None,
+            "appointment_url": lambda: poi.appointment_url or None,
+            "location": lambda: transform_poi(poi),
+            "hash": lambda: None,
+            "organization": lambda: {
+                "id": poi.organization.id,
+                "slug": poi.organization.slug,
+                "name": poi.organization.name,
+                "logo": poi.organization.icon.url,
+                "website": poi.organization.website,
+            }
+            if poi.organization
+            else None,
+            "barrier_free": lambda: poi.barrier_free,
+        },
+    )
+
+
+def parse_coordinates(value: str, count: int) -> list[float]:
+    """
+    Parse a comma-separated list of coordinates
+
+    :param value: The value of the query parameter
+    :param count: The expected number of coordinates
+    :raises ValueError: When the value does not consist of the given number of finite numbers
+    :return: The coordinates
+    """
+    coordinates = [float(coordinate) for coordinate in value.split(",")]
+    if len(coordinates) != count or not all(map(math.isfinite, coordinates)):
+        raise ValueError
+    return coordinates
+
+
+def parse_bounding_box(value: str, region: Region) -> BoundingBox:
+    """
+    Parse the ``bbox`` query parameter of the locations endpoint
+
+    :param value: The value of the query parameter
+    :param region: The requested region (the bounding box has to overlap with its bounding box)
+    :raises ValueError: When the bounding box is invalid
+    :return: The bounding box
+    """
+    try:
+        longitude_min, latitude_min, longitude_max, latitude_max = parse_coordinates(
+            value, 4
+        )
+    except ValueError as e:
+        raise ValueError(
+            "The bounding box must be in the format longitude_min,latitude_min,longitude_max,latitude_max."
+        ) from e
+    if latitude_min > latitude_max or longitude_min > longitude_max:
+        raise ValueError(
+            "The minimum coordinates of the bounding box must not be greater than the maximum coordinates."
+        )
+    bounding_box = BoundingBox(latitude_min, latitude_max, longitude_min, longitude_max)
+    if not region.bounding_box.intersects(bounding_box):
+        raise ValueError(
+            "The bounding box does not overlap with the bounding box of the region."
+        )
+    return bounding_box
+
+
+def parse_point(value: str, region: Region) -> tuple[float, float]:
+    """
+    Parse the ``near`` query parameter of the locations endpoint
+
+    :param value: The value of the query parameter
+    :param region: The requested region (the point has to lie within its bounding box)
+    :raises ValueError: When the point is invalid
+    :return: The latitude and longitude of the point
+    """
+    try:
+        latitude, longitude = parse_coordinates(value, 2)
+    except ValueError as e:
+        raise ValueError("The point must be in the format latitude,longitude.") from e
+    if not region.bounding_box.contains(latitude, longitude):
+        raise ValueError("The point must lie within the bounding box of the region.")
+    return latitude, longitude
+
+
+def parse_location_area_parameters(
+    params: QueryDict, region: Region
+) -> tuple[BoundingBox | None, tuple[float, float] | None, float | None, int | None]:
+    """
+    Parse the ``bbox``, ``near``, ``radius`` and ``limit`` query parameters of the locations endpoint
+
+    :param params: The query parameters
+    :param region: The requested region (the coordinates have to lie within its bounding box)
+    :raises ValueError: When one of the parameters is invalid
+    :return: The requested bounding box, the point whose nearest locations are requested, the maximum distance to this
+             point in meters and the maximum number of results
+    """
+    bounding_box = (
+        parse_bounding_box(params["bbox"], region) if "bbox" in params else None
+    )
+    near = parse_point(params["near"], region) if "near" in params else None
+    radius = None
+    if "radius" in params:
+        if not near:
+            raise ValueError("The radius can only be used in combination with a point.")
+        try:
+            radius = float(params["radius"])
+        except ValueError as e:
+            raise ValueError("The radius must be a positive number of meters.") from e
+        if not math.isfinite(radius) or radius <= 0:
+            raise ValueError("The radius must be a positive number of meters.")
+    return bounding_box, near, radius, parse_limit(params)
+
+
+def filter_pois_in_bounding_box(
+    pois: QuerySet[POI], bounding_box: BoundingBox
+) -> QuerySet[POI]:
+    """
+    Filter the locations whose coordinates lie within the given bounding box.
+    The candidates are determined by searching the prefixes of the cells which cover the box in the indexed geohashes
+    (see :mod:`~integreat_cms.cms.utils.geo_utils`).
+
+    :param pois: The locations
+    :param bounding_box: The bounding box
+    :return: The filtered locations
+    """
+    if not (prefixes := get_geohash_prefixes(bounding_box)):
+        # The bounding box is empty
+        return pois.none()
+    return pois.filter(
+        reduce(operator.or_, (Q(geohash__startswith=prefix) for prefix in prefixes)),
+        latitude__range=(bounding_box.latitude_min, bounding_box.latitude_max),
+        longitude__range=(bounding_box.longitude_min, bounding_box.longitude_max),
+    )
+
+
+def sort_pois_by_distance(
+    pois: Iterable[POI], latitude: float, longitude: float, radius: float | None
+) -> list[POI]:
+    """
+    Sort the locations by their distance to the given point
+
+    :param pois: The locations
+    :param latitude: The latitude of the point
+    :param longitude: The longitude of the point
+    :param radius: The maximum distance of the returned locations in meters (or ``None`` for all locations)
+    :return: The locations within the radius, ordered by their distance to the point
+    """
+    distances = [
+        (get_distance(latitude, longitude, poi.latitude, poi.longitude), poi)
+        for poi in pois
+    ]
+    return [
+        poi
+        for distance, poi in sorted(distances, key=operator.itemgetter(0))
+        if radius is None or distance <= radius
+    ]
+
+
+def get_public_translations(
+    pois: Iterable[POI], language_slug: str
+) -> Iterator[POITranslation]:
+    """
+    Get the public translations of the given locations in the given language
+
+    :param pois: The locations
+    :param language_slug: The slug of the requested language
+    :return: An iterator over the public translations, skipping the locations which are not translated
+    """
+    for poi in pois:
+        if translation := poi.get_public_translation(language_slug):
+            yield translation
 
 
 @json_response
+@conditional_response(LOCATIONS)
+@materialized_response(LOCATIONS)
 # pylint: disable=unused-argument
 def locations(
     request: HttpRequest, region_slug: str, language_slug: str
-) -> JsonResponse:
+) -> JsonResponse | StreamingJsonResponse:
     """
     List all POIs of the region and transform result into JSON
 
@@ -127,7 +308,7 @@ def locations(
     region = request.region
     # Throw a 404 error when the language does not exist or is disabled
     region.get_language_or_404(language_slug, only_active=True)
-    result = []
+    fields = parse_fields(request.GET)
     pois = (
         region.pois.prefetch_public_translations()
         .filter(
@@ -138,13 +319,14 @@ def locations(
         )
         .distinct()
         .select_related("category", "organization__icon")
-        .prefetch_related(
+    )
+    if fields is None or "category" in fields:
+        pois = pois.prefetch_related(
             Prefetch(
                 "category__translations",
                 queryset=POICategoryTranslation.objects.select_related("language"),
             )
         )
-    )
 
     if "on_map" in request.GET:
         try:
@@ -153,10 +335,56 @@ def locations(
             return JsonResponse({"error": str(e)}, status=400)
         pois = pois.filter(location_on_map=location_on_map)
 
-    for poi in pois:
-        if translation := poi.get_public_translation(language_slug):
-            result.append(transform_poi_translation(translation))
+    try:
+        bounding_box, near, radius, limit = parse_location_area_parameters(
+            request.GET, region
+        )
+        after = parse_cursor(request.GET, 1)
+        if near and after:
+            raise ValueError("The cursor can only be used without a point.")
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if near and radius:
+        # Only search the locations within the bounding box of the circle
+        circle_bounding_box = get_bounding_box_around(*near, radius)
+        bounding_box = (
+            BoundingBox(
+                max(bounding_box.latitude_min, circle_bounding_box.latitude_min),
+                min(bounding_box.latitude_max, circle_bounding_box.latitude_max),
+                max(bounding_box.longitude_min, circle_bounding_box.longitude_min),
+                min(bounding_box.longitude_max, circle_bounding_box.longitude_max),
+            )
+            if bounding_box
+            else circle_bounding_box
+        )
+    if bounding_box:
+        pois = filter_pois_in_bounding_box(pois, bounding_box)
 
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+    if near:
+        return list_response(
+            transform_poi_translation(translation, fields)
+            for translation in islice(
+                get_public_translations(
+                    sort_pois_by_distance(
+                        iterate_in_chunks(
+                            pois.filter(latitude__isnull=False, longitude__isnull=False)
+                        ),
+                        *near,
+                        radius,
+                    ),
+                    language_slug,
+                ),
+                limit,
+            )
+        )
+    if after:
+        pois = pois.filter(id__gt=after[0])
+    return paginated_list_response(
+        request,
+        get_public_translations(iterate_in_chunks(pois), language_slug),
+        partial(transform_poi_translation, fields=fields),
+        # The locations are ordered by their id
+        lambda translation: (translation.poi_id,),
+        limit,
+        after,
+    )
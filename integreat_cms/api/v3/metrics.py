@@ -0,0 +1,57 @@
+"""
+This module includes the endpoint which exposes the metrics of the CMS in the Prometheus text format (see
+:mod:`~integreat_cms.core.utils.metrics`).
+"""
+from __future__ import annotations
+
+import hmac
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from ...core.utils.metrics import get_registry
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.http import HttpRequest
+
+#: The addresses from which the metrics can be accessed without token
+LOCAL_ADDRESSES: Final[set[str]] = {"127.0.0.1", "::1"}
+
+
+def has_metrics_access(request: HttpRequest) -> bool:
+    """
+    Check whether the request is allowed to access the metrics
+
+    :param request: The current request
+    :return: Whether the request contains the metrics token or comes from localhost if no token is configured
+    """
+    if not settings.METRICS_TOKEN:
+        return request.META.get("REMOTE_ADDR") in LOCAL_ADDRESSES
+    return hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    )
+
+
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Expose the metrics of all processes
+
+    :param request: The current request
+    :raises ~django.http.Http404: When the metrics are disabled
+    :raises ~django.core.exceptions.PermissionDenied: When the request is not allowed to access the metrics
+    :return: The metrics in the Prometheus text format
+    """
+    if not settings.METRICS_ENABLED:
+        raise Http404("The metrics are disabled.")
+    if not has_metrics_access(request):
+        raise PermissionDenied("The request is not allowed to access the metrics.")
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
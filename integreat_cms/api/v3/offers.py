@@ -8,7 +8,8 @@ from typing import TYPE_CHECKING
 from django.http import JsonResponse
 
 from ...cms.constants import postal_code
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response, materialized_response
+from ..utils.content_version_utils import OFFERS
 
 if TYPE_CHECKING:
     from typing import Any
@@ -74,6 +75,8 @@ def transform_offer(offer: OfferTemplate, region: Region) -> dict[str, Any]:
 
 
 @json_response
+@conditional_response(OFFERS)
+@materialized_response(OFFERS)
 # pylint: disable=unused-argument
 def offers(
     request: HttpRequest, region_slug: str, language_slug: str | None = None
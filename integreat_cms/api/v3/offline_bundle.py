@@ -0,0 +1,60 @@
+"""
+This module includes the endpoint which delivers the offline bundle of a language of a region (see
+:mod:`~integreat_cms.api.utils.offline_bundle_utils`).
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.http import JsonResponse
+from django.shortcuts import redirect
+from django.views.decorators.cache import never_cache
+
+from ..decorators import json_response, matomo_tracking
+from ..utils.offline_bundle_utils import (
+    bundle_storage,
+    get_bundle_dir,
+    get_latest_bundle,
+)
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+#: The number of seconds after which clients should request a bundle again which has not been built yet
+RETRY_AFTER: Final[int] = 15 * 60
+
+
+@matomo_tracking
+@json_response
+@never_cache
+# pylint: disable=unused-argument
+def offline_bundle(
+    request: HttpRequest, region_slug: str, language_slug: str
+) -> HttpResponse:
+    """
+    Redirect to the latest offline bundle of the requested language. The bundles are never built while handling the
+    request, but regularly by the management command
+    :mod:`~integreat_cms.core.management.commands.build_offline_bundles`, so the latest bundle can be slightly
+    outdated.
+
+    :param request: The current request
+    :param region_slug: The slug of the requested region
+    :param language_slug: The slug of the requested language
+    :return: The redirect to the archive of the bundle, or status 202 if no bundle has been built yet
+    """
+    region = request.region
+    # Throw a 404 error when the language does not exist or is disabled
+    region.get_language_or_404(language_slug, only_active=True)
+    if not (name := get_latest_bundle(get_bundle_dir(region, language_slug))):
+        logger.debug("No offline bundle of %r in %r yet", language_slug, region)
+        response = JsonResponse(
+            {"error": "The offline bundle has not been built yet."}, status=202
+        )
+        response["Retry-After"] = RETRY_AFTER
+        return response
+    return redirect(bundle_storage.url(name))
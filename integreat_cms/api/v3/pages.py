@@ -5,11 +5,13 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import partial
 from typing import TYPE_CHECKING
+from urllib.parse import unquote, urlsplit
 
 from django.conf import settings
 from django.core.exceptions import MultipleObjectsReturned
-from django.db.models import prefetch_related_objects
+from django.db.models import Exists, OuterRef, prefetch_related_objects, Q
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -18,99 +20,132 @@ from django.utils.text import slugify
 from django.views.decorators.csrf import csrf_exempt
 
 from ...cms.forms import PageTranslationForm
-from ...cms.models import Page
-from ..decorators import json_response, matomo_tracking
+from ...cms.models import Page, PageTranslation
+from ..decorators import (
+    conditional_response,
+    json_response,
+    materialized_response,
+    matomo_tracking,
+)
+from ..utils.content_version_utils import PAGES
+from ..utils.list_query_utils import (
+    paginated_list_response,
+    parse_cursor,
+    parse_fields,
+    parse_limit,
+    select_fields,
+)
 from .offers import transform_offer
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Collection
 
     from django.http import HttpRequest
 
-    from ...cms.models import PageTranslation
+    from ...cms.models import Language, Region
+    from ...cms.models.pages.page import PageQuerySet
+    from ..utils.json_response_utils import StreamingJsonResponse
 
 logger = logging.getLogger(__name__)
 
 
-def transform_page(page_translation: PageTranslation) -> dict[str, Any]:
+def transform_parent(page_translation: PageTranslation) -> dict[str, Any]:
+    """
+    Function to create a dict from the parent of a single page_translation Object.
+
+    :param page_translation: single page translation object
+    :raises ~django.http.Http404: HTTP status 404 if the parent does not have a public translation
+
+    :return: data of the parent necessary for API
+    """
+    parent_page = page_translation.page.cached_parent
+    if not parent_page or parent_page.explicitly_archived:
+        return {
+            "id": 0,
+            "url": None,
+            "path": None,
+        }
+    if parent_public_translation := parent_page.get_public_translation(
+        page_translation.language.slug
+    ):
+        parent_absolute_url = parent_public_translation.get_absolute_url()
+        return {
+            "id": parent_page.id,
+            "url": settings.BASE_URL + parent_absolute_url,
+            "path": parent_absolute_url,
+        }
+    logger.info(
+        "The parent %r of %r does not have a public translation in %r",
+        parent_page,
+        page_translation.page,
+        page_translation.language,
+    )
+    raise Http404("No Page matches the given url or id.")
+
+
+def transform_page(
+    page_translation: PageTranslation, fields: Collection[str] | None = None
+) -> dict[str, Any]:
     """
     Function to create a dict from a single page_translation Object.
 
     :param page_translation: single page translation object
+    :param fields: The names of the fields which should be returned (see
+                   :func:`~integreat_cms.api.utils.list_query_utils.parse_fields`, defaults to all fields)
     :raises ~django.http.Http404: HTTP status 404 if a parent is archived
 
     :return: data necessary for API
     """
-    fallback_parent = {
-        "id": 0,
-        "url": None,
-        "path": None,
-    }
-
-    parent_page = page_translation.page.cached_parent
-    if parent_page and not parent_page.explicitly_archived:
-        if parent_public_translation := parent_page.get_public_translation(
-            page_translation.language.slug
-        ):
-            parent_absolute_url = parent_public_translation.get_absolute_url()
-            parent = {
-                "id": parent_page.id,
-                "url": settings.BASE_URL + parent_absolute_url,
-                "path": parent_absolute_url,
+    page = page_translation.page
+    parent_page = page.cached_parent
+    organization = page.organization
+    return select_fields(
+        fields,
+        {
+            "id": lambda: page_translation.id,
+            "url": lambda: settings.BASE_URL + page_translation.get_absolute_url(),
+            "path": page_translation.get_absolute_url,
+            "title": lambda: page_translation.title,
+            # deprecated field in the future
+            "modified_gmt": lambda: page_translation.combined_last_updated,
+            "last_updated": lambda: timezone.localtime(
+                page_translation.combined_last_updated
+            ),
+            "excerpt": lambda: strip_tags(page_translation.combined_text),
+            "content": lambda: page_translation.combined_text,
+            "parent": lambda: transform_parent(page_translation),
+            # use left edge indicator of mptt model for ordering of child pages and tree id for ordering of root pages
+            "order": lambda: page.lft
+            if parent_page and not parent_page.explicitly_archived
+            else page.tree_id,
+            "available_languages": lambda: page_translation.available_languages_dict,
+            "thumbnail": lambda: page.icon.url if page.icon else None,
+            "organization": lambda: {
+                "id": organization.id,
+                "slug": organization.slug,
+                "name": organization.name,
+                "logo": organization.icon.url,
+                "website": organization.website,
             }
-            # use left edge indicator of mptt model for ordering of child pages
-            order = page_translation.page.lft
-        else:
-            logger.info(
-                "The parent %r of %r does not have a public translation in %r",
-                parent_page,
-                page_translation.page,
-                page_translation.language,
-            )
-            raise Http404("No Page matches the given url or id.")
-    else:
-        parent = fallback_parent
-        # use tree id of mptt model for ordering of root pages
-        order = page_translation.page.tree_id
-
-    organization = page_translation.page.organization
-    absolute_url = page_translation.get_absolute_url()
-    return {
-        "id": page_translation.id,
-        "url": settings.BASE_URL + absolute_url,
-        "path": absolute_url,
-        "title": page_translation.title,
-        "modified_gmt": page_translation.combined_last_updated,  # deprecated field in the future
-        "last_updated": timezone.localtime(page_translation.combined_last_updated),
-        "excerpt": strip_tags(page_translation.combined_text),
-        "content": page_translation.combined_text,
-        "parent": parent,
-        "order": order,
-        "available_languages": page_translation.available_languages_dict,
-        "thumbnail": page_translation.page.icon.url
-        if page_translation.page.icon
-        else None,
-        "organization": {
-            "id": organization.id,
-            "slug": organization.slug,
-            "name": organization.name,
-            "logo": organization.icon.url,
-            "website": organization.website,
-        }
-        if organization
-        else None,
-        "hash": None,
-        "embedded_offers": [
-            transform_offer(offer, page_translation.page.region)
-            for offer in page_translation.page.embedded_offers.all()
-        ],
-    }
+            if organization
+            else None,
+            "hash": lambda: None,
+            "embedded_offers": lambda: [
+                transform_offer(offer, page.region)
+                for offer in page.embedded_offers.all()
+            ],
+        },
+    )
 
 
 @matomo_tracking
 @json_response
+@conditional_response(PAGES)
+@materialized_response(PAGES)
 # pylint: disable=unused-argument
-def pages(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
+def pages(
+    request: HttpRequest, region_slug: str, language_slug: str
+) -> JsonResponse | StreamingJsonResponse:
     """
     Function to iterate through all non-archived pages of a region and return them as JSON.
 
@@ -122,22 +157,94 @@ def pages(request: HttpRequest, region_slug: str, language_slug: str) -> JsonRes
     region = request.region
     # Throw a 404 error when the language does not exist or is disabled
     region.get_language_or_404(language_slug, only_active=True)
-    result = []
+    try:
+        limit = parse_limit(request.GET)
+        after = parse_cursor(request.GET, 2)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    fields = parse_fields(request.GET)
     # The preliminary filter for explicitly_archived=False is not strictly required, but reduces the number of entries
     # requested from the database
-    for page in (
+    region_pages = (
         region.pages.select_related("organization__icon")
-        .prefetch_related(
-            "embedded_offers",
+        .prefetch_paths()
+        .filter(explicitly_archived=False)
+    )
+    if fields is None or "embedded_offers" in fields:
+        region_pages = region_pages.prefetch_related("embedded_offers")
+    if after:
+        # Only complete page trees can be cached, so the pages of the first tree are skipped after caching
+        region_pages = region_pages.filter(tree_id__gte=after[0])
+    return paginated_list_response(
+        request,
+        (
+            page_translation
+            for page in region_pages.cache_tree(
+                archived=False,
+                language_slug=language_slug,
+                translations=("public_translations",),
+            )
+            if (page_translation := page.get_public_translation(language_slug))
+        ),
+        partial(transform_page, fields=fields),
+        # The pages are ordered by their position in the page tree
+        lambda page_translation: (
+            page_translation.page.tree_id,
+            page_translation.page.lft,
+        ),
+        limit,
+        after,
+    )
+
+
+def get_page_path(url: str, region_slug: str, language_slug: str) -> str:
+    """
+    Convert the url of a page into the format of its stored path, which contains the slugs of the page's ancestors and
+    the page itself separated by slashes
+
+    :param url: The url of the page (either absolute or relative to the region and language)
+    :param region_slug: The slug of the region
+    :param language_slug: The slug of the language
+    :return: The path of the page
+    """
+    # Ignore empty path components to avoid ambiguous urls
+    slugs = [
+        slugify(component, allow_unicode=True)
+        for component in unquote(urlsplit(url).path).split("/")
+        if component
+    ]
+    # Strip the region and language of absolute urls
+    if slugs[:2] == [region_slug, language_slug]:
+        slugs = slugs[2:]
+    return "/".join(slugs)
+
+
+def get_available_pages(region: Region, language: Language) -> PageQuerySet:
+    """
+    Get the pages of a region which can be requested in the given language. A page is available if neither the page
+    nor one of its ancestors is archived and all of its ancestors have a public translation in this language.
+    The ancestors are checked in the same query via the nested set fields of the page tree.
+
+    :param region: The region
+    :param language: The requested language
+    :return: The available pages of the region
+    """
+    unavailable_ancestors = Page.objects.filter(
+        tree_id=OuterRef("tree_id"), lft__lt=OuterRef("lft"), rgt__gt=OuterRef("rgt")
+    ).filter(
+        Q(explicitly_archived=True)
+        | ~Exists(
+            PageTranslation.objects.filter(
+                page=OuterRef("pk"), language=language, latest_public=True
+            )
         )
+    )
+    return (
+        region.pages.select_related("organization__icon")
+        .prefetch_related("embedded_offers")
         .filter(explicitly_archived=False)
-        .cache_tree(archived=False, language_slug=language_slug)
-    ):
-        if page_translation := page.get_public_translation(language_slug):
-            result.append(transform_page(page_translation))
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+        .filter(~Exists(unavailable_ancestors))
+    )
 
 
 def get_single_page(request: HttpRequest, language_slug: str) -> Page:
@@ -156,52 +263,47 @@ def get_single_page(request: HttpRequest, language_slug: str) -> Page:
     :return: the requested page
     """
     region = request.region
+    language = region.get_language_or_404(language_slug)
+    available_pages = get_available_pages(region, language)
 
     if request.GET.get("id"):
-        page = get_object_or_404(region.pages, id=request.GET.get("id"))
-
-    elif request.GET.get("url"):
-        # Strip leading and trailing slashes to avoid ambiguous urls
-        url = request.GET.get("url").strip("/")
-        # The last path component of the url is the page translation slug
-        page_translation_slug = slugify(url.split("/")[-1], allow_unicode=True)
-        # Get page by filtering for translation slug and translation language slug
-        filtered_pages = (
-            region.pages.select_related("organization__icon")
-            .prefetch_related("embedded_offers")
-            .filter(
-                translations__slug=page_translation_slug,
-                translations__language__slug=language_slug,
-            )
-            .distinct()
-        )
-
-        if len(filtered_pages) > 1:
-            logger.error(
-                "Page translation slug %r is not unique per region and language, found multiple: %r",
-                page_translation_slug,
-                filtered_pages,
-            )
-            raise MultipleObjectsReturned(
-                "This page translation slug is not unique, please contact your server administrator."
-            )
-        if not filtered_pages:
-            raise Http404("No matching page translation found for url.")
-        page = filtered_pages[0]
+        return get_object_or_404(available_pages, id=request.GET.get("id"))
 
-    else:
+    if not request.GET.get("url"):
         raise RuntimeError("Either the id or the url parameter is required.")
 
-    if page.explicitly_archived:
+    path = get_page_path(request.GET.get("url"), region.slug, language_slug)
+    # Get page by its stored path in the requested language
+    filtered_pages = available_pages.filter(
+        paths__region=region, paths__language=language, paths__path=path
+    )
+    if not filtered_pages:
+        # If the path is not stored (e.g. because the url contains outdated slugs of ancestors), fall back to the
+        # last path component of the url which is the slug of the latest (public) translation
+        page_translation_slug = path.rsplit("/", maxsplit=1)[-1]
+        filtered_pages = available_pages.filter(
+            Q(translations__latest=True) | Q(translations__latest_public=True),
+            translations__slug=page_translation_slug,
+            translations__language=language,
+        ).distinct()
+
+    if len(filtered_pages) > 1:
+        logger.error(
+            "Page url %r is not unique per region and language, found multiple: %r",
+            path,
+            filtered_pages,
+        )
+        raise MultipleObjectsReturned(
+            "This page url is not unique, please contact your server administrator."
+        )
+    if not filtered_pages:
         raise Http404("No matching page translation found for url.")
-
-    # Check if any ancestor is archived -> will raise a 404
-    get_public_ancestor_translations(page, language_slug)
-
-    return page
+    return filtered_pages[0]
 
 
 @json_response
+@conditional_response(PAGES)
+@materialized_response(PAGES)
 # pylint: disable=unused-argument
 def single_page(
     request: HttpRequest, region_slug: str, language_slug: str
@@ -229,6 +331,8 @@ def single_page(
 
 @matomo_tracking
 @json_response
+@conditional_response(PAGES)
+@materialized_response(PAGES)
 def children(
     request: HttpRequest, region_slug: str, language_slug: str
 ) -> JsonResponse:
@@ -258,10 +362,15 @@ def children(
     public_region_pages = (
         request.region.pages.select_related("organization__icon")
         .prefetch_related("embedded_offers")
+        .prefetch_paths()
         .filter(
             explicitly_archived=False, tree_id__in=[page.tree_id for page in root_pages]
         )
-        .cache_tree(archived=False, language_slug=language_slug)
+        .cache_tree(
+            archived=False,
+            language_slug=language_slug,
+            translations=("public_translations",),
+        )
     )
     for root in root_pages:
         descendants = root.get_tree_max_depth(max_depth=depth)
@@ -274,6 +383,8 @@ def children(
 
 
 @json_response
+@conditional_response(PAGES)
+@materialized_response(PAGES)
 # pylint: disable=unused-argument
 def parents(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
     """
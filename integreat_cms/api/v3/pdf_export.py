@@ -8,34 +8,90 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from django.http import Http404
+from django.conf import settings
+from django.http import Http404, HttpResponse, JsonResponse
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+from django.views.decorators.cache import never_cache
 
 from ...cms.models import Page
-from ...cms.utils.pdf_utils import generate_pdf
+from ...cms.utils.pdf_job_utils import (
+    DONE,
+    FAILED,
+    get_pdf_job,
+    is_lost,
+    read_job,
+    submit_job,
+)
+from ...cms.utils.pdf_utils import (
+    generate_pdf,
+    get_pdf_filename,
+    get_pdf_redirect,
+    pdf_storage,
+)
 from ..decorators import json_response
 
 if TYPE_CHECKING:
+    from typing import Any, Final
+
     from django.http import HttpRequest, HttpResponseRedirect
 
 logger = logging.getLogger(__name__)
 
+#: The number of seconds after which clients should poll unfinished PDF jobs again
+RETRY_AFTER: Final[int] = 2
+
+
+def get_job_response(
+    region_slug: str, language_slug: str, job_id: str, job: dict[str, Any]
+) -> HttpResponse:
+    """
+    Get the response for the current state of a PDF job
+
+    :param region_slug: Slug defining the region
+    :param language_slug: current language slug
+    :param job_id: The id of the job
+    :param job: The job
+    :return: The redirect to the PDF document if it is finished, otherwise the state of the job
+    """
+    if job["status"] == DONE:
+        return get_pdf_redirect(job["filename"])
+    if job["status"] == FAILED:
+        return JsonResponse(
+            {"status": FAILED, "error": "The PDF could not be generated."}, status=500
+        )
+    job_url = reverse(
+        "api:pdf_job",
+        kwargs={
+            "region_slug": region_slug,
+            "language_slug": language_slug,
+            "job_id": job_id,
+        },
+    )
+    response = JsonResponse({"status": job["status"], "url": job_url}, status=202)
+    response["Location"] = job_url
+    response["Retry-After"] = RETRY_AFTER
+    return response
+
 
 @json_response
-# pylint: disable=unused-argument
+@never_cache
 def pdf_export(
     request: HttpRequest, region_slug: str, language_slug: str
-) -> HttpResponseRedirect:
+) -> HttpResponse:
     """
     View function that either returns the requested page specified by the
-    url parameter or returns all pages of current region and language as PDF document
-    by forwarding the request to :func:`~integreat_cms.cms.utils.pdf_utils.generate_pdf`
+    url parameter or returns all pages of current region and language as PDF document.
+    If the document does not exist yet, it is rendered in the background (see
+    :mod:`~integreat_cms.cms.utils.pdf_job_utils`) and the url of the job is returned. If background jobs are disabled,
+    the request is forwarded to :func:`~integreat_cms.cms.utils.pdf_utils.generate_pdf`.
 
     :param request: request that was sent to the server
     :param region_slug: Slug defining the region
     :param language_slug: current language slug
     :raises ~django.http.Http404: HTTP status 404 if the requested page translation cannot be found.
 
-    :return: The redirect to the generated PDF document
+    :return: The redirect to the generated PDF document or the state of the job which generates it
     """
     region = request.region
     # Request unrestricted queryset because pdf generator performs further operations (e.g. aggregation) on the queryset
@@ -52,7 +108,45 @@ def pdf_export(
         ).distinct()
         if len(page) != 1:
             raise Http404("No matching page translation found for url.")
-        pages = Page.get_tree(page[0]).prefetch_public_translations()
-    else:
-        pages = pages.prefetch_public_translations()
-    return generate_pdf(region, language_slug, pages)
+        pages = Page.get_tree(page[0])
+    # Only the translations in the requested language are rendered
+    pages = pages.prefetch_public_translations(language_slugs=[language_slug])
+    if not settings.PDF_JOB_WORKERS:
+        return generate_pdf(region, language_slug, pages)
+    if not (result := get_pdf_filename(region, language_slug, pages)):
+        return HttpResponse(
+            _("No valid pages selected for PDF generation."), status=400
+        )
+    filename, pages = result
+    if pdf_storage.exists(filename):
+        return get_pdf_redirect(filename)
+    job_id, job = get_pdf_job(region, language_slug, pages, filename)
+    return get_job_response(region_slug, language_slug, job_id, job)
+
+
+@json_response
+@never_cache
+def pdf_job(
+    request: HttpRequest, region_slug: str, language_slug: str, job_id: str
+) -> HttpResponse:
+    """
+    View function that returns the state of a PDF job which was created by :func:`pdf_export`
+
+    :param request: request that was sent to the server
+    :param region_slug: Slug defining the region
+    :param language_slug: current language slug
+    :param job_id: The id of the job
+    :raises ~django.http.Http404: HTTP status 404 if the job does not exist.
+
+    :return: The redirect to the generated PDF document or the state of the job
+    """
+    job = read_job(job_id)
+    if (
+        not job
+        or job.get("region") != request.region.slug
+        or job.get("language") != language_slug
+    ):
+        raise Http404("No matching PDF job found.")
+    if job["status"] != FAILED and is_lost(job):
+        submit_job(job_id, job)
+    return get_job_response(region_slug, language_slug, job_id, job)
@@ -3,25 +3,44 @@ This module includes functions related to the push notification that are sent vi
 """
 from __future__ import annotations
 
+import datetime
+from functools import partial
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.db.models import Q
 from django.http import JsonResponse
 from django.utils import timezone
 
 from ...cms.models import PushNotificationTranslation
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
+from ..utils.content_version_utils import PUSH_NOTIFICATIONS
+from ..utils.list_query_utils import (
+    paginated_list_response,
+    parse_cursor,
+    parse_fields,
+    parse_limit,
+    select_fields,
+)
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Collection, Final
 
     from django.http import HttpRequest
 
+    from ..utils.json_response_utils import StreamingJsonResponse
+
+#: The reference date of the cursors of the push notifications
+EPOCH: Final[datetime.datetime] = datetime.datetime(
+    1970, 1, 1, tzinfo=datetime.timezone.utc
+)
+
 
 @json_response
+@conditional_response(PUSH_NOTIFICATIONS, time_dependent=True)
 def sent_push_notifications(
     request: HttpRequest, region_slug: str, language_slug: str
-) -> JsonResponse:
+) -> JsonResponse | StreamingJsonResponse:
     """
     Function to iterate through all sent push notifications related to a region and adds them to a JSON.
 
@@ -30,6 +49,11 @@ def sent_push_notifications(
     :param language_slug: language slug
     :return: JSON object according to APIv3 push notifications definition
     """
+    try:
+        limit = parse_limit(request.GET)
+        after = parse_cursor(request.GET, 2)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
     channel = request.GET.get("channel", "all")
     query_result = (
         PushNotificationTranslation.objects.filter(
@@ -41,26 +65,58 @@ def sent_push_notifications(
         )
         .filter(language__slug=language_slug)
         .filter(push_notification__draft=False)
-        .order_by("-last_updated")
+        .select_related("push_notification")
+        .order_by("-last_updated", "-id")
     )
     if channel != "all":
         query_result = query_result.filter(push_notification__channel=channel)
-    result = list(map(transform_notification, query_result))
-    return JsonResponse(result, safe=False)
+    if after:
+        last_updated = EPOCH + datetime.timedelta(microseconds=-after[0])
+        query_result = query_result.filter(
+            Q(last_updated__lt=last_updated)
+            | Q(last_updated=last_updated, id__lt=-after[1])
+        )
+    return paginated_list_response(
+        request,
+        query_result,
+        partial(transform_notification, fields=parse_fields(request.GET)),
+        get_sort_key,
+        limit,
+        after,
+    )
 
 
-def transform_notification(pnt: PushNotificationTranslation) -> dict[str, Any]:
+def get_sort_key(pnt: PushNotificationTranslation) -> tuple[int, int]:
+    """
+    Get the sort key of a push notification translation which is used as cursor for the pagination.
+    The notifications are ordered by descending date, so the components of the key are negated.
+
+    :param pnt: A push notification translation
+    :return: The negated microseconds since :data:`EPOCH` and the negated id
+    """
+    return -((pnt.last_updated - EPOCH) // datetime.timedelta(microseconds=1)), -pnt.id
+
+
+def transform_notification(
+    pnt: PushNotificationTranslation, fields: Collection[str] | None = None
+) -> dict[str, Any]:
     """
     Function to create a JSON from a single push notification translation Object.
 
     :param pnt: A push notification translation
+    :param fields: The names of the fields which should be returned (see
+                   :func:`~integreat_cms.api.utils.list_query_utils.parse_fields`, defaults to all fields)
     :return: data necessary for API
     """
-    return {
-        "id": str(pnt.pk),
-        "title": pnt.get_title(),
-        "message": pnt.get_text(),
-        "timestamp": pnt.last_updated,  # deprecated field in the future
-        "last_updated": timezone.localtime(pnt.last_updated),
-        "channel": pnt.push_notification.channel,
-    }
+    return select_fields(
+        fields,
+        {
+            "id": lambda: str(pnt.pk),
+            "title": pnt.get_title,
+            "message": pnt.get_text,
+            # deprecated field in the future
+            "timestamp": lambda: pnt.last_updated,
+            "last_updated": lambda: timezone.localtime(pnt.last_updated),
+            "channel": lambda: pnt.push_notification.channel,
+        },
+    )
@@ -13,7 +13,8 @@ if TYPE_CHECKING:
 
 from ...cms.constants import region_status
 from ...cms.models import Region
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
+from ..utils.content_version_utils import REGIONS
 from .languages import transform_language
 
 
@@ -47,6 +48,7 @@ def transform_region(region: Region) -> dict[str, Any]:
 
 
 @json_response
+@conditional_response(REGIONS)
 def regions(_: HttpRequest) -> JsonResponse:
     """
     List all regions that are not archived and transform result into JSON
@@ -62,6 +64,7 @@ def regions(_: HttpRequest) -> JsonResponse:
 
 
 @json_response
+@conditional_response(REGIONS)
 # pylint: disable=unused-argument
 def region_by_slug(request: HttpRequest, region_slug: str) -> JsonResponse:
     """
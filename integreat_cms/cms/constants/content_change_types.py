@@ -0,0 +1,32 @@
+"""
+This module contains the types of content whose changes are recorded for the delta sync of the API
+(see :class:`~integreat_cms.cms.models.content_changes.content_change.ContentChange`).
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.utils.translation import gettext_lazy as _
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.utils.functional import Promise
+
+
+#: Page
+PAGE: Final = "PAGE"
+#: Event
+EVENT: Final = "EVENT"
+#: Location
+POI: Final = "POI"
+#: Imprint
+IMPRINT: Final = "IMPRINT"
+
+#: Choices to use these constants in a database field
+CHOICES: Final[list[tuple[str, Promise]]] = [
+    (PAGE, _("Page")),
+    (EVENT, _("Event")),
+    (POI, _("Location")),
+    (IMPRINT, _("Imprint")),
+]
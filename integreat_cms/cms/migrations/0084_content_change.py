@@ -0,0 +1,88 @@
+# Generated by Django 3.2.23 on 2026-10-18 05:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add model to record content changes for the delta sync of the API
+    """
+
+    dependencies = [
+        ("cms", "0083_add_page_based_offer_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.CharField(
+                        choices=[
+                            ("PAGE", "Page"),
+                            ("EVENT", "Event"),
+                            ("POI", "Location"),
+                            ("IMPRINT", "Imprint"),
+                        ],
+                        max_length=7,
+                        verbose_name="content type",
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField(verbose_name="object id")),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="modification date",
+                    ),
+                ),
+                (
+                    "removed",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the content object was deleted or archived",
+                        verbose_name="removed",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="content_changes",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "content change",
+                "verbose_name_plural": "content changes",
+                "ordering": ["timestamp"],
+                "default_permissions": (),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="contentchange",
+            index=models.Index(
+                fields=["region", "timestamp"], name="cms_content_region__8a9298_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="contentchange",
+            constraint=models.UniqueConstraint(
+                fields=("content_type", "object_id"), name="contentchange_unique_object"
+            ),
+        ),
+    ]
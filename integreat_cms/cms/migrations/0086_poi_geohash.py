@@ -0,0 +1,53 @@
+# Generated by Django 3.2.23 on 2026-10-18 06:01
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import migrations, models
+
+from ..utils.geo_utils import encode_geohash
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+# pylint: disable=unused-argument
+def set_geohashes(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """
+    Set the geohash of all existing POIs with coordinates
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    POI = apps.get_model("cms", "POI")
+    pois = POI.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    for poi in pois:
+        poi.geohash = encode_geohash(poi.latitude, poi.longitude)
+    POI.objects.bulk_update(pois, ["geohash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    """
+    Add indexed geohash to POIs to allow efficient spatial queries
+    """
+
+    dependencies = [
+        ("cms", "0085_event_occurrence"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="poi",
+            name="geohash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=12,
+                verbose_name="geohash",
+            ),
+        ),
+        migrations.RunPython(set_geohashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,235 @@
+# Generated by Django 3.2.23 on 2026-10-18 06:07
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import migrations, models
+
+from ..constants import status
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+#: The flags of the latest versions and the filters which define them
+LATEST_VERSION_FLAGS = {
+    "latest": {},
+    "latest_public": {"status": status.PUBLIC},
+    "latest_major": {"minor_edit": False},
+    "latest_major_public": {"status": status.PUBLIC, "minor_edit": False},
+}
+
+
+# pylint: disable=unused-argument
+def mark_latest_versions(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """
+    Mark the latest versions of all existing translations
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    for model_name, foreign_field in [
+        ("EventTranslation", "event_id"),
+        ("ImprintPageTranslation", "page_id"),
+        ("PageTranslation", "page_id"),
+        ("POITranslation", "poi_id"),
+    ]:
+        model = apps.get_model("cms", model_name)
+        for flag, filters in LATEST_VERSION_FLAGS.items():
+            model.objects.filter(
+                id__in=model.objects.filter(**filters)
+                .order_by(foreign_field, "language_id", "-version")
+                .distinct(foreign_field, "language_id")
+                .values("id")
+            ).update(**{flag: True})
+
+
+class Migration(migrations.Migration):
+    """
+    Add flags to mark the latest versions of translations
+    """
+
+    dependencies = [
+        ("cms", "0086_poi_geohash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventtranslation",
+            name="latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventtranslation",
+            name="latest_major",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest major version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventtranslation",
+            name="latest_major_public",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                verbose_name="latest major public version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventtranslation",
+            name="latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpagetranslation",
+            name="latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpagetranslation",
+            name="latest_major",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest major version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpagetranslation",
+            name="latest_major_public",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                verbose_name="latest major public version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpagetranslation",
+            name="latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="pagetranslation",
+            name="latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="pagetranslation",
+            name="latest_major",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest major version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="pagetranslation",
+            name="latest_major_public",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                verbose_name="latest major public version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="pagetranslation",
+            name="latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="poitranslation",
+            name="latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="poitranslation",
+            name="latest_major",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest major version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="poitranslation",
+            name="latest_major_public",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                verbose_name="latest major public version",
+            ),
+        ),
+        migrations.AddField(
+            model_name="poitranslation",
+            name="latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.RunPython(mark_latest_versions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="eventtranslation",
+            index=models.Index(
+                condition=models.Q(
+                    ("latest", True),
+                    ("latest_public", True),
+                    ("latest_major", True),
+                    ("latest_major_public", True),
+                    _connector="OR",
+                ),
+                fields=["event", "language"],
+                name="eventtranslation_latest",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="imprintpagetranslation",
+            index=models.Index(
+                condition=models.Q(
+                    ("latest", True),
+                    ("latest_public", True),
+                    ("latest_major", True),
+                    ("latest_major_public", True),
+                    _connector="OR",
+                ),
+                fields=["page", "language"],
+                name="imprintpagetranslation_latest",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetranslation",
+            index=models.Index(
+                condition=models.Q(
+                    ("latest", True),
+                    ("latest_public", True),
+                    ("latest_major", True),
+                    ("latest_major_public", True),
+                    _connector="OR",
+                ),
+                fields=["page", "language"],
+                name="pagetranslation_latest",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poitranslation",
+            index=models.Index(
+                condition=models.Q(
+                    ("latest", True),
+                    ("latest_public", True),
+                    ("latest_major", True),
+                    ("latest_major_public", True),
+                    _connector="OR",
+                ),
+                fields=["poi", "language"],
+                name="poitranslation_latest",
+            ),
+        ),
+    ]
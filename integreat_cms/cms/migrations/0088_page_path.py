@@ -0,0 +1,150 @@
+# Generated by Django 3.2.23 on 2026-10-18 06:16
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+def get_slugs(apps: Apps) -> dict[int, dict[int, str]]:
+    """
+    Get the slugs of the latest public translations or the latest translations of all pages in all languages
+
+    :param apps: The configuration of installed applications
+    :return: A mapping from page ids to the slugs of the pages by language id
+    """
+    PageTranslation = apps.get_model("cms", "PageTranslation")
+    slugs: dict[int, dict[int, str]] = {}
+    for flag in ["latest_public", "latest"]:
+        for page_id, language_id, slug in PageTranslation.objects.filter(
+            **{flag: True}
+        ).values_list("page_id", "language_id", "slug"):
+            slugs.setdefault(page_id, {}).setdefault(language_id, slug)
+    return slugs
+
+
+# pylint: disable=unused-argument
+def set_page_paths(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """
+    Store the paths of all existing pages
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    LanguageTreeNode = apps.get_model("cms", "LanguageTreeNode")
+    Page = apps.get_model("cms", "Page")
+    PagePath = apps.get_model("cms", "PagePath")
+    default_language_ids = dict(
+        LanguageTreeNode.objects.filter(parent__isnull=True).values_list(
+            "region_id", "language_id"
+        )
+    )
+    slugs = get_slugs(apps)
+    ancestors: dict[int, list[int]] = {}
+    paths = []
+    for page_id, parent_id, region_id in Page.objects.order_by(
+        "tree_id", "lft"
+    ).values_list("id", "parent_id", "region_id"):
+        # The parents are processed before their children
+        ancestors[page_id] = [*ancestors[parent_id], parent_id] if parent_id else []
+        for language_id, slug in slugs.get(page_id, {}).items():
+            ancestor_path = "/".join(
+                slugs[ancestor_id].get(language_id)
+                or slugs[ancestor_id].get(default_language_ids.get(region_id))
+                or next(iter(slugs[ancestor_id].values()))
+                for ancestor_id in ancestors[page_id]
+            )
+            paths.append(
+                PagePath(
+                    page_id=page_id,
+                    language_id=language_id,
+                    region_id=region_id,
+                    ancestor_path=ancestor_path,
+                    path=f"{ancestor_path}/{slug}" if ancestor_path else slug,
+                )
+            )
+    PagePath.objects.bulk_create(paths, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    """
+    Add a model to store the translated url paths of pages
+    """
+
+    dependencies = [
+        ("cms", "0087_translation_latest_versions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PagePath",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ancestor_path",
+                    models.TextField(blank=True, verbose_name="ancestor path"),
+                ),
+                ("path", models.TextField(verbose_name="path")),
+                (
+                    "language",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="page_paths",
+                        to="cms.language",
+                        verbose_name="language",
+                    ),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="paths",
+                        to="cms.page",
+                        verbose_name="page",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="page_paths",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "page path",
+                "verbose_name_plural": "page paths",
+                "default_permissions": (),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="pagepath",
+            index=models.Index(
+                fields=["region", "language", "path"],
+                name="cms_pagepat_region__d0eaa2_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="pagepath",
+            constraint=models.UniqueConstraint(
+                fields=("page", "language"), name="pagepath_unique_language"
+            ),
+        ),
+        migrations.RunPython(set_page_paths, migrations.RunPython.noop),
+    ]
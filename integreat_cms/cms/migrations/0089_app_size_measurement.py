@@ -0,0 +1,75 @@
+# Generated by Django 3.2.23 on 2026-10-18 06:50
+
+from __future__ import annotations
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add a model to store the history of the app size
+    """
+
+    dependencies = [
+        ("cms", "0088_page_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppSizeMeasurement",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "date",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="date"
+                    ),
+                ),
+                ("sizes", models.JSONField(default=dict, verbose_name="sizes")),
+                (
+                    "largest_items",
+                    models.JSONField(default=list, verbose_name="largest items"),
+                ),
+                (
+                    "language",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="app_size_measurements",
+                        to="cms.language",
+                        verbose_name="language",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="app_size_measurements",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "app size measurement",
+                "verbose_name_plural": "app size measurements",
+                "ordering": ["-date"],
+                "default_permissions": (),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="appsizemeasurement",
+            index=models.Index(
+                fields=["region", "date"], name="cms_appsize_region__b584f0_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 3.2.23 on 2026-10-18 07:07
+
+from __future__ import annotations
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add a model to store the manifest of the generated PDF documents
+    """
+
+    dependencies = [
+        ("cms", "0089_app_size_measurement"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PdfDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "filename",
+                    models.CharField(
+                        max_length=512, unique=True, verbose_name="filename"
+                    ),
+                ),
+                ("size", models.PositiveBigIntegerField(verbose_name="size")),
+                (
+                    "created_date",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="creation date"
+                    ),
+                ),
+                (
+                    "last_accessed",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="last accessed"
+                    ),
+                ),
+                (
+                    "language",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pdf_documents",
+                        to="cms.language",
+                        verbose_name="language",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pdf_documents",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "PDF document",
+                "verbose_name_plural": "PDF documents",
+                "ordering": ["-last_accessed"],
+                "default_permissions": (),
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.23 on 2026-10-18 07:40
+
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add a field to mark push notifications which are being sent
+    """
+
+    dependencies = [
+        ("cms", "0090_pdf_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pushnotification",
+            name="sending_date",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The date and time when sending the News was started.",
+                null=True,
+                verbose_name="sending date",
+            ),
+        ),
+    ]
@@ -5,7 +5,9 @@ Please refer to :mod:`django.db.models` for general information about Django mod
 from __future__ import annotations
 
 from .chat.chat_message import ChatMessage
+from .content_changes.content_change import ContentChange
 from .events.event import Event
+from .events.event_occurrence import EventOccurrence
 from .events.event_translation import EventTranslation
 from .events.recurrence_rule import RecurrenceRule
 from .feedback.event_feedback import EventFeedback
@@ -27,7 +29,9 @@ from .offers.offer_template import OfferTemplate
 from .pages.imprint_page import ImprintPage
 from .pages.imprint_page_translation import ImprintPageTranslation
 from .pages.page import Page
+from .pages.page_path import PagePath
 from .pages.page_translation import PageTranslation
+from .pages.pdf_document import PdfDocument
 from .poi_categories.poi_category import POICategory
 from .poi_categories.poi_category_translation import POICategoryTranslation
 from .pois.poi import POI
@@ -36,6 +40,7 @@ from .push_notifications.push_notification import PushNotification
 from .push_notifications.push_notification_translation import (
     PushNotificationTranslation,
 )
+from .regions.app_size_measurement import AppSizeMeasurement
 from .regions.region import Region
 from .users.organization import Organization
 from .users.role import Role
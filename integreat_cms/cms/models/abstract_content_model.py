@@ -11,13 +11,14 @@ from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 if TYPE_CHECKING:
-    from typing import Any, Iterator
+    from typing import Any, Iterable, Iterator
     from .languages.language import Language
     from .abstract_content_translation import AbstractContentTranslation
 
 from ..constants import status, translation_status
 from ..utils.content_edit_lock import get_locking_user
 from .abstract_base_model import AbstractBaseModel
+from .abstract_content_translation import get_latest_version_flag
 from .regions.region import Region
 
 logger = logging.getLogger(__name__)
@@ -29,79 +30,103 @@ class ContentQuerySet(models.QuerySet):
     """
 
     def prefetch_translations(
-        self, to_attr: str = "prefetched_translations", **filters: Any
+        self,
+        to_attr: str = "prefetched_translations",
+        language_slugs: Iterable[str] | None = None,
+        **filters: Any,
     ) -> ContentQuerySet:
         r"""
         Get the queryset including the custom attribute ``to_attr`` which contains the latest
         translations of each content object in each language, optionally filtered by the given ``status``
 
         :param to_attr: To which attribute the prefetched translations should be added [optional, defaults to ``prefetched_translations``]
+        :param language_slugs: Only prefetch the translations in these languages [optional, defaults to all languages]
         :param \**filters: Additional filters to be applied on the translations (e.g. by status)
         :return: The queryset of content objects
         """
         TranslationModel = self.model.get_translation_model()
         foreign_field = TranslationModel.foreign_field() + "_id"
+        # Use the flags of the latest versions instead of sorting the whole version history if possible
+        translations = (
+            TranslationModel.objects.filter(**{flag: True}).order_by(
+                foreign_field, "language_id"
+            )
+            if (flag := get_latest_version_flag(**filters))
+            else TranslationModel.objects.filter(**filters)
+            .order_by(foreign_field, "language_id", "-version")
+            .distinct(foreign_field, "language_id")
+        )
+        if language_slugs is not None:
+            translations = translations.filter(language__slug__in=language_slugs)
         return self.prefetch_related(
             models.Prefetch(
                 "translations",
-                queryset=TranslationModel.objects.filter(**filters)
-                .order_by(foreign_field, "language_id", "-version")
-                .distinct(foreign_field, "language_id")
-                .select_related("language"),
+                queryset=translations.select_related("language"),
                 to_attr=to_attr,
             )
         )
 
     def prefetch_public_translations(
-        self,
+        self, language_slugs: Iterable[str] | None = None
     ) -> ContentQuerySet:
         """
         Get the queryset including the custom attribute ``prefetched_public_translations`` which contains the latest
         public translations of each content object in each language
 
+        :param language_slugs: Only prefetch the translations in these languages [optional, defaults to all languages]
         :return: The queryset of content objects
         """
         return self.prefetch_translations(
-            to_attr="prefetched_public_translations", status=status.PUBLIC
+            to_attr="prefetched_public_translations",
+            language_slugs=language_slugs,
+            status=status.PUBLIC,
         )
 
     def prefetch_public_or_draft_translations(
-        self,
+        self, language_slugs: Iterable[str] | None = None
     ) -> ContentQuerySet:
         """
         Get the queryset including the custom attribute ``prefetched_public_or_draft_translations`` which contains the latest
         public or draft translations of each content object in each language
 
+        :param language_slugs: Only prefetch the translations in these languages [optional, defaults to all languages]
         :return: The queryset of content objects
         """
         return self.prefetch_translations(
             to_attr="prefetched_public_or_draft_translations",
+            language_slugs=language_slugs,
             status__in=[status.DRAFT, status.PUBLIC],
         )
 
-    def prefetch_major_translations(self) -> ContentQuerySet:
+    def prefetch_major_translations(
+        self, language_slugs: Iterable[str] | None = None
+    ) -> ContentQuerySet:
         """
         Get the queryset including the custom attribute ``prefetched_major_translations`` which contains the
         latest major (in other words not a minor edit) translations of each content object in each language
 
+        :param language_slugs: Only prefetch the translations in these languages [optional, defaults to all languages]
         :return: The queryset of content objects
         """
         return self.prefetch_translations(
             to_attr="prefetched_major_translations",
+            language_slugs=language_slugs,
             minor_edit=False,
         )
 
     def prefetch_major_public_translations(
-        self,
+        self, language_slugs: Iterable[str] | None = None
     ) -> ContentQuerySet:
         """
         Get the queryset including the custom attribute ``prefetched_major_public_translations`` which contains the
         latest major (in other words not a minor edit) public translations of each content object in each language
 
+        :param language_slugs: Only prefetch the translations in these languages [optional, defaults to all languages]
         :return: The queryset of content objects
         """
         return self.prefetch_translations(
             to_attr="prefetched_major_public_translations",
+            language_slugs=language_slugs,
             status=status.PUBLIC,
             minor_edit=False,
         )
@@ -194,11 +219,14 @@ class AbstractContentModel(AbstractBaseModel):
         except AttributeError:
             # If the translations were not prefetched, query it from the database
             prefetched_translations = (
-                self.translations.filter(**filters)
+                self.translations.filter(**{flag: True})
+                .select_related("language")
+                .order_by("language__id")
+                if (flag := get_latest_version_flag(**filters))
+                else self.translations.filter(**filters)
                 .select_related("language")
                 .order_by("language__id", "-version")
                 .distinct("language__id")
-                .all()
             )
         return {
             translation.language.slug: translation
@@ -3,14 +3,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.db import models
-from django.db.models import Q
+from django.db import models, transaction
+from django.db.models import Case, Q, Value, When
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 if TYPE_CHECKING:
-    from typing import Any, Literal
+    from typing import Any, Final, Literal
     from django.db.models.query import QuerySet
     from .abstract_content_model import AbstractContentModel
     from .regions.region import Region
@@ -20,6 +20,31 @@ from ..utils.translation_utils import gettext_many_lazy as __
 from .abstract_base_model import AbstractBaseModel
 from .languages.language import Language
 
+#: The flags which mark the latest versions of a translation and the filters which define the respective versions
+LATEST_VERSION_FLAGS: Final[dict[str, dict[str, Any]]] = {
+    "latest": {},
+    "latest_public": {"status": status.PUBLIC},
+    "latest_major": {"minor_edit": False},
+    "latest_major_public": {"status": status.PUBLIC, "minor_edit": False},
+}
+
+
+def get_latest_version_flag(**filters: Any) -> str | None:
+    r"""
+    Get the flag which marks the latest versions matching the given filters
+
+    :param \**filters: The filters of the translations (e.g. by status)
+    :return: The name of the flag or ``None`` if the latest versions matching the filters are not marked
+    """
+    return next(
+        (
+            flag
+            for flag, flag_filters in LATEST_VERSION_FLAGS.items()
+            if flag_filters == filters
+        ),
+        None,
+    )
+
 
 # pylint: disable=too-many-public-methods
 class AbstractContentTranslation(AbstractBaseModel):
@@ -89,6 +114,22 @@ class AbstractContentTranslation(AbstractBaseModel):
             "Tick if updating this content should automatically refresh or create its translations."
         ),
     )
+    #: Whether this is the latest version in its language (see :meth:`update_latest_versions`)
+    latest = models.BooleanField(
+        default=False, editable=False, verbose_name=_("latest version")
+    )
+    #: Whether this is the latest public version in its language
+    latest_public = models.BooleanField(
+        default=False, editable=False, verbose_name=_("latest public version")
+    )
+    #: Whether this is the latest major version in its language
+    latest_major = models.BooleanField(
+        default=False, editable=False, verbose_name=_("latest major version")
+    )
+    #: Whether this is the latest major public version in its language
+    latest_major_public = models.BooleanField(
+        default=False, editable=False, verbose_name=_("latest major public version")
+    )
     #: The HIX score is ``None`` if not overwritten by a submodel
     hix_score = None
     #: Whether this object is read-only and not meant to be stored to the database
@@ -566,7 +607,117 @@ class AbstractContentTranslation(AbstractBaseModel):
             )
         if kwargs.pop("update_timestamp", True):
             self.last_updated = timezone.now()
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            latest_versions = self.update_latest_versions(
+                getattr(self, f"{self.foreign_field()}_id"), self.language_id
+            )
+        for flag, latest_id in latest_versions.items():
+            setattr(self, flag, latest_id == self.id)
+
+    @classmethod
+    def update_latest_versions(
+        cls, foreign_object_id: int, language_id: int
+    ) -> dict[str, int | None]:
+        """
+        Update the flags which mark the latest versions of the translations of a content object in a language (see
+        :data:`LATEST_VERSION_FLAGS`). The flags allow to query the latest versions with an index scan instead of
+        sorting the whole version history.
+
+        :param foreign_object_id: The id of the content object
+        :param language_id: The id of the language
+        :return: The ids of the latest versions by their flags
+        """
+        versions = cls.objects.filter(
+            **{f"{cls.foreign_field()}_id": foreign_object_id},
+            language_id=language_id,
+        )
+        latest_versions: dict[str, int | None] = dict.fromkeys(LATEST_VERSION_FLAGS)
+        # Lock the versions to prevent concurrent saves from marking different versions
+        for version in (
+            versions.select_for_update()
+            .order_by("-version")
+            .values("id", "status", "minor_edit")
+        ):
+            for flag, filters in LATEST_VERSION_FLAGS.items():
+                if latest_versions[flag] is None and all(
+                    version[field] == value for field, value in filters.items()
+                ):
+                    latest_versions[flag] = version["id"]
+            if None not in latest_versions.values():
+                break
+        # Only update the versions which are marked currently or which have to be marked
+        versions.filter(
+            Q(id__in=set(latest_versions.values()))
+            | Q(latest=True)
+            | Q(latest_public=True)
+            | Q(latest_major=True)
+            | Q(latest_major_public=True)
+        ).update(
+            **{
+                flag: Case(When(id=latest_id, then=Value(True)), default=Value(False))
+                if latest_id
+                else Value(False)
+                for flag, latest_id in latest_versions.items()
+            }
+        )
+        return latest_versions
+
+    @classmethod
+    def update_status(cls, translations: QuerySet, new_status: str) -> int:
+        """
+        Change the status of multiple versions at once. Since :meth:`~django.db.models.query.QuerySet.update` does not
+        call :meth:`save`, the flags of the latest versions of all affected content objects and languages are updated
+        afterwards (see :meth:`update_latest_versions`).
+
+        :param translations: The versions which should be changed
+        :param new_status: The new status (see :mod:`~integreat_cms.cms.constants.status`)
+        :return: The number of changed versions
+        """
+        foreign_field = f"{cls.foreign_field()}_id"
+        with transaction.atomic():
+            affected = set(translations.values_list(foreign_field, "language_id"))
+            changed = translations.update(status=new_status)
+            for foreign_object_id, language_id in affected:
+                cls.update_latest_versions(foreign_object_id, language_id)
+        return changed
+
+    @classmethod
+    def get_latest_versions(cls, flag: str) -> QuerySet:
+        """
+        Determine the latest versions which should be marked with the given flag by sorting the version history
+
+        :param flag: The flag (see :data:`LATEST_VERSION_FLAGS`)
+        :return: The latest versions of all content objects in all languages which match the filters of the flag
+        """
+        foreign_field = f"{cls.foreign_field()}_id"
+        return (
+            cls.objects.filter(**LATEST_VERSION_FLAGS[flag])
+            .order_by(foreign_field, "language_id", "-version")
+            .distinct(foreign_field, "language_id")
+        )
+
+    @classmethod
+    def rebuild_latest_versions(cls) -> int:
+        """
+        Update the flags of the latest versions of all translations of this model
+
+        :return: The number of changed flags
+        """
+        changed = 0
+        for flag in LATEST_VERSION_FLAGS:
+            latest_version_ids = cls.get_latest_versions(flag).values("id")
+            changed += (
+                cls.objects.filter(**{flag: True})
+                .exclude(id__in=latest_version_ids)
+                .update(**{flag: False})
+            )
+            changed += (
+                cls.objects.filter(id__in=latest_version_ids)
+                .exclude(**{flag: True})
+                .update(**{flag: True})
+            )
+        return changed
 
     class Meta:
         #: This model is an abstract base class
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from cacheops import invalidate_model
@@ -22,6 +24,98 @@ from .abstract_base_model import AbstractBaseModel
 logger = logging.getLogger(__name__)
 
 
+class CachedTree:
+    """
+    Compact representation of the structure of cached tree nodes (see
+    :meth:`~integreat_cms.cms.models.pages.page.PageQuerySet.cache_tree`).
+    Each node is stored only once per tree in nested set order, so the descendants of a node are the nodes between its
+    left and right value and its ancestors are found by following the parent ids. In contrast to lists of ancestors and
+    descendants on every node, the required memory does not grow with the depth of the tree.
+    """
+
+    __slots__ = ("nodes_by_id", "nodes_by_tree_id", "lfts_by_tree_id")
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty tree cache
+        """
+        #: The cached nodes by their id
+        self.nodes_by_id: dict[int, AbstractTreeNode] = {}
+        #: The cached nodes of each tree in nested set order
+        self.nodes_by_tree_id: defaultdict[int, list[AbstractTreeNode]] = defaultdict(
+            list
+        )
+        #: The left values of the cached nodes of each tree (to look up ranges of nodes via bisection)
+        self.lfts_by_tree_id: defaultdict[int, list[int]] = defaultdict(list)
+
+    def __contains__(self, node_id: int | None) -> bool:
+        """
+        Check whether the node with the given id is cached
+
+        :param node_id: The id of the node
+        :return: Whether the node is cached
+        """
+        return node_id in self.nodes_by_id
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached nodes
+
+        :return: The number of nodes
+        """
+        return len(self.nodes_by_id)
+
+    def add(self, node: AbstractTreeNode) -> None:
+        """
+        Add a node to the cache. The nodes have to be added ordered by their tree id and left value.
+
+        :param node: The node
+        """
+        # pylint: disable=protected-access
+        node._cached_tree = self
+        node._cached_children = []
+        if parent := self.nodes_by_id.get(node.parent_id):
+            parent._cached_children.append(node)
+        self.nodes_by_id[node.id] = node
+        self.nodes_by_tree_id[node.tree_id].append(node)
+        self.lfts_by_tree_id[node.tree_id].append(node.lft)
+
+    def get_parent(self, node: AbstractTreeNode) -> AbstractTreeNode | None:
+        """
+        Get the cached parent of a node
+
+        :param node: The node
+        :return: The parent or ``None`` if the parent is not cached
+        """
+        return self.nodes_by_id.get(node.parent_id)
+
+    def get_ancestors(self, node: AbstractTreeNode) -> list[AbstractTreeNode]:
+        """
+        Get the cached ancestors of a node
+
+        :param node: The node
+        :return: The ancestors, starting by the root node and descending to the parent
+        """
+        ancestors = []
+        while parent := self.get_parent(node):
+            ancestors.append(parent)
+            node = parent
+        ancestors.reverse()
+        return ancestors
+
+    def get_descendants(self, node: AbstractTreeNode) -> list[AbstractTreeNode]:
+        """
+        Get the cached descendants of a node
+
+        :param node: The node
+        :return: The descendants in nested set order
+        """
+        lfts = self.lfts_by_tree_id[node.tree_id]
+        start = bisect_right(lfts, node.lft)
+        end = bisect_left(lfts, node.rgt, lo=start)
+        return self.nodes_by_tree_id[node.tree_id][start:end]
+
+
 # pylint: disable=attribute-defined-outside-init
 class AbstractTreeNode(NS_Node, AbstractBaseModel):
     """
@@ -148,6 +242,15 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
             return siblings[idx + 1]
         return None
 
+    @property
+    def has_cached_ancestors(self) -> bool:
+        """
+        Whether the ancestors of this node are already cached, so they can be accessed without database queries
+
+        :return: Whether the ancestors are cached
+        """
+        return hasattr(self, "_cached_tree") or hasattr(self, "_cached_ancestors")
+
     def get_cached_ancestors(
         self, include_self: bool = False
     ) -> list[AbstractTreeNode]:
@@ -158,11 +261,15 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
         :return: A :class:`~django.db.models.query.QuerySet` containing the current node object's ancestors, starting by
                  the root node and descending to the parent.
         """
-        if not hasattr(self, "_cached_ancestors"):
-            self._cached_ancestors = list(self.get_ancestors())
+        if hasattr(self, "_cached_tree"):
+            ancestors = self._cached_tree.get_ancestors(self)
+        else:
+            if not hasattr(self, "_cached_ancestors"):
+                self._cached_ancestors = list(self.get_ancestors())
+            ancestors = self._cached_ancestors
         if include_self:
-            return [*self._cached_ancestors, self]
-        return self._cached_ancestors
+            return [*ancestors, self]
+        return ancestors
 
     @cached_property
     def cached_parent(self) -> AbstractTreeNode | None:
@@ -174,6 +281,8 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
         """
         if self.is_root():
             return None
+        if hasattr(self, "_cached_tree"):
+            return self._cached_tree.get_parent(self)
         return self.get_cached_ancestors()[-1]
 
     def get_cached_descendants(
@@ -186,11 +295,15 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
         :return: A :class:`~django.db.models.query.QuerySet` containing the current node object's ancestors, starting by
                  the root node and descending to the parent.
         """
-        if not hasattr(self, "_cached_descendants"):
-            self._cached_descendants = list(self.get_descendants())
+        if hasattr(self, "_cached_tree"):
+            descendants = self._cached_tree.get_descendants(self)
+        else:
+            if not hasattr(self, "_cached_descendants"):
+                self._cached_descendants = list(self.get_descendants())
+            descendants = self._cached_descendants
         if include_self:
-            return [self, *self._cached_descendants]
-        return self._cached_descendants
+            return [self, *descendants]
+        return descendants
 
     @cached_property
     def cached_children(self) -> list[AbstractTreeNode]:
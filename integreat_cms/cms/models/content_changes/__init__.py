@@ -0,0 +1,3 @@
+"""
+This package contains the model which records changes of content for the delta sync of the API
+"""
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ...constants import content_change_types
+from ..abstract_base_model import AbstractBaseModel
+from ..regions.region import Region
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class ContentChange(AbstractBaseModel):
+    """
+    Data model representing the most recent change of a content object.
+    There is at most one record per content object, which is updated on every change of the object or its translations.
+    When the object is deleted or archived, the record is kept as tombstone, so clients of the delta sync can remove the
+    object from their local copy.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="content_changes",
+        verbose_name=_("region"),
+    )
+    #: Manage choices in :mod:`~integreat_cms.cms.constants.content_change_types`
+    content_type = models.CharField(
+        max_length=7,
+        choices=content_change_types.CHOICES,
+        verbose_name=_("content type"),
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_("object id"))
+    timestamp = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("modification date"),
+    )
+    removed = models.BooleanField(
+        default=False,
+        verbose_name=_("removed"),
+        help_text=_("Whether the content object was deleted or archived"),
+    )
+
+    @classmethod
+    def record(
+        cls,
+        region_id: int,
+        content_type: str,
+        object_ids: Iterable[int],
+        removed: bool = False,
+    ) -> None:
+        """
+        Record that the given content objects have been changed just now
+
+        :param region_id: The id of the region of the content objects
+        :param content_type: The type of the content objects
+                             (see :mod:`~integreat_cms.cms.constants.content_change_types`)
+        :param object_ids: The ids of the changed content objects
+        :param removed: Whether the content objects were deleted or archived
+        """
+        if not (object_ids := set(object_ids)):
+            return
+        timestamp = timezone.now()
+        existing_records = cls.objects.filter(
+            content_type=content_type, object_id__in=object_ids
+        )
+        existing_ids = set(existing_records.values_list("object_id", flat=True))
+        existing_records.update(
+            region_id=region_id, timestamp=timestamp, removed=removed
+        )
+        cls.objects.bulk_create(
+            [
+                cls(
+                    region_id=region_id,
+                    content_type=content_type,
+                    object_id=object_id,
+                    timestamp=timestamp,
+                    removed=removed,
+                )
+                for object_id in object_ids - existing_ids
+            ],
+            # Another process might have created the record in the meantime
+            ignore_conflicts=True,
+        )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``ContentChange object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the content change
+        """
+        return f"{self.get_content_type_display()} {self.object_id} ({self.timestamp.strftime('%Y-%m-%d %H:%M')})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<ContentChange: ContentChange object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the content change
+        """
+        return f"<ContentChange (id: {self.id}, region: {self.region_id}, content_type: {self.content_type}, object_id: {self.object_id}, removed: {self.removed})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("content change")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("content changes")
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["timestamp"]
+        #: The default permissions for this model
+        default_permissions = ()
+        #: A list of database constraints for this model
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"],
+                name="%(class)s_unique_object",
+            ),
+        ]
+        #: A list of database indexes for this model
+        indexes = [models.Index(fields=["region", "timestamp"])]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import zoneinfo
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+from ..regions.region import Region
+from .event import Event
+
+if TYPE_CHECKING:
+    from datetime import date
+    from typing import Iterator
+
+
+class EventOccurrence(AbstractBaseModel):
+    """
+    Data model representing a single occurrence of an event.
+    The occurrences are materialized to answer date range queries of the API with an index scan instead of expanding
+    all recurring events on every request. They contain all occurrences of non-archived events which end on the day of
+    their last update or later and start within :attr:`~integreat_cms.core.settings.EVENT_OCCURRENCES_HORIZON_DAYS` days
+    after this day (or after the start of the event if it lies in the future). They are updated whenever an event or its
+    recurrence rule changes and are extended daily by the management command
+    :mod:`~integreat_cms.core.management.commands.update_event_occurrences`.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="occurrences",
+        verbose_name=_("event"),
+    )
+    #: The region of the event (to allow efficient range queries per region)
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="event_occurrences",
+        verbose_name=_("region"),
+    )
+    start = models.DateTimeField(verbose_name=_("start"))
+    end = models.DateTimeField(verbose_name=_("end"))
+
+    @staticmethod
+    def get_occurrence_periods(
+        event: Event, today: date, horizon: date | None = None
+    ) -> Iterator[tuple[datetime, datetime]]:
+        """
+        Get the start and end of all occurrences of an event which should be stored on the given day
+
+        :param event: The event
+        :param today: The day on which the occurrences are stored
+        :param horizon: The last day on which recurrences may start (defaults to
+                        :attr:`~integreat_cms.core.settings.EVENT_OCCURRENCES_HORIZON_DAYS` days after the given day or
+                        the start of the event if it lies in the future)
+        :return: An iterator over the start and end of the occurrences
+        """
+        if event.archived:
+            return
+        start_local = event.start_local
+        end_local = event.end_local
+        if not event.recurrence_rule:
+            if end_local.date() >= today:
+                yield event.start, event.end
+            return
+        start_date = start_local.date()
+        duration = end_local.date() - start_date
+        horizon = horizon or max(start_date, today) + timedelta(
+            days=settings.EVENT_OCCURRENCES_HORIZON_DAYS
+        )
+        tzinfo = zoneinfo.ZoneInfo(event.timezone)
+        # Include occurrences which started before today but did not end yet
+        for recurrence_date in event.recurrence_rule.iter_after(
+            start_date, today - duration
+        ):
+            if recurrence_date > horizon:
+                break
+            yield (
+                datetime.combine(recurrence_date, start_local.time(), tzinfo=tzinfo),
+                datetime.combine(
+                    recurrence_date + duration, end_local.time(), tzinfo=tzinfo
+                ),
+            )
+
+    @classmethod
+    def update_occurrences(cls, event: Event, today: date | None = None) -> int:
+        """
+        Replace the stored occurrences of the given event
+
+        :param event: The event
+        :param today: The day on which the occurrences are stored (defaults to the current date)
+        :return: The number of stored occurrences
+        """
+        today = today or timezone.now().date()
+        cls.objects.filter(event=event).delete()
+        return len(
+            cls.objects.bulk_create(
+                cls(event=event, region_id=event.region_id, start=start, end=end)
+                for start, end in cls.get_occurrence_periods(event, today)
+            )
+        )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``EventOccurrence object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the event occurrence
+        """
+        return f"{self.event} ({self.start.strftime('%Y-%m-%d %H:%M')})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<EventOccurrence: EventOccurrence object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the event occurrence
+        """
+        return f"<EventOccurrence (id: {self.id}, event: {self.event_id}, start: {self.start}, end: {self.end})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("event occurrence")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("event occurrences")
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["start"]
+        #: The default permissions for this model
+        default_permissions = ()
+        #: A list of database indexes for this model
+        indexes = [models.Index(fields=["region", "start"])]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import calendar
 from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 
@@ -18,6 +19,37 @@ if TYPE_CHECKING:
     from typing import Iterator
 
 
+def get_nth_weekday(month_date: date, weekday: int, n: int) -> date:
+    """
+    Get the nth occurrence of a given weekday in a specific month
+
+    :param month_date: the current date of month
+    :param weekday: the requested weekday
+    :param n: the requested number
+    :return: The nth weekday
+    """
+    month_date = month_date.replace(day=1)
+    month_date += timedelta((weekday - month_date.weekday()) % 7)
+    n_th_occurrence = month_date + timedelta(weeks=n - 1)
+    # If the occurrence is not in the desired month (because the last week is 4 and not 5), retry with 4
+    if n_th_occurrence.month != month_date.month:
+        n_th_occurrence = month_date + timedelta(weeks=n - 2)
+    return n_th_occurrence
+
+
+def next_month(month_date: date) -> date:
+    """
+    Advance the given date by one month
+
+    :param month_date: the given date
+    :return: The same date one month later
+    """
+    month_date = month_date.replace(day=1)
+    if month_date.month < 12:
+        return month_date.replace(month=month_date.month + 1)
+    return month_date.replace(month=1, year=month_date.year + 1)
+
+
 class RecurrenceRule(AbstractBaseModel):
     """
     Data model representing the recurrence frequency and interval of an event
@@ -75,45 +107,23 @@ class RecurrenceRule(AbstractBaseModel):
         ),
     )
 
-    def iter_after(self, start_date: date) -> Iterator[date]:
+    def iter_after(
+        self, start_date: date, from_date: date | None = None
+    ) -> Iterator[date]:
         """
         Iterate all recurrences after a given start date.
         This method assumes that ``weekdays_for_weekly`` contains at least one member
         and that ``weekday_for_monthly`` and ``week_for_monthly`` are not null.
 
+        If ``from_date`` is given, the iteration directly jumps to the first recurrence on or after this date instead of
+        walking through all previous recurrences (e.g. to get the upcoming recurrences of long-running events).
+
         :param start_date: The date on which the iteration should start
+        :param from_date: The date before which recurrences are skipped (defaults to ``start_date``)
         :return: An iterator over all dates defined by this recurrence rule
         """
         next_recurrence = start_date
-
-        def get_nth_weekday(month_date: date, weekday: int, n: int) -> date:
-            """
-            Get the nth occurrence of a given weekday in a specific month
-
-            :param month_date: the current date of month
-            :param weekday: the requested weekday
-            :param n: the requested number
-            :return: The nth weekday
-            """
-            month_date = month_date.replace(day=1)
-            month_date += timedelta((weekday - month_date.weekday()) % 7)
-            n_th_occurrence = month_date + timedelta(weeks=n - 1)
-            # If the occurrence is not in the desired month (because the last week is 4 and not 5), retry with 4
-            if n_th_occurrence.month != month_date.month:
-                n_th_occurrence = month_date + timedelta(weeks=n - 2)
-            return n_th_occurrence
-
-        def next_month(month_date: date) -> date:
-            """
-            Advance the given date by one month
-
-            :param month_date: the given date
-            :return: The same date one month later
-            """
-            month_date = month_date.replace(day=1)
-            if month_date.month < 12:
-                return month_date.replace(month=month_date.month + 1)
-            return month_date.replace(month=1, year=month_date.year + 1)
+        from_date = from_date or start_date
 
         def advance() -> Iterator[date]:
             """
@@ -165,15 +175,79 @@ class RecurrenceRule(AbstractBaseModel):
                         year_dif += 1
 
         i = 0
+        if from_date > start_date:
+            # Only every nth period contains recurrences, so jump to the first one which is not completely skipped
+            i = max(0, -(-self.count_periods(start_date, from_date) // self.interval))
+            i *= self.interval
+            if i:
+                next_recurrence = self.get_period_start(start_date, i)
         end_date = self.recurrence_end_date or date.max
         while True:
             for _ in advance():
                 if next_recurrence > end_date:
                     return
-                if not i % self.interval:
+                if not i % self.interval and next_recurrence >= from_date:
                     yield next_recurrence
             i += 1
 
+    def count_periods(self, start_date: date, from_date: date) -> int:
+        """
+        Count the periods of this rule which only contain recurrences before a given date. A period is the time span
+        which is covered by one step of :meth:`iter_after` (a day, week, month or year depending on the frequency).
+
+        :param start_date: The date on which the iteration starts
+        :param from_date: The date before which recurrences are skipped
+        :return: The number of periods before the period which contains ``from_date``
+        """
+        if self.frequency == frequency.DAILY:
+            return (from_date - start_date).days
+        if self.frequency == frequency.WEEKLY:
+            return ((from_date - start_date).days + start_date.weekday()) // 7
+        if self.frequency == frequency.MONTHLY:
+            first_month = self.get_period_start(start_date, 0)
+            return (from_date.year - first_month.year) * 12 + (
+                from_date.month - first_month.month
+            )
+        if start_date.month == 2 and start_date.day == 29:
+            # Recurrences on february 29 only exist in leap years
+            return calendar.leapdays(start_date.year + 1, from_date.year)
+        return from_date.year - start_date.year
+
+    def get_period_start(self, start_date: date, period: int) -> date:
+        """
+        Get the date from which :meth:`iter_after` continues the iteration in the given period
+
+        :param start_date: The date on which the iteration starts
+        :param period: The index of the period
+        :return: The start date of the period (or the first day of the month for monthly recurrences)
+        """
+        if self.frequency == frequency.DAILY:
+            return start_date + timedelta(days=period)
+        if self.frequency == frequency.WEEKLY:
+            # All periods except the first one start on monday
+            return start_date + timedelta(
+                weeks=period, days=-start_date.weekday() if period else 0
+            )
+        if self.frequency == frequency.MONTHLY:
+            # The first recurrence might be in the month after the start date
+            months = start_date.month - 1 + period
+            if (
+                get_nth_weekday(
+                    start_date, self.weekday_for_monthly, self.week_for_monthly
+                )
+                < start_date
+            ):
+                months += 1
+            return date(start_date.year + months // 12, months % 12 + 1, 1)
+        if start_date.month == 2 and start_date.day == 29:
+            year = start_date.year
+            for _ in range(period):
+                year += 4
+                while not calendar.isleap(year):
+                    year += 4
+            return start_date.replace(year=year)
+        return start_date.replace(year=start_date.year + period)
+
     def __str__(self) -> str:
         """
         This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``RecurrenceRule object (id)``.
@@ -3,8 +3,9 @@ This package contains page-related data models:
 
 * :class:`~integreat_cms.cms.models.pages.abstract_base_page.AbstractBasePage` and
   :class:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation`
-* :class:`~integreat_cms.cms.models.pages.page.Page` and
-  :class:`~integreat_cms.cms.models.pages.page_translation.PageTranslation`
+* :class:`~integreat_cms.cms.models.pages.page.Page`,
+  :class:`~integreat_cms.cms.models.pages.page_translation.PageTranslation` and
+  :class:`~integreat_cms.cms.models.pages.page_path.PagePath`
 * :class:`~integreat_cms.cms.models.pages.imprint_page.ImprintPage` and
   :class:`~integreat_cms.cms.models.pages.imprint_page_translation.ImprintPageTranslation`
 """
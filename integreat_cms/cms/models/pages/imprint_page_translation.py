@@ -96,3 +96,14 @@ class ImprintPageTranslation(AbstractBasePageTranslation):
                 name="%(class)s_unique_version",
             ),
         ]
+        #: A list of database indexes for this model
+        indexes = [
+            models.Index(
+                fields=["page", "language"],
+                condition=models.Q(latest=True)
+                | models.Q(latest_public=True)
+                | models.Q(latest_major=True)
+                | models.Q(latest_major_public=True),
+                name="%(class)s_latest",
+            ),
+        ]
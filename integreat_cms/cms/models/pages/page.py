@@ -13,34 +13,72 @@ from treebeard.ns_tree import NS_NodeQuerySet
 
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..abstract_content_model import ContentQuerySet
-from ..abstract_tree_node import AbstractTreeNode
+from ..abstract_tree_node import AbstractTreeNode, CachedTree
 from ..decorators import modify_fields
 from .abstract_base_page import AbstractBasePage
+from .page_path import PagePath
 from .page_translation import PageTranslation
 
 if TYPE_CHECKING:
-    from typing import Any, Iterator
+    from typing import Any, Final, Iterable, Iterator
 
     from django.db.models.base import ModelBase
     from django.utils.safestring import SafeString
 
 logger = logging.getLogger(__name__)
 
+#: The kinds of translations which can be prefetched when caching a page tree (see
+#: :meth:`~integreat_cms.cms.models.pages.page.PageQuerySet.cache_tree`)
+CACHED_TRANSLATION_KINDS: Final[tuple[str, ...]] = (
+    "translations",
+    "public_translations",
+    "public_or_draft_translations",
+    "major_translations",
+    "major_public_translations",
+)
+
 
 class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
     """
     Custom queryset for pages to inherit methods from both querysets for tree nodes and content objects
     """
 
+    def prefetch_paths(
+        self, language_slugs: Iterable[str] | None = None
+    ) -> PageQuerySet:
+        """
+        Get the queryset including the custom attribute ``prefetched_paths`` which contains the stored paths of each
+        page in all languages (see :class:`~integreat_cms.cms.models.pages.page_path.PagePath`)
+
+        :param language_slugs: Only prefetch the paths in these languages [optional, defaults to all languages]
+        :return: The queryset of pages
+        """
+        paths = PagePath.objects.all()
+        if language_slugs is not None:
+            paths = paths.filter(language__slug__in=language_slugs)
+        return self.prefetch_related(
+            models.Prefetch("paths", queryset=paths, to_attr="prefetched_paths")
+        )
+
     def cache_tree(
-        self, archived: bool | None = None, language_slug: str | None = None
+        self,
+        archived: bool | None = None,
+        language_slug: str | None = None,
+        translations: Iterable[str] = ("translations", "public_translations"),
+        language_slugs: Iterable[str] | None = None,
     ) -> list[Page]:
         """
         Caches a page tree queryset in a python data structure.
+        The structure of the tree is stored in a shared :class:`~integreat_cms.cms.models.abstract_tree_node.CachedTree`
+        instead of separate lists of ancestors and descendants for each page.
 
         :param archived: Whether the pages should be limited to either archived  or non-archived pages.
                          If not passed or ``None``, both archived and non-archived pages are returned.
         :param language_slug: Code to identify the desired language (optional, requires ``archived`` to be ``False``)
+        :param translations: The kinds of translations which should be prefetched (any of
+                             :data:`~integreat_cms.cms.models.pages.page.CACHED_TRANSLATION_KINDS`, defaults to the
+                             latest translations and the latest public translations)
+        :param language_slugs: Only prefetch the translations in these languages [optional, defaults to all languages]
         :raises ValueError: Indicates that the combination of parameters is not supported.
 
         :return: A list of pages with cached children, descendants and ancestors and a list of all skipped pages
@@ -49,17 +87,16 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
             raise ValueError(
                 "archived must be False in order to filter for public translations by language_slug"
             )
-        result: dict[int, Page] = {}
+        queryset = self
+        for kind in translations:
+            if kind not in CACHED_TRANSLATION_KINDS:
+                raise ValueError(f"{kind!r} is not a valid kind of translations")
+            queryset = getattr(queryset, f"prefetch_{kind}")(
+                language_slugs=language_slugs
+            )
+        tree = CachedTree()
         skipped_pages: list[Page] = []
-        for page in (
-            self.prefetch_translations()
-            .prefetch_public_translations()
-            .order_by("tree_id", "lft")
-        ):
-            # pylint: disable=protected-access
-            page._cached_ancestors = []
-            page._cached_descendants = []
-            page._cached_children = []
+        for page in queryset.order_by("tree_id", "lft"):
             # Determine whether the page should be included in the result
             # pylint: disable=too-many-boolean-expressions
             if (
@@ -72,7 +109,7 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
                         # If the page is a root page, include it only when archive is either False or None
                         (not page.parent_id and not archived)
                         # Alternatively, include it if its parent is in the result
-                        or (page.parent_id in result)
+                        or (page.parent_id in tree)
                     )
                     # If the page is not archived, we may want to check if a translation exists for a given language
                     and (
@@ -81,32 +118,20 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
                     )
                 )
             ):
-                if page.parent_id in result:
-                    # Cache the page as child of the parent page
-                    # pylint: disable=protected-access
-                    result[page.parent_id]._cached_children.append(page)
-                    result[page.parent_id]._cached_descendants.append(page)
-                    # Cache the parent page as ancestor of the current page
-                    page._cached_ancestors.extend(
-                        result[page.parent_id]._cached_ancestors
-                    )
-                    page._cached_ancestors.append(result[page.parent_id])
-                    # Cache the current page as descendant of the parent's page ancestors
-                    for ancestor in result[page.parent_id]._cached_ancestors:
-                        if ancestor.id in result:
-                            result[ancestor.id]._cached_descendants.append(page)
+                # pylint: disable=protected-access
+                if parent := tree.get_parent(page):
                     # Set the relative depth to the relative depth of the parent + 1
-                    page._relative_depth = result[page.parent_id].relative_depth + 1
+                    page._relative_depth = parent.relative_depth + 1
                 else:
                     # Set the relative depth to 1
                     page._relative_depth = 1
-                result[page.id] = page
+                tree.add(page)
             else:
                 # Keep track of all skipped pages
                 skipped_pages.append(page)
-        logger.debug("Cached result: %r", result)
+        logger.debug("Cached %d pages", len(tree))
         logger.debug("Skipped pages: %r", skipped_pages)
-        return list(result.values())
+        return list(tree.nodes_by_id.values())
 
 
 # pylint: disable=too-few-public-methods
@@ -223,6 +248,20 @@ class Page(AbstractTreeNode, AbstractBasePage):
         """
         return PageTranslation
 
+    @cached_property
+    def paths_by_language_id(self) -> dict[int, PagePath]:
+        """
+        This property returns a mapping from language ids to the stored paths of this page (see
+        :class:`~integreat_cms.cms.models.pages.page_path.PagePath`)
+
+        :return: The stored paths by language id
+        """
+        try:
+            paths = self.prefetched_paths
+        except AttributeError:
+            paths = self.paths.all()
+        return {path.language_id: path for path in paths}
+
     @cached_property
     def explicitly_archived_ancestors(self) -> list[Page]:
         """
@@ -312,7 +351,8 @@ class Page(AbstractTreeNode, AbstractBasePage):
     def move(self, target: Page, pos: str | None = None) -> None:
         """
         Moving tree nodes potentially causes changes to the fields tree_id, lft and rgt in :class:`~treebeard.ns_tree.NS_Node`
-        so the cache of page translations has to be cleared, because of it's relation to :class:`~integreat_cms.cms.models.pages.page.Page`
+        so the cache of page translations has to be cleared, because of it's relation to :class:`~integreat_cms.cms.models.pages.page.Page`.
+        Since the ancestors of the page change, the stored paths of the page and its descendants are updated as well.
 
         :param target: The target node which determines the new position
         :param pos: The new position of the page relative to the target
@@ -321,6 +361,11 @@ class Page(AbstractTreeNode, AbstractBasePage):
         """
         super().move(target, pos)
         invalidate_model(PageTranslation)
+        PagePath.update_tree_paths(self)
+        try:
+            del self.paths_by_language_id
+        except AttributeError:
+            pass
 
     def archive(self) -> None:
         """
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from cacheops import invalidate_model
+from django.db import models, transaction
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+    from ..regions.region import Region
+    from .page import Page, PageQuerySet
+    from .page_translation import PageTranslation
+
+logger = logging.getLogger(__name__)
+
+
+class PagePath(AbstractBaseModel):
+    """
+    Data model representing the translated url path of a page in one language.
+    The paths are stored to generate the urls of page translations without traversing the ancestors of the page and to
+    resolve urls with an index lookup. There is one path for each language in which a translation of the page exists.
+    The paths of a page tree are recalculated whenever a translation in this tree is changed or the page is moved (see
+    :meth:`~integreat_cms.cms.models.pages.page_path.PagePath.update_paths`) and can be rebuilt with the management
+    command :mod:`~integreat_cms.core.management.commands.update_page_paths`.
+    """
+
+    page = models.ForeignKey(
+        "cms.Page",
+        on_delete=models.CASCADE,
+        related_name="paths",
+        verbose_name=_("page"),
+    )
+    language = models.ForeignKey(
+        "cms.Language",
+        on_delete=models.CASCADE,
+        related_name="page_paths",
+        verbose_name=_("language"),
+    )
+    #: The region of the page (to allow efficient lookups of urls per region)
+    region = models.ForeignKey(
+        "cms.Region",
+        on_delete=models.CASCADE,
+        related_name="page_paths",
+        verbose_name=_("region"),
+    )
+    #: The slugs of all ancestors of the page, separated by slashes
+    ancestor_path = models.TextField(blank=True, verbose_name=_("ancestor path"))
+    #: The slugs of all ancestors and the page itself, separated by slashes
+    path = models.TextField(verbose_name=_("path"))
+
+    @staticmethod
+    def get_slug(page: Page, language_slug: str, default_language_slug: str) -> str:
+        """
+        Get the slug which represents a page in the urls of the given language.
+        This is the slug of the latest public translation or the latest translation if the page is not public in this
+        language. If the page is not translated into this language, the slug of the translation in the region's default
+        language (or any other translation) is used.
+
+        :param page: The page with prefetched translations
+        :param language_slug: The slug of the language
+        :param default_language_slug: The slug of the default language of the page's region
+        :return: The slug of the page
+        """
+        translation = (
+            page.get_public_translation(language_slug)
+            or page.get_translation(language_slug)
+            or page.get_translation(default_language_slug)
+            or next(iter(page.prefetched_translations_by_language_slug.values()))
+        )
+        return translation.slug
+
+    @classmethod
+    def get_paths(
+        cls, pages: list[Page], default_language_slug: str
+    ) -> Iterator[PagePath]:
+        """
+        Calculate the paths of the given pages
+
+        :param pages: The pages with cached ancestors and prefetched translations (see
+                      :meth:`~integreat_cms.cms.models.pages.page.PageQuerySet.cache_tree`)
+        :param default_language_slug: The slug of the default language of the pages' region
+        :return: An iterator over the unsaved paths of the pages in all languages in which they are translated
+        """
+        for page in pages:
+            ancestors = page.get_cached_ancestors()
+            for (
+                language_slug,
+                translation,
+            ) in page.prefetched_translations_by_language_slug.items():
+                ancestor_path = "/".join(
+                    cls.get_slug(ancestor, language_slug, default_language_slug)
+                    for ancestor in ancestors
+                )
+                slug = cls.get_slug(page, language_slug, default_language_slug)
+                yield cls(
+                    page=page,
+                    language_id=translation.language_id,
+                    region_id=page.region_id,
+                    ancestor_path=ancestor_path,
+                    path=f"{ancestor_path}/{slug}" if ancestor_path else slug,
+                )
+
+    @classmethod
+    def update_paths(cls, region: Region, pages: PageQuerySet) -> int:
+        """
+        Recalculate the stored paths of the given pages and store the paths which changed.
+        Since the paths depend on the ancestors of a page, the pages have to contain complete trees.
+
+        :param region: The region of the pages
+        :param pages: The pages whose paths should be updated
+        :return: The number of created, changed and deleted paths
+        """
+        paths = {
+            (path.page_id, path.language_id): path
+            for path in cls.get_paths(pages.cache_tree(), region.default_language.slug)
+        }
+        changed_paths = []
+        obsolete_paths = []
+        with transaction.atomic():
+            for stored_path in cls.objects.filter(page__in=pages).select_for_update():
+                path = paths.pop((stored_path.page_id, stored_path.language_id), None)
+                if path is None:
+                    obsolete_paths.append(stored_path.id)
+                elif (stored_path.ancestor_path, stored_path.path) != (
+                    path.ancestor_path,
+                    path.path,
+                ):
+                    stored_path.ancestor_path = path.ancestor_path
+                    stored_path.path = path.path
+                    changed_paths.append(stored_path)
+            cls.objects.filter(id__in=obsolete_paths).delete()
+            cls.objects.bulk_update(changed_paths, ["ancestor_path", "path"])
+            # Paths which were created concurrently are left as they are
+            cls.objects.bulk_create(paths.values(), ignore_conflicts=True)
+        if changed := len(paths) + len(changed_paths) + len(obsolete_paths):
+            logger.debug("Updated %d paths of %r", changed, pages)
+            # Bulk operations are not recognized by cacheops
+            invalidate_model(cls)
+        return changed
+
+    @classmethod
+    def update_tree_paths(cls, page: Page) -> int:
+        """
+        Recalculate the stored paths of all pages in the tree of the given page
+
+        :param page: The page
+        :return: The number of created, changed and deleted paths
+        """
+        return cls.update_paths(
+            page.region, page.region.pages.filter(tree_id=page.tree_id)
+        )
+
+    @classmethod
+    def is_up_to_date(cls, page_translation: PageTranslation) -> bool:
+        """
+        Check whether the stored path of a page translation already ends with its slug.
+        If this is the case, saving the translation does not change the paths of its page tree.
+
+        :param page_translation: The page translation
+        :return: Whether the stored path matches the translation
+        """
+        return (
+            cls.objects.filter(
+                page_id=page_translation.page_id,
+                language_id=page_translation.language_id,
+            )
+            .filter(
+                models.Q(path=page_translation.slug)
+                | models.Q(path__endswith=f"/{page_translation.slug}")
+            )
+            .exists()
+        )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``PagePath object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the page path
+        """
+        return self.path
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<PagePath: PagePath object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the page path
+        """
+        return f"<PagePath (id: {self.id}, page: {self.page_id}, language: {self.language_id}, path: {self.path})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("page path")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("page paths")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: A list of database constraints for this model
+        constraints = [
+            models.UniqueConstraint(
+                fields=["page", "language"],
+                name="%(class)s_unique_language",
+            ),
+        ]
+        #: A list of database indexes for this model
+        indexes = [models.Index(fields=["region", "language", "path"])]
@@ -58,10 +58,19 @@ class PageTranslation(AbstractBasePageTranslation):
     @cached_property
     def ancestor_path(self) -> str:
         """
-        This property calculates the path of all parents of the page
+        This property calculates the path of all parents of the page.
+        If the stored paths of the page were prefetched or its ancestors are not cached, the stored path is used instead
+        (see :class:`~integreat_cms.cms.models.pages.page_path.PagePath`), which saves the queries for the ancestors
+        and their translations.
 
         :return: The relative path to the page
         """
+        if not self.page.parent_id:
+            return ""
+        if (
+            hasattr(self.page, "prefetched_paths") or not self.page.has_cached_ancestors
+        ) and (page_path := self.page.paths_by_language_id.get(self.language_id)):
+            return page_path.ancestor_path
         slugs = []
         for ancestor in self.page.get_cached_ancestors():
             if public_translation := ancestor.get_public_translation(
@@ -403,3 +412,14 @@ class PageTranslation(AbstractBasePageTranslation):
                 name="%(class)s_unique_version",
             ),
         ]
+        #: A list of database indexes for this model
+        indexes = [
+            models.Index(
+                fields=["page", "language"],
+                condition=models.Q(latest=True)
+                | models.Q(latest_public=True)
+                | models.Q(latest_major=True)
+                | models.Q(latest_major_public=True),
+                name="%(class)s_latest",
+            ),
+        ]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+from ..languages.language import Language
+from ..regions.region import Region
+
+
+class PdfDocument(AbstractBaseModel):
+    """
+    Data model representing a generated PDF document of pages (see :mod:`~integreat_cms.cms.utils.pdf_utils`).
+    It serves as manifest of the files in :attr:`~integreat_cms.core.settings.PDF_ROOT`, which is used to evict the least
+    recently accessed documents (see :mod:`~integreat_cms.core.management.commands.clean_pdf_files`).
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="pdf_documents",
+        verbose_name=_("region"),
+    )
+    language = models.ForeignKey(
+        Language,
+        on_delete=models.CASCADE,
+        related_name="pdf_documents",
+        verbose_name=_("language"),
+    )
+    #: The path of the file relative to :attr:`~integreat_cms.core.settings.PDF_ROOT`
+    filename = models.CharField(max_length=512, unique=True, verbose_name=_("filename"))
+    #: The size of the file in bytes
+    size = models.PositiveBigIntegerField(verbose_name=_("size"))
+    created_date = models.DateTimeField(
+        default=timezone.now, verbose_name=_("creation date")
+    )
+    #: The date of the last request of the document
+    last_accessed = models.DateTimeField(
+        default=timezone.now, verbose_name=_("last accessed")
+    )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``PdfDocument object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the document
+        """
+        return self.filename
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<PdfDocument: PdfDocument object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the document
+        """
+        return f"<PdfDocument (id: {self.id}, region: {self.region_id}, language: {self.language_id}, filename: {self.filename})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("PDF document")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("PDF documents")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The default sorting for this model
+        ordering = ["-last_accessed"]
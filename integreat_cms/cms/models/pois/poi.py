@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 from django.utils.translation import gettext_lazy as _
 from linkcheck.models import Link
 
+from ...utils.geo_utils import encode_geohash
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..abstract_content_model import AbstractContentModel
 from ..media.media_file import MediaFile
@@ -58,6 +59,14 @@ class POI(AbstractContentModel):
         help_text=_("The longitude coordinate"),
         validators=[MinValueValidator(-180.0), MaxValueValidator(180.0)],
     )
+    #: The geohash of the coordinates (to allow efficient spatial queries, see :mod:`~integreat_cms.cms.utils.geo_utils`)
+    geohash = models.CharField(
+        max_length=12,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name=_("geohash"),
+    )
     location_on_map = models.BooleanField(
         default=False,
         verbose_name=_("Show this location on map"),
@@ -144,6 +153,23 @@ class POI(AbstractContentModel):
         """
         return POITranslation
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        r"""
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method,
+        to update the geohash of the coordinates.
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        """
+        if self.latitude is None or self.longitude is None:
+            self.geohash = ""
+        else:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+        if update_fields := kwargs.get("update_fields"):
+            if {"latitude", "longitude"} & set(update_fields):
+                kwargs["update_fields"] = {*update_fields, "geohash"}
+        super().save(*args, **kwargs)
+
     def archive(self) -> None:
         """
         Archives the poi and removes all links of this poi from the linkchecker
@@ -112,3 +112,14 @@ class POITranslation(AbstractContentTranslation):
                 name="%(class)s_unique_version",
             ),
         ]
+        #: A list of database indexes for this model
+        indexes = [
+            models.Index(
+                fields=["poi", "language"],
+                condition=models.Q(latest=True)
+                | models.Q(latest_public=True)
+                | models.Q(latest_major=True)
+                | models.Q(latest_major_public=True),
+                name="%(class)s_latest",
+            ),
+        ]
@@ -53,6 +53,14 @@ class PushNotification(AbstractBaseModel):
         verbose_name=_("sent date"),
         help_text=_("The date and time when the News was sent."),
     )
+    #: Set while the push notification is being sent, so it is not sent concurrently by another process (see
+    #: :func:`~integreat_cms.firebase_api.push_notification_scheduler.send_push_notification`)
+    sending_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("sending date"),
+        help_text=_("The date and time when sending the News was started."),
+    )
     created_date = models.DateTimeField(
         auto_now_add=True,
         verbose_name=_("creation date"),
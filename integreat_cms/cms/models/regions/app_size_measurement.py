@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+from ..languages.language import Language
+from .region import Region
+
+
+class AppSizeMeasurement(AbstractBaseModel):
+    """
+    Data model representing the size of the content which a client downloads for one language of a region at a given
+    time. The measurements are calculated in the background by the management command
+    :mod:`~integreat_cms.core.management.commands.calculate_app_size` and are kept to show the trend of the app size.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="app_size_measurements",
+        verbose_name=_("region"),
+    )
+    language = models.ForeignKey(
+        Language,
+        on_delete=models.CASCADE,
+        related_name="app_size_measurements",
+        verbose_name=_("language"),
+    )
+    date = models.DateTimeField(default=timezone.now, verbose_name=_("date"))
+    #: The size in bytes per content type (see :data:`~integreat_cms.api.utils.app_size_utils.CONTENT_TYPES`)
+    sizes = models.JSONField(default=dict, verbose_name=_("sizes"))
+    #: The pages and media files with the largest size
+    largest_items = models.JSONField(default=list, verbose_name=_("largest items"))
+
+    @property
+    def total_size(self) -> int:
+        """
+        The total size of all content types
+
+        :return: The size in bytes
+        """
+        return sum(self.sizes.values())
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``AppSizeMeasurement object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the measurement
+        """
+        return f"{self.region} ({self.language}, {self.date})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<AppSizeMeasurement: AppSizeMeasurement object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the measurement
+        """
+        return f"<AppSizeMeasurement (id: {self.id}, region: {self.region_id}, language: {self.language_id}, date: {self.date})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("app size measurement")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("app size measurements")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The default sorting for this model
+        ordering = ["-date"]
+        #: A list of database indexes for this model
+        indexes = [models.Index(fields=["region", "date"])]
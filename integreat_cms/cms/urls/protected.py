@@ -728,6 +728,11 @@ urlpatterns: list[URLPattern] = [
                                 analytics.TranslationCoverageView.as_view(),
                                 name="translation_coverage",
                             ),
+                            path(
+                                "app-size/",
+                                analytics.AppSizeView.as_view(),
+                                name="app_size",
+                            ),
                             path(
                                 "linkcheck/",
                                 include(
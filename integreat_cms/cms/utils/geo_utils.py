@@ -0,0 +1,170 @@
+"""
+This module contains helpers for spatial queries on coordinates.
+
+Locations are indexed by their `geohash <https://en.wikipedia.org/wiki/Geohash>`_, which divides the world into a grid
+of nested cells. All coordinates within the same cell share the same geohash prefix, so the locations within a bounding
+box can be determined by a few prefix searches on the indexed geohash column.
+"""
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from ...nominatim_api.utils import BoundingBox
+
+if TYPE_CHECKING:
+    from typing import Final
+
+#: The characters of the base32 alphabet which is used for geohashes
+GEOHASH_ALPHABET: Final[str] = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+#: The precision of the stored geohashes (9 characters correspond to cells of roughly 5 x 5 meters)
+GEOHASH_PRECISION: Final[int] = 9
+
+#: The maximum number of geohash prefixes which are used to search for the locations within a bounding box
+MAX_GEOHASH_PREFIXES: Final[int] = 16
+
+#: The mean radius of the earth in meters
+EARTH_RADIUS: Final[float] = 6371008.8
+
+
+def get_geohash_cell_size(precision: int) -> tuple[float, float]:
+    """
+    Get the size of the geohash cells with the given precision
+
+    :param precision: The number of characters of the geohash
+    :return: The height (latitude) and width (longitude) of the cells in degrees
+    """
+    bits = 5 * precision
+    return 180 / 2 ** (bits // 2), 360 / 2 ** ((bits + 1) // 2)
+
+
+def encode_geohash(
+    latitude: float, longitude: float, precision: int = GEOHASH_PRECISION
+) -> str:
+    """
+    Encode the given coordinates as geohash
+
+    :param latitude: The latitude of the coordinates
+    :param longitude: The longitude of the coordinates
+    :param precision: The number of characters of the geohash
+    :return: The geohash of the cell which contains the coordinates
+    """
+    latitude_range = [-90.0, 90.0]
+    longitude_range = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    value = 0
+    # The bits alternately halve the longitude and the latitude range, starting with the longitude
+    even = True
+    while len(geohash) < precision:
+        coordinate, coordinate_range = (
+            (longitude, longitude_range) if even else (latitude, latitude_range)
+        )
+        middle = (coordinate_range[0] + coordinate_range[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            coordinate_range[0] = middle
+        else:
+            coordinate_range[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            geohash.append(GEOHASH_ALPHABET[value])
+            bits = 0
+            value = 0
+    return "".join(geohash)
+
+
+def get_geohash_prefixes(
+    bounding_box: BoundingBox, max_prefixes: int = MAX_GEOHASH_PREFIXES
+) -> list[str]:
+    """
+    Get the geohash prefixes of the cells which cover the given bounding box.
+    The longest prefixes are chosen for which at most ``max_prefixes`` cells are required.
+
+    :param bounding_box: The bounding box
+    :param max_prefixes: The maximum number of returned prefixes
+    :return: The geohash prefixes of all cells which intersect the bounding box
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = get_geohash_cell_size(precision)
+        rows = range(
+            math.floor((bounding_box.latitude_min + 90) / height),
+            min(
+                math.floor((bounding_box.latitude_max + 90) / height),
+                round(180 / height) - 1,
+            )
+            + 1,
+        )
+        columns = range(
+            math.floor((bounding_box.longitude_min + 180) / width),
+            min(
+                math.floor((bounding_box.longitude_max + 180) / width),
+                round(360 / width) - 1,
+            )
+            + 1,
+        )
+        if len(rows) * len(columns) <= max_prefixes:
+            # Encode the center of each cell to get its geohash
+            return [
+                encode_geohash(
+                    -90 + (row + 0.5) * height, -180 + (column + 0.5) * width, precision
+                )
+                for row in rows
+                for column in columns
+            ]
+    # The bounding box covers almost the entire world, so all cells have to be searched
+    return list(GEOHASH_ALPHABET)
+
+
+def get_distance(
+    latitude_1: float, longitude_1: float, latitude_2: float, longitude_2: float
+) -> float:
+    """
+    Get the great-circle distance between two coordinates with the haversine formula
+
+    :param latitude_1: The latitude of the first coordinates
+    :param longitude_1: The longitude of the first coordinates
+    :param latitude_2: The latitude of the second coordinates
+    :param longitude_2: The longitude of the second coordinates
+    :return: The distance in meters
+    """
+    phi_1, phi_2 = math.radians(latitude_1), math.radians(latitude_2)
+    delta_phi = phi_2 - phi_1
+    delta_lambda = math.radians(longitude_2 - longitude_1)
+    a = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi_1) * math.cos(phi_2) * math.sin(delta_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+def get_bounding_box_around(
+    latitude: float, longitude: float, radius: float
+) -> BoundingBox:
+    """
+    Get the bounding box which contains all coordinates within the given radius around a point
+
+    :param latitude: The latitude of the point
+    :param longitude: The longitude of the point
+    :param radius: The radius in meters
+    :return: The bounding box around the circle
+    """
+    delta_latitude = math.degrees(radius / EARTH_RADIUS)
+    latitude_min = max(-90.0, latitude - delta_latitude)
+    latitude_max = min(90.0, latitude + delta_latitude)
+    # The longitude range grows with the latitude, so the latitude which is closest to a pole is relevant
+    max_abs_latitude = max(abs(latitude_min), abs(latitude_max))
+    if max_abs_latitude >= 90 or (
+        (cos := math.cos(math.radians(max_abs_latitude))) * EARTH_RADIUS <= radius
+    ):
+        return BoundingBox(latitude_min, latitude_max, -180.0, 180.0)
+    delta_longitude = math.degrees(radius / (EARTH_RADIUS * cos))
+    return BoundingBox(
+        latitude_min,
+        latitude_max,
+        max(-180.0, longitude - delta_longitude),
+        min(180.0, longitude + delta_longitude),
+    )
@@ -0,0 +1,307 @@
+"""
+This module contains a local job queue which renders the PDF documents of the API in the background (see
+:func:`~integreat_cms.api.v3.pdf_export.pdf_export`).
+
+The jobs are executed by a pool of forked worker processes, so no external message broker is required. The state of
+each job is stored in a job file next to the PDF document, which makes it available to all processes of the node:
+
+* Requests for the same content hash are de-duplicated, because only the process which creates the job file submits
+  the job. Jobs which failed or did not finish within :data:`PDF_JOB_TIMEOUT` are submitted again on the next request.
+* The number of concurrently rendered documents is limited to :attr:`~integreat_cms.core.settings.PDF_JOB_WORKERS` per
+  node, because each worker has to acquire one of the node-wide slot locks before rendering.
+"""
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import connections
+
+from ..models import Page, Region
+from .pdf_utils import get_pdf_filename, pdf_storage, render_pdf
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Any, Final, IO
+
+    from ..models import Language
+    from ..models.pages.page import PageQuerySet
+
+logger = logging.getLogger(__name__)
+
+#: The job is waiting for a free worker
+PENDING: Final = "pending"
+#: The document is being rendered
+RUNNING: Final = "running"
+#: The document is available
+DONE: Final = "done"
+#: The document could not be rendered
+FAILED: Final = "failed"
+
+#: The name of the job file in the directory of the PDF document
+JOB_FILENAME: Final = "job.json"
+
+#: The number of seconds after which an unfinished job is considered lost and is submitted again
+PDF_JOB_TIMEOUT: Final[int] = 10 * 60
+
+#: The directory which contains the node-wide slot locks of the workers
+SLOT_DIR: Final[str] = os.path.join(tempfile.gettempdir(), "integreat-cms-pdf-slots")
+
+#: The number of seconds a worker waits before it tries to acquire a slot again
+SLOT_POLL_INTERVAL: Final[float] = 0.5
+
+#: The process pool of this process, which is created on the first submitted job
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+#: The database connections which were inherited from the parent process. They must neither be used nor closed by the
+#: worker, and are kept referenced to prevent the garbage collector from terminating the session of the parent.
+_inherited_connections: list[Any] = []
+
+
+def get_job_path(job_id: str) -> str:
+    """
+    Get the path of the job file
+
+    :param job_id: The id of the job (the content hash of the PDF document)
+    :return: The absolute path of the job file
+    """
+    return pdf_storage.path(f"{job_id}/{JOB_FILENAME}")
+
+
+def read_job(job_id: str) -> dict[str, Any] | None:
+    """
+    Read the state of a job
+
+    :param job_id: The id of the job
+    :return: The job, or ``None`` if the job does not exist
+    """
+    try:
+        with open(get_job_path(job_id), encoding="utf-8") as job_file:
+            return json.load(job_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # An empty job file has just been created and is not written yet
+        return None
+
+
+def write_job(job_id: str, job: dict[str, Any]) -> None:
+    """
+    Atomically write the state of a job
+
+    :param job_id: The id of the job
+    :param job: The job
+    """
+    job["updated"] = time.time()
+    path = get_job_path(job_id)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=os.path.dirname(path), suffix=".tmp", delete=False
+    ) as job_file:
+        json.dump(job, job_file)
+    os.replace(job_file.name, path)
+
+
+def is_lost(job: dict[str, Any]) -> bool:
+    """
+    Check whether a job has to be submitted again
+
+    :param job: The job
+    :return: Whether the job failed or did not finish in time
+    """
+    if job["status"] == DONE:
+        return not pdf_storage.exists(job["filename"])
+    return job["status"] == FAILED or job["updated"] < time.time() - PDF_JOB_TIMEOUT
+
+
+def claim_job(job_id: str) -> bool:
+    """
+    Create the job file. Since the file is created exclusively, only one of multiple concurrent requests for the same
+    document succeeds, even if the requests are handled by different processes.
+
+    :param job_id: The id of the job
+    :return: Whether the job file was created by this call
+    """
+    path = get_job_path(job_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
+def get_pdf_job(
+    region: Region, language_slug: str, pages: PageQuerySet, filename: str
+) -> tuple[str, dict[str, Any]]:
+    """
+    Get the job which renders the given PDF document and submit it if it does not exist yet or has been lost
+
+    :param region: region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param pages: The pages which have a public translation in the given language
+    :param filename: The filename relative to :attr:`~integreat_cms.core.settings.PDF_ROOT`
+    :return: The id and the state of the job
+    """
+    # The first path component of the filename is the content hash
+    job_id = filename.split("/", 1)[0]
+    job = read_job(job_id)
+    if claim_job(job_id) or (job and is_lost(job)):
+        job = {
+            "region": region.slug,
+            "language": language_slug,
+            "pages": list(pages.values_list("id", flat=True)),
+            "filename": filename,
+        }
+        submit_job(job_id, job)
+    return job_id, job or {"status": PENDING}
+
+
+def prewarm_region_pdf(region: Region, language: Language) -> None:
+    """
+    Submit a job which renders the PDF document of all pages of a region in the given language, as requested by the
+    API without the ``url`` parameter, unless the document already exists. Documents are only pre-warmed if
+    :attr:`~integreat_cms.core.settings.PDF_JOB_WORKERS` is enabled, because they must not be rendered while handling
+    another request.
+
+    :param region: The region
+    :param language: The language
+    """
+    if not settings.PDF_JOB_WORKERS or language not in region.active_languages:
+        return
+    pages = region.get_pages().prefetch_public_translations(
+        language_slugs=[language.slug]
+    )
+    if not (result := get_pdf_filename(region, language.slug, pages)):
+        return
+    filename, pages = result
+    if not pdf_storage.exists(filename):
+        logger.debug("Pre-warming PDF document %r", filename)
+        get_pdf_job(region, language.slug, pages, filename)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Get the process pool of this process
+
+    :return: The process pool
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            # Fork the workers, because the executable of the server is not necessarily a python interpreter
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PDF_JOB_WORKERS,
+                mp_context=get_context("fork"),
+                initializer=init_worker,
+            )
+        return _executor
+
+
+def submit_job(job_id: str, job: dict[str, Any]) -> None:
+    """
+    Reset the state of a job and submit it to the process pool
+
+    :param job_id: The id of the job
+    :param job: The job
+    """
+    global _executor  # pylint: disable=global-statement
+    job["status"] = PENDING
+    write_job(job_id, job)
+    try:
+        future = get_executor().submit(run_worker, job_id)
+    except BrokenProcessPool:
+        logger.warning("The PDF process pool is broken and is recreated")
+        with _executor_lock:
+            _executor = None
+        future = get_executor().submit(run_worker, job_id)
+    future.add_done_callback(partial(handle_crash, job_id))
+
+
+def handle_crash(job_id: str, future: Future) -> None:
+    """
+    Mark a job as failed if its worker process crashed
+
+    :param job_id: The id of the job
+    :param future: The future of the job
+    """
+    if exception := future.exception():
+        logger.error("The PDF job %r crashed: %r", job_id, exception)
+        if job := read_job(job_id):
+            job["status"] = FAILED
+            write_job(job_id, job)
+
+
+def init_worker() -> None:
+    """
+    Initialize a forked worker process by detaching the database connections of the parent process
+    """
+    for connection in connections.all():
+        if connection.connection is not None:
+            _inherited_connections.append(connection.connection)
+            connection.connection = None
+
+
+def acquire_slot() -> IO:
+    """
+    Wait until one of the node-wide slots is free and lock it. The lock is released when the returned file is closed.
+
+    :return: The locked slot file
+    """
+    os.makedirs(SLOT_DIR, exist_ok=True)
+    while True:
+        for slot in range(settings.PDF_JOB_WORKERS):
+            # pylint: disable=consider-using-with
+            slot_file = open(os.path.join(SLOT_DIR, str(slot)), "a", encoding="utf-8")
+            try:
+                fcntl.flock(slot_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                slot_file.close()
+                continue
+            return slot_file
+        time.sleep(SLOT_POLL_INTERVAL)
+
+
+def run_worker(job_id: str) -> None:
+    """
+    Run a job in a worker process
+
+    :param job_id: The id of the job
+    """
+    try:
+        with acquire_slot():
+            run_pdf_job(job_id)
+    finally:
+        connections.close_all()
+
+
+def run_pdf_job(job_id: str) -> None:
+    """
+    Render the PDF document of a job and update its state
+
+    :param job_id: The id of the job
+    """
+    if not (job := read_job(job_id)) or job["status"] != PENDING:
+        return
+    job["status"] = RUNNING
+    write_job(job_id, job)
+    try:
+        region = Region.objects.get(slug=job["region"])
+        pages = Page.objects.filter(id__in=job["pages"]).prefetch_public_translations(
+            language_slugs=[job["language"]]
+        )
+        success = render_pdf(region, job["language"], pages, job["filename"])
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("The PDF job %r failed", job_id)
+        success = False
+    job["status"] = DONE if success else FAILED
+    write_job(job_id, job)
@@ -1,29 +1,38 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import logging
 import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing import get_context
 from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 
+import PyPDF3
 from django.conf import settings
 from django.contrib.staticfiles import finders
-from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage
-from django.db.models import Min
 from django.http import HttpResponse
 from django.shortcuts import redirect
 from django.template.loader import get_template
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.cache import never_cache
 from xhtml2pdf import pisa
 from xhtml2pdf.default import DEFAULT_CSS
 
-from ..constants import text_directions
-from ..models import Language, Page
+from ..constants import status, text_directions
+from ..models import Language, Page, PageTranslation, PdfDocument
 from .text_utils import truncate_bytewise
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+    from typing import Any, Final, IO
+
     from django.http.response import HttpResponseRedirect
 
     from ..models import Region
@@ -33,9 +42,11 @@ logger = logging.getLogger(__name__)
 
 pdf_storage = FileSystemStorage(location=settings.PDF_ROOT, base_url=settings.PDF_URL)
 
+#: The directory of the cached parts of large documents (see :func:`render_pdf_parts`)
+PDF_PARTS_DIR: Final = "parts"
+
 
 @never_cache
-# pylint: disable=too-many-locals
 def generate_pdf(
     region: Region, language_slug: str, pages: PageQuerySet
 ) -> HttpResponseRedirect:
@@ -49,41 +60,60 @@ def generate_pdf(
     :param pages: at least on page to render as PDF document
     :return: Redirection to PDF document
     """
+    if not (result := get_pdf_filename(region, language_slug, pages)):
+        return HttpResponse(
+            _("No valid pages selected for PDF generation."), status=400
+        )
+    filename, pages = result
+    # Only generate new pdf if not already exists
+    if not pdf_storage.exists(filename) and not render_pdf(
+        region, language_slug, pages, filename
+    ):
+        return HttpResponse(
+            _("The PDF could not be successfully generated."), status=500
+        )
+    return get_pdf_redirect(filename)
+
+
+def get_pdf_filename(
+    region: Region, language_slug: str, pages: PageQuerySet
+) -> tuple[str, PageQuerySet] | None:
+    """
+    Get the filename of the PDF document of the given pages. The filename contains a hash of the content, so it changes
+    whenever one of the pages is changed. All required data is fetched with a single query of the latest public
+    translations of the non-archived pages.
+
+    :param region: region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param pages: The requested pages
+    :return: The filename relative to :attr:`~integreat_cms.core.settings.PDF_ROOT` and the pages which have a public
+             translation in the given language, or ``None`` if none of the pages has a public translation
+    """
+    # The latest public translation of each non-archived page in tree order
+    translations = list(
+        PageTranslation.objects.filter(
+            page__in=pages.filter(id__in=region.non_archived_pages.values("id")),
+            language__slug=language_slug,
+            status=status.PUBLIC,
+        )
+        .order_by("page__tree_id", "page__lft", "-version")
+        .distinct("page__tree_id", "page__lft")
+        .values("page_id", "id", "last_updated", "title", "page__depth")
+    )
+    if not translations:
+        return None
     # first all necessary data for hashing are collected, starting at region slug
     # region last_updated field taking into account, to keep track of maybe edited region icons
     pdf_key_list = [region.slug, region.last_updated]
-    for page in pages:
-        # add translation id and last_updated to hash key list if they exist
-        page_translation = page.get_public_translation(language_slug)
-        if page_translation and not page.archived:
-            # if translation for this language exists
-            pdf_key_list.append(page_translation.id)
-            pdf_key_list.append(page_translation.last_updated)
-        else:
-            # if the page has no translation for this language
-            pages = pages.exclude(id=page.id)
+    for translation in translations:
+        # add translation id and last_updated to hash key list
+        pdf_key_list.append(translation["id"])
+        pdf_key_list.append(translation["last_updated"])
     # finally combine all list entries to a single hash key
     pdf_key_string = "_".join(map(str, pdf_key_list))
     # compute the hash value based on the hash key
     pdf_hash = hashlib.sha256(bytes(pdf_key_string, "utf-8")).hexdigest()[:10]
-    if not (amount_pages := pages.count()):
-        return HttpResponse(
-            _("No valid pages selected for PDF generation."), status=400
-        )
-    if amount_pages == 1:
-        # If pdf contains only one page, take its title as filename
-        title = pages.first().get_public_translation(language_slug).title
-    else:
-        # If pdf contains multiple pages, check the minimum level
-        min_level = pages.aggregate(Min("depth")).get("depth__min")
-        # Query all pages with this minimum level
-        min_level_pages = pages.filter(depth=min_level)
-        if min_level_pages.count() == 1:
-            # If there's exactly one page with the minimum level, take its title
-            title = min_level_pages.first().get_public_translation(language_slug).title
-        else:
-            # In any other case, take the region name
-            title = region.name
+    title = get_pdf_title(region, translations)
     language = Language.objects.get(slug=language_slug)
     # Make sure, that the length of the filename is valid. To prevent potential
     # edge cases, shorten filenames to 3/4 of the allowed max length.
@@ -93,49 +123,465 @@ def generate_pdf(
     except FileNotFoundError:
         max_len = 192 - len(ext)
     name = f"{settings.BRANDING_TITLE} - {language.translated_name} - {title}"
-    filename = f"{pdf_hash}/{truncate_bytewise(name, max_len)}{ext}"
-    # Only generate new pdf if not already exists
-    if not pdf_storage.exists(filename):
-        # Convert queryset to annotated list which can be rendered better
-        annotated_pages = Page.get_annotated_list_qs(pages)
-        context = {
-            "right_to_left": language.text_direction == text_directions.RIGHT_TO_LEFT,
-            "region": region,
+    # Only the pages which have a public translation in this language are rendered
+    pages = pages.filter(
+        id__in=[translation["page_id"] for translation in translations]
+    )
+    return f"{pdf_hash}/{truncate_bytewise(name, max_len)}{ext}", pages
+
+
+def get_pdf_title(region: Region, translations: list[dict[str, Any]]) -> str:
+    """
+    Get the title of the PDF document of the given pages
+
+    :param region: region which requested the pdf document
+    :param translations: The public translations of the pages in tree order
+    :return: The title of the top-level page, or the region name if there are multiple top-level pages
+    """
+    # Check the minimum level of the pages
+    min_level = min(translation["page__depth"] for translation in translations)
+    # Get all pages with this minimum level
+    min_level_translations = [
+        translation
+        for translation in translations
+        if translation["page__depth"] == min_level
+    ]
+    if len(min_level_translations) == 1:
+        # If there's exactly one page with the minimum level (or only one page at all), take its title
+        return min_level_translations[0]["title"]
+    # In any other case, take the region name
+    return region.name
+
+
+def get_pdf_redirect(filename: str) -> HttpResponseRedirect:
+    """
+    Redirect to a PDF document and record the access in the manifest (see
+    :class:`~integreat_cms.cms.models.pages.pdf_document.PdfDocument`)
+
+    :param filename: The filename relative to :attr:`~integreat_cms.core.settings.PDF_ROOT`
+    :return: The redirect to the document
+    """
+    PdfDocument.objects.filter(filename=filename).update(last_accessed=timezone.now())
+    return redirect(pdf_storage.url(filename))
+
+
+def render_pdf(
+    region: Region, language_slug: str, pages: PageQuerySet, filename: str
+) -> bool:
+    """
+    Render the PDF document of the given pages. The document is written to a temporary file first, so an incomplete
+    document is never delivered. Documents with more than :attr:`~integreat_cms.core.settings.PDF_CHUNK_SIZE` pages
+    are rendered in parts (see :func:`render_pdf_parts`).
+
+    :param region: region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param pages: The pages which have a public translation in the given language
+    :param filename: The filename relative to :attr:`~integreat_cms.core.settings.PDF_ROOT`
+    :return: Whether the document was rendered successfully
+    """
+    language = Language.objects.get(slug=language_slug)
+    context = {
+        "right_to_left": language.text_direction == text_directions.RIGHT_TO_LEFT,
+        "region": region,
+        "language": language,
+        "prevent_italics": ["ar", "fa"],
+        "BRANDING": settings.BRANDING,
+        "BRANDING_TITLE": settings.BRANDING_TITLE,
+    }
+    path = pdf_storage.path(filename)
+    if (
+        render_pdf_parts(context, list(pages), path)
+        if pages.count() > settings.PDF_CHUNK_SIZE
+        else convert_html_to_pdf(render_pdf_html(context, pages), path)
+    ):
+        # Add the document to the manifest
+        PdfDocument.objects.update_or_create(
+            filename=filename,
+            defaults={
+                "region": region,
+                "language": language,
+                "size": os.path.getsize(path),
+                "created_date": timezone.now(),
+                "last_accessed": timezone.now(),
+            },
+        )
+        return True
+    logger.error(
+        "The following PDF could not be rendered: %r, %r, %r",
+        region,
+        language,
+        pages,
+    )
+    return False
+
+
+def render_pdf_html(
+    context: dict[str, Any], pages: PageQuerySet | list[Page], **kwargs: Any
+) -> str:
+    r"""
+    Render the HTML of a PDF document
+
+    :param context: The context of the template
+    :param pages: The pages of the document
+    :param \**kwargs: Additional context of the template
+    :return: The HTML of the document
+    """
+    # Convert queryset to annotated list which can be rendered better
+    annotated_pages = Page.get_annotated_list_qs(pages)
+    return get_template("pages/page_pdf.html").render(
+        {
+            **context,
             "annotated_pages": annotated_pages,
-            "language": language,
-            "amount_pages": amount_pages,
-            "prevent_italics": ["ar", "fa"],
-            "BRANDING": settings.BRANDING,
-            "BRANDING_TITLE": settings.BRANDING_TITLE,
+            "amount_pages": len(annotated_pages),
+            **kwargs,
         }
-        html = get_template("pages/page_pdf.html").render(context)
-        # Save empty file
-        pdf_storage.save(filename, ContentFile(""))
-
-        # Get fixed version of default pdf styling (see https://github.com/digitalfabrik/integreat-cms/issues/1537)
-        fixed_css = DEFAULT_CSS.replace("background-color: transparent;", "", 1)
-
-        # Write PDF content into file
-        with pdf_storage.open(filename, "w+b") as pdf_file:
-            pisa_status = pisa.CreatePDF(
-                html,
-                dest=pdf_file,
-                link_callback=link_callback,
-                encoding="UTF-8",
-                default_css=fixed_css,
+    )
+
+
+def create_pdf(html: str, dest: IO) -> bool:
+    """
+    Convert HTML to PDF with xhtml2pdf
+
+    :param html: The HTML of the document
+    :param dest: The file to which the PDF is written
+    :return: Whether the conversion was successful
+    """
+    # Get fixed version of default pdf styling (see https://github.com/digitalfabrik/integreat-cms/issues/1537)
+    fixed_css = DEFAULT_CSS.replace("background-color: transparent;", "", 1)
+    pisa_status = pisa.CreatePDF(
+        html,
+        dest=dest,
+        link_callback=link_callback,
+        encoding="UTF-8",
+        default_css=fixed_css,
+    )
+    # pylint: disable=no-member
+    return not pisa_status.err
+
+
+def convert_html_to_pdf(html: str, path: str) -> bool:
+    """
+    Convert HTML to a PDF file. The file is written to a temporary file first and then moved to its final location.
+
+    :param html: The HTML of the document
+    :param path: The absolute path of the PDF file
+    :return: Whether the conversion was successful
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(path), suffix=".tmp", delete=False
+    ) as pdf_file:
+        success = create_pdf(html, pdf_file)
+    if not success:
+        os.remove(pdf_file.name)
+        return False
+    os.replace(pdf_file.name, path)
+    return True
+
+
+def get_pdf_parts(pages: list[Page]) -> list[list[Page]]:
+    """
+    Split the pages of a document into parts of at most :attr:`~integreat_cms.core.settings.PDF_CHUNK_SIZE` pages.
+    Consecutive top-level subtrees are combined into one part as long as they fit, larger subtrees are split.
+
+    :param pages: The pages of the document in tree order
+    :return: The parts of the document
+    """
+    min_depth = min(page.depth for page in pages)
+    subtrees: list[list[Page]] = []
+    for page in pages:
+        if page.depth == min_depth or not subtrees:
+            subtrees.append([])
+        subtrees[-1].append(page)
+    parts: list[list[Page]] = []
+    for subtree in subtrees:
+        if parts and len(parts[-1]) + len(subtree) <= settings.PDF_CHUNK_SIZE:
+            parts[-1].extend(subtree)
+        else:
+            parts.extend(
+                subtree[i : i + settings.PDF_CHUNK_SIZE]
+                for i in range(0, len(subtree), settings.PDF_CHUNK_SIZE)
             )
-        # pylint: disable=no-member
-        if pisa_status.err:
-            logger.error(
-                "The following PDF could not be rendered: %r, %r, %r",
-                region,
-                language,
-                pages,
+    return parts
+
+
+def get_part_filename(context: dict[str, Any], pages: list[Page]) -> str:
+    """
+    Get the filename of a cached part of a document. The filename contains a hash of the content of the part, so it
+    changes whenever one of its pages is changed.
+
+    :param context: The context of the template
+    :param pages: The pages of the part
+    :return: The filename relative to :attr:`~integreat_cms.core.settings.PDF_ROOT`
+    """
+    region, language = context["region"], context["language"]
+    part_key_list = [region.slug, region.last_updated, language.slug]
+    for page in pages:
+        page_translation = page.get_public_translation(language.slug)
+        part_key_list.extend(
+            [page_translation.id, page_translation.last_updated, page.depth]
+        )
+    part_key_string = "_".join(map(str, part_key_list))
+    part_hash = hashlib.sha256(bytes(part_key_string, "utf-8")).hexdigest()[:16]
+    return f"{PDF_PARTS_DIR}/{part_hash}.pdf"
+
+
+def render_pdf_parts(context: dict[str, Any], pages: list[Page], path: str) -> bool:
+    """
+    Render a large document in parts (see :func:`get_pdf_parts`) and merge them (see :func:`merge_pdf_parts`).
+    The parts are cached by the hash of their content, so only the parts which contain changed pages are rendered
+    again. The HTML is rendered in the current process, while the conversion to PDF is distributed to
+    :attr:`~integreat_cms.core.settings.PDF_PART_WORKERS` worker processes.
+
+    :param context: The context of the template
+    :param pages: The pages of the document in tree order
+    :param path: The absolute path of the PDF file
+    :return: Whether the document was rendered successfully
+    """
+    part_filenames = []
+    missing_parts = {}
+    for part in get_pdf_parts(pages):
+        part_filename = get_part_filename(context, part)
+        part_filenames.append(part_filename)
+        if pdf_storage.exists(part_filename):
+            # Keep the part from being removed by the cleanup of outdated files
+            os.utime(pdf_storage.path(part_filename))
+        else:
+            missing_parts[pdf_storage.path(part_filename)] = render_pdf_html(
+                context, part, part=True
             )
-            return HttpResponse(
-                _("The PDF could not be successfully generated."), status=500
+    logger.debug(
+        "Rendering %d of %d parts of %r", len(missing_parts), len(part_filenames), path
+    )
+    if settings.PDF_PART_WORKERS and len(missing_parts) > 1:
+        # Fork the workers, because the executable of the server is not necessarily a python interpreter
+        with ProcessPoolExecutor(
+            max_workers=min(settings.PDF_PART_WORKERS, len(missing_parts)),
+            mp_context=get_context("fork"),
+        ) as executor:
+            results = list(
+                executor.map(
+                    convert_html_to_pdf, missing_parts.values(), missing_parts.keys()
+                )
             )
-    return redirect(pdf_storage.url(filename))
+    else:
+        results = [
+            convert_html_to_pdf(html, part_path)
+            for part_path, html in missing_parts.items()
+        ]
+    if not all(results):
+        return False
+    return merge_pdf_parts(
+        context, [pdf_storage.path(filename) for filename in part_filenames], path
+    )
+
+
+def get_outline_entries(
+    reader: PyPDF3.PdfFileReader, outlines: list[Any], level: int = 0
+) -> list[tuple[int, str, int]]:
+    """
+    Get the flattened outline of a PDF document
+
+    :param reader: The reader of the document
+    :param outlines: The (nested) outline entries
+    :param level: The level of the given entries
+    :return: The level, the title and the index of the page of each outline entry
+    """
+    entries = []
+    for outline in outlines:
+        if isinstance(outline, list):
+            entries.extend(get_outline_entries(reader, outline, level + 1))
+        else:
+            entries.append(
+                (level, outline.title, reader.getDestinationPageNumber(outline))
+            )
+    return entries
+
+
+def get_merged_outline_entries(
+    parts: list[PyPDF3.PdfFileReader],
+) -> list[tuple[int, str, int]]:
+    """
+    Get the flattened outline of a document which is merged from multiple parts
+
+    :param parts: The readers of the parts
+    :return: The level, the title and the index of the page in the merged document of each outline entry
+    """
+    entries: list[tuple[int, str, int]] = []
+    offset = 0
+    for part in parts:
+        for level, title, page_index in get_outline_entries(part, part.getOutlines()):
+            if entries and entries[-1][1:] == (title, offset + page_index):
+                # If a part starts below the top level, the missing parent entries are filled with copies of the
+                # first entry, so only the deepest copy is kept
+                entries.pop()
+            entries.append((level, title, offset + page_index))
+        offset += part.getNumPages()
+    return entries
+
+
+def render_pdf_pages(html: str) -> PyPDF3.PdfFileReader:
+    """
+    Convert HTML to PDF in memory
+
+    :param html: The HTML of the document
+    :raises RuntimeError: If the document could not be converted
+    :return: The reader of the document
+    """
+    pdf_file = io.BytesIO()
+    if not create_pdf(html, pdf_file):
+        raise RuntimeError("The PDF could not be rendered")
+    return PyPDF3.PdfFileReader(pdf_file)
+
+
+def render_pdf_toc(
+    context: dict[str, Any], entries: list[tuple[int, str, int]]
+) -> PyPDF3.PdfFileReader:
+    """
+    Render the table of contents of a document which is merged from multiple parts. Since the page numbers depend on
+    the length of the table of contents itself, it is rendered again until its number of pages is stable.
+
+    :param context: The context of the template
+    :param entries: The level, the title and the index of the page (without the table of contents) of each entry
+    :return: The reader of the table of contents
+    """
+    toc_pages = 0
+    while True:
+        toc = render_pdf_pages(
+            render_pdf_html(
+                context,
+                [],
+                part=True,
+                toc_entries=[
+                    (level, title, toc_pages + page_index + 1)
+                    for level, title, page_index in entries
+                ],
+            )
+        )
+        if toc.getNumPages() == toc_pages:
+            return toc
+        toc_pages = toc.getNumPages()
+
+
+def add_bookmarks(
+    writer: PyPDF3.PdfFileWriter, entries: list[tuple[int, str, int]], offset: int
+) -> None:
+    """
+    Add the outline entries of the parts to the merged document
+
+    :param writer: The writer of the merged document
+    :param entries: The level, the title and the index of the page (without the table of contents) of each entry
+    :param offset: The number of pages of the table of contents
+    """
+    parents: list[Any] = []
+    for level, title, page_index in entries:
+        parents = parents[:level]
+        parents.append(
+            writer.addBookmark(
+                title, offset + page_index, parents[-1] if parents else None
+            )
+        )
+
+
+def merge_pdf_parts(context: dict[str, Any], part_paths: list[str], path: str) -> bool:
+    """
+    Merge the parts of a document. The table of contents is rendered from the outlines of the parts, and the footer
+    including the consecutive page numbers is rendered separately for the whole document and stamped onto each page.
+
+    :param context: The context of the template
+    :param part_paths: The absolute paths of the parts
+    :param path: The absolute path of the merged PDF file
+    :return: Whether the document was merged successfully
+    """
+    with ExitStack() as stack:
+        parts = [
+            PyPDF3.PdfFileReader(stack.enter_context(open(part_path, "rb")))
+            for part_path in part_paths
+        ]
+        entries = get_merged_outline_entries(parts)
+        try:
+            toc = render_pdf_toc(context, entries)
+            footers = render_pdf_pages(
+                render_pdf_html(
+                    context,
+                    [],
+                    footer_pages=range(
+                        sum(document.getNumPages() for document in [toc, *parts])
+                    ),
+                )
+            )
+        except RuntimeError:
+            return False
+        writer = PyPDF3.PdfFileWriter()
+        pages = [
+            document.getPage(page_index)
+            for document in [toc, *parts]
+            for page_index in range(document.getNumPages())
+        ]
+        for page_index, page in enumerate(pages):
+            page.mergePage(footers.getPage(page_index))
+            writer.addPage(page)
+        add_bookmarks(writer, entries, toc.getNumPages())
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as pdf_file:
+            writer.write(pdf_file)
+    os.replace(pdf_file.name, path)
+    return True
+
+
+def evict_pdf_documents(max_age: timedelta, max_size: int) -> tuple[int, int]:
+    """
+    Remove the PDF documents of the manifest (see :class:`~integreat_cms.cms.models.pages.pdf_document.PdfDocument`)
+    which were not accessed within the maximum age, and the least recently accessed documents until the total size of
+    the remaining documents is within the maximum size.
+
+    :param max_age: The maximum time since the last access of a document
+    :param max_size: The maximum total size of all documents in bytes
+    :return: The number and the total size of the removed documents
+    """
+    outdated = timezone.now() - max_age
+    total_size = 0
+    evicted = []
+    for document in PdfDocument.objects.order_by("-last_accessed").iterator():
+        total_size += document.size
+        if document.last_accessed < outdated or total_size > max_size:
+            evicted.append(document)
+    for document in evicted:
+        logger.debug("Removing %r", document)
+        # Each document has its own directory, which might also contain its job file
+        shutil.rmtree(
+            os.path.dirname(pdf_storage.path(document.filename)), ignore_errors=True
+        )
+    PdfDocument.objects.filter(id__in=[document.id for document in evicted]).delete()
+    return len(evicted), sum(document.size for document in evicted)
+
+
+def remove_outdated_pdf_files(max_age: timedelta) -> int:
+    """
+    Remove files in :attr:`~integreat_cms.core.settings.PDF_ROOT` which are not contained in the manifest and were not
+    modified within the maximum age, e.g. unused parts of large documents, job files or documents of deleted regions.
+
+    :param max_age: The maximum time since the last modification of a file
+    :return: The number of removed files
+    """
+    outdated = (timezone.now() - max_age).timestamp()
+    documents = set(PdfDocument.objects.values_list("filename", flat=True))
+    removed = 0
+    for directory, _, filenames in os.walk(pdf_storage.location, topdown=False):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            if (
+                os.path.relpath(path, pdf_storage.location) not in documents
+                and os.path.getmtime(path) < outdated
+            ):
+                logger.debug("Removing outdated file %r", path)
+                os.remove(path)
+                removed += 1
+        # Remove empty directories (subdirectories are visited first)
+        if directory != pdf_storage.location and not os.listdir(directory):
+            os.rmdir(directory)
+    return removed
 
 
 # pylint: disable=unused-argument
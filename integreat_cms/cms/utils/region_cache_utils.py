@@ -0,0 +1,123 @@
+"""
+This module contains a per-process cache of the regions which are requested via the API (see
+:class:`~integreat_cms.core.middleware.region_middleware.RegionMiddleware`).
+
+The cached regions already contain their language tree and the properties derived from it, so API requests can resolve
+the region and the requested language without querying the database. The cache is versioned by a stamp in the version
+cache, which is replaced whenever a region or its language tree changes (see
+:mod:`~integreat_cms.core.signals.region_cache_signals`). Since the version cache is shared between processes (see
+:mod:`~integreat_cms.core.utils.version_cache`), the invalidation also affects all other workers. If it is not shared,
+the regions are not cached at all, because the cached regions of a process would miss the changes of other processes.
+"""
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import uuid
+from typing import TYPE_CHECKING
+
+from ...core.utils.version_cache import get_version_cache, is_version_cache_shared
+from ..models import Region
+
+if TYPE_CHECKING:
+    from typing import Final
+
+logger = logging.getLogger(__name__)
+
+#: The cache key of the version stamp of the region cache
+REGION_CACHE_VERSION_KEY: Final[str] = "region_cache_version"
+
+#: The cached properties of regions which are computed before a region is cached
+CACHED_PROPERTIES: Final[list[str]] = [
+    "language_tree",
+    "language_node_by_id",
+    "language_node_by_slug",
+    "languages",
+    "active_languages",
+    "visible_languages",
+    "language_tree_root",
+    "default_language",
+    "prefix",
+    "full_name",
+]
+
+#: The lock for the cached regions of this process
+_lock = threading.Lock()
+#: The version stamp of the cached regions of this process
+_version: str | None = None
+#: The cached regions of this process by their slugs
+_regions: dict[str, Region] = {}
+
+
+def get_region_cache_version() -> str:
+    """
+    Get the current version stamp of the region cache
+
+    :return: The version stamp
+    """
+    cache = get_version_cache()
+    if (version := cache.get(REGION_CACHE_VERSION_KEY)) is None:
+        # Do not overwrite the stamp if another process created it in the meantime
+        cache.add(REGION_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(REGION_CACHE_VERSION_KEY)
+    return version
+
+
+def invalidate_region_cache() -> None:
+    """
+    Invalidate the cached regions of all processes by replacing the version stamp
+    """
+    logger.debug("Invalidating region cache")
+    get_version_cache().set(REGION_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def clear_local_region_cache() -> None:
+    """
+    Remove all cached regions of the current process
+    """
+    global _version  # pylint: disable=global-statement
+    with _lock:
+        _regions.clear()
+        _version = None
+
+
+def load_region(region_slug: str) -> Region | None:
+    """
+    Load a region with all data which is cached
+
+    :param region_slug: The slug of the region
+    :return: The region or ``None`` if it does not exist
+    """
+    if region := Region.objects.filter(slug=region_slug).first():
+        for cached_property in CACHED_PROPERTIES:
+            getattr(region, cached_property)
+    return region
+
+
+def get_cached_region(region_slug: str) -> Region | None:
+    """
+    Get a region from the cache of the current process or load it if it is not cached or outdated.
+    Each call returns a shallow copy of the cached region, so properties which are computed during a request are not
+    shared with other requests. If the version cache is not shared between processes, the region is always loaded.
+
+    :param region_slug: The slug of the region
+    :return: The region or ``None`` if it does not exist
+    """
+    global _version  # pylint: disable=global-statement
+    if not is_version_cache_shared():
+        return load_region(region_slug)
+    version = get_region_cache_version()
+    with _lock:
+        if version != _version:
+            _regions.clear()
+            _version = version
+        region = _regions.get(region_slug)
+    if not region:
+        # Non-existing regions are not cached to limit the size of the cache
+        if not (region := load_region(region_slug)):
+            return None
+        with _lock:
+            if _version == version:
+                _regions[region_slug] = region
+    return copy.copy(region)
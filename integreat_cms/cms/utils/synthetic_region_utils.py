@@ -0,0 +1,530 @@
+"""
+This module contains a generator for synthetic regions with a configurable amount of content.
+The generated content is reproducible for a given seed and is used to measure the performance of the CMS and the API
+with production-like data sets (see :mod:`~integreat_cms.core.management.commands.generate_synthetic_region` and the
+benchmarks in ``tests/benchmarks``).
+"""
+from __future__ import annotations
+
+import logging
+import random
+from datetime import datetime, time, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+from ..constants import administrative_division, frequency, region_status, status
+from ..models import (
+    Event,
+    EventOccurrence,
+    EventTranslation,
+    Language,
+    LanguageTreeNode,
+    Page,
+    PagePath,
+    PageTranslation,
+    POI,
+    POICategory,
+    POICategoryTranslation,
+    POITranslation,
+    RecurrenceRule,
+    Region,
+)
+from ..models.abstract_content_translation import LATEST_VERSION_FLAGS
+from .geo_utils import encode_geohash
+
+if TYPE_CHECKING:
+    from typing import Final, Iterable, Iterator, TypeVar
+
+    from ..models.abstract_content_translation import AbstractContentTranslation
+
+    T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+#: The words of which the synthetic texts are composed
+WORDS: Final[list[str]] = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore "
+    "magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo consequat "
+    "duis aute irure in reprehenderit voluptate velit esse cillum fugiat nulla pariatur excepteur sint occaecat "
+    "cupidatat non proident sunt culpa qui officia deserunt mollit anim id est laborum"
+).split()
+
+#: The number of objects which are created in one query
+BATCH_SIZE: Final[int] = 1000
+
+#: The probability that a content object is translated into a language other than the default language
+TRANSLATION_PROBABILITY: Final[float] = 0.9
+
+#: The probability that the latest version of a translation is a draft
+DRAFT_PROBABILITY: Final[float] = 0.1
+
+#: The bounding box of the synthetic regions (latitude min, latitude max, longitude min, longitude max)
+BOUNDING_BOX: Final[tuple[float, float, float, float]] = (48.25, 48.46, 10.76, 10.96)
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of the given size
+
+    :param iterable: The iterable
+    :param size: The maximum size of the batches
+    :return: An iterator over the batches
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def mark_latest_versions(versions: list[AbstractContentTranslation]) -> None:
+    """
+    Set the flags of the latest versions of a translation (see
+    :meth:`~integreat_cms.cms.models.abstract_content_translation.AbstractContentTranslation.update_latest_versions`)
+    without querying the database
+
+    :param versions: The unsaved versions of a translation in one language, ordered by their version number
+    """
+    for flag, filters in LATEST_VERSION_FLAGS.items():
+        for version in reversed(versions):
+            if all(
+                getattr(version, field) == value for field, value in filters.items()
+            ):
+                setattr(version, flag, True)
+                break
+
+
+# pylint: disable=too-many-instance-attributes
+class SyntheticRegionGenerator:
+    """
+    This class generates a synthetic region with pages, events and locations in multiple languages
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        slug: str,
+        pages: int = 1000,
+        max_depth: int = 8,
+        languages: int = 5,
+        versions: int = 3,
+        events: int = 200,
+        recurring_events: int = 50,
+        pois: int = 200,
+        categories: int = 10,
+        mirrored_pages: int = 50,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the generator
+
+        :param slug: The slug of the new region
+        :param pages: The number of pages
+        :param max_depth: The maximum depth of the page tree
+        :param languages: The number of languages (existing languages are used first)
+        :param versions: The number of versions of each translation
+        :param events: The number of events
+        :param recurring_events: How many of the events are recurring
+        :param pois: The number of locations
+        :param categories: The number of new location categories
+        :param mirrored_pages: The number of pages which embed the content of another page
+        :param seed: The seed of the random number generator
+        """
+        self.slug = slug
+        self.pages = pages
+        self.max_depth = max_depth
+        self.languages = languages
+        self.versions = versions
+        self.events = events
+        self.recurring_events = min(recurring_events, events)
+        self.pois = pois
+        self.categories = categories
+        self.mirrored_pages = min(mirrored_pages, max(pages - 1, 0))
+        self.random = random.Random(seed)
+        self.now = timezone.now()
+        #: The languages of the region, the first one is the default language
+        self.language_objects: list[Language] = []
+        #: The generated location categories (they are not bound to the region)
+        self.category_objects: list[POICategory] = []
+
+    def text(self, words: int) -> str:
+        """
+        Generate a random text
+
+        :param words: The number of words
+        :return: The text
+        """
+        return " ".join(self.random.choices(WORDS, k=words))
+
+    def html(self, paragraphs: int = 5) -> str:
+        """
+        Generate random html content
+
+        :param paragraphs: The number of paragraphs
+        :return: The content
+        """
+        return "".join(
+            f"<h2>{self.text(3).title()}</h2><p>{self.text(60)}</p>"
+            for _ in range(paragraphs)
+        )
+
+    def create_versions(
+        self, model: type[AbstractContentTranslation], title: str, **kwargs: object
+    ) -> list[AbstractContentTranslation]:
+        r"""
+        Create the unsaved versions of a translation
+
+        :param model: The translation model
+        :param title: The title of the translation
+        :param \**kwargs: The foreign keys and further fields of the translation
+        :return: The versions
+        """
+        versions = [
+            model(
+                title=title,
+                slug=slugify(title),
+                content=self.html(),
+                status=status.PUBLIC,
+                version=version,
+                last_updated=self.now - timedelta(days=self.versions - version),
+                **kwargs,
+            )
+            for version in range(1, self.versions + 1)
+        ]
+        if versions and self.random.random() < DRAFT_PROBABILITY:
+            versions[-1].status = status.DRAFT
+        mark_latest_versions(versions)
+        return versions
+
+    def get_translation_languages(self) -> Iterator[Language]:
+        """
+        Select the languages of a content object
+
+        :return: The default language and a random selection of the other languages
+        """
+        default_language, *other_languages = self.language_objects
+        yield default_language
+        for language in other_languages:
+            if self.random.random() < TRANSLATION_PROBABILITY:
+                yield language
+
+    def get_languages(self) -> list[Language]:
+        """
+        Get the languages of the region and create synthetic languages if not enough languages exist
+
+        :return: The languages
+        """
+        languages = list(Language.objects.order_by("id")[: self.languages])
+        for number in range(len(languages), self.languages):
+            languages.append(
+                Language.objects.create(
+                    slug=f"x{number}",
+                    bcp47_tag=f"x-synthetic-{number}",
+                    native_name=f"Synthetic {number}",
+                    english_name=f"Synthetic {number}",
+                    primary_country_code="de",
+                )
+            )
+        return languages
+
+    def create_region(self) -> Region:
+        """
+        Create the region and its language tree
+
+        :return: The region
+        """
+        latitude_min, latitude_max, longitude_min, longitude_max = BOUNDING_BOX
+        region = Region.objects.create(
+            name=self.slug.replace("-", " ").title(),
+            slug=self.slug,
+            status=region_status.ACTIVE,
+            administrative_division=administrative_division.CITY,
+            locations_enabled=True,
+            latitude=(latitude_min + latitude_max) / 2,
+            longitude=(longitude_min + longitude_max) / 2,
+            latitude_min=latitude_min,
+            latitude_max=latitude_max,
+            longitude_min=longitude_min,
+            longitude_max=longitude_max,
+            postal_code="00000",
+            admin_mail=f"{self.slug}@example.com",
+        )
+        tree_id = (
+            LanguageTreeNode.objects.aggregate(Max("tree_id"))["tree_id__max"] or 0
+        ) + 1
+        default_language, *other_languages = self.language_objects
+        root = LanguageTreeNode.objects.create(
+            region=region,
+            language=default_language,
+            tree_id=tree_id,
+            lft=1,
+            rgt=2 * len(self.language_objects),
+            depth=1,
+        )
+        LanguageTreeNode.objects.bulk_create(
+            LanguageTreeNode(
+                region=region,
+                language=language,
+                parent=root,
+                tree_id=tree_id,
+                lft=2 * number,
+                rgt=2 * number + 1,
+                depth=2,
+            )
+            for number, language in enumerate(other_languages, start=1)
+        )
+        return region
+
+    def get_page_parents(self) -> list[int | None]:
+        """
+        Generate the structure of the page tree. The first pages form a chain of the maximum depth, all further pages
+        are either roots or children of random pages which are not at the maximum depth.
+
+        :return: The index of the parent of each page (or ``None`` for root pages)
+        """
+        roots = max(1, self.pages // 100)
+        parents: list[int | None] = []
+        depths: list[int] = []
+        candidates: list[int] = []
+        for index in range(self.pages):
+            if index < self.max_depth:
+                parent = index - 1 if index else None
+            elif index < self.max_depth + roots - 1:
+                parent = None
+            else:
+                parent = self.random.choice(candidates)
+            depth = depths[parent] + 1 if parent is not None else 1
+            parents.append(parent)
+            depths.append(depth)
+            if depth < self.max_depth:
+                candidates.append(index)
+        return parents
+
+    @staticmethod
+    def number_pages(
+        pages: list[Page], parents: list[int | None], first_tree_id: int
+    ) -> None:
+        """
+        Calculate the nested set values of the pages
+
+        :param pages: The pages
+        :param parents: The index of the parent of each page
+        :param first_tree_id: The id of the first tree
+        """
+        children: dict[int | None, list[int]] = {}
+        for index, parent in enumerate(parents):
+            children.setdefault(parent, []).append(index)
+
+        def number_subtree(index: int, tree_id: int, lft: int, depth: int) -> int:
+            """
+            Calculate the nested set values of a subtree
+
+            :param index: The index of the subtree's root
+            :param tree_id: The id of the tree
+            :param lft: The left value of the subtree's root
+            :param depth: The depth of the subtree's root
+            :return: The right value of the subtree's root
+            """
+            rgt = lft + 1
+            for child in children.get(index, []):
+                rgt = number_subtree(child, tree_id, rgt, depth + 1) + 1
+            page = pages[index]
+            page.tree_id, page.lft, page.rgt, page.depth = tree_id, lft, rgt, depth
+            return rgt
+
+        for tree_number, root in enumerate(children.get(None, [])):
+            number_subtree(root, first_tree_id + tree_number, 1, 1)
+
+    def create_pages(self, region: Region) -> list[Page]:
+        """
+        Create the page tree of the region
+
+        :param region: The region
+        :return: The pages
+        """
+        parents = self.get_page_parents()
+        pages = [Page(region=region, created_date=self.now) for _ in parents]
+        self.number_pages(
+            pages,
+            parents,
+            (Page.objects.aggregate(Max("tree_id"))["tree_id__max"] or 0) + 1,
+        )
+        # Create the pages level by level, so the ids of the parents are known
+        for depth in range(1, self.max_depth + 1):
+            level = [index for index, page in enumerate(pages) if page.depth == depth]
+            for index in level:
+                if (parent := parents[index]) is not None:
+                    pages[index].parent_id = pages[parent].id
+            Page.objects.bulk_create(
+                [pages[index] for index in level], batch_size=BATCH_SIZE
+            )
+        # Let some pages embed the content of other pages
+        for page in self.random.sample(pages, self.mirrored_pages):
+            while (mirrored_page := self.random.choice(pages)) is page:
+                pass
+            page.mirrored_page = mirrored_page
+            page.mirrored_page_first = self.random.random() < 0.5
+        Page.objects.bulk_update(
+            [page for page in pages if page.mirrored_page_id],
+            ["mirrored_page", "mirrored_page_first"],
+            batch_size=BATCH_SIZE,
+        )
+        for batch in batched(pages, 100):
+            PageTranslation.objects.bulk_create(
+                (
+                    version
+                    for page in batch
+                    for language in self.get_translation_languages()
+                    for version in self.create_versions(
+                        PageTranslation,
+                        f"{self.text(3).title()} {page.id}",
+                        page=page,
+                        language=language,
+                    )
+                ),
+                batch_size=BATCH_SIZE,
+            )
+        PagePath.update_paths(region, region.pages.all())
+        return pages
+
+    def create_pois(self, region: Region) -> list[POI]:
+        """
+        Create the locations of the region and their categories
+
+        :param region: The region
+        :return: The locations
+        """
+        self.category_objects = categories = POICategory.objects.bulk_create(
+            POICategory() for _ in range(self.categories)
+        )
+        POICategoryTranslation.objects.bulk_create(
+            POICategoryTranslation(
+                category=category, language=language, name=self.text(2).title()
+            )
+            for category in categories
+            for language in self.language_objects
+        )
+        latitude_min, latitude_max, longitude_min, longitude_max = BOUNDING_BOX
+        pois = []
+        for number in range(self.pois):
+            latitude = self.random.uniform(latitude_min, latitude_max)
+            longitude = self.random.uniform(longitude_min, longitude_max)
+            pois.append(
+                POI(
+                    region=region,
+                    created_date=self.now,
+                    address=f"{self.text(1).title()}straße {number + 1}",
+                    postcode="00000",
+                    city=region.name,
+                    country="Deutschland",
+                    latitude=latitude,
+                    longitude=longitude,
+                    geohash=encode_geohash(latitude, longitude),
+                    location_on_map=True,
+                    category=self.random.choice(categories),
+                )
+            )
+        POI.objects.bulk_create(pois, batch_size=BATCH_SIZE)
+        for batch in batched(pois, 100):
+            POITranslation.objects.bulk_create(
+                (
+                    version
+                    for poi in batch
+                    for language in self.get_translation_languages()
+                    for version in self.create_versions(
+                        POITranslation,
+                        f"{self.text(2).title()} {poi.id}",
+                        poi=poi,
+                        language=language,
+                        meta_description=self.text(10),
+                    )
+                ),
+                batch_size=BATCH_SIZE,
+            )
+        return pois
+
+    def create_events(self, region: Region, pois: list[POI]) -> list[Event]:
+        """
+        Create the events of the region and store their occurrences
+
+        :param region: The region
+        :param pois: The locations of the region
+        :return: The events
+        """
+        recurrence_rules = RecurrenceRule.objects.bulk_create(
+            RecurrenceRule(
+                frequency=frequency.WEEKLY,
+                interval=self.random.randint(1, 2),
+                weekdays_for_weekly=[self.random.randrange(7)],
+            )
+            for _ in range(self.recurring_events)
+        )
+        today = timezone.localdate()
+        events = []
+        for number in range(self.events):
+            start = timezone.make_aware(
+                datetime.combine(
+                    today + timedelta(days=self.random.randrange(60)),
+                    time(hour=self.random.randint(8, 20)),
+                )
+            )
+            events.append(
+                Event(
+                    region=region,
+                    created_date=self.now,
+                    start=start,
+                    end=start + timedelta(hours=2),
+                    recurrence_rule=recurrence_rules[number]
+                    if number < len(recurrence_rules)
+                    else None,
+                    location=self.random.choice(pois)
+                    if pois and self.random.random() < 0.5
+                    else None,
+                )
+            )
+        Event.objects.bulk_create(events, batch_size=BATCH_SIZE)
+        EventOccurrence.objects.bulk_create(
+            (
+                EventOccurrence(event=event, region=region, start=start, end=end)
+                for event in events
+                for start, end in EventOccurrence.get_occurrence_periods(event, today)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        for batch in batched(events, 100):
+            EventTranslation.objects.bulk_create(
+                (
+                    version
+                    for event in batch
+                    for language in self.get_translation_languages()
+                    for version in self.create_versions(
+                        EventTranslation,
+                        f"{self.text(3).title()} {event.id}",
+                        event=event,
+                        language=language,
+                    )
+                ),
+                batch_size=BATCH_SIZE,
+            )
+        return events
+
+    @transaction.atomic
+    def generate(self) -> Region:
+        """
+        Generate the region with all its content
+
+        :return: The new region
+        """
+        self.language_objects = self.get_languages()
+        region = self.create_region()
+        logger.info("Created %r with %d languages", region, self.languages)
+        pages = self.create_pages(region)
+        logger.info("Created %d pages in %r", len(pages), region)
+        pois = self.create_pois(region)
+        logger.info("Created %d locations in %r", len(pois), region)
+        events = self.create_events(region, pois)
+        logger.info("Created %d events in %r", len(events), region)
+        return region
@@ -1,36 +1,161 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
 
+from ....api.utils.app_size_utils import (
+    CONTENT_TYPES,
+    LARGEST_ITEMS_COUNT,
+    MEDIA,
+    THUMBNAILS,
+)
+from ...decorators import permission_required
+
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Final
+
+    from django.utils.functional import Promise
+
+    from ...models import AppSizeMeasurement
 
 logger = logging.getLogger(__name__)
 
+#: The labels of the measured content types
+CONTENT_TYPE_LABELS: Final[dict[str, Promise]] = {
+    "pages": _("Pages"),
+    "events": _("Events"),
+    "locations": _("Locations"),
+    "location-categories": _("Location categories"),
+    "offers": _("Offers"),
+    "imprint": _("Imprint"),
+    MEDIA: _("Media files"),
+    THUMBNAILS: _("Thumbnails"),
+}
+
+#: The number of days of the app size history which are shown
+HISTORY_DAYS: Final[int] = 90
 
+
+@method_decorator(permission_required("cms.view_translation_report"), name="dispatch")
 class AppSizeView(TemplateView):
     """
-    View to calculate the current size of the content, that's been send via the API.
+    View to show the size of the content which clients download via the API for each language of the region. The sizes
+    are calculated in the background by the management command
+    :mod:`~integreat_cms.core.management.commands.calculate_app_size`.
     """
 
     #: The template to render (see :class:`~django.views.generic.base.TemplateResponseMixin`)
     template_name = "analytics/app_size.html"
 
-    # pylint: disable=fixme
-    def get_context_data(self, **kwargs: Any) -> dict:
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         r"""
         Extend context by app size
 
         :param \**kwargs: The supplied keyword arguments
         :return: The context dictionary
         """
+        region = self.request.region
+        # The latest measurement of each language
+        measurements = list(
+            region.app_size_measurements.select_related("language")
+            .order_by("language_id", "-date")
+            .distinct("language_id")
+        )
+        measurements.sort(key=lambda measurement: measurement.language.translated_name)
+        total_sizes = {
+            content_type: sum(
+                measurement.sizes.get(content_type, 0) for measurement in measurements
+            )
+            for content_type in CONTENT_TYPES
+        }
         context = super().get_context_data(**kwargs)
+        context.update(
+            {
+                "current_menu_item": "app_size",
+                "content_types": [
+                    CONTENT_TYPE_LABELS[content_type] for content_type in CONTENT_TYPES
+                ],
+                "rows": [
+                    (
+                        measurement,
+                        [
+                            measurement.sizes.get(content_type, 0)
+                            for content_type in CONTENT_TYPES
+                        ],
+                    )
+                    for measurement in measurements
+                ],
+                "total_sizes": list(total_sizes.values()),
+                "app_size": sum(total_sizes.values()),
+                "largest_pages": self.get_largest_items(measurements, "page"),
+                "largest_media": self.get_largest_items(measurements, "media"),
+                "chart_data": self.get_chart_data(),
+            }
+        )
+        return context
 
-        # TODO: Implement correct calculation.
-        app_size_total = 0
+    @staticmethod
+    def get_largest_items(
+        measurements: list[AppSizeMeasurement], item_type: str
+    ) -> list[dict[str, Any]]:
+        """
+        Get the largest items of the given type in all languages. Media files which are used in multiple languages are
+        only listed once.
 
-        context.update({"current_menu_item": "app_size", "app_size": app_size_total})
-        return context
+        :param measurements: The latest measurement of each language
+        :param item_type: The type of the items (``page`` or ``media``)
+        :return: The largest items with their language
+        """
+        items: dict[str, dict[str, Any]] = {}
+        for measurement in measurements:
+            for item in measurement.largest_items:
+                if item["type"] == item_type:
+                    items.setdefault(
+                        item["url"],
+                        {
+                            **item,
+                            "language": measurement.language,
+                            "total_size": item["size"] + item.get("media_size", 0),
+                        },
+                    )
+        return sorted(
+            items.values(), key=lambda item: item["total_size"], reverse=True
+        )[:LARGEST_ITEMS_COUNT]
+
+    def get_chart_data(self) -> dict[str, Any]:
+        """
+        Get the history of the app size per content type in megabytes in the format expected by ChartJS.
+        If a language was measured multiple times on one day, the latest measurement is used.
+
+        :return: The chart data
+        """
+        history: dict[str, dict[int, dict[str, int]]] = {}
+        for measurement in self.request.region.app_size_measurements.filter(
+            date__gte=timezone.now() - timedelta(days=HISTORY_DAYS)
+        ).order_by("date"):
+            day = str(timezone.localdate(measurement.date))
+            history.setdefault(day, {})[measurement.language_id] = measurement.sizes
+        return {
+            "labels": list(history),
+            "datasets": [
+                {
+                    "label": CONTENT_TYPE_LABELS[content_type],
+                    # The sizes are shown in megabytes
+                    "data": [
+                        round(
+                            sum(sizes.get(content_type, 0) for sizes in day.values())
+                            / 1000**2,
+                            2,
+                        )
+                        for day in history.values()
+                    ],
+                }
+                for content_type in CONTENT_TYPES
+            ],
+        }
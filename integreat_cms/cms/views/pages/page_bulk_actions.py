@@ -41,8 +41,6 @@ class GeneratePdfView(PageBulkActionMixin, BulkActionView):
 
     #: Whether the view requires change permissions
     require_change_permission = False
-    #: Whether the public translation objects should be prefetched
-    prefetch_public_translations = True
 
     def post(
         self, request: HttpRequest, *args: Any, **kwargs: Any
@@ -55,11 +53,14 @@ class GeneratePdfView(PageBulkActionMixin, BulkActionView):
         :param \**kwargs: The supplied keyword arguments
         :return: The redirect
         """
-        # Generate PDF document and redirect to it
+        language_slug = kwargs.get("language_slug")
+        # Generate PDF document and redirect to it (only the translations in the requested language are rendered)
         return generate_pdf(
             request.region,
-            kwargs.get("language_slug"),
-            self.get_queryset(),
+            language_slug,
+            self.get_queryset().prefetch_public_translations(
+                language_slugs=[language_slug]
+            ),
         )
 
 
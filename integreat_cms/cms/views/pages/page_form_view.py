@@ -374,9 +374,12 @@ class PageFormView(
                 languages = [language] + [
                     node.language for node in language_tree_node.get_descendants()
                 ]
-                page_translation_form.instance.page.translations.filter(
-                    language__in=languages
-                ).update(status=status.DRAFT)
+                page_translation_form.instance.update_status(
+                    page_translation_form.instance.page.translations.filter(
+                        language__in=languages
+                    ),
+                    status.DRAFT,
+                )
             # If this is the first version and the minor edit checkbox is checked, remove it
             if (
                 page_translation_form.instance.version == 1
@@ -396,9 +399,12 @@ class PageFormView(
                 page_translation_form.instance.status == status.PUBLIC
                 and page_translation_form.instance.minor_edit
             ):
-                page_translation_form.instance.page.translations.filter(
-                    language=language
-                ).update(status=status.PUBLIC)
+                page_translation_form.instance.update_status(
+                    page_translation_form.instance.page.translations.filter(
+                        language=language
+                    ),
+                    status.PUBLIC,
+                )
 
             # Add the success message and redirect to the edit page
             if not page_instance:
@@ -133,9 +133,12 @@ class PageTreeView(TemplateView, PageContextMixin, MachineTranslationContextMixi
 
         # Cache tree structure to reduce database queries
         pages = (
-            page_queryset.prefetch_major_translations()
-            .prefetch_related("mirroring_pages")
-            .cache_tree(archived=self.archived)
+            page_queryset.prefetch_related("mirroring_pages")
+            .prefetch_paths()
+            .cache_tree(
+                archived=self.archived,
+                translations=("translations", "major_translations"),
+            )
         )
 
         # Filter pages according to given filters, if any
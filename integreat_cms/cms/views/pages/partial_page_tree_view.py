@@ -36,9 +36,9 @@ def render_partial_page_tree_views(
 
     all_pages = (
         region.pages.filter(tree_id__in=requested_tree_ids)
-        .prefetch_major_translations()
         .prefetch_related("mirroring_pages")
-        .cache_tree(archived=False)
+        .prefetch_paths()
+        .cache_tree(archived=False, translations=("translations", "major_translations"))
     )
 
     pages_by_id = defaultdict(list)
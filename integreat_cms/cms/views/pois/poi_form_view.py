@@ -180,16 +180,22 @@ class POIFormView(
                 languages = [language] + [
                     node.language for node in language_tree_node.get_descendants()
                 ]
-                poi_translation_form.instance.poi.translations.filter(
-                    language__in=languages
-                ).update(status=status.DRAFT)
+                poi_translation_form.instance.update_status(
+                    poi_translation_form.instance.poi.translations.filter(
+                        language__in=languages
+                    ),
+                    status.DRAFT,
+                )
             elif (
                 poi_translation_form.instance.status == status.PUBLIC
                 and poi_translation_form.instance.minor_edit
             ):
-                poi_translation_form.instance.poi.translations.filter(
-                    language=language
-                ).update(status=status.PUBLIC)
+                poi_translation_form.instance.update_status(
+                    poi_translation_form.instance.poi.translations.filter(
+                        language=language
+                    ),
+                    status.PUBLIC,
+                )
 
             # Show a message that the slug was changed if it was not unique
             if user_slug and user_slug != poi_translation_form.cleaned_data["slug"]:
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
 from django.http import JsonResponse
+from django.utils.translation import get_language
 from django.views.decorators.http import require_POST
 
 from ...constants import status
@@ -121,7 +122,15 @@ def search_content_ajax(
         object_types.remove("page")
         if not user.has_perm("cms.view_page"):
             raise PermissionDenied
-        pages = region.pages.all().cache_tree(archived=archived_flag)
+        # Only the translations which are required for the titles and paths of the results are prefetched
+        pages = region.pages.prefetch_paths(language_slugs=[language_slug]).cache_tree(
+            archived=archived_flag,
+            language_slugs={
+                language_slug,
+                get_language(),
+                region.default_language.slug,
+            },
+        )
         for page in pages:
             page_translation = page.get_translation(language_slug)
             if page_translation and (
@@ -40,7 +40,7 @@ def change_translation_status(
                 translation.pk = None
                 translation.version += 1
                 if desired_status == status.DRAFT:
-                    translation.all_versions.update(status=desired_status)
+                    translation.update_status(translation.all_versions, desired_status)
                 translation.save()
                 messages.success(
                     request,
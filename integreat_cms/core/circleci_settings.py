@@ -8,12 +8,14 @@ For the full list of settings and their values, see :doc:`django:ref/settings`.
 # pylint: disable=unused-wildcard-import
 from __future__ import annotations
 
+import tempfile
+
 from .settings import *
 
 #: Set a dummy secret key for CircleCI build even if it's not in debug mode
 SECRET_KEY = "dummy"
-#: Set dummy key to test push notifications
-FCM_KEY = "dummy"
+#: Set dummy credentials to test push notifications
+FCM_CREDENTIALS = "dummy"
 #: Enable manually because existing setting derives from the unset env var
 FCM_ENABLED = True
 #: Set dummy SUMM.AI API key to test translations into Easy German
@@ -28,6 +30,13 @@ DEEPL_ENABLED = True
 LOG_LEVEL = "DEBUG"
 #: Disable linkcheck listeners on CircleCI
 LINKCHECK_DISABLE_LISTENERS = True
+#: Render PDF documents synchronously, because background workers cannot access the data of the test transactions
+PDF_JOB_WORKERS = 0
+#: Use a separate directory for the version stamps of each test process, so parallel test runs do not interfere
+CACHES["versions"] = {
+    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+    "LOCATION": tempfile.mkdtemp(prefix="integreat-cms-versions-"),
+}
 #: Enable logging of all entries from the messages framework
 MESSAGE_LOGGING_ENABLED = True
 
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from ....api.utils.offline_bundle_utils import build_offline_bundle
+from ....cms.constants import region_status
+from ....cms.models import Region
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to build the offline bundles of the API
+    (see :mod:`~integreat_cms.api.utils.offline_bundle_utils`)
+    """
+
+    help = "Build the offline bundles of all active languages whose content changed"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            help="The slugs of the regions which should be processed. If empty, all active regions will be processed",
+            nargs="*",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, region_slugs: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the given regions
+        :param \**options: The supplied keyword options
+        :raises ~django.core.management.base.CommandError: When one of the given regions does not exist
+        """
+        if region_slugs:
+            regions = Region.objects.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - set(region.slug for region in regions)
+                raise CommandError(f"The following regions do not exist: {diff}")
+        else:
+            regions = Region.objects.filter(status=region_status.ACTIVE)
+
+        built = total = 0
+        for region in regions:
+            for language in region.active_languages:
+                name, is_new = build_offline_bundle(region, language.slug)
+                logger.info("Offline bundle of %r: %s", region, name)
+                built += is_new
+                total += 1
+        self.print_success(
+            f"✔ Built {built} offline bundles ({total - built} were up to date)."
+        )
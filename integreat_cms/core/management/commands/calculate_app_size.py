@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from ....api.utils.app_size_utils import measure_app_size
+from ....cms.constants import region_status
+from ....cms.models import Region
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to measure the size of the content which clients download
+    (see :mod:`~integreat_cms.api.utils.app_size_utils`)
+    """
+
+    help = "Measure the size of the content of all active languages"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            help="The slugs of the regions which should be processed. If empty, all active regions will be processed",
+            nargs="*",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, region_slugs: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the given regions
+        :param \**options: The supplied keyword options
+        :raises ~django.core.management.base.CommandError: When one of the given regions does not exist
+        """
+        if region_slugs:
+            regions = Region.objects.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - set(region.slug for region in regions)
+                raise CommandError(f"The following regions do not exist: {diff}")
+        else:
+            regions = Region.objects.filter(status=region_status.ACTIVE)
+
+        count = 0
+        for region in regions:
+            for language in region.active_languages:
+                measure_app_size(region, language)
+                count += 1
+        self.print_success(
+            f"✔ Measured the app size of {count} languages in {len(regions)} regions."
+        )
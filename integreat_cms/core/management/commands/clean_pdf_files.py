@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.template.defaultfilters import filesizeformat
+
+from ....cms.utils.pdf_utils import evict_pdf_documents, remove_outdated_pdf_files
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to remove outdated PDF documents (see :mod:`~integreat_cms.cms.utils.pdf_utils`)
+    """
+
+    help = "Remove PDF documents which were not requested recently or exceed the maximum size of the cache"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=settings.PDF_CACHE_MAX_AGE,
+            help="The number of days after which documents which were not requested are removed",
+        )
+        parser.add_argument(
+            "--max-size",
+            type=int,
+            default=settings.PDF_CACHE_MAX_SIZE,
+            help="The maximum total size of all documents in megabytes",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, max_age: int, max_size: int, **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param max_age: The maximum number of days since the last request of a document
+        :param max_size: The maximum total size of all documents in megabytes
+        :param \**options: The supplied keyword options
+        """
+        evicted, size = evict_pdf_documents(
+            timedelta(days=max_age), max_size * 1000**2
+        )
+        removed = remove_outdated_pdf_files(timedelta(days=max_age))
+        self.print_success(
+            f"✔ Removed {evicted} PDF documents ({filesizeformat(size)}) and {removed} outdated files."
+        )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ....cms.models.abstract_content_translation import LATEST_VERSION_FLAGS
+from ..log_command import LogCommand
+from .update_latest_versions import MODELS
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to find translations whose flags of the latest versions are inconsistent with their version
+    history
+    """
+
+    help = "Find inconsistent flags of the latest versions of translations"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "model",
+            choices=MODELS,
+            help="The model to check",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, model: str, **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param model: The model to check
+        :param \**options: The supplied keyword options
+        """
+        translation_model = MODELS[model]
+        self.print_info(
+            f"Checking the model {translation_model.__name__} for inconsistent latest versions..."
+        )
+        success = True
+        for flag in LATEST_VERSION_FLAGS:
+            expected = set(
+                translation_model.get_latest_versions(flag).values_list("id", flat=True)
+            )
+            actual = set(
+                translation_model.objects.filter(**{flag: True}).values_list(
+                    "id", flat=True
+                )
+            )
+            for translation in translation_model.objects.filter(
+                id__in=expected ^ actual
+            ):
+                self.print_error(
+                    f"The flag {flag!r} of {translation!r} (version {translation.version}) is {getattr(translation, flag)}, but should be {translation.id in expected}!"
+                )
+                success = False
+        if success:
+            self.print_success("✔ All latest versions are consistent.")
+        else:
+            self.print_info(
+                "Run the command update_latest_versions to fix the inconsistencies."
+            )
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from ....cms.models import Region
+from ....cms.utils.synthetic_region_utils import SyntheticRegionGenerator
+from ..debug_command import DebugCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a positive integer argument
+
+    :param value: The value of the argument
+    :raises ValueError: When the value is not a positive integer
+    :return: The parsed integer
+    """
+    if (number := int(value)) < 1:
+        raise ValueError("The value must be positive")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """
+    Parse a non-negative integer argument
+
+    :param value: The value of the argument
+    :raises ValueError: When the value is negative
+    :return: The parsed integer
+    """
+    if (number := int(value)) < 0:
+        raise ValueError("The value must not be negative")
+    return number
+
+
+class Command(DebugCommand):
+    """
+    Management command to generate a synthetic region with a configurable amount of content (see
+    :class:`~integreat_cms.cms.utils.synthetic_region_utils.SyntheticRegionGenerator`)
+    """
+
+    help = "Generate a reproducible synthetic region to measure the performance with production-like data"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument("region_slug", help="The slug of the new region")
+        parser.add_argument(
+            "--pages", type=non_negative_int, default=1000, help="The number of pages"
+        )
+        parser.add_argument(
+            "--max-depth",
+            type=positive_int,
+            default=8,
+            help="The maximum depth of the page tree",
+        )
+        parser.add_argument(
+            "--languages",
+            type=positive_int,
+            default=5,
+            help="The number of languages (existing languages are used first)",
+        )
+        parser.add_argument(
+            "--versions",
+            type=positive_int,
+            default=3,
+            help="The number of versions of each translation",
+        )
+        parser.add_argument(
+            "--events", type=non_negative_int, default=200, help="The number of events"
+        )
+        parser.add_argument(
+            "--recurring-events",
+            type=non_negative_int,
+            default=50,
+            help="How many of the events are recurring",
+        )
+        parser.add_argument(
+            "--pois", type=non_negative_int, default=200, help="The number of locations"
+        )
+        parser.add_argument(
+            "--categories",
+            type=positive_int,
+            default=10,
+            help="The number of new location categories",
+        )
+        parser.add_argument(
+            "--mirrored-pages",
+            type=non_negative_int,
+            default=50,
+            help="The number of pages which embed the content of another page",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="The seed of the random number generator",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, region_slug: str, **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slug: The slug of the new region
+        :param \**options: The supplied keyword options
+        :raises ~django.core.management.base.CommandError: When the input is invalid
+        """
+        if Region.objects.filter(slug=region_slug).exists():
+            raise CommandError(f'Region with slug "{region_slug}" already exists.')
+        region = SyntheticRegionGenerator(
+            region_slug,
+            pages=options["pages"],
+            max_depth=options["max_depth"],
+            languages=options["languages"],
+            versions=options["versions"],
+            events=options["events"],
+            recurring_events=options["recurring_events"],
+            pois=options["pois"],
+            categories=options["categories"],
+            mirrored_pages=options["mirrored_pages"],
+            seed=options["seed"],
+        ).generate()
+        self.print_success(f'✔ Successfully generated region "{region}".')
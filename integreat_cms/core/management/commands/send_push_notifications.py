@@ -4,16 +4,20 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.core.exceptions import ImproperlyConfigured
 from django.core.management.base import BaseCommand, CommandError
-from django.utils import timezone
 
-from ....cms.models import PushNotification, Region
-from ....firebase_api.firebase_api_client import FirebaseApiClient
+from ....cms.models import Region
+from ....firebase_api.push_notification_scheduler import (
+    get_due_push_notifications,
+    PushNotificationScheduler,
+    send_push_notification,
+)
 
 if TYPE_CHECKING:
     from typing import Any
 
+    from django.core.management.base import CommandParser
+
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,24 @@ class Command(BaseCommand):
 
     help: str = "Send pending push notifications"
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Keep running and send each push notification as soon as it is due",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="The number of push notifications which are sent concurrently in daemon mode",
+        )
+
     def handle(self, *args: Any, **options: Any) -> None:
         r"""
         Try to run the command
@@ -47,60 +69,26 @@ class Command(BaseCommand):
                     f"The system runs with DEBUG=True but the region with TEST_REGION_SLUG={settings.TEST_REGION_SLUG} does not exist."
                 ) from e
 
-        pending_push_notifications = PushNotification.objects.filter(
-            scheduled_send_date__isnull=False,
-            sent_date__isnull=True,
-            draft=False,
-            scheduled_send_date__lte=timezone.now(),
+        if options["workers"] < 1:
+            raise CommandError("The number of workers must be at least 1")
+
+        if options["daemon"]:
+            logger.info("Starting push notification scheduler")
+            PushNotificationScheduler(workers=options["workers"]).run()
+            return
+
+        pending_push_notifications = list(
+            get_due_push_notifications().values_list("id", flat=True)
         )
         if total := len(pending_push_notifications):
-            for counter, push_notification in enumerate(pending_push_notifications):
-                self.send_push_notification(counter, total, push_notification)
+            sent = sum(
+                bool(send_push_notification(push_notification_id))
+                for push_notification_id in pending_push_notifications
+            )
             logger.info(
-                "All %d scheduled push notifications have been processed.", total
+                "%d of %d scheduled push notifications have been sent.", sent, total
             )
         else:
             logger.debug(
                 "There are currently no push notifications scheduled to be sent."
             )
-
-    def send_push_notification(
-        self, counter: int, total: int, push_notification: PushNotification
-    ) -> None:
-        """
-        Sends a push notification
-
-        :param counter: The current counter
-        :param total: How many push notifications are scheduled for this slot
-        :param push_notification: The push notification object
-        """
-        try:
-            push_sender = FirebaseApiClient(push_notification)
-            if not push_sender.is_valid():
-                logger.error(
-                    "Push notification %d/%d %r cannot be sent because required texts are missing",
-                    counter,
-                    total,
-                    push_notification,
-                )
-            elif push_sender.send_all():
-                logger.info(
-                    "Successfully sent %d/%d %r", counter, total, push_notification
-                )
-                push_notification.sent_date = timezone.now()
-                push_notification.save()
-            else:
-                logger.error(
-                    "Push notification %d/%d %r could not be sent",
-                    counter,
-                    total,
-                    push_notification,
-                )
-        except ImproperlyConfigured as e:
-            logger.info(
-                "Push notification %d/%d %r could not be sent due to a configuration error: %s",
-                counter,
-                total,
-                push_notification,
-                e,
-            )
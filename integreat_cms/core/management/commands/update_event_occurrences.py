@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from ....cms.models import Event, EventOccurrence, Region
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to update the stored occurrences of events
+    (see :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`)
+    """
+
+    help = "Remove past event occurrences and extend the occurrences of recurring events to the current horizon"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            help="The slugs of the regions which should be processed. If empty, all regions will be processed",
+            nargs="*",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, region_slugs: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the given regions
+        :param \**options: The supplied keyword options
+        """
+        regions = Region.objects.all()
+        if region_slugs:
+            regions = regions.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - set(region.slug for region in regions)
+                raise CommandError(f"The following regions do not exist: {diff}")
+
+        today = timezone.now().date()
+        deleted, _ = EventOccurrence.objects.filter(
+            region__in=regions, end__date__lt=today
+        ).delete()
+        logger.info("Deleted %d past event occurrences", deleted)
+
+        stored = 0
+        events = (
+            Event.objects.filter(region__in=regions, archived=False)
+            .filter_upcoming(today)
+            .select_related("region", "recurrence_rule")
+        )
+        for event in events.iterator():
+            stored += EventOccurrence.update_occurrences(event, today)
+        self.print_success(
+            f"✔ Stored {stored} occurrences of {events.count()} upcoming events."
+        )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ....cms.models import (
+    EventTranslation,
+    ImprintPageTranslation,
+    PageTranslation,
+    POITranslation,
+)
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+    from django.db.models.base import ModelBase
+
+logger = logging.getLogger(__name__)
+
+#: The translation models whose latest versions are marked
+MODELS: dict[str, ModelBase] = {
+    "page": PageTranslation,
+    "imprint": ImprintPageTranslation,
+    "event": EventTranslation,
+    "poi": POITranslation,
+}
+
+
+class Command(LogCommand):
+    """
+    Management command to mark the latest versions of translations (see
+    :meth:`~integreat_cms.cms.models.abstract_content_translation.AbstractContentTranslation.update_latest_versions`)
+    """
+
+    help = "Mark the latest versions of all translations"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "models",
+            choices=MODELS,
+            help="The models which should be processed. If empty, all models will be processed",
+            nargs="*",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, models: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param models: The models which should be processed
+        :param \**options: The supplied keyword options
+        """
+        for model in [MODELS[model] for model in models] or MODELS.values():
+            changed = model.rebuild_latest_versions()
+            logger.info("Changed %d flags of %s", changed, model.__name__)
+            self.print_success(
+                f"✔ Marked the latest versions of {model.__name__} ({changed} changed flags)."
+            )
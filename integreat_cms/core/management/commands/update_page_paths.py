@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from ....cms.models import PagePath, Region
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to update the stored paths of pages
+    (see :class:`~integreat_cms.cms.models.pages.page_path.PagePath`)
+    """
+
+    help = "Recalculate the stored paths of all pages"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            help="The slugs of the regions which should be processed. If empty, all regions will be processed",
+            nargs="*",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, region_slugs: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the given regions
+        :param \**options: The supplied keyword options
+        """
+        regions = Region.objects.all()
+        if region_slugs:
+            regions = regions.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - set(region.slug for region in regions)
+                raise CommandError(f"The following regions do not exist: {diff}")
+
+        changed = 0
+        for region in regions:
+            if region.pages.exists():
+                region_changed = PagePath.update_paths(region, region.pages.all())
+                logger.info("Updated %d page paths of %r", region_changed, region)
+                changed += region_changed
+        self.print_success(
+            f"✔ Updated the page paths of {len(regions)} regions ({changed} changed paths)."
+        )
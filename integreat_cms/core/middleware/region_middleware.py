@@ -4,10 +4,12 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import resolve
 
 from ...cms.models import Region
+from ...cms.utils.region_cache_utils import get_cached_region
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -62,6 +64,8 @@ class RegionMiddleware:
         This method returns the current region based on the current request.
         If the request path contains a region slug, the corresponding
         :class:`~integreat_cms.cms.models.regions.region.Region` object is queried from the database.
+        For API requests, the region is taken from the region cache of the current process
+        (see :mod:`~integreat_cms.cms.utils.region_cache_utils`).
 
         :param request: Django request
         :raises ~django.http.Http404: When the current request has a ``region_slug`` parameter, but there is no region
@@ -72,7 +76,11 @@ class RegionMiddleware:
         # Resolve current url
         resolver_match = resolve(request.path)
         if region_slug := resolver_match.kwargs.get("region_slug"):
-            return get_object_or_404(Region, slug=region_slug)
+            if "api" not in resolver_match.app_names:
+                return get_object_or_404(Region, slug=region_slug)
+            if not (region := get_cached_region(region_slug)):
+                raise Http404("No Region matches the given query.")
+            return region
         return None
 
     @staticmethod
@@ -56,11 +56,39 @@ MATOMO_TRACKING: Final[bool] = bool(
     strtobool(os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING", "False"))
 )
 
+#: The maximum number of API requests which are queued for tracking in Matomo per process.
+#: When the queue is full (e.g. because Matomo is slow or unavailable), further tracking requests are dropped.
+MATOMO_TRACKING_QUEUE_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_QUEUE_SIZE", 10000)
+)
+
+#: The number of worker threads per process which send the tracking requests to Matomo
+MATOMO_TRACKING_WORKERS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_WORKERS", 2)
+)
+
+#: The maximum number of tracking requests which are combined into one bulk request
+MATOMO_TRACKING_BATCH_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_BATCH_SIZE", 100)
+)
+
+#: The timeout in seconds for bulk tracking requests to Matomo
+MATOMO_TRACKING_TIMEOUT: Final[int] = 10
+
+#: How often failed bulk tracking requests are retried
+MATOMO_TRACKING_RETRIES: Final[int] = 3
+
+#: The delay in seconds before the first retry of a failed bulk tracking request (doubled on every further retry)
+MATOMO_TRACKING_RETRY_DELAY: Final[float] = 1
+
+#: The maximum time in seconds to wait for queued tracking requests to be sent when the process exits
+MATOMO_TRACKING_SHUTDOWN_TIMEOUT: Final[int] = 5
+
 #: The slug for the legal notice (see e.g. :class:`~integreat_cms.cms.models.pages.imprint_page_translation.ImprintPageTranslation`)
 IMPRINT_SLUG: Final[str] = os.environ.get("INTEGREAT_CMS_IMPRINT_SLUG", "disclaimer")
 
 #: The slug of the region "Testumgebung" - prevent sending PNs to actual users in development in
-#: :func:`~integreat_cms.firebase_api.firebase_api_client.FirebaseApiClient.send_pn`
+#: :class:`~integreat_cms.firebase_api.firebase_api_client.FirebaseApiClient`
 
 TEST_REGION_SLUG: Final[str] = "testumgebung"
 
@@ -123,6 +151,49 @@ AUTHOR_CHAT_HISTORY_DAYS: Final[int] = 30
 #: The time span up to which recurrent events should be returned by the api
 API_EVENTS_MAX_TIME_SPAN_DAYS: Final[int] = 31
 
+#: The time span up to which the occurrences of recurrent events are stored (see
+#: :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`). Occurrences beyond this time span are
+#: computed when they are requested by the api.
+EVENT_OCCURRENCES_HORIZON_DAYS: Final[int] = 365
+
+#: Whether the large list endpoints of the api should stream their responses (see
+#: :mod:`~integreat_cms.api.utils.json_response_utils`)
+API_STREAMING_RESPONSES: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_API_STREAMING_RESPONSES", "False"))
+)
+
+#: Whether the SQL queries, cache hits and misses and the timing of each request should be measured and exposed as
+#: ``Server-Timing`` header and log record (see :class:`~integreat_cms.api.middleware.ServerTimingMiddleware`)
+SERVER_TIMING: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_SERVER_TIMING", "False"))
+)
+
+#: Whether metrics of the API, the caches and the external services should be collected and exposed at ``/metrics``
+#: (see :mod:`~integreat_cms.core.utils.metrics`)
+METRICS_ENABLED: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_METRICS_ENABLED", "False"))
+)
+
+#: The directory in which the metrics of all processes are stored. It has to be set when the CMS runs in multiple
+#: processes and should be emptied whenever the CMS is restarted.
+METRICS_DIR: Final[str | None] = os.environ.get("INTEGREAT_CMS_METRICS_DIR")
+
+#: The token which has to be sent as ``Authorization: Bearer <token>`` header to access ``/metrics``.
+#: If it is not set, the metrics can only be accessed from localhost.
+METRICS_TOKEN: Final[str | None] = os.environ.get("INTEGREAT_CMS_METRICS_TOKEN")
+
+# The Prometheus client reads this environment variable when the metrics are created
+if METRICS_DIR:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", METRICS_DIR)
+
+#: The number of objects which are fetched from the database at once when streaming api responses
+API_STREAMING_CHUNK_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_STREAMING_CHUNK_SIZE", 100)
+)
+
+#: The approximate number of characters which are sent at once when streaming api responses
+API_STREAMING_BUFFER_SIZE: Final[int] = 64 * 1024
+
 #: The maximum duration of an event
 MAX_EVENT_DURATION: Final[int] = int(
     os.environ.get("INTEGREAT_CMS_MAX_EVENT_DURATION", 28)
@@ -188,15 +259,31 @@ NUM_REGIONS_QUICK_ACCESS: Final[int] = 15
 # Firebase Push Notifications (Firebase Cloud Messaging FCM) #
 ##############################################################
 
-#: FCM API Url
-FCM_URL: Final[str] = "https://fcm.googleapis.com/fcm/send"
+#: FCM HTTP v1 API Url (the placeholder ``{project_id}`` is replaced with the project id of the service account)
+FCM_URL: Final[
+    str
+] = "https://fcm.googleapis.com/v1/projects/{project_id}/messages:send"
+
+#: The path to the JSON key file of the service account of the Firebase project (see
+#: https://firebase.google.com/docs/cloud-messaging/auth-server). This needs to be set for a correct usage of the
+#: messages feature.
+FCM_CREDENTIALS: str | None = os.environ.get("INTEGREAT_CMS_FCM_CREDENTIALS")
 
-#: Authentication token for the Firebase API. This needs to be set for a correct usage of the messages feature.
-FCM_KEY: str | None = os.environ.get("INTEGREAT_CMS_FCM_KEY")
+#: The OAuth 2.0 scopes which are requested for the access token of the service account
+FCM_SCOPES: Final[list[str]] = ["https://www.googleapis.com/auth/firebase.messaging"]
 
 #: Whether push notifications via Firebase are enabled.
-#: This is ``True`` if :attr:`~integreat_cms.core.settings.FCM_KEY` is set, ``False`` otherwise.
-FCM_ENABLED: bool = bool(FCM_KEY)
+#: This is ``True`` if :attr:`~integreat_cms.core.settings.FCM_CREDENTIALS` is set, ``False`` otherwise.
+FCM_ENABLED: bool = bool(FCM_CREDENTIALS)
+
+#: The maximum number of messages which are sent concurrently (and the number of pooled connections to FCM)
+FCM_WORKERS: Final[int] = int(os.environ.get("INTEGREAT_CMS_FCM_WORKERS", 10))
+
+#: How often messages are retried when FCM is overloaded or unavailable
+FCM_RETRIES: Final[int] = 5
+
+#: The delay in seconds before the first retry of a message (doubled on every further retry)
+FCM_RETRY_DELAY: Final[float] = 1
 
 #: The available push notification channels
 FCM_CHANNELS: Final[tuple[tuple[str, Promise], ...]] = (("news", _("News")),)
@@ -374,6 +461,10 @@ if DEBUG:
 
 #: Activated middlewares (see :setting:`django:MIDDLEWARE`)
 MIDDLEWARE: list[str] = [
+    # Is only used if SERVER_TIMING is enabled and should be put first to measure all other middlewares as well
+    "integreat_cms.api.middleware.ServerTimingMiddleware",
+    # Is only used if METRICS_ENABLED is set
+    "integreat_cms.api.middleware.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -1017,6 +1108,74 @@ if REDIS_CACHE:
         },
     }
 
+#: The directory of the file based cache of the version stamps which are used to detect changes made by other processes
+#: (see :mod:`~integreat_cms.core.utils.version_cache`). It is only used if redis is not activated.
+VERSION_CACHE_DIR: Final[str] = os.environ.get(
+    "INTEGREAT_CMS_VERSION_CACHE_DIR", os.path.join(BASE_DIR, "version-cache")
+)
+
+# The version stamps have to be shared between all processes, so a local memory cache cannot be used for them
+if REDIS_CACHE:
+    CACHES["versions"] = {
+        **CACHES["default"],
+        "KEY_PREFIX": "versions",
+    }
+else:
+    CACHES["versions"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": VERSION_CACHE_DIR,
+        # Culled stamps would be replaced by new ones, which invalidates the content they belong to
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    }
+
+#: The directory of the file based store of materialized API responses (see
+#: :mod:`~integreat_cms.api.utils.response_store_utils`). If it is not set, the responses are kept in memory.
+API_RESPONSE_STORE_DIR: Final[str | None] = os.environ.get(
+    "INTEGREAT_CMS_API_RESPONSE_STORE_DIR"
+)
+
+# Store API responses in redis if available, otherwise use a local backend
+if REDIS_CACHE:
+    CACHES["api_responses"] = {
+        **CACHES["default"],
+        "KEY_PREFIX": "api_responses",
+    }
+elif API_RESPONSE_STORE_DIR:
+    CACHES["api_responses"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": API_RESPONSE_STORE_DIR,
+    }
+else:
+    CACHES["api_responses"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "api_responses",
+    }
+
+#: How long materialized API responses are kept in seconds. Outdated responses are never served, so this only limits
+#: the size of the store.
+API_RESPONSE_STORE_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_RESPONSE_STORE_TIMEOUT", 24 * 60 * 60)
+)
+
+#: The maximum size of a single materialized API response in bytes
+API_RESPONSE_STORE_MAX_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_RESPONSE_STORE_MAX_SIZE", 50 * 1024 * 1024)
+)
+
+#: The minimum size of a materialized API response in bytes for which compressed variants are stored
+API_RESPONSE_STORE_COMPRESSION_MIN_SIZE: Final[int] = 200
+
+#: The compression level of the stored gzip variants of API responses (the compression only runs once per content
+#: version, so a high level is used by default)
+API_RESPONSE_STORE_GZIP_LEVEL: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_RESPONSE_STORE_GZIP_LEVEL", 9)
+)
+
+#: The quality of the stored brotli variants of API responses
+API_RESPONSE_STORE_BROTLI_QUALITY: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_RESPONSE_STORE_BROTLI_QUALITY", 9)
+)
+
 #: Default cache timeout for cacheops
 CACHEOPS_DEFAULTS: Final[dict[str, int]] = {"timeout": 60 * 60}
 
@@ -1145,6 +1304,44 @@ PDF_ROOT: Final[str] = os.environ.get(
 #: The URL path where PDF files are served for download
 PDF_URL: Final[str] = "/pdf/"
 
+#: The number of worker processes which render PDF documents of the API in the background (see
+#: :mod:`~integreat_cms.cms.utils.pdf_job_utils`). This is also the maximum number of PDF documents which are rendered
+#: concurrently on one node. If set to ``0``, the documents are rendered synchronously while handling the request.
+PDF_JOB_WORKERS: Final[int] = int(os.environ.get("INTEGREAT_CMS_PDF_JOB_WORKERS", 2))
+
+#: Documents with more pages are rendered in separate parts of at most this many pages, which are cached individually
+#: and merged afterwards (see :func:`~integreat_cms.cms.utils.pdf_utils.render_pdf_parts`)
+PDF_CHUNK_SIZE: Final[int] = int(os.environ.get("INTEGREAT_CMS_PDF_CHUNK_SIZE", 50))
+
+#: The number of processes which render the parts of one document in parallel. If set to ``0``, the parts are rendered
+#: one after another in the current process.
+PDF_PART_WORKERS: Final[int] = int(os.environ.get("INTEGREAT_CMS_PDF_PART_WORKERS", 4))
+
+#: The number of days after which PDF documents which were not requested are removed by the management command
+#: :mod:`~integreat_cms.core.management.commands.clean_pdf_files`
+PDF_CACHE_MAX_AGE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_CACHE_MAX_AGE", 7)
+)
+
+#: The maximum total size of the PDF documents in megabytes. If it is exceeded, the least recently requested documents
+#: are removed by the management command :mod:`~integreat_cms.core.management.commands.clean_pdf_files`
+PDF_CACHE_MAX_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_CACHE_MAX_SIZE", 1024)
+)
+
+
+###################
+# OFFLINE BUNDLES #
+###################
+
+#: The directory where the offline bundles of the API are stored (see :mod:`~integreat_cms.api.utils.offline_bundle_utils`)
+OFFLINE_BUNDLE_ROOT: Final[str] = os.environ.get(
+    "INTEGREAT_CMS_OFFLINE_BUNDLE_ROOT", os.path.join(BASE_DIR, "offline-bundles")
+)
+
+#: The URL path where offline bundles are served for download
+OFFLINE_BUNDLE_URL: Final[str] = "/offline-bundles/"
+
 
 #######################
 # XLIFF SERIALIZATION #
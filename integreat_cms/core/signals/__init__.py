@@ -3,4 +3,16 @@ This package contains signal handlers (see :doc:`django:topics/signals`).
 """
 from __future__ import annotations
 
-from . import auth_signals, feedback_signals, hix_signals, organization_signals
+from . import (
+    auth_signals,
+    content_change_signals,
+    content_version_signals,
+    event_occurrence_signals,
+    feedback_signals,
+    hix_signals,
+    organization_signals,
+    page_path_signals,
+    pdf_signals,
+    push_notification_signals,
+    region_cache_signals,
+)
@@ -0,0 +1,203 @@
+"""
+This module contains signal handlers which record changes of content objects for the delta sync of the API
+(see :class:`~integreat_cms.cms.models.content_changes.content_change.ContentChange`).
+The records are written in the same transaction as the changes, so they are rolled back together.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.constants import content_change_types
+from ...cms.models import (
+    ContentChange,
+    Event,
+    EventTranslation,
+    ImprintPage,
+    ImprintPageTranslation,
+    Page,
+    PageTranslation,
+    POI,
+    POITranslation,
+    RecurrenceRule,
+    Region,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+    from django.db.models.base import ModelBase
+
+    from ...cms.models.abstract_content_model import AbstractContentModel
+    from ...cms.models.abstract_content_translation import AbstractContentTranslation
+
+#: The content types of the content models
+CONTENT_TYPES: Final[dict[ModelBase, str]] = {
+    Page: content_change_types.PAGE,
+    Event: content_change_types.EVENT,
+    POI: content_change_types.POI,
+    ImprintPage: content_change_types.IMPRINT,
+}
+
+
+def record_page_change(page: Page, removed: bool = False) -> None:
+    """
+    Record the change of a page. Since the urls and the archived state of a page are inherited by its descendants, they
+    are recorded as well. Pages which mirror the changed page are also affected.
+
+    :param page: The changed page
+    :param removed: Whether the page was deleted or archived
+    """
+    ContentChange.record(
+        page.region_id,
+        content_change_types.PAGE,
+        [page.id, *page.get_descendants().values_list("id", flat=True)],
+        removed=removed or page.explicitly_archived,
+    )
+    for mirroring_page in page.mirroring_pages.all():
+        ContentChange.record(
+            mirroring_page.region_id, content_change_types.PAGE, [mirroring_page.id]
+        )
+
+
+def record_poi_change(poi: POI, removed: bool = False) -> None:
+    """
+    Record the change of a location. Events embed their location, so they are recorded as well.
+
+    :param poi: The changed location
+    :param removed: Whether the location was deleted or archived
+    """
+    ContentChange.record(
+        poi.region_id,
+        content_change_types.POI,
+        [poi.id],
+        removed=removed or poi.archived,
+    )
+    ContentChange.record(
+        poi.region_id,
+        content_change_types.EVENT,
+        poi.events.values_list("id", flat=True),
+    )
+
+
+def record_change(content_object: AbstractContentModel, removed: bool = False) -> None:
+    """
+    Record the change of a content object
+
+    :param content_object: The changed content object
+    :param removed: Whether the content object was deleted or archived
+    """
+    if isinstance(content_object, Page):
+        record_page_change(content_object, removed)
+    elif isinstance(content_object, POI):
+        record_poi_change(content_object, removed)
+    else:
+        ContentChange.record(
+            content_object.region_id,
+            CONTENT_TYPES[type(content_object)],
+            [content_object.id],
+            removed=removed or content_object.archived,
+        )
+
+
+@receiver(post_save, sender=Page)
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=POI)
+@receiver(post_save, sender=ImprintPage)
+# pylint: disable=unused-argument
+def content_object_saved_handler(
+    sender: ModelBase, instance: AbstractContentModel, **kwargs: Any
+) -> None:
+    r"""
+    Record the change of a content object after it has been saved
+
+    :param sender: The class of the content object
+    :param instance: The content object
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not kwargs.get("raw"):
+        record_change(instance)
+
+
+@receiver(post_delete, sender=Page)
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=POI)
+@receiver(post_delete, sender=ImprintPage)
+def content_object_deleted_handler(
+    sender: ModelBase, instance: AbstractContentModel, **kwargs: Any
+) -> None:
+    r"""
+    Record a tombstone after a content object has been deleted
+
+    :param sender: The class of the content object
+    :param instance: The content object
+    :param \**kwargs: The supplied keyword arguments
+    """
+    ContentChange.record(
+        instance.region_id, CONTENT_TYPES[sender], [instance.id], removed=True
+    )
+
+
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_save, sender=POITranslation)
+@receiver(post_delete, sender=POITranslation)
+@receiver(post_save, sender=ImprintPageTranslation)
+@receiver(post_delete, sender=ImprintPageTranslation)
+# pylint: disable=unused-argument
+def content_translation_changed_handler(
+    sender: ModelBase, instance: AbstractContentTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Record the change of a content object after one of its translations has been changed
+
+    :param sender: The class of the content translation
+    :param instance: The content translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    foreign_field = instance.foreign_field()
+    content_model = instance._meta.get_field(foreign_field).related_model
+    # The content object does not exist anymore if the translation is deleted together with its content object
+    if content_object := content_model.objects.filter(
+        id=getattr(instance, f"{foreign_field}_id")
+    ).first():
+        record_change(content_object)
+
+
+@receiver(post_save, sender=RecurrenceRule)
+# pylint: disable=unused-argument
+def recurrence_rule_changed_handler(
+    sender: ModelBase, instance: RecurrenceRule, **kwargs: Any
+) -> None:
+    r"""
+    Record the change of an event after its recurrence rule has been changed
+
+    :param sender: The class of the recurrence rule
+    :param instance: The recurrence rule
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw") or kwargs.get("created"):
+        # New recurrence rules are saved before their event, which records its own change
+        return
+    if event := Event.objects.filter(recurrence_rule=instance).first():
+        record_change(event)
+
+
+@receiver(post_delete, sender=Region)
+# pylint: disable=unused-argument
+def region_deleted_handler(sender: ModelBase, instance: Region, **kwargs: Any) -> None:
+    r"""
+    Remove the records which were created while the content of the region was deleted
+
+    :param sender: The class of the region
+    :param instance: The region
+    :param \**kwargs: The supplied keyword arguments
+    """
+    ContentChange.objects.filter(region_id=instance.id).delete()
@@ -0,0 +1,355 @@
+"""
+This module contains signal handlers which invalidate the content versions of the API endpoints
+(see :mod:`~integreat_cms.api.utils.content_version_utils`) whenever the content they deliver is changed.
+
+To keep the overhead low when many objects are changed at once (e.g. when a region is deleted), the affected objects
+are collected and the invalidation is performed once after the current transaction has been committed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ...api.utils.content_version_utils import (
+    ENDPOINTS,
+    EVENTS,
+    IMPRINT,
+    invalidate_all_content_versions,
+    invalidate_content_versions,
+    LOCATIONS,
+    OFFERS,
+    PAGES,
+    PUSH_NOTIFICATIONS,
+    REGIONS,
+)
+from ...cms.models import (
+    Event,
+    EventTranslation,
+    ImprintPage,
+    ImprintPageTranslation,
+    Language,
+    LanguageTreeNode,
+    MediaFile,
+    OfferTemplate,
+    Organization,
+    Page,
+    PageTranslation,
+    POI,
+    POICategory,
+    POICategoryTranslation,
+    POITranslation,
+    PushNotification,
+    PushNotificationTranslation,
+    RecurrenceRule,
+    Region,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+    from django.db.models import Model
+    from django.db.models.base import ModelBase
+
+logger = logging.getLogger(__name__)
+
+#: The endpoints which are affected by changes of content objects and their translations
+CONTENT_ENDPOINTS: Final[dict[ModelBase, list[str]]] = {
+    Page: [PAGES],
+    ImprintPage: [IMPRINT],
+    Event: [EVENTS],
+    # Events embed their location
+    POI: [LOCATIONS, EVENTS],
+}
+
+#: The thread-local storage of pending invalidations
+_pending = threading.local()
+
+
+def get_pending_invalidations() -> dict[Any, set]:
+    """
+    Get the invalidations which are scheduled to be executed after the current transaction has been committed.
+    The keys are either endpoints, in which case the values are the ids of the affected regions, or content models,
+    in which case the values are the ids of the changed content objects.
+
+    :return: The pending invalidations of the current thread
+    """
+    if not hasattr(_pending, "invalidations"):
+        _pending.invalidations = defaultdict(set)
+    return _pending.invalidations
+
+
+def schedule_invalidation(key: Any, *values: Any) -> None:
+    r"""
+    Schedule the invalidation of content versions after the current transaction has been committed
+
+    :param key: Either a content model or an endpoint
+    :param \*values: Either the ids of changed content objects or the ids of changed regions
+    """
+    get_pending_invalidations()[key].update(values)
+    # If the transaction is rolled back, the pending invalidations will be executed after the next commit, which is
+    # not necessary but harmless. Subsequent executions of the callback within the same commit do nothing.
+    transaction.on_commit(flush_invalidations)
+
+
+def flush_invalidations() -> None:
+    """
+    Execute all pending invalidations of the current thread
+    """
+    if not (invalidations := get_pending_invalidations()):
+        return
+    _pending.invalidations = defaultdict(set)
+    # Resolve the regions of the changed content objects
+    for model, endpoints in CONTENT_ENDPOINTS.items():
+        if object_ids := invalidations.pop(model, None):
+            region_ids = set(
+                model.objects.filter(id__in=object_ids).values_list(
+                    "region_id", flat=True
+                )
+            )
+            if model is Page:
+                # Pages which mirror the changed pages have to be invalidated as well
+                region_ids.update(
+                    Page.objects.filter(mirrored_page_id__in=object_ids).values_list(
+                        "region_id", flat=True
+                    )
+                )
+            for endpoint in endpoints:
+                invalidations[endpoint].update(region_ids)
+    for endpoint, region_ids in invalidations.items():
+        invalidate_content_versions(region_ids, [endpoint])
+
+
+def invalidate_region(region_id: int | None, *endpoints: str) -> None:
+    r"""
+    Schedule the invalidation of the given endpoints of a region
+
+    :param region_id: The id of the region
+    :param \*endpoints: The endpoints to invalidate
+    """
+    if region_id:
+        for endpoint in endpoints:
+            schedule_invalidation(endpoint, region_id)
+
+
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=ImprintPage)
+@receiver(post_delete, sender=ImprintPage)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=POI)
+@receiver(post_delete, sender=POI)
+def content_object_changed_handler(
+    sender: ModelBase, instance: Model, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of the affected endpoints after a content object has been changed
+
+    :param sender: The class of the content object
+    :param instance: The content object
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    invalidate_region(instance.region_id, *CONTENT_ENDPOINTS[sender])
+    if sender is Page:
+        # The region itself is not affected, but pages of other regions might mirror this page
+        schedule_invalidation(Page, instance.id)
+
+
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+@receiver(post_save, sender=ImprintPageTranslation)
+@receiver(post_delete, sender=ImprintPageTranslation)
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_save, sender=POITranslation)
+@receiver(post_delete, sender=POITranslation)
+# pylint: disable=unused-argument
+def content_translation_changed_handler(
+    sender: ModelBase, instance: Model, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of the affected endpoints after a content translation has been changed
+
+    :param sender: The class of the content translation
+    :param instance: The content translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    foreign_field = instance.foreign_field()
+    schedule_invalidation(
+        instance._meta.get_field(foreign_field).related_model,
+        getattr(instance, f"{foreign_field}_id"),
+    )
+
+
+@receiver(post_save, sender=RecurrenceRule)
+# pylint: disable=unused-argument
+def recurrence_rule_changed_handler(
+    sender: ModelBase, instance: RecurrenceRule, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of the events endpoint after a recurrence rule has been changed
+
+    :param sender: The class of the recurrence rule
+    :param instance: The recurrence rule
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw") or kwargs.get("created"):
+        # New recurrence rules are saved before their event, which triggers its own invalidation
+        return
+    schedule_invalidation(
+        Event,
+        *Event.objects.filter(recurrence_rule=instance).values_list("id", flat=True),
+    )
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=MediaFile)
+@receiver(post_delete, sender=MediaFile)
+# pylint: disable=unused-argument
+def shared_object_changed_handler(
+    sender: ModelBase, instance: Organization | MediaFile, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of the affected endpoints after an object has been changed which is embedded into
+    the content of a region
+
+    :param sender: The class of the changed object
+    :param instance: The changed object
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    if instance.region_id:
+        invalidate_region(instance.region_id, PAGES, EVENTS, LOCATIONS)
+    else:
+        # Media files without region are available in all regions
+        transaction.on_commit(invalidate_all_content_versions)
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+def region_changed_handler(
+    sender: ModelBase, instance: Region | LanguageTreeNode, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of all endpoints of a region after the region or its language tree has been changed
+
+    :param sender: The class of the changed object
+    :param instance: The region or language tree node
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    invalidate_region(
+        instance.id if sender is Region else instance.region_id, *ENDPOINTS
+    )
+    # The list of all regions contains the changed region
+    schedule_invalidation(REGIONS, None)
+
+
+@receiver(m2m_changed, sender=Region.offers.through)
+# pylint: disable=unused-argument
+def region_offers_changed_handler(
+    sender: ModelBase, instance: Region | OfferTemplate, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of the offers of a region after offers have been added or removed
+
+    :param sender: The through model of the relation
+    :param instance: The region or offer template whose relations changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not kwargs.get("action", "").startswith("post_"):
+        return
+    region_ids = (
+        [instance.id]
+        if isinstance(instance, Region)
+        else list(kwargs.get("pk_set") or [])
+    )
+    for region_id in region_ids:
+        invalidate_region(region_id, OFFERS, REGIONS)
+    schedule_invalidation(REGIONS, None)
+
+
+@receiver(m2m_changed, sender=Page.embedded_offers.through)
+# pylint: disable=unused-argument
+def embedded_offers_changed_handler(
+    sender: ModelBase, instance: Page | OfferTemplate, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the content version of the pages endpoint after offers have been embedded into pages or removed from them
+
+    :param sender: The through model of the relation
+    :param instance: The page or offer template whose relations changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not kwargs.get("action", "").startswith("post_"):
+        return
+    if isinstance(instance, Page):
+        schedule_invalidation(Page, instance.id)
+    else:
+        schedule_invalidation(Page, *(kwargs.get("pk_set") or []))
+
+
+@receiver(post_save, sender=PushNotification)
+@receiver(post_delete, sender=PushNotification)
+@receiver(post_save, sender=PushNotificationTranslation)
+@receiver(post_delete, sender=PushNotificationTranslation)
+def push_notification_changed_handler(
+    sender: ModelBase,
+    instance: PushNotification | PushNotificationTranslation,
+    **kwargs: Any,
+) -> None:
+    r"""
+    Invalidate the content version of the push notifications endpoint after a push notification has been changed
+
+    :param sender: The class of the changed object
+    :param instance: The push notification or its translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    push_notification_id = (
+        instance.id if sender is PushNotification else instance.push_notification_id
+    )
+    schedule_invalidation(
+        PUSH_NOTIFICATIONS,
+        *PushNotification.regions.through.objects.filter(
+            pushnotification_id=push_notification_id
+        ).values_list("region_id", flat=True),
+    )
+
+
+@receiver(post_save, sender=OfferTemplate)
+@receiver(post_delete, sender=OfferTemplate)
+@receiver(post_save, sender=POICategory)
+@receiver(post_delete, sender=POICategory)
+@receiver(post_save, sender=POICategoryTranslation)
+@receiver(post_delete, sender=POICategoryTranslation)
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+# pylint: disable=unused-argument
+def global_object_changed_handler(sender: ModelBase, **kwargs: Any) -> None:
+    r"""
+    Invalidate the content version of all endpoints after an object has been changed which is shared by all regions
+
+    :param sender: The class of the changed object
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        return
+    transaction.on_commit(invalidate_all_content_versions)
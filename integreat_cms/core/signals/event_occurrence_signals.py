@@ -0,0 +1,82 @@
+"""
+This module contains signal handlers which keep the stored occurrences of events up to date
+(see :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from ...cms.models import Event, EventOccurrence, RecurrenceRule
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.db.models.base import ModelBase
+
+
+@receiver(post_save, sender=Event)
+# pylint: disable=unused-argument
+def event_saved_handler(sender: ModelBase, instance: Event, **kwargs: Any) -> None:
+    r"""
+    Update the occurrences of an event after it has been saved
+
+    :param sender: The class of the event
+    :param instance: The event
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not kwargs.get("raw"):
+        EventOccurrence.update_occurrences(instance)
+
+
+@receiver(post_save, sender=RecurrenceRule)
+# pylint: disable=unused-argument
+def recurrence_rule_saved_handler(
+    sender: ModelBase, instance: RecurrenceRule, **kwargs: Any
+) -> None:
+    r"""
+    Update the occurrences of an event after its recurrence rule has been changed
+
+    :param sender: The class of the recurrence rule
+    :param instance: The recurrence rule
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw") or kwargs.get("created"):
+        # New recurrence rules are saved before their event, which updates its own occurrences
+        return
+    if event := Event.objects.filter(recurrence_rule=instance).first():
+        EventOccurrence.update_occurrences(event)
+
+
+@receiver(pre_delete, sender=RecurrenceRule)
+# pylint: disable=unused-argument
+def recurrence_rule_deleted_handler(
+    sender: ModelBase, instance: RecurrenceRule, **kwargs: Any
+) -> None:
+    r"""
+    Update the occurrences of an event after its recurrence rule has been deleted.
+    The reference of the event to the recurrence rule is removed without saving the event, so the event has to be
+    determined before the deletion and updated after the deletion has been committed.
+
+    :param sender: The class of the recurrence rule
+    :param instance: The recurrence rule
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if event_id := (
+        Event.objects.filter(recurrence_rule=instance)
+        .values_list("id", flat=True)
+        .first()
+    ):
+
+        def update_occurrences() -> None:
+            """
+            Update the occurrences of the event if it still exists
+            """
+            if event := Event.objects.filter(id=event_id).first():
+                EventOccurrence.update_occurrences(event)
+
+        transaction.on_commit(update_occurrences)
@@ -0,0 +1,65 @@
+"""
+This module contains signal handlers which keep the stored paths of pages up to date
+(see :class:`~integreat_cms.cms.models.pages.page_path.PagePath`).
+Moving pages is handled in :meth:`~integreat_cms.cms.models.pages.page.Page.move`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.models import Page, PagePath, PageTranslation
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.db.models.base import ModelBase
+
+
+@receiver(post_save, sender=PageTranslation)
+# pylint: disable=unused-argument
+def page_translation_saved_handler(
+    sender: ModelBase, instance: PageTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Update the paths of the page tree after a page translation has been saved
+
+    :param sender: The class of the page translation
+    :param instance: The page translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    # If the stored path already ends with the slug of the translation, the paths of the tree do not change
+    if not kwargs.get("raw") and not PagePath.is_up_to_date(instance):
+        PagePath.update_tree_paths(instance.page)
+
+
+@receiver(post_delete, sender=PageTranslation)
+# pylint: disable=unused-argument
+def page_translation_deleted_handler(
+    sender: ModelBase, instance: PageTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Update the paths of the page tree after the latest version of a page translation has been deleted.
+    The translations are also deleted together with their page, so the update is performed after the deletion has been
+    committed.
+
+    :param sender: The class of the page translation
+    :param instance: The page translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not instance.latest:
+        return
+    page_id = instance.page_id
+
+    def update_paths() -> None:
+        """
+        Update the paths of the page tree if the page still exists
+        """
+        if page := Page.objects.filter(id=page_id).first():
+            PagePath.update_tree_paths(page)
+
+    transaction.on_commit(update_paths)
@@ -0,0 +1,100 @@
+"""
+This module contains signal handlers which pre-warm the PDF document of all pages of a region (see
+:func:`~integreat_cms.cms.utils.pdf_job_utils.prewarm_region_pdf`) after page translations have been published.
+
+To render each document only once when many translations are published at once (e.g. by a bulk action), the affected
+regions and languages are collected and the jobs are submitted after the current transaction has been committed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ...cms.constants import region_status, status
+from ...cms.models import Language, Page, PageTranslation, Region
+from ...cms.utils.pdf_job_utils import prewarm_region_pdf
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+#: The thread-local storage of pending pre-warmings
+_pending = threading.local()
+
+
+def get_pending_translations() -> set[tuple[int, int]]:
+    """
+    Get the page and language ids of the translations which were published in the current transaction
+
+    :return: The pending page and language ids of the current thread
+    """
+    if not hasattr(_pending, "translations"):
+        _pending.translations = set()
+    return _pending.translations
+
+
+@receiver(post_save, sender=PageTranslation)
+def page_translation_published_handler(
+    instance: PageTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Schedule the pre-warming of the PDF document of the region after a page translation has been published
+
+    :param instance: The page translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if (
+        kwargs.get("raw")
+        or instance.status != status.PUBLIC
+        or not settings.PDF_JOB_WORKERS
+    ):
+        return
+    get_pending_translations().add((instance.page_id, instance.language_id))
+    # Subsequent executions of the callback within the same commit do nothing
+    transaction.on_commit(flush_prewarming)
+
+
+def flush_prewarming() -> None:
+    """
+    Pre-warm the PDF documents of all regions and languages with published translations of the current thread
+    """
+    if not (translations := get_pending_translations()):
+        return
+    _pending.translations = set()
+    page_regions = dict(
+        Page.objects.filter(
+            id__in={page_id for page_id, _ in translations}
+        ).values_list("id", "region_id")
+    )
+    region_languages = {
+        (page_regions[page_id], language_id)
+        for page_id, language_id in translations
+        if page_id in page_regions
+    }
+    regions = Region.objects.filter(
+        id__in={region_id for region_id, _ in region_languages},
+        status=region_status.ACTIVE,
+    ).in_bulk()
+    languages = Language.objects.filter(
+        id__in={language_id for _, language_id in region_languages}
+    ).in_bulk()
+    for region_id, language_id in region_languages:
+        if region_id not in regions:
+            continue
+        try:
+            prewarm_region_pdf(regions[region_id], languages[language_id])
+        # The pre-warming must never break the request which published the content
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "Pre-warming the PDF document of %r in %r failed",
+                regions[region_id],
+                languages[language_id],
+            )
@@ -0,0 +1,40 @@
+"""
+This module contains signal handlers which wake up the push notification scheduler (see
+:mod:`~integreat_cms.firebase_api.push_notification_scheduler`) when a push notification has been scheduled.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ...cms.models import PushNotification
+from ...firebase_api.push_notification_scheduler import notify_scheduler
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(post_save, sender=PushNotification)
+def push_notification_scheduled_handler(
+    instance: PushNotification, **kwargs: Any
+) -> None:
+    r"""
+    Notify the scheduler after a push notification has been scheduled, so it does not have to wait for its next
+    regular wake-up to learn about the new schedule
+
+    :param instance: The push notification
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if (
+        kwargs.get("raw")
+        or instance.draft
+        or instance.sent_date
+        or not instance.scheduled_send_date
+    ):
+        return
+    # Notifications are only delivered after the transaction has been committed anyway
+    transaction.on_commit(notify_scheduler)
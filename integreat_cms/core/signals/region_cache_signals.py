@@ -0,0 +1,64 @@
+"""
+This module contains signal handlers which invalidate the cached regions of all processes
+(see :mod:`~integreat_cms.cms.utils.region_cache_utils`) whenever a region or the data which is cached with it changes.
+The invalidation of other processes is performed once after the current transaction has been committed, so they cannot
+cache the old state again.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.models import Language, LanguageTreeNode, Region
+from ...cms.utils.region_cache_utils import (
+    clear_local_region_cache,
+    invalidate_region_cache,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.db.models import Model
+    from django.db.models.base import ModelBase
+
+#: The thread-local storage of the pending invalidation
+_pending = threading.local()
+
+
+def flush_invalidation() -> None:
+    """
+    Invalidate the region cache if an invalidation is pending in the current thread
+    """
+    if getattr(_pending, "invalidation", False):
+        _pending.invalidation = False
+        invalidate_region_cache()
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+# pylint: disable=unused-argument
+def region_data_changed_handler(
+    sender: ModelBase, instance: Model, **kwargs: Any
+) -> None:
+    r"""
+    Schedule the invalidation of the region cache after a region or its cached data has been changed
+
+    :param sender: The class of the changed object
+    :param instance: The changed object
+    :param \**kwargs: The supplied keyword arguments
+    """
+    # The cache of the current process is cleared immediately, so subsequent requests within the transaction see the
+    # changes as well
+    clear_local_region_cache()
+    _pending.invalidation = True
+    # Subsequent executions of the callback within the same commit do nothing
+    transaction.on_commit(flush_invalidation)
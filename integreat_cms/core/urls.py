@@ -75,6 +75,18 @@ urlpatterns += [
             )
         ),
     ),
+    path(
+        "",
+        include(
+            (
+                static(
+                    settings.OFFLINE_BUNDLE_URL,
+                    document_root=settings.OFFLINE_BUNDLE_ROOT,
+                ),
+                "offline_bundle_files",
+            )
+        ),
+    ),
     path(
         "",
         include(
@@ -0,0 +1,166 @@
+"""
+This module contains the in-process metrics of the CMS which are exposed in the Prometheus text format at ``/metrics``
+(see :mod:`~integreat_cms.api.v3.metrics`).
+
+The metrics are only collected if :attr:`~integreat_cms.core.settings.METRICS_ENABLED` is set. If the CMS runs in
+multiple processes, :attr:`~integreat_cms.core.settings.METRICS_DIR` has to be set to a directory which is shared by all
+processes, so the metrics of all processes are aggregated (see
+https://prometheus.github.io/client_python/multiprocess/).
+"""
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+    REGISTRY,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Final, Iterator
+
+#: The buckets of the response size histogram in bytes
+RESPONSE_SIZE_BUCKETS: Final[tuple[float, ...]] = tuple(
+    4**exponent for exponent in range(4, 14)
+)
+
+#: The buckets of the SQL query count histogram
+QUERY_COUNT_BUCKETS: Final[tuple[float, ...]] = (
+    0,
+    1,
+    2,
+    5,
+    10,
+    20,
+    50,
+    100,
+    200,
+    500,
+)
+
+#: The duration of API requests per url name
+REQUEST_DURATION: Final[Histogram] = Histogram(
+    "integreat_cms_api_request_duration_seconds",
+    "The duration of API requests",
+    ["view", "method", "status"],
+)
+
+#: The size of the API responses per url name (streaming responses are not included)
+RESPONSE_SIZE: Final[Histogram] = Histogram(
+    "integreat_cms_api_response_size_bytes",
+    "The size of API responses",
+    ["view"],
+    buckets=RESPONSE_SIZE_BUCKETS,
+)
+
+#: The number of SQL queries of API requests per url name
+REQUEST_QUERIES: Final[Histogram] = Histogram(
+    "integreat_cms_api_request_queries",
+    "The number of SQL queries of API requests",
+    ["view"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+
+#: The number of cacheops reads per model and result (``hit`` or ``miss``)
+CACHEOPS_READS: Final[Counter] = Counter(
+    "integreat_cms_cacheops_reads",
+    "The number of cacheops reads",
+    ["model", "result"],
+)
+
+#: The duration of requests to outbound integrations per service and outcome (``success`` or ``error``)
+INTEGRATION_DURATION: Final[Histogram] = Histogram(
+    "integreat_cms_integration_request_duration_seconds",
+    "The duration of requests to external services",
+    ["service", "outcome"],
+)
+
+#: The number of requests to outbound integrations which are currently in progress
+INTEGRATION_IN_PROGRESS: Final[Gauge] = Gauge(
+    "integreat_cms_integration_requests_in_progress",
+    "The number of requests to external services which are in progress",
+    ["service"],
+    multiprocess_mode="livesum",
+)
+
+#: The number of requests to outbound integrations which are queued for background processing
+INTEGRATION_QUEUE_SIZE: Final[Gauge] = Gauge(
+    "integreat_cms_integration_queue_size",
+    "The number of queued requests to external services",
+    ["service"],
+    multiprocess_mode="livesum",
+)
+
+
+def get_registry() -> CollectorRegistry:
+    """
+    Get the registry which contains the metrics of all processes
+
+    :return: The registry
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+# pylint: disable=unused-argument
+def count_cacheops_read(
+    sender: Any, func: Callable | None, hit: bool, **kwargs: Any
+) -> None:
+    r"""
+    Count a cacheops read (connected to :data:`cacheops.signals.cache_read` by
+    :class:`~integreat_cms.api.middleware.MetricsMiddleware`)
+
+    :param sender: The model of the cached queryset
+    :param func: The cached function (if not a queryset)
+    :param hit: Whether the result was found in the cache
+    :param \**kwargs: The supplied keyword arguments
+    """
+    model = sender._meta.label if sender else "function"
+    CACHEOPS_READS.labels(model, "hit" if hit else "miss").inc()
+
+
+@contextmanager
+def track_integration(service: str) -> Iterator[None]:
+    """
+    Measure a request to an external service. This can be used in asynchronous code as well.
+
+    :param service: The name of the service
+    :return: A context manager which measures the enclosed request
+    """
+    if not settings.METRICS_ENABLED:
+        yield
+        return
+    in_progress = INTEGRATION_IN_PROGRESS.labels(service)
+    in_progress.inc()
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        yield
+        outcome = "success"
+    finally:
+        in_progress.dec()
+        INTEGRATION_DURATION.labels(service, outcome).observe(
+            time.perf_counter() - start
+        )
+
+
+def set_queue_size(service: str, size: int) -> None:
+    """
+    Record the number of queued requests to an external service
+
+    :param service: The name of the service
+    :param size: The current size of the queue
+    """
+    if settings.METRICS_ENABLED:
+        INTEGRATION_QUEUE_SIZE.labels(service).set(size)
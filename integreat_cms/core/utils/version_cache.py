@@ -0,0 +1,47 @@
+"""
+This module contains the cache of the version stamps which are used to detect changes made by other processes (e.g. the
+content versions of the API, see :mod:`~integreat_cms.api.utils.content_version_utils`).
+
+A stamp which is replaced in one process has to be visible to all other processes, otherwise they would keep serving
+outdated content. Therefore, this cache has to be shared between all processes, e.g. via Redis or the file system (see
+:attr:`~integreat_cms.core.settings.CACHES`).
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.core.cache.backends.base import BaseCache
+
+#: The alias of the cache which is used to store the version stamps (see :setting:`django:CACHES`)
+VERSION_CACHE_ALIAS: Final[str] = "versions"
+
+
+def get_version_cache() -> BaseCache:
+    """
+    Get the cache which is used to store the version stamps.
+    If the dedicated cache is not configured, the default cache is used.
+
+    :return: The version cache
+    """
+    try:
+        return caches[VERSION_CACHE_ALIAS]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def is_version_cache_shared() -> bool:
+    """
+    Check whether the version cache is shared between processes. This is not the case if its backend keeps the stamps
+    in the memory of the current process or does not keep them at all.
+
+    :return: Whether changes of the version stamps are visible to all processes
+    """
+    return not isinstance(get_version_cache(), (LocMemCache, DummyCache))
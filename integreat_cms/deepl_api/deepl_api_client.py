@@ -14,6 +14,7 @@ from django.utils.translation import gettext_lazy as _
 
 from ..core.utils.machine_translation_api_client import MachineTranslationApiClient
 from ..core.utils.machine_translation_provider import MachineTranslationProvider
+from ..core.utils.metrics import track_integration
 from ..textlab_api.utils import check_hix_score
 
 if TYPE_CHECKING:
@@ -184,12 +185,13 @@ class DeepLApiClient(MachineTranslationApiClient):
                         source_translation, attr
                     ):
                         # data has to be unescaped for DeepL to recognize Umlaute
-                        data[attr] = self.translator.translate_text(
-                            unescape(getattr(source_translation, attr)),
-                            source_lang=source_language.slug,
-                            target_lang=target_language_key,
-                            tag_handling="html",
-                        )
+                        with track_integration("deepl"):
+                            data[attr] = self.translator.translate_text(
+                                unescape(getattr(source_translation, attr)),
+                                source_lang=source_language.slug,
+                                target_lang=target_language_key,
+                                tag_handling="html",
+                            )
 
                 content_translation_form = self.form_class(
                     data=data,
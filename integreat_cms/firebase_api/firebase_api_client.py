@@ -1,37 +1,95 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING
 
 import requests
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from google.auth.exceptions import GoogleAuthError
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
 
 from ..cms.constants import push_notifications as pnt_const
 from ..cms.forms.push_notifications.push_notification_translation_form import (
     PushNotificationTranslation,
 )
 from ..cms.models import Region
+from ..core.utils.metrics import track_integration
 
 if TYPE_CHECKING:
-    from requests.models import Response
+    from typing import Any
 
     from ..cms.models.push_notifications.push_notification import PushNotification
 
 logger = logging.getLogger(__name__)
 
+#: The authorized sessions of the current process per credentials file
+_sessions: dict[str, AuthorizedSession] = {}
+#: The lock to create the sessions
+_sessions_lock = threading.Lock()
+
+
+def get_fcm_session() -> AuthorizedSession:
+    """
+    Get the authorized session of the current process. The session keeps the connections to FCM alive and refreshes the
+    access token of the service account (see :attr:`~integreat_cms.core.settings.FCM_CREDENTIALS`) when it expires.
+
+    :return: The session
+    """
+    with _sessions_lock:
+        if settings.FCM_CREDENTIALS not in _sessions:
+            credentials = service_account.Credentials.from_service_account_file(
+                settings.FCM_CREDENTIALS, scopes=settings.FCM_SCOPES
+            )
+            session = AuthorizedSession(credentials)
+            # Keep one connection per concurrently sent message
+            adapter = HTTPAdapter(pool_maxsize=settings.FCM_WORKERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[settings.FCM_CREDENTIALS] = session
+        return _sessions[settings.FCM_CREDENTIALS]
+
+
+def is_retryable(status_code: int) -> bool:
+    """
+    Check whether a request to FCM should be retried
+
+    :param status_code: The status code of the response
+    :return: Whether FCM is overloaded or unavailable
+    """
+    return status_code == 429 or status_code >= 500
+
+
+def get_retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Get the delay before the next attempt to send a message
+
+    :param attempt: The number of the failed attempt (starting with 1)
+    :param retry_after: The value of the ``Retry-After`` header of the response (if any)
+    :return: The exponential backoff, or the delay requested by FCM if it is longer
+    """
+    delay = settings.FCM_RETRY_DELAY * 2 ** (attempt - 1)
+    if retry_after and retry_after.isdigit():
+        return max(delay, int(retry_after))
+    return delay
+
 
 class FirebaseApiClient:
     """
     Firebase Push Notifications / Firebase Cloud Messaging
 
-    Sends push notifications via FCM HTTP API.
-    Definition: https://firebase.google.com/docs/cloud-messaging/http-server-ref#downstream-http-messages-json
-
-    .. warning::
+    Sends push notifications via FCM HTTP v1 API.
+    Definition: https://firebase.google.com/docs/reference/fcm/rest/v1/projects.messages
 
-        We use legacy HTTP-API - Migration to HTTP v1-API will be necessary!
-        https://firebase.google.com/docs/cloud-messaging/migrate-v1
+    The messages of all regions and languages are sent concurrently by up to
+    :attr:`~integreat_cms.core.settings.FCM_WORKERS` threads which share a pool of persistent connections. Messages are
+    retried with exponential backoff if FCM is overloaded or unavailable.
     """
 
     def __init__(self, push_notification: PushNotification) -> None:
@@ -39,12 +97,13 @@ class FirebaseApiClient:
         Load relevant push notification translations and prepare content for sending
 
         :param push_notification: the push notification that should be sent
-        :raises ~django.core.exceptions.ImproperlyConfigured: If the auth key is missing or the system runs in debug
+        :raises ~django.core.exceptions.ImproperlyConfigured: If the credentials are missing or the system runs in debug
                                                               mode but the test region does not exist.
         """
         self.push_notification = push_notification
-        self.fcm_url = settings.FCM_URL
         self.prepared_pnts = []
+        #: The result of each sent message (see :meth:`send_message`)
+        self.results: list[dict[str, Any]] = []
         self.primary_pnt = PushNotificationTranslation.objects.get(
             push_notification=push_notification,
             language=push_notification.regions.first().default_language,
@@ -55,7 +114,6 @@ class FirebaseApiClient:
 
         if not settings.FCM_ENABLED:
             raise ImproperlyConfigured("Push notifications are disabled")
-        self.auth_key = settings.FCM_KEY
 
         if settings.DEBUG:
             # Prevent sending PNs to actual users in development
@@ -102,16 +160,18 @@ class FirebaseApiClient:
                 return False
         return True
 
-    def send_pn(self, pnt: PushNotificationTranslation, region: Region) -> Response:
+    def get_message(
+        self, pnt: PushNotificationTranslation, region: Region
+    ) -> dict[str, Any]:
         """
-        Send single push notification translation
+        Get the message of a single push notification translation
 
         :param pnt: The prepared push notification translation to be sent
         :param region: The region for which to send the prepared push notification translation
-        :return: Response of the :mod:`requests` library
+        :return: The message in the format of the FCM HTTP v1 API
         """
-        payload = {
-            "to": f"/topics/{region.slug}-{pnt.language.slug}-{self.push_notification.channel}",
+        return {
+            "topic": f"{region.slug}-{pnt.language.slug}-{self.push_notification.channel}",
             "notification": {"title": pnt.title, "body": pnt.text},
             "data": {
                 "news_id": str(pnt.id),
@@ -119,54 +179,120 @@ class FirebaseApiClient:
                 "language_code": pnt.language.slug,
                 "group": self.push_notification.channel,
             },
-            "apns": {
-                "headers": {"apns-priority": "5"},
-            },
             "android": {
                 "ttl": "86400s",
             },
-            "payload": {
-                "aps": {
-                    "category": "NEW_MESSAGE_CATEGORY",
-                }
+            "apns": {
+                "headers": {"apns-priority": "5"},
+                "payload": {
+                    "aps": {
+                        "category": "NEW_MESSAGE_CATEGORY",
+                    }
+                },
             },
         }
-        headers = {"Authorization": f"key={self.auth_key}"}
-        return requests.post(
-            self.fcm_url,
-            json=payload,
-            headers=headers,
-            timeout=settings.DEFAULT_REQUEST_TIMEOUT,
-        )
+
+    def send_message(
+        self, session: AuthorizedSession, url: str, message: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Send a single message and retry with exponential backoff if FCM is overloaded or unavailable.
+        This is executed in a worker thread, so it must not access the database.
+
+        :param session: The authorized session
+        :param url: The url of the FCM API
+        :param message: The message
+        :return: The result of the message (its ``topic``, the last ``status`` code, the FCM ``message_id`` if it was
+                 sent, the ``error`` otherwise, and the number of ``attempts``)
+        """
+        result: dict[str, Any] = {
+            "topic": message["topic"],
+            "status": None,
+            "message_id": None,
+            "error": None,
+            "attempts": 0,
+        }
+        for attempt in range(1, settings.FCM_RETRIES + 2):
+            result["attempts"] = attempt
+            retry_after = None
+            try:
+                with track_integration("fcm"):
+                    response = session.post(
+                        url,
+                        json={"message": message},
+                        timeout=settings.DEFAULT_REQUEST_TIMEOUT,
+                    )
+                result["status"] = response.status_code
+                if response.status_code == 200:
+                    result["message_id"] = response.json().get("name")
+                    result["error"] = None
+                    return result
+                result["error"] = response.text
+                if not is_retryable(response.status_code):
+                    return result
+                retry_after = response.headers.get("Retry-After")
+            except (requests.RequestException, GoogleAuthError) as e:
+                result["error"] = str(e)
+            if attempt <= settings.FCM_RETRIES:
+                delay = get_retry_delay(attempt, retry_after)
+                logger.warning(
+                    "Sending to topic %r failed (attempt %d), retrying in %s seconds: %s",
+                    message["topic"],
+                    attempt,
+                    delay,
+                    result["error"],
+                )
+                time.sleep(delay)
+        return result
 
     def send_all(self) -> bool:
         """
-        Send all prepared push notification translations
+        Send all prepared push notification translations concurrently
 
         :return: Success status
         """
-        status = True
+        pnts = {}
+        messages = []
         for pnt in self.prepared_pnts:
             for region in self.regions:
                 if pnt.language in region.active_languages:
-                    res = self.send_pn(pnt, region)
-                    if res.status_code == 200:
-                        if "message_id" in res.json():
-                            logger.info(
-                                "%r sent, FCM id: %r", pnt, res.json()["message_id"]
-                            )
-                        else:
-                            logger.warning(
-                                "%r sent, but unexpected API response: %r",
-                                pnt,
-                                res.json(),
-                            )
-                    else:
-                        status = False
-                        logger.error(
-                            "Received invalid response from FCM for %r, status: %r, body: %r",
-                            pnt,
-                            res.status_code,
-                            res.text,
-                        )
+                    message = self.get_message(pnt, region)
+                    pnts[message["topic"]] = pnt
+                    messages.append(message)
+        try:
+            session = get_fcm_session()
+            # Refresh the access token once instead of in every worker
+            if not session.credentials.valid:
+                with track_integration("fcm"):
+                    session.credentials.refresh(Request())
+        except (OSError, ValueError, GoogleAuthError) as e:
+            logger.error(
+                "Could not authenticate at FCM to send %r: %s",
+                self.push_notification,
+                e,
+            )
+            return False
+        url = settings.FCM_URL.format(project_id=session.credentials.project_id)
+        with ThreadPoolExecutor(
+            max_workers=settings.FCM_WORKERS, thread_name_prefix="fcm"
+        ) as executor:
+            self.results = list(
+                executor.map(partial(self.send_message, session, url), messages)
+            )
+        status = True
+        for result in self.results:
+            pnt = pnts[result["topic"]]
+            if result["message_id"]:
+                logger.info("%r sent, FCM id: %r", pnt, result["message_id"])
+            elif result["status"] == 200:
+                logger.warning("%r sent, but unexpected API response", pnt)
+            else:
+                status = False
+                logger.error(
+                    "Received invalid response from FCM for %r after %d attempts, status: %r, body: %r",
+                    pnt,
+                    result["attempts"],
+                    result["status"],
+                    result["error"],
+                )
         return status
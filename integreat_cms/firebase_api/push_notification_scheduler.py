@@ -0,0 +1,338 @@
+"""
+This module contains the scheduler which sends timed push notifications when they are due (see
+:mod:`~integreat_cms.core.management.commands.send_push_notifications`).
+
+Each push notification is marked as being sent before it is sent, so it is sent only once even if the scheduler runs on
+multiple nodes or overlaps with a one-shot run of the command. When the scheduler runs as daemon, it sleeps until the
+next push notification is due. It is woken up early via PostgreSQL's ``NOTIFY`` when a push notification is scheduled
+(see :mod:`~integreat_cms.core.signals.push_notification_signals`).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import select
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import psycopg2
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections, DatabaseError, transaction
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from ..cms.models import PushNotification
+from .firebase_api_client import FirebaseApiClient
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Any, Final
+
+    from django.db.models.query import QuerySet
+
+logger = logging.getLogger(__name__)
+
+#: The channel which is notified when a push notification is scheduled
+NOTIFY_CHANNEL: Final = "integreat_cms_push_notifications"
+
+#: The maximum number of seconds the daemon sleeps, in case a notification about a new schedule was missed
+MAX_SLEEP: Final[int] = 5 * 60
+
+#: The number of seconds the daemon waits before it reconnects after a database error
+RECONNECT_DELAY: Final[int] = 10
+
+#: The time after which a push notification which is still marked as being sent is considered abandoned
+CLAIM_TIMEOUT: Final[timedelta] = timedelta(minutes=30)
+
+
+def get_scheduled_push_notifications() -> QuerySet[PushNotification]:
+    """
+    Get the push notifications which are scheduled but not sent yet
+
+    :return: The scheduled push notifications
+    """
+    return PushNotification.objects.filter(
+        scheduled_send_date__isnull=False,
+        sent_date__isnull=True,
+        draft=False,
+    )
+
+
+def get_due_push_notifications() -> QuerySet[PushNotification]:
+    """
+    Get the scheduled push notifications which are due
+
+    :return: The due push notifications
+    """
+    return get_scheduled_push_notifications().filter(
+        scheduled_send_date__lte=timezone.now()
+    )
+
+
+def notify_scheduler() -> None:
+    """
+    Wake up the daemons of all nodes to reconsider the next due push notification
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"NOTIFY {NOTIFY_CHANNEL}")
+
+
+def claim_push_notification(push_notification_id: int) -> PushNotification | None:
+    """
+    Mark a due push notification as being sent, unless another process is already sending it. Claims which are older
+    than :data:`CLAIM_TIMEOUT` are considered abandoned (e.g. because the sending process crashed) and are taken over.
+
+    :param push_notification_id: The id of the push notification
+    :return: The claimed push notification, or ``None`` if it is claimed by another process or not due anymore
+    """
+    now = timezone.now()
+    # The update is atomic, so only one process can claim the push notification
+    claimed = (
+        get_due_push_notifications()
+        .filter(id=push_notification_id)
+        .filter(Q(sending_date__isnull=True) | Q(sending_date__lt=now - CLAIM_TIMEOUT))
+        .update(sending_date=now)
+    )
+    return PushNotification.objects.get(id=push_notification_id) if claimed else None
+
+
+def send_push_notification(push_notification_id: int) -> bool | None:
+    """
+    Claim a due push notification and send it. The push notification is claimed in a short transaction before it is
+    sent (see :func:`claim_push_notification`), so concurrent calls for the same push notification skip it instead of
+    sending it again without keeping a transaction open during the requests to FCM.
+
+    :param push_notification_id: The id of the push notification
+    :return: Whether the push notification was sent, or ``None`` if it is claimed by another process or not due anymore
+    """
+    if not (push_notification := claim_push_notification(push_notification_id)):
+        return None
+    sent = False
+    try:
+        sent = send_claimed_push_notification(push_notification)
+    finally:
+        if not sent:
+            # Release the claim, so the push notification can be retried
+            PushNotification.objects.filter(id=push_notification_id).update(
+                sending_date=None
+            )
+    if not sent:
+        return False
+    with transaction.atomic():
+        push_notification.sent_date = timezone.now()
+        push_notification.sending_date = None
+        push_notification.save()
+    logger.info("Successfully sent %r", push_notification)
+    return True
+
+
+def send_claimed_push_notification(push_notification: PushNotification) -> bool:
+    """
+    Send a push notification which was claimed by the current process
+
+    :param push_notification: The push notification
+    :return: Whether the push notification was sent
+    """
+    try:
+        push_sender = FirebaseApiClient(push_notification)
+    except ImproperlyConfigured as e:
+        logger.error(
+            "%r could not be sent due to a configuration error: %s",
+            push_notification,
+            e,
+        )
+        return False
+    if not push_sender.is_valid():
+        logger.error(
+            "%r cannot be sent because required texts are missing",
+            push_notification,
+        )
+        return False
+    if not push_sender.send_all():
+        logger.error("%r could not be sent", push_notification)
+        return False
+    return True
+
+
+# pylint: disable=too-many-instance-attributes
+class PushNotificationScheduler:
+    """
+    This class sends the scheduled push notifications when they are due, until it receives ``SIGINT`` or ``SIGTERM``
+    """
+
+    def __init__(self, workers: int) -> None:
+        """
+        Initialize the scheduler
+
+        :param workers: The number of push notifications which are sent concurrently
+        """
+        self.workers = workers
+        self.stopping = False
+        #: The ids of the push notifications which are currently sent by the workers
+        self.in_progress: set[int] = set()
+        #: The ids of the push notifications which could not be sent and the dates when they are retried
+        self.retries: dict[int, datetime] = {}
+        self.lock = threading.Lock()
+        #: The pipe which wakes up the daemon when a worker finished or a signal was received
+        self.wakeup_read, self.wakeup_write = os.pipe()
+        os.set_blocking(self.wakeup_read, False)
+        os.set_blocking(self.wakeup_write, False)
+        #: The database connection which listens to the notifications about new schedules
+        self.listening: Any = None
+
+    def run(self) -> None:
+        """
+        Run the daemon loop in the main thread
+        """
+        previous_wakeup_fd = signal.set_wakeup_fd(self.wakeup_write)
+        previous_handlers = {
+            signum: signal.signal(signum, self.stop)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="push-notifications"
+        )
+        try:
+            while not self.stopping:
+                try:
+                    self.listen()
+                    timeout = self.dispatch(executor)
+                except DatabaseError as e:
+                    logger.error(
+                        "Database error in push notification scheduler, reconnecting in %d seconds: %s",
+                        RECONNECT_DELAY,
+                        e,
+                    )
+                    connection.close()
+                    self.listening = None
+                    timeout = RECONNECT_DELAY
+                self.wait(timeout)
+        finally:
+            logger.info("Waiting for push notifications which are being sent")
+            # Push notifications which are not claimed yet are sent by the next run
+            executor.shutdown(cancel_futures=True)
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            os.close(self.wakeup_read)
+            os.close(self.wakeup_write)
+            connection.close()
+
+    def stop(self, *args: Any) -> None:
+        r"""
+        Stop the daemon after the push notifications which are currently sent
+
+        :param \*args: The signal number and the current stack frame
+        """
+        logger.info("Stopping push notification scheduler")
+        self.stopping = True
+
+    def listen(self) -> None:
+        """
+        Listen to notifications about new schedules on the database connection of the daemon
+        """
+        connection.ensure_connection()
+        if self.listening is not connection.connection:
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            self.listening = connection.connection
+
+    def dispatch(self, executor: ThreadPoolExecutor) -> float:
+        """
+        Submit all due push notifications to the workers
+
+        :param executor: The pool of workers
+        :return: The number of seconds until the next push notification is due
+        """
+        now = timezone.now()
+        with self.lock:
+            self.retries = {
+                push_notification_id: retry_date
+                for push_notification_id, retry_date in self.retries.items()
+                if retry_date > now
+            }
+            excluded = self.in_progress | set(self.retries)
+            next_dates = list(self.retries.values())
+        scheduled = get_scheduled_push_notifications().exclude(id__in=excluded)
+        for push_notification_id in scheduled.filter(
+            scheduled_send_date__lte=now
+        ).values_list("id", flat=True):
+            with self.lock:
+                self.in_progress.add(push_notification_id)
+            executor.submit(self.send, push_notification_id)
+        if next_date := scheduled.filter(scheduled_send_date__gt=now).aggregate(
+            next_date=Min("scheduled_send_date")
+        )["next_date"]:
+            next_dates.append(next_date)
+        if not next_dates:
+            return MAX_SLEEP
+        return min(max((min(next_dates) - now).total_seconds(), 0), MAX_SLEEP)
+
+    def send(self, push_notification_id: int) -> None:
+        """
+        Send a push notification in a worker thread. If it could not be sent, it is retried after the interval of the
+        schedule (see :attr:`~integreat_cms.core.settings.FCM_SCHEDULE_INTERVAL_MINUTES`).
+
+        :param push_notification_id: The id of the push notification
+        """
+        try:
+            success = send_push_notification(push_notification_id)
+        # pylint: disable=broad-except
+        except Exception:
+            # Make sure the push notification is not retried immediately
+            logger.exception(
+                "Sending push notification %d failed", push_notification_id
+            )
+            success = False
+        finally:
+            connections.close_all()
+        with self.lock:
+            if not success:
+                self.retries[push_notification_id] = timezone.now() + timedelta(
+                    minutes=settings.FCM_SCHEDULE_INTERVAL_MINUTES
+                )
+            self.in_progress.discard(push_notification_id)
+        self.wake_up()
+
+    def wake_up(self) -> None:
+        """
+        Wake up the daemon loop
+        """
+        try:
+            os.write(self.wakeup_write, b"\0")
+        except BlockingIOError:
+            # The daemon will wake up anyway
+            pass
+
+    def wait(self, timeout: float) -> None:
+        """
+        Sleep until the timeout expired, a push notification was scheduled, a worker finished or a signal was received
+
+        :param timeout: The maximum number of seconds to sleep
+        """
+        readers = [self.wakeup_read]
+        if self.listening is not None:
+            readers.append(self.listening)
+        try:
+            ready, _, _ = select.select(readers, [], [], timeout)
+        except OSError:
+            # The database connection was closed
+            return
+        if self.wakeup_read in ready:
+            try:
+                while os.read(self.wakeup_read, 1024):
+                    pass
+            except BlockingIOError:
+                pass
+        if self.listening in ready:
+            try:
+                self.listening.poll()
+                self.listening.notifies.clear()
+            except psycopg2.Error as e:
+                logger.error("Listening for scheduled push notifications failed: %s", e)
+                connection.close()
+                self.listening = None
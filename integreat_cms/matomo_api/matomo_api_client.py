@@ -13,6 +13,7 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from ..cms.constants import colors, matomo_periods
+from ..core.utils.metrics import track_integration
 
 if TYPE_CHECKING:
     import sys
@@ -98,14 +99,15 @@ class MatomoApiClient:
             re.sub(r"&token_auth=[^&]+", "&token_auth=********", url),
         )
         try:
-            async with session.get(url) as response:
-                response_data = await response.json()
-                if (
-                    isinstance(response_data, dict)
-                    and response_data.get("result") == "error"
-                ):
-                    raise MatomoException(response_data["message"])
-                return response_data
+            with track_integration("matomo"):
+                async with session.get(url) as response:
+                    response_data = await response.json()
+                    if (
+                        isinstance(response_data, dict)
+                        and response_data.get("result") == "error"
+                    ):
+                        raise MatomoException(response_data["message"])
+                    return response_data
         except aiohttp.ClientError as e:
             raise MatomoException(str(e)) from e
 
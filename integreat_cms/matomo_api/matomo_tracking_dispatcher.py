@@ -0,0 +1,274 @@
+"""
+This module contains the dispatcher which sends the tracking requests of the API to Matomo in the background.
+
+The tracking requests are put into a bounded queue and sent by a small pool of worker threads, which combine them into
+bulk tracking requests (see https://developer.matomo.org/api-reference/tracking-api#bulk-tracking) and reuse their
+connections. When the queue is full, new tracking requests are dropped instead of slowing down the API.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+import requests
+from django.conf import settings
+
+from ..core.utils.metrics import set_queue_size, track_integration
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
+class MatomoTrackingDispatcher:
+    """
+    This class dispatches tracking requests to the Matomo tracking API.
+    Use :func:`~integreat_cms.matomo_api.matomo_tracking_dispatcher.get_matomo_tracking_dispatcher` to get the
+    dispatcher of the current process.
+    """
+
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        workers: int | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        Initialize the dispatcher. The worker threads are started with the first tracking request.
+
+        :param queue_size: The maximum number of queued tracking requests
+                           (defaults to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_QUEUE_SIZE`)
+        :param workers: The number of worker threads
+                        (defaults to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_WORKERS`)
+        :param batch_size: The maximum number of tracking requests per bulk request
+                           (defaults to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_BATCH_SIZE`)
+        """
+        self.queue: queue.Queue = queue.Queue(
+            queue_size or settings.MATOMO_TRACKING_QUEUE_SIZE
+        )
+        self.workers = workers or settings.MATOMO_TRACKING_WORKERS
+        self.batch_size = batch_size or settings.MATOMO_TRACKING_BATCH_SIZE
+        #: The number of tracking requests per outcome (``sent``, ``dropped`` and ``failed``)
+        self.counters: Counter = Counter()
+        self.lock = threading.Lock()
+        self.threads: list[threading.Thread] = []
+        self.stopping = threading.Event()
+        #: The process which started the worker threads (threads do not survive when a process is forked)
+        self.pid: int | None = None
+        #: Whether :meth:`stop` is registered to be called when the process exits (forked processes inherit it)
+        self.exit_handler_registered = False
+
+    def start(self) -> None:
+        """
+        Start the worker threads if they are not running in the current process
+        """
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            if not self.exit_handler_registered:
+                atexit.register(self.stop)
+                self.exit_handler_registered = True
+            self.pid = os.getpid()
+            self.stopping.clear()
+            self.threads = [
+                threading.Thread(
+                    target=self.work, name=f"matomo-tracking-{i}", daemon=True
+                )
+                for i in range(self.workers)
+            ]
+            for thread in self.threads:
+                thread.start()
+
+    def track(self, data: dict[str, Any]) -> bool:
+        """
+        Queue a tracking request without blocking
+
+        :param data: The parameters of the tracking request (including ``token_auth``)
+        :return: Whether the tracking request was queued
+        """
+        if self.pid != os.getpid():
+            self.start()
+        try:
+            self.queue.put_nowait(data)
+            set_queue_size("matomo_tracking", self.queue.qsize())
+        except queue.Full:
+            self.count("dropped")
+            logger.warning(
+                "Matomo tracking queue is full, dropped request (%d dropped in total)",
+                self.counters["dropped"],
+            )
+            return False
+        return True
+
+    def count(self, outcome: str, amount: int = 1) -> None:
+        """
+        Increase the counter of an outcome
+
+        :param outcome: The outcome of the tracking requests
+        :param amount: The number of tracking requests
+        """
+        with self.lock:
+            self.counters[outcome] += amount
+
+    def get_batch(self) -> list[dict[str, Any]]:
+        """
+        Wait for the next tracking request and collect all further requests which are already queued
+
+        :return: The tracking requests of the batch (empty if no request was queued within a second)
+        """
+        try:
+            batch = [self.queue.get(timeout=1)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        set_queue_size("matomo_tracking", self.queue.qsize())
+        return batch
+
+    def work(self) -> None:
+        """
+        The loop of the worker threads. Each worker uses its own session to keep its connection alive.
+        """
+        with requests.Session() as session:
+            while not self.stopping.is_set() or not self.queue.empty():
+                if not (batch := self.get_batch()):
+                    continue
+                try:
+                    self.send(session, batch)
+                # pylint: disable=broad-except
+                except Exception as e:
+                    # Make sure the worker does not die
+                    logger.exception(e)
+                    self.count("failed", len(batch))
+                finally:
+                    for _ in batch:
+                        self.queue.task_done()
+
+    def send(self, session: requests.Session, batch: list[dict[str, Any]]) -> None:
+        """
+        Send a batch of tracking requests. Since the access token is required for bulk requests, one bulk request is
+        sent per Matomo access token.
+
+        :param session: The session of the current worker
+        :param batch: The tracking requests
+        """
+        requests_by_token = defaultdict(list)
+        for data in batch:
+            data = dict(data)
+            requests_by_token[data.pop("token_auth", None)].append(
+                f"?{urlencode(data)}"
+            )
+        for token_auth, tracking_requests in requests_by_token.items():
+            if self.post(
+                session, {"requests": tracking_requests, "token_auth": token_auth}
+            ):
+                self.count("sent", len(tracking_requests))
+            else:
+                self.count("failed", len(tracking_requests))
+
+    def post(self, session: requests.Session, payload: dict[str, Any]) -> bool:
+        """
+        Post a bulk tracking request to Matomo and retry with exponential backoff on errors
+
+        :param session: The session of the current worker
+        :param payload: The bulk tracking request
+        :return: Whether the request was successful
+        """
+        url = f"{settings.MATOMO_URL}/matomo.php"
+        for attempt in range(settings.MATOMO_TRACKING_RETRIES + 1):
+            if attempt:
+                time.sleep(settings.MATOMO_TRACKING_RETRY_DELAY * 2 ** (attempt - 1))
+            try:
+                with track_integration("matomo_tracking"):
+                    response = session.post(
+                        url, json=payload, timeout=settings.MATOMO_TRACKING_TIMEOUT
+                    )
+                    response.raise_for_status()
+                return True
+            except requests.RequestException as e:
+                logger.error(
+                    "Matomo bulk tracking request to %r failed (attempt %d) with: %s",
+                    url,
+                    attempt + 1,
+                    e,
+                )
+        return False
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all queued tracking requests have been processed
+
+        :param timeout: The maximum time to wait in seconds (or ``None`` to wait indefinitely)
+        :return: Whether all tracking requests have been processed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self) -> None:
+        """
+        Send the queued tracking requests and stop the worker threads.
+        This is called automatically when the process exits.
+        """
+        if self.pid != os.getpid():
+            return
+        if not self.flush(timeout=settings.MATOMO_TRACKING_SHUTDOWN_TIMEOUT):
+            logger.warning(
+                "Not all Matomo tracking requests could be sent before shutdown"
+            )
+        self.stopping.set()
+        with self.lock:
+            self.pid = None
+        for thread in self.threads:
+            thread.join(timeout=settings.MATOMO_TRACKING_SHUTDOWN_TIMEOUT)
+        logger.debug("Matomo tracking dispatcher stopped: %r", dict(self.counters))
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the number of tracking requests per outcome and the current size of the queue
+
+        :return: The statistics of the dispatcher
+        """
+        with self.lock:
+            return {
+                "queued": self.queue.qsize(),
+                "sent": self.counters["sent"],
+                "dropped": self.counters["dropped"],
+                "failed": self.counters["failed"],
+            }
+
+
+#: The dispatcher of the current process
+_dispatcher: MatomoTrackingDispatcher | None = None
+#: The lock to create the dispatcher
+_dispatcher_lock = threading.Lock()
+
+
+def get_matomo_tracking_dispatcher() -> MatomoTrackingDispatcher:
+    """
+    Get the tracking dispatcher of the current process
+
+    :return: The dispatcher
+    """
+    global _dispatcher  # pylint: disable=global-statement
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = MatomoTrackingDispatcher()
+        return _dispatcher
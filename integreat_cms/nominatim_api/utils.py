@@ -92,6 +92,33 @@ class BoundingBox:
         # If an empty list was given, return None
         return None
 
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """
+        Check whether the given coordinates lie within the bounding box
+
+        :param latitude: The latitude of the coordinates
+        :param longitude: The longitude of the coordinates
+        :return: Whether the coordinates are inside the box
+        """
+        return (
+            self.latitude_min <= latitude <= self.latitude_max
+            and self.longitude_min <= longitude <= self.longitude_max
+        )
+
+    def intersects(self, other: BoundingBox) -> bool:
+        """
+        Check whether the bounding box overlaps with another bounding box
+
+        :param other: The other bounding box
+        :return: Whether the boxes have at least one point in common
+        """
+        return (
+            self.latitude_min <= other.latitude_max
+            and other.latitude_min <= self.latitude_max
+            and self.longitude_min <= other.longitude_max
+            and other.longitude_min <= self.longitude_max
+        )
+
     def __repr__(self) -> str:
         """
         String representation for debug logging
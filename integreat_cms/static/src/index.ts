@@ -69,6 +69,7 @@ import "./js/mfa/login";
 
 import "./js/analytics/statistics-charts";
 import "./js/analytics/translation_coverage";
+import "./js/analytics/app-size-chart";
 import "./js/analytics/linkcheck-widget";
 import "./js/analytics/hix-list";
 
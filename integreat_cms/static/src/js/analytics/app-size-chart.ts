@@ -0,0 +1,49 @@
+import {
+    Chart,
+    ChartData,
+    LineElement,
+    PointElement,
+    LineController,
+    CategoryScale,
+    LinearScale,
+    Legend,
+    Tooltip,
+} from "chart.js";
+
+// Register all components that are being used - the others will be excluded from the final webpack build
+// See https://www.chartjs.org/docs/latest/getting-started/integration.html#bundlers-webpack-rollup-etc for details
+Chart.register(LineElement, PointElement, LineController, CategoryScale, LinearScale, Legend, Tooltip);
+
+window.addEventListener("load", async () => {
+    // If the page has no diagram, do nothing
+    const chart: HTMLElement = document.getElementById("app_size_chart");
+    if (!chart) {
+        return;
+    }
+
+    const JsonData: ChartData = JSON.parse(document.getElementById("chart_data").textContent);
+
+    /* eslint-disable-next-line no-new */
+    new Chart("app_size_chart", {
+        type: "line",
+        data: JsonData,
+        options: {
+            responsive: true,
+            scales: {
+                x: {
+                    title: {
+                        display: true,
+                        text: chart.getAttribute("data-chart-dates"),
+                    },
+                },
+                y: {
+                    beginAtZero: true,
+                    title: {
+                        display: true,
+                        text: chart.getAttribute("data-chart-size"),
+                    },
+                },
+            },
+        },
+    });
+});
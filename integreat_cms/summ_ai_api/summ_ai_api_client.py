@@ -13,6 +13,7 @@ from django.conf import settings
 
 from ..core.utils.machine_translation_api_client import MachineTranslationApiClient
 from ..core.utils.machine_translation_provider import MachineTranslationProvider
+from ..core.utils.metrics import track_integration
 from .utils import TranslationHelper
 
 if TYPE_CHECKING:
@@ -76,31 +77,32 @@ class SummAiApiClient(MachineTranslationApiClient):
         # Use test region for development
         user = settings.TEST_REGION_SLUG if settings.DEBUG else self.region.slug
         try:
-            async with session.post(
-                settings.SUMM_AI_API_URL,
-                headers={"Authorization": f"Bearer {settings.SUMM_AI_API_KEY}"},
-                json={
-                    "input_text": text_field.text,
-                    "user": user,
-                    "separator": settings.SUMM_AI_SEPARATOR,
-                    "is_test": settings.SUMM_AI_TEST_MODE,
-                    "is_initial": settings.SUMM_AI_IS_INITIAL,
-                },
-            ) as response:
-                # Wait for the response
-                response_data = await response.json()
-                # Check whether the text was translated successfully
-                if "translated_text" not in response_data:
-                    if "error" in response_data:
+            with track_integration("summ_ai"):
+                async with session.post(
+                    settings.SUMM_AI_API_URL,
+                    headers={"Authorization": f"Bearer {settings.SUMM_AI_API_KEY}"},
+                    json={
+                        "input_text": text_field.text,
+                        "user": user,
+                        "separator": settings.SUMM_AI_SEPARATOR,
+                        "is_test": settings.SUMM_AI_TEST_MODE,
+                        "is_initial": settings.SUMM_AI_IS_INITIAL,
+                    },
+                ) as response:
+                    # Wait for the response
+                    response_data = await response.json()
+                    # Check whether the text was translated successfully
+                    if "translated_text" not in response_data:
+                        if "error" in response_data:
+                            raise SummAiException(
+                                f"API error: {response.status} - {response_data['error']}"
+                            )
                         raise SummAiException(
-                            f"API error: {response.status} - {response_data['error']}"
+                            f"Unexpected API result: {response.status} - {response_data!r}"
                         )
-                    raise SummAiException(
-                        f"Unexpected API result: {response.status} - {response_data!r}"
-                    )
-                # Let the field handle the translated text
-                text_field.translate(response_data["translated_text"])
-                return text_field
+                    # Let the field handle the translated text
+                    text_field.translate(response_data["translated_text"])
+                    return text_field
         except (aiohttp.ClientError, asyncio.TimeoutError, SummAiException) as e:
             logger.error(
                 "SUMM.AI translation of %r failed because of %s: %s",
@@ -9,6 +9,8 @@ from urllib.request import Request, urlopen
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+from ..core.utils.metrics import track_integration
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -77,5 +79,5 @@ class TextlabClient:
         if auth_token:
             request.add_header("authorization", f"Bearer {auth_token}")
         request.add_header("Content-Type", "application/json")
-        with urlopen(request) as response:
+        with track_integration("textlab"), urlopen(request) as response:
             return json.loads(response.read().decode("utf-8"))
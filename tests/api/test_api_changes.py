@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+from django.test.client import Client
+
+from integreat_cms.cms.models import Event, Page
+
+
+@pytest.mark.django_db
+def test_api_changes_without_token(load_test_data: None) -> None:
+    """
+    Check that all content is returned as created if no sync token is given
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    response = client.get("/api/augsburg/de/changes/")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["token"]
+    pages = client.get("/api/augsburg/de/pages/").json()
+    assert len(result["pages"]["created"]) == len(pages)
+    assert sorted(page["id"] for page in result["pages"]["created"].values()) == sorted(
+        page["id"] for page in pages
+    )
+    for key in ["pages", "events", "locations", "imprint"]:
+        assert not result[key]["updated"]
+        assert not result[key]["deleted"]
+
+
+@pytest.mark.django_db
+def test_api_changes_invalid_token(load_test_data: None) -> None:
+    """
+    Check that invalid sync tokens are rejected
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    response = client.get("/api/augsburg/de/changes/", {"since": "invalid"})
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+@pytest.mark.django_db
+def test_api_changes(load_test_data: None) -> None:
+    """
+    Check that changes since a sync token are returned
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/augsburg/de/changes/"
+    token = client.get(endpoint).json()["token"]
+    result = client.get(endpoint, {"since": token}).json()
+    for key in ["pages", "events", "locations", "imprint"]:
+        assert result[key] == {"created": {}, "updated": {}, "deleted": []}
+    # Update a page
+    page = Page.objects.filter(region__slug="augsburg", lft=1).first()
+    translation = page.get_translation("de")
+    translation.title = "Changed title"
+    translation.save()
+    result = client.get(endpoint, {"since": token}).json()
+    assert result["pages"]["updated"][str(page.id)]["title"] == "Changed title"
+    # Archive the page
+    page.archive()
+    result = client.get(endpoint, {"since": token}).json()
+    assert not result["pages"]["updated"]
+    assert page.id in result["pages"]["deleted"]
+    # Delete an event
+    event = Event.objects.filter(region__slug="augsburg").first()
+    event_id = event.id
+    event.delete()
+    result = client.get(endpoint, {"since": token}).json()
+    assert result["events"]["deleted"] == [event_id]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+import brotli
+import pytest
+from django.test.client import Client
+
+from integreat_cms.api.utils import response_store_utils
+from integreat_cms.api.utils.response_store_utils import (
+    decompress,
+    get_accepted_encodings,
+    get_stored_response,
+    store_response,
+)
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+#: The endpoint of the pages of the test region
+PAGES_ENDPOINT = "/api/augsburg/de/pages/"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected_encodings",
+    [
+        ("", []),
+        ("gzip", ["gzip"]),
+        ("gzip, deflate, br", ["br", "gzip"]),
+        ("br;q=0.5, gzip", ["gzip", "br"]),
+        ("br;q=0, *", ["gzip"]),
+        ("identity", []),
+    ],
+)
+def test_get_accepted_encodings(
+    accept_encoding: str, expected_encodings: list[str]
+) -> None:
+    """
+    Check that the accepted encodings are determined according to the ``Accept-Encoding`` header
+
+    :param accept_encoding: The value of the header
+    :param expected_encodings: The expected encodings in the order of preference
+    """
+    assert get_accepted_encodings(accept_encoding) == expected_encodings
+
+
+def test_store_compressed_variants() -> None:
+    """
+    Check that the compressed variants are stored with the response
+    """
+    content = b'{"title": "Test"}' * 100
+    variants = store_response(None, '"compressed-variants"', content)
+    assert set(variants) == {"identity", "gzip", "br"}
+    assert gzip.decompress(variants["gzip"]) == content
+    assert brotli.decompress(variants["br"]) == content
+    for encodings, expected_encoding in [
+        (["br", "gzip"], "br"),
+        (["gzip"], "gzip"),
+        ([], "identity"),
+    ]:
+        stored_content, encoding = get_stored_response(
+            None, '"compressed-variants"', encodings
+        )
+        assert encoding == expected_encoding
+        assert decompress(stored_content, encoding) == content
+    # Small responses are not compressed
+    assert set(store_response(None, '"small"', b"[]")) == {"identity"}
+    assert get_stored_response(None, '"small"', ["gzip"]) == (b"[]", "identity")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_api_compressed_response(load_test_data: None, encoding: str) -> None:
+    """
+    Check that the stored responses are served in the accepted encoding
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param encoding: The accepted encoding
+    """
+    client = Client()
+    content = client.get(PAGES_ENDPOINT).content
+    for _ in range(2):
+        response = client.get(PAGES_ENDPOINT, HTTP_ACCEPT_ENCODING=encoding)
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == encoding
+        assert response["Content-Length"] == str(len(response.content))
+        assert "Accept-Encoding" in response["Vary"]
+        assert decompress(response.content, encoding) == content
+    assert (
+        client.get(PAGES_ENDPOINT, HTTP_IF_NONE_MATCH=response["ETag"]).status_code
+        == 304
+    )
+
+
+@pytest.mark.django_db
+def test_api_compressed_response_compressed_once(
+    load_test_data: None, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Check that the compressed variants of a response are only created once and served from the store afterwards
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    """
+    compressed_encodings = []
+    original_compress = response_store_utils.compress
+
+    def compress(content: bytes, encoding: str) -> bytes:
+        """
+        Record the encoding and compress the content
+
+        :param content: The serialized content of the response
+        :param encoding: The content encoding
+        :return: The compressed content
+        """
+        compressed_encodings.append(encoding)
+        return original_compress(content, encoding)
+
+    monkeypatch.setattr(response_store_utils, "compress", compress)
+    client = Client()
+    for _ in range(3):
+        response = client.get(PAGES_ENDPOINT, HTTP_ACCEPT_ENCODING="gzip")
+        assert response["Content-Encoding"] == "gzip"
+    assert sorted(compressed_encodings) == ["br", "gzip"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache.backends.filebased import FileBasedCache
+from django.test.client import Client
+
+from integreat_cms.api.utils.content_version_utils import (
+    create_version_stamp,
+    get_cache_key,
+    get_content_version,
+    PAGES,
+)
+from integreat_cms.cms.models import Page
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/augsburg/de/pages/",
+        "/api/augsburg/de/events/",
+        "/api/augsburg/de/locations/",
+        "/api/augsburg/de/offers/",
+        "/api/augsburg/languages/",
+        "/api/regions/",
+    ],
+)
+def test_api_conditional_request(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that the API endpoints deliver validators and answer conditional requests with ``304 Not Modified``
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The url of the endpoint
+    """
+    client = Client()
+    response = client.get(endpoint)
+    assert response.status_code == 200
+    assert response.has_header("ETag")
+    assert response.has_header("Last-Modified")
+    # Repeated requests with the same validator are not modified
+    response = client.get(endpoint, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+    assert not response.content
+    # Different query parameters result in different validators
+    other_response = client.get(endpoint, {"unknown": "parameter"})
+    assert other_response["ETag"] != response["ETag"]
+
+
+@pytest.mark.django_db
+def test_api_conditional_request_after_change(
+    load_test_data: None, django_capture_on_commit_callbacks: Callable
+) -> None:
+    """
+    Check that the validators of the pages endpoint change when a page translation is changed
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    """
+    client = Client()
+    endpoint = "/api/augsburg/de/pages/"
+    etag = client.get(endpoint)["ETag"]
+    # Changes of other regions do not affect the validator
+    with django_capture_on_commit_callbacks(execute=True):
+        page = Page.objects.exclude(region__slug="augsburg").first()
+        translation = page.translations.first()
+        translation.title = "Changed title"
+        translation.save()
+    response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    # Changes of the region's content result in a new validator
+    with django_capture_on_commit_callbacks(execute=True):
+        page = Page.objects.filter(region__slug="augsburg").first()
+        translation = page.get_translation("de")
+        translation.title = "Changed title"
+        translation.save()
+    response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_content_versions_are_shared(settings: SettingsWrapper, tmp_path: Path) -> None:
+    """
+    Check that the content versions are stored in a cache which is shared between processes, so the validators change
+    when the content is changed by another process
+
+    :param settings: The fixture providing the django settings
+    :param tmp_path: The fixture providing the directory for temporary files for this test case
+    """
+    settings.CACHES = {
+        **settings.CACHES,
+        "versions": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        },
+    }
+    version, _ = get_content_version(1, PAGES)
+    assert get_content_version(1, PAGES)[0] == version
+    # Another process uses its own cache instance with the same location
+    other_process_cache = FileBasedCache(str(tmp_path), {})
+    other_process_cache.set(
+        get_cache_key(1, PAGES), create_version_stamp(), timeout=None
+    )
+    assert get_content_version(1, PAGES)[0] != version
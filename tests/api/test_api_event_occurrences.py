@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.cms.models import EventOccurrence
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+#: The endpoint of the events of the test region
+EVENTS_ENDPOINT = "/api/augsburg/de/events/"
+
+
+@pytest.mark.django_db
+def test_api_events_date_range(load_test_data: None) -> None:
+    """
+    Check that the events endpoint returns the recurrences in the requested time range
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    call_command("update_event_occurrences")
+    client = Client()
+    response = client.get(EVENTS_ENDPOINT, {"from": "2030-01-10", "to": "2030-01-20"})
+    assert response.status_code == 200
+    assert [event["path"] for event in response.json()] == [
+        "/augsburg/de/events/test-veranstaltung$2030-01-15/",
+        "/augsburg/de/events/test-veranstaltung$2030-01-17/",
+    ]
+    # Without the time range parameters, the events are expanded like before
+    with open(
+        "tests/api/expected-outputs/augsburg_de_events.json", encoding="utf-8"
+    ) as f:
+        expected_events = json.load(f)
+    response = client.get(EVENTS_ENDPOINT, {"from": "2030-01-01"})
+    assert [event["path"] for event in response.json()] == [
+        event["path"] for event in expected_events
+    ]
+
+
+@pytest.mark.django_db
+def test_api_events_beyond_stored_occurrences(
+    load_test_data: None, settings: SettingsWrapper
+) -> None:
+    """
+    Check that the events endpoint also returns the recurrences beyond the horizon of the stored occurrences
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.EVENT_OCCURRENCES_HORIZON_DAYS = 10
+    call_command("update_event_occurrences")
+    last_stored = EventOccurrence.objects.filter(
+        region__slug="augsburg", event__translations__slug="test-veranstaltung"
+    ).latest("start")
+    assert str(last_stored.start.date()) < "2030-01-15"
+    response = Client().get(EVENTS_ENDPOINT, {"from": "2030-01-10", "to": "2030-01-20"})
+    assert response.status_code == 200
+    assert [event["path"] for event in response.json()] == [
+        "/augsburg/de/events/test-veranstaltung$2030-01-15/",
+        "/augsburg/de/events/test-veranstaltung$2030-01-17/",
+    ]
+
+
+@pytest.mark.django_db
+def test_api_events_limit(load_test_data: None) -> None:
+    """
+    Check that the number of returned events can be limited
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    call_command("update_event_occurrences")
+    client = Client()
+    response = client.get(EVENTS_ENDPOINT, {"from": "2030-01-01", "limit": 1})
+    assert [event["path"] for event in response.json()] == [
+        "/augsburg/de/events/test-veranstaltung$2030-01-01/"
+    ]
+    response = client.get(
+        EVENTS_ENDPOINT, {"from": "2030-01-01", "combine_recurring": True}
+    )
+    assert [event["path"] for event in response.json()] == [
+        "/augsburg/de/events/test-veranstaltung/"
+    ]
+
+
+@pytest.mark.django_db
+def test_api_events_cursor(load_test_data: None) -> None:
+    """
+    Check that the occurrences before the cursor are not queried and only the events of the page are loaded
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    call_command("update_event_occurrences")
+    client = Client()
+    response = client.get(EVENTS_ENDPOINT, {"from": "2030-01-01", "limit": 1})
+    next_url = response["Link"].split(">")[0][1:]
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(next_url)
+    assert [event["path"] for event in response.json()] == [
+        "/augsburg/de/events/test-veranstaltung$2030-01-03/"
+    ]
+    occurrence_queries = [
+        query["sql"]
+        for query in context.captured_queries
+        if 'FROM "cms_eventoccurrence"' in query["sql"]
+    ]
+    assert occurrence_queries
+    assert all('"start" >=' in sql for sql in occurrence_queries)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"from": "invalid"},
+        {"to": "2030-13-01"},
+        {"limit": "0"},
+        {"limit": "many"},
+        {"from": "2030-01-02", "to": "2030-01-01"},
+    ],
+)
+def test_api_events_invalid_range(load_test_data: None, params: dict[str, str]) -> None:
+    """
+    Check that invalid time range parameters are rejected
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param params: The invalid query parameters
+    """
+    response = Client().get(EVENTS_ENDPOINT, params)
+    assert response.status_code == 400
+    assert "error" in response.json()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+from django.http import QueryDict
+from django.test.client import Client
+
+from integreat_cms.api.utils.list_query_utils import (
+    encode_cursor,
+    parse_cursor,
+    parse_fields,
+    select_fields,
+)
+
+#: The list endpoints which support field selection and pagination
+LIST_ENDPOINTS = [
+    "/api/augsburg/de/pages/",
+    "/api/augsburg/de/locations/",
+    "/api/augsburg/de/events/?from=2000-01-01",
+    "/api/augsburg/de/events/?from=2000-01-01&combine_recurring=1",
+    "/api/augsburg/de/fcm/",
+]
+
+
+def test_select_fields() -> None:
+    """
+    Check that only the values of the requested fields are computed
+    """
+
+    def fail() -> None:
+        """
+        A getter which must not be called
+        """
+        raise AssertionError("The value of an unrequested field was computed")
+
+    assert select_fields({"id"}, {"id": lambda: 1, "content": fail}) == {"id": 1}
+    assert select_fields(None, {"id": lambda: 1, "title": lambda: "a"}) == {
+        "id": 1,
+        "title": "a",
+    }
+
+
+def test_parse_fields_and_cursor() -> None:
+    """
+    Check that the query parameters are parsed correctly
+    """
+    assert parse_fields(QueryDict("")) is None
+    assert parse_fields(QueryDict("fields=id, title,,path")) == {"id", "title", "path"}
+    assert parse_cursor(QueryDict(""), 2) is None
+    cursor = encode_cursor((-12, 3))
+    assert parse_cursor(QueryDict(f"after={cursor}"), 2) == (-12, 3)
+    for invalid_cursor in ["1", "1.2.3", "a.b", ""]:
+        with pytest.raises(ValueError):
+            parse_cursor(QueryDict(f"after={invalid_cursor}"), 2)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", LIST_ENDPOINTS)
+def test_api_field_selection(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that only the requested fields are returned
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The list endpoint
+    """
+    client = Client()
+    items = client.get(endpoint).json()
+    separator = "&" if "?" in endpoint else "?"
+    selected_items = client.get(f"{endpoint}{separator}fields=id,title").json()
+    assert selected_items == [
+        {"id": item["id"], "title": item["title"]} for item in items
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", LIST_ENDPOINTS)
+def test_api_pagination(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that following the links to the next pages returns all items exactly once
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The list endpoint
+    """
+    client = Client()
+    items = client.get(endpoint).json()
+    separator = "&" if "?" in endpoint else "?"
+    url: str | None = f"{endpoint}{separator}limit=1"
+    paginated_items = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 1
+        paginated_items.extend(page)
+        url = (
+            match.group(1)
+            if (match := re.match(r'<(.*)>; rel="next"', response.get("Link", "")))
+            else None
+        )
+    assert paginated_items == items
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", LIST_ENDPOINTS)
+def test_api_invalid_cursor(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that invalid cursors are rejected
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The list endpoint
+    """
+    separator = "&" if "?" in endpoint else "?"
+    response = Client().get(f"{endpoint}{separator}after=invalid")
+    assert response.status_code == 400
+    assert "error" in response.json()
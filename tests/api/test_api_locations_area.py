@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+from django.test.client import Client
+
+#: The endpoint of the locations of the test region
+LOCATIONS_ENDPOINT = "/api/augsburg/de/locations/"
+
+#: The path of the only public location of the test region (at 48.3781092,10.887578)
+LOCATION_PATH = "/augsburg/de/locations/test-ort/"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params,expected_paths",
+    [
+        ({"bbox": "10.88,48.37,10.89,48.38"}, [LOCATION_PATH]),
+        ({"bbox": "10.89,48.37,10.90,48.38"}, []),
+        ({"near": "48.37,10.88"}, [LOCATION_PATH]),
+        ({"near": "48.37,10.88", "radius": "2000"}, [LOCATION_PATH]),
+        ({"near": "48.37,10.88", "radius": "500"}, []),
+        (
+            {
+                "bbox": "10.89,48.37,10.90,48.38",
+                "near": "48.37,10.88",
+                "radius": "2000",
+            },
+            [],
+        ),
+        ({"limit": "1"}, [LOCATION_PATH]),
+    ],
+)
+def test_api_locations_area(
+    load_test_data: None, params: dict[str, str], expected_paths: list[str]
+) -> None:
+    """
+    Check that the locations endpoint only returns the locations in the requested area
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param params: The query parameters
+    :param expected_paths: The paths of the expected locations
+    """
+    response = Client().get(LOCATIONS_ENDPOINT, params)
+    assert response.status_code == 200
+    assert [location["path"] for location in response.json()] == expected_paths
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"bbox": "10.88,48.37,10.89"},
+        {"bbox": "10.89,48.37,10.88,48.38"},
+        {"bbox": "0,0,1,1"},
+        {"near": "48.37"},
+        {"near": "nan,10.88"},
+        {"near": "0,0"},
+        {"radius": "1000"},
+        {"near": "48.37,10.88", "radius": "-1"},
+        {"limit": "0"},
+    ],
+)
+def test_api_locations_invalid_area(
+    load_test_data: None, params: dict[str, str]
+) -> None:
+    """
+    Check that invalid area parameters are rejected
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param params: The invalid query parameters
+    """
+    response = Client().get(LOCATIONS_ENDPOINT, params)
+    assert response.status_code == 400
+    assert "error" in response.json()
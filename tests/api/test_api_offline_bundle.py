@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import shutil
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+from django.test.client import Client
+
+from integreat_cms.api.utils.content_version_utils import (
+    invalidate_content_versions,
+    PAGES,
+)
+from integreat_cms.api.utils.offline_bundle_utils import (
+    build_offline_bundle,
+    bundle_storage,
+    get_referenced_media,
+    lock_bundle_dir,
+    LOCK_FILENAME,
+    MANIFEST_NAME,
+)
+from integreat_cms.cms.models import Region
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.fixture(name="clean_bundles")
+def fixture_clean_bundles() -> Iterator[None]:
+    """
+    Remove the offline bundles of the test region after the test
+
+    :return: A generator which removes the bundles on teardown
+    """
+    yield
+    shutil.rmtree(bundle_storage.path("augsburg"), ignore_errors=True)
+
+
+def read_bundle(location: str) -> zipfile.ZipFile:
+    """
+    Open the bundle the API redirected to
+
+    :param location: The location of the redirect
+    :return: The archive of the bundle
+    """
+    return zipfile.ZipFile(bundle_storage.path(location.split("/offline-bundles/")[1]))
+
+
+@pytest.mark.django_db
+def test_api_offline_bundle(load_test_data: None, clean_bundles: None) -> None:
+    """
+    Check that the bundle contains the payloads of the API, is only rebuilt when the content changes and that the API
+    delivers the latest bundle without building it
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param clean_bundles: The fixture removing the bundles after the test
+    """
+    client = Client()
+    region = Region.objects.get(slug="augsburg")
+    response = client.get("/api/augsburg/de/bundle/")
+    assert response.status_code == 202
+    assert "Retry-After" in response.headers
+    assert build_offline_bundle(region, "de")[1]
+    response = client.get("/api/augsburg/de/bundle/")
+    assert response.status_code == 302
+    location = response.headers["Location"]
+    with read_bundle(location) as archive:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+        pages = json.loads(archive.read(manifest["endpoints"]["pages"]["path"]))
+    assert manifest["region"] == "augsburg"
+    assert manifest["language"] == "de"
+    assert {"pages", "events", "locations", "location-categories"} <= manifest[
+        "endpoints"
+    ].keys()
+    pages_response = client.get("/api/augsburg/de/pages/")
+    assert pages == json.loads(b"".join(pages_response))
+    # The bundle is not rebuilt as long as the content did not change
+    assert not build_offline_bundle(region, "de")[1]
+    assert client.get("/api/augsburg/de/bundle/").headers["Location"] == location
+    invalidate_content_versions([region.id], [PAGES])
+    # The latest bundle is delivered until the new bundle is built
+    assert client.get("/api/augsburg/de/bundle/").headers["Location"] == location
+    assert build_offline_bundle(region, "de")[1]
+    new_location = client.get("/api/augsburg/de/bundle/").headers["Location"]
+    assert new_location != location
+    with read_bundle(new_location) as archive:
+        new_manifest = json.loads(archive.read(MANIFEST_NAME))
+    assert (
+        new_manifest["endpoints"]["pages"]["version"]
+        != manifest["endpoints"]["pages"]["version"]
+    )
+    assert new_manifest["endpoints"]["locations"] == manifest["endpoints"]["locations"]
+
+
+@pytest.mark.django_db
+def test_api_offline_bundle_inactive_language(load_test_data: None) -> None:
+    """
+    Check that no bundle is built for languages which do not exist in the region
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    response = Client().get("/api/augsburg/xx/bundle/")
+    assert response.status_code == 404
+
+
+def test_get_referenced_media(settings: SettingsWrapper, tmp_path: Path) -> None:
+    """
+    Check that only existing files inside the media root are added to the bundles
+
+    :param settings: The fixture providing the django settings
+    :param tmp_path: The fixture providing the directory for temporary files for this test case
+    """
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    (tmp_path / "media" / "regions").mkdir(parents=True)
+    (tmp_path / "media" / "regions" / "icon 1.png").write_bytes(b"icon")
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    payload = json.dumps(
+        {
+            "thumbnail": "http://localhost:8000/media/regions/icon%201.png",
+            "content": '<img src="/media/regions/icon%201.png?1">'
+            '<a href="/media/../secret.txt">'
+            '<img src="/media/regions/missing.png">'
+            '<img src="https://example.com/media/regions/other.png">',
+        }
+    ).encode()
+    assert get_referenced_media([payload]) == {
+        "regions/icon 1.png": (
+            "regions/icon%201.png",
+            str(tmp_path / "media" / "regions" / "icon 1.png"),
+        )
+    }
+
+
+def test_lock_bundle_dir(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Check that the directory of the bundles is locked for other processes while a bundle is built
+
+    :param monkeypatch: The fixture which allows to modify objects for the duration of the test
+    :param tmp_path: The fixture providing the directory for temporary files for this test case
+    """
+    monkeypatch.setattr(bundle_storage, "location", str(tmp_path))
+    lock_path = os.path.join(bundle_storage.path("augsburg/de"), LOCK_FILENAME)
+    with lock_bundle_dir("augsburg/de"):
+        with open(lock_path, "a", encoding="utf-8") as lock_file:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    with open(lock_path, "a", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+from django.test.client import Client
+
+from integreat_cms.api.v3.pages import get_page_path
+
+
+@pytest.mark.parametrize(
+    "url,expected_path",
+    [
+        (
+            "/augsburg/de/behörden-und-beratung/behörden/",
+            "behörden-und-beratung/behörden",
+        ),
+        ("behörden-und-beratung/behörden", "behörden-und-beratung/behörden"),
+        (
+            "https://integreat.app/augsburg/de/beh%C3%B6rden-und-beratung//",
+            "behörden-und-beratung",
+        ),
+        ("/nurnberg/de/willkommen/", "nurnberg/de/willkommen"),
+    ],
+)
+def test_get_page_path(url: str, expected_path: str) -> None:
+    """
+    Check that urls are converted into the format of the stored page paths
+
+    :param url: The requested url
+    :param expected_path: The expected page path
+    """
+    assert get_page_path(url, "augsburg", "de") == expected_path
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url",
+    [
+        # The full path is resolved via the stored paths
+        "/augsburg/de/behörden-und-beratung/behörden/ausländerbehörde/",
+        # Outdated ancestors fall back to the slug of the page
+        "/augsburg/de/outdated-slug/ausländerbehörde/",
+    ],
+)
+def test_single_page_by_url(load_test_data: None, url: str) -> None:
+    """
+    Check that pages are found by their url
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param url: The requested url
+    """
+    client = Client()
+    response = client.get("/api/augsburg/de/page/", {"url": url})
+    assert response.status_code == 200
+    assert (
+        response.json()["path"]
+        == "/augsburg/de/behörden-und-beratung/behörden/ausländerbehörde/"
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query",
+    [
+        {
+            "url": "/augsburg/de/behörden-und-beratung/behörden/archiviertes-amt/nicht-archivierte-details/"
+        },
+        {"url": "nicht-archivierte-details"},
+        {"id": 25},
+    ],
+)
+def test_single_page_with_archived_ancestor(
+    load_test_data: None, query: dict[str, str | int]
+) -> None:
+    """
+    Check that pages with archived ancestors are not found
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param query: The query parameters of the request
+    """
+    client = Client()
+    response = client.get("/api/augsburg/de/page/", query)
+    assert response.status_code == 404
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+from django.test.client import Client
+from django.test.utils import override_settings
+
+from ..utils import assert_query_budget, parse_server_timing
+from .api_config import API_ENDPOINTS
+
+
+@pytest.mark.django_db
+@override_settings(SERVER_TIMING=True)
+@pytest.mark.parametrize(
+    "endpoint,wp_endpoint,expected_result,expected_code,expected_queries", API_ENDPOINTS
+)
+def test_api_query_budget(
+    load_test_data: None,
+    endpoint: str,
+    wp_endpoint: str,
+    expected_result: str,
+    expected_code: int,
+    expected_queries: int,
+) -> None:
+    """
+    Check that no endpoint defined in :attr:`~tests.api.api_config.API_ENDPOINTS` exceeds its query budget and that
+    the measurements are exposed in the ``Server-Timing`` header
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The url of the new Django pattern
+    :param wp_endpoint: The legacy url of the wordpress endpoint pattern
+    :param expected_result: The path to the json file that contains the expected result
+    :param expected_code: The expected HTTP status code
+    :param expected_queries: The maximum number of SQL queries
+    """
+    response = Client().get(endpoint, format="json")
+    assert response.status_code == expected_code
+    assert_query_budget(response, expected_queries)
+    assert {"sql", "cache", "python", "total"} <= parse_server_timing(response).keys()
+
+
+@pytest.mark.django_db
+def test_server_timing_disabled_by_default(load_test_data: None) -> None:
+    """
+    Check that the ``Server-Timing`` header is only added when the measurements are enabled
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    response = Client().get("/api/regions/")
+    assert not response.has_header("Server-Timing")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.cms.models import Page
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/augsburg/de/pages/",
+        "/api/augsburg/de/events/",
+        "/api/augsburg/de/locations/",
+        "/api/augsburg/de/offers/",
+        "/api/augsburg/de/disclaimer/",
+    ],
+)
+def test_api_response_store(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that repeated requests are served from the response store without executing the view
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The url of the endpoint
+    """
+    client = Client()
+    with CaptureQueriesContext(connection) as initial_queries:
+        response = client.get(endpoint)
+    assert response.status_code == 200
+    with CaptureQueriesContext(connection) as stored_queries:
+        stored_response = client.get(endpoint)
+    assert stored_response.status_code == 200
+    assert stored_response["Content-Type"] == "application/json"
+    assert stored_response.content == response.content
+    assert len(stored_queries) < len(initial_queries)
+
+
+@pytest.mark.django_db
+def test_api_response_store_mirrored_page(
+    load_test_data: None, django_capture_on_commit_callbacks: Callable
+) -> None:
+    """
+    Check that the stored responses of a region are rebuilt when a page is changed which is mirrored by this region
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    """
+    client = Client()
+    endpoint = "/api/nurnberg/de/pages/"
+    mirrored_page = Page.objects.filter(region__slug="augsburg").first()
+    # Update the page without sending signals
+    Page.objects.filter(region__slug="nurnberg", lft=1).update(
+        mirrored_page=mirrored_page
+    )
+    etag = client.get(endpoint)["ETag"]
+    assert client.get(endpoint, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    with django_capture_on_commit_callbacks(execute=True):
+        translation = mirrored_page.get_translation("de")
+        translation.title = "Changed title"
+        translation.save()
+    response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_api_response_store_requires_shared_versions(
+    load_test_data: None, settings: SettingsWrapper
+) -> None:
+    """
+    Check that the response store is bypassed if the content versions are kept in the memory of each process, because
+    the stored responses would not be invalidated by changes made in other processes
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.CACHES = {
+        **settings.CACHES,
+        "versions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    client = Client()
+    endpoint = "/api/augsburg/de/pages/"
+    # Make sure the region is cached, so the requests only differ in whether the view is executed
+    client.get(endpoint)
+    with CaptureQueriesContext(connection) as initial_queries:
+        response = client.get(endpoint)
+    assert response.status_code == 200
+    with CaptureQueriesContext(connection) as repeated_queries:
+        repeated_response = client.get(endpoint)
+    assert repeated_response.content == response.content
+    assert len(repeated_queries) == len(initial_queries)
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
 import pytest
 from django.test.client import Client
 
+from integreat_cms.api.utils.response_store_utils import get_response_cache
+from integreat_cms.cms.utils.region_cache_utils import clear_local_region_cache
+
 from .api_config import API_ENDPOINTS
 
 
@@ -43,6 +46,9 @@ def test_api_result(
         response = client.get(endpoint, format="json")
     print(response.headers)
     assert response.status_code == expected_code
+    # Make sure the legacy endpoint is not served from the response store or the region cache
+    get_response_cache().clear()
+    clear_local_region_cache()
     with django_assert_num_queries(expected_queries):
         response_wp = client.get(wp_endpoint, format="json")
     print(response_wp.headers)
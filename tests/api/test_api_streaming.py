@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+from django.http import JsonResponse
+from django.test.client import Client
+
+from integreat_cms.api.utils.json_response_utils import StreamingJsonResponse
+from integreat_cms.api.utils.response_store_utils import get_response_cache
+from integreat_cms.api.v3 import events
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_django.fixtures import SettingsWrapper
+
+
+def failing_items(count: int) -> Iterator[dict[str, int]]:
+    """
+    Yield the given number of items and fail afterwards
+
+    :param count: The number of items before the error
+    :raises RuntimeError: After the items were yielded
+    :return: An iterator over the items
+    """
+    for index in range(count):
+        yield {"id": index}
+    raise RuntimeError("Test error")
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [{}],
+        [{"id": 1, "title": "Übersicht", "nested": {"list": [1, 2.5, None, True]}}],
+        [
+            {"date": date(2023, 1, 1), "price": Decimal("1.50")},
+            {"last_updated": datetime(2023, 1, 1, 12, 30)},
+            "العربية",
+        ],
+    ],
+)
+def test_streaming_json_response(settings: SettingsWrapper, items: list) -> None:
+    """
+    Check that the streaming JSON response encodes the items exactly like :class:`~django.http.JsonResponse`
+
+    :param settings: The fixture providing the django settings
+    :param items: The items of the list
+    """
+    settings.API_STREAMING_BUFFER_SIZE = 10
+    response = StreamingJsonResponse(iter(items))
+    assert response["Content-Type"] == "application/json"
+    assert (
+        b"".join(response.streaming_content) == JsonResponse(items, safe=False).content
+    )
+
+
+def test_streaming_json_response_error(settings: SettingsWrapper) -> None:
+    """
+    Check that errors which occur after the streaming started abort the transfer instead of closing the list
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.API_STREAMING_BUFFER_SIZE = 1
+    response = StreamingJsonResponse(failing_items(3))
+    chunks = []
+    with pytest.raises(RuntimeError):
+        for chunk in response.streaming_content:
+            chunks.append(chunk)
+    assert chunks
+    assert not b"".join(chunks).endswith(b"]")
+    assert not response.complete
+
+
+def test_streaming_json_response_initial_error(settings: SettingsWrapper) -> None:
+    """
+    Check that errors which occur before the streaming started are raised
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.API_STREAMING_BUFFER_SIZE = 1
+    with pytest.raises(RuntimeError):
+        StreamingJsonResponse(failing_items(0))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/augsburg/de/pages/",
+        "/api/augsburg/en/pages/",
+        "/api/augsburg/de/events/",
+        "/api/augsburg/de/events/?combine_recurring=True",
+        "/api/augsburg/de/locations/",
+        "/api/augsburg/de/locations/?on_map=1",
+        "/api/nurnberg/de/locations/",
+    ],
+)
+def test_api_streaming(
+    load_test_data: None, settings: SettingsWrapper, endpoint: str
+) -> None:
+    """
+    Check that the streaming responses are identical to the regular responses
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param endpoint: The url of the endpoint
+    """
+    client = Client()
+    response = client.get(endpoint)
+    assert response.status_code == 200
+    assert not response.streaming
+    get_response_cache().clear()
+    settings.API_STREAMING_RESPONSES = True
+    # Use small chunks and buffers to make sure the items are split up
+    settings.API_STREAMING_CHUNK_SIZE = 2
+    settings.API_STREAMING_BUFFER_SIZE = 1
+    streaming_response = client.get(endpoint)
+    assert streaming_response.status_code == 200
+    assert streaming_response.streaming
+    assert streaming_response["Content-Type"] == "application/json"
+    assert b"".join(streaming_response.streaming_content) == response.content
+    # The streamed content is stored for subsequent requests
+    stored_response = client.get(endpoint)
+    assert not stored_response.streaming
+    assert stored_response.content == response.content
+
+
+@pytest.mark.django_db
+def test_api_streaming_error(
+    load_test_data: None, settings: SettingsWrapper, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Check that an error during the streaming of an endpoint aborts the transfer and the content is not stored
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    """
+    settings.API_STREAMING_RESPONSES = True
+    settings.API_STREAMING_BUFFER_SIZE = 1
+    transform_event_translation = events.transform_event_translation
+    calls = []
+
+    def fail_after_first_event(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        r"""
+        Transform the first event and fail afterwards
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied keyword arguments
+        :raises RuntimeError: When the event is not the first one
+        :return: The transformed event
+        """
+        calls.append(args)
+        if len(calls) > 1:
+            raise RuntimeError("Test error")
+        return transform_event_translation(*args, **kwargs)
+
+    monkeypatch.setattr(events, "transform_event_translation", fail_after_first_event)
+    client = Client()
+    endpoint = "/api/augsburg/de/events/"
+    response = client.get(endpoint)
+    assert response.status_code == 200
+    with pytest.raises(RuntimeError):
+        b"".join(response.streaming_content)
+    # The incomplete content is not stored
+    assert client.get(endpoint).streaming
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test.client import Client
+from django.urls import reverse
+
+from integreat_cms.cms.constants import status
+from integreat_cms.cms.models import Page
+
+
+def get_api_page_ids(client: Client, language_slug: str) -> set[int]:
+    """
+    Get the ids of the page translations which are delivered by the pages API
+
+    :param client: The test client
+    :param language_slug: The slug of the requested language
+    :return: The ids of the delivered page translations
+    """
+    response = client.get(f"/api/augsburg/{language_slug}/pages/")
+    assert response.status_code == 200
+    return {page["id"] for page in response.json()}
+
+
+@pytest.mark.django_db
+def test_unpublished_page_is_removed_from_api(load_test_data: None) -> None:
+    """
+    Check that a page which is set to draft via the page form is no longer delivered by the pages API, neither in
+    the edited language nor in the depending languages
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    page = Page.objects.get(id=4)
+    public_ids = {
+        language_slug: page.get_public_translation(language_slug).id
+        for language_slug in ["de", "en"]
+    }
+    client = Client()
+    for language_slug, translation_id in public_ids.items():
+        assert translation_id in get_api_page_ids(client, language_slug)
+
+    client.force_login(get_user_model().objects.get(username="root"))
+    response = client.post(
+        reverse(
+            "edit_page",
+            kwargs={"region_slug": "augsburg", "language_slug": "de", "page_id": 4},
+        ),
+        data={
+            "title": "unpublished page",
+            "mirrored_page_region": "",
+            "_ref_node_id": 1,
+            "_position": "first-child",
+            "status": status.DRAFT,
+        },
+    )
+    assert response.status_code == 302
+
+    assert not page.translations.filter(latest_public=True).exists()
+    for language_slug, translation_id in public_ids.items():
+        assert translation_id not in get_api_page_ids(client, language_slug)
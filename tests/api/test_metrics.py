@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from prometheus_client import REGISTRY
+
+from integreat_cms.api.v3.metrics import metrics
+from integreat_cms.core.utils.metrics import track_integration
+
+
+def get_integration_count(service: str, outcome: str) -> float:
+    """
+    Get the number of measured requests to an external service
+
+    :param service: The name of the service
+    :param outcome: The outcome of the requests
+    :return: The number of requests
+    """
+    return (
+        REGISTRY.get_sample_value(
+            "integreat_cms_integration_request_duration_seconds_count",
+            {"service": service, "outcome": outcome},
+        )
+        or 0
+    )
+
+
+@override_settings(METRICS_ENABLED=True)
+def test_track_integration() -> None:
+    """
+    Check that successful and failed requests to external services are measured
+    """
+    successes = get_integration_count("test", "success")
+    errors = get_integration_count("test", "error")
+    with track_integration("test"):
+        pass
+    with pytest.raises(RuntimeError), track_integration("test"):
+        raise RuntimeError("The request failed")
+    assert get_integration_count("test", "success") == successes + 1
+    assert get_integration_count("test", "error") == errors + 1
+    assert not REGISTRY.get_sample_value(
+        "integreat_cms_integration_requests_in_progress", {"service": "test"}
+    )
+
+
+@override_settings(METRICS_ENABLED=True, METRICS_TOKEN="secret")
+def test_metrics_endpoint() -> None:
+    """
+    Check that the metrics are only exposed to requests with the correct token
+    """
+    with pytest.raises(PermissionDenied):
+        metrics(RequestFactory().get("/metrics"))
+    response = metrics(
+        RequestFactory().get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+    )
+    assert response.status_code == 200
+    assert b"integreat_cms_api_request_duration_seconds" in response.content
+
+
+def test_metrics_endpoint_disabled() -> None:
+    """
+    Check that the metrics endpoint is not available if the metrics are disabled
+    """
+    with pytest.raises(Http404):
+        metrics(RequestFactory().get("/metrics"))
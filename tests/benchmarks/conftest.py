@@ -0,0 +1,55 @@
+"""
+This module contains the fixtures of the benchmarks
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from integreat_cms.cms.models import POICategory
+from integreat_cms.cms.utils.synthetic_region_utils import SyntheticRegionGenerator
+
+if TYPE_CHECKING:
+    from typing import Final, Iterator
+
+    from pytest_django.plugin import _DatabaseBlocker  # type: ignore[attr-defined]
+
+    from integreat_cms.cms.models import Region
+
+#: The slug of the synthetic region of the benchmarks
+BENCHMARK_REGION_SLUG: Final[str] = "benchmark"
+
+
+@pytest.fixture(scope="module")
+def synthetic_region(
+    load_test_data: None, django_db_blocker: _DatabaseBlocker
+) -> Iterator[Region]:
+    """
+    Generate a synthetic region with production-like amounts of content for all benchmarks of a module and delete it
+    afterwards, so other tests are not affected
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_db_blocker: The fixture providing the database blocker
+    :return: The synthetic region
+    """
+    with django_db_blocker.unblock():
+        generator = SyntheticRegionGenerator(
+            BENCHMARK_REGION_SLUG,
+            pages=500,
+            max_depth=8,
+            languages=3,
+            versions=2,
+            events=200,
+            recurring_events=50,
+            pois=200,
+            categories=10,
+            mirrored_pages=20,
+        )
+        region = generator.generate()
+    yield region
+    with django_db_blocker.unblock():
+        region.delete()
+        POICategory.objects.filter(
+            id__in=[category.id for category in generator.category_objects]
+        ).delete()
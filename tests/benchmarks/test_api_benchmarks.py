@@ -0,0 +1,127 @@
+"""
+This module contains benchmarks of the API endpoints on a synthetic region (see
+:class:`~integreat_cms.cms.utils.synthetic_region_utils.SyntheticRegionGenerator`).
+Besides the wall time which is measured by :doc:`pytest-benchmark <pytest-benchmark:index>`, the number of SQL queries
+and the peak memory usage of each endpoint are recorded in the ``extra_info`` of the results.
+"""
+from __future__ import annotations
+
+import gzip
+import tracemalloc
+from typing import TYPE_CHECKING
+from urllib.parse import unquote
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.api.utils.response_store_utils import get_response_cache
+from integreat_cms.cms.utils.pdf_utils import pdf_storage
+from integreat_cms.cms.utils.region_cache_utils import clear_local_region_cache
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.http import HttpResponse
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from integreat_cms.cms.models import Region
+
+#: The benchmarked endpoints (the url pattern and the number of rounds)
+ENDPOINTS: Final[list[tuple[str, int]]] = [
+    ("/api/{region}/{language}/pages/", 5),
+    ("/api/{region}/{language}/events/", 5),
+    ("/api/{region}/{language}/locations/", 5),
+    ("/api/{region}/{language}/children/?depth=3", 5),
+    ("/api/{region}/{language}/pdf/", 1),
+]
+
+
+def clear_caches(response: HttpResponse | None = None) -> None:
+    """
+    Make sure the next request is neither served from the response store nor from a previously generated PDF
+
+    :param response: The previous response of the endpoint
+    """
+    get_response_cache().clear()
+    clear_local_region_cache()
+    if response is not None and response.has_header("Location"):
+        pdf_path = unquote(response["Location"]).split(settings.PDF_URL, 1)[-1]
+        if pdf_storage.exists(pdf_path):
+            pdf_storage.delete(pdf_path)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_pattern,rounds", ENDPOINTS)
+def test_api_benchmark(
+    benchmark: BenchmarkFixture, synthetic_region: Region, url_pattern: str, rounds: int
+) -> None:
+    """
+    Benchmark an API endpoint on the synthetic region
+
+    :param benchmark: The fixture providing the benchmark
+    :param synthetic_region: The fixture providing the synthetic region (see
+                             :meth:`~tests.benchmarks.conftest.synthetic_region`)
+    :param url_pattern: The url pattern of the endpoint
+    :param rounds: How often the endpoint is requested
+    """
+    url = url_pattern.format(
+        region=synthetic_region.slug, language=synthetic_region.default_language.slug
+    )
+    client = Client()
+    # Measure the queries and the memory in a separate request to not distort the timing
+    clear_caches()
+    tracemalloc.start()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert response.status_code in (200, 302)
+    benchmark.extra_info["queries"] = len(queries)
+    benchmark.extra_info["peak_memory"] = peak_memory
+    benchmark.extra_info["response_size"] = len(response.content)
+
+    def setup() -> None:
+        """
+        Clear the caches before each round
+        """
+        clear_caches(response)
+
+    benchmark.pedantic(client.get, args=(url,), setup=setup, rounds=rounds)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("store", [False, True])
+def test_api_compression_benchmark(
+    benchmark: BenchmarkFixture, synthetic_region: Region, store: bool
+) -> None:
+    """
+    Benchmark the pages endpoint when the response is compressed on every request (like by a web server or
+    :class:`~django.middleware.gzip.GZipMiddleware`) and when the stored compressed variant is served
+
+    :param benchmark: The fixture providing the benchmark
+    :param synthetic_region: The fixture providing the synthetic region (see
+                             :meth:`~tests.benchmarks.conftest.synthetic_region`)
+    :param store: Whether the stored compressed variant is served
+    """
+    url = (
+        f"/api/{synthetic_region.slug}/{synthetic_region.default_language.slug}/pages/"
+    )
+    client = Client()
+    clear_caches()
+    # Store the response and its compressed variants
+    assert client.get(url).status_code == 200
+
+    def request() -> bytes:
+        """
+        Request the endpoint and compress the response unless the stored compressed variant is served
+
+        :return: The compressed content
+        """
+        if store:
+            return client.get(url, HTTP_ACCEPT_ENCODING="gzip").content
+        return gzip.compress(client.get(url).content)
+
+    benchmark.pedantic(request, rounds=5)
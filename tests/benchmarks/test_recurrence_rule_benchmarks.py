@@ -0,0 +1,50 @@
+"""
+This module contains benchmarks of the iteration of recurrence rules (see
+:class:`~integreat_cms.cms.models.events.recurrence_rule.RecurrenceRule`).
+"""
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from integreat_cms.cms.constants import frequency
+from integreat_cms.cms.models import RecurrenceRule
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.parametrize("skip_ahead", [False, True])
+def test_iter_after_benchmark(benchmark: BenchmarkFixture, skip_ahead: bool) -> None:
+    """
+    Benchmark getting the next recurrence of a daily event which started decades ago with and without skipping ahead
+
+    :param benchmark: The fixture providing the benchmark
+    :param skip_ahead: Whether the iteration skips ahead to the current date
+    """
+    recurrence_rule = RecurrenceRule(
+        frequency=frequency.DAILY,
+        interval=1,
+        weekdays_for_weekly=[],
+        recurrence_end_date=None,
+    )
+    start_date = datetime.date(1970, 1, 1)
+    today = datetime.date(2030, 1, 1)
+
+    def get_next_recurrence() -> datetime.date:
+        """
+        Get the next recurrence on or after the current date
+
+        :return: The next recurrence
+        """
+        if skip_ahead:
+            return next(recurrence_rule.iter_after(start_date, today))
+        return next(
+            recurrence_date
+            for recurrence_date in recurrence_rule.iter_after(start_date)
+            if recurrence_date >= today
+        )
+
+    assert benchmark(get_next_recurrence) == today
@@ -4,13 +4,21 @@ Test module for RecurrenceRule class
 from __future__ import annotations
 
 import datetime
+import itertools
+import random
 from typing import TYPE_CHECKING
 
+import pytest
 import pytz
 
+from integreat_cms.cms.constants import frequency, weeks
 from integreat_cms.cms.models import Event, RecurrenceRule
+from integreat_cms.cms.models.events import recurrence_rule as recurrence_rule_module
 
 if TYPE_CHECKING:
+    from typing import Any
+
+    from _pytest.monkeypatch import MonkeyPatch
     from rrule import rrule
 
 
@@ -109,3 +117,111 @@ class TestCreatingIcalRule:
             recurrence_end_date=None,
         )
         self.check_rrule(recurrence_rule, "DTSTART:20300101T113000\nRRULE:FREQ=YEARLY")
+
+
+def create_random_recurrence_rule(rng: random.Random) -> RecurrenceRule:
+    """
+    Create a random recurrence rule
+
+    :param rng: The random number generator
+    :return: The recurrence rule
+    """
+    return RecurrenceRule(
+        frequency=rng.choice(frequency.CHOICES)[0],
+        interval=rng.choice([1, 1, 2, 3, 5, 7]),
+        weekdays_for_weekly=rng.sample(range(7), rng.randint(1, 7)),
+        weekday_for_monthly=rng.randrange(7),
+        week_for_monthly=rng.choice(weeks.CHOICES)[0],
+        recurrence_end_date=(
+            datetime.date(2000, 1, 1) + datetime.timedelta(days=rng.randrange(15000))
+            if rng.random() < 0.3
+            else None
+        ),
+    )
+
+
+def get_random_date(rng: random.Random) -> datetime.date:
+    """
+    Get a random date which is a leap day with a higher probability than usual
+
+    :param rng: The random number generator
+    :return: The date
+    """
+    if rng.random() < 0.1:
+        return datetime.date(rng.choice([1996, 2000, 2004, 2096]), 2, 29)
+    return datetime.date(2000, 1, 1) + datetime.timedelta(days=rng.randrange(15000))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_iter_after_skip_ahead(seed: int) -> None:
+    """
+    Check that skipping ahead to a date yields the same recurrences as iterating all recurrences from the start date
+    and discarding the ones before the date (for random recurrence rules)
+
+    :param seed: The seed of the random number generator
+    """
+    rng = random.Random(seed)
+    for _ in range(100):
+        recurrence_rule = create_random_recurrence_rule(rng)
+        start_date = get_random_date(rng)
+        from_date = get_random_date(rng)
+        expected = list(
+            itertools.islice(
+                (
+                    recurrence_date
+                    for recurrence_date in recurrence_rule.iter_after(start_date)
+                    if recurrence_date >= from_date
+                ),
+                20,
+            )
+        )
+        assert (
+            list(
+                itertools.islice(recurrence_rule.iter_after(start_date, from_date), 20)
+            )
+            == expected
+        ), f"{recurrence_rule.__dict__}, {start_date=}, {from_date=}"
+
+
+def test_iter_after_skip_ahead_steps(monkeypatch: MonkeyPatch) -> None:
+    """
+    Check that skipping ahead to the next recurrence of an event which started decades ago does not walk through all
+    previous recurrences (the monthly recurrences are computed with
+    :func:`~integreat_cms.cms.models.events.recurrence_rule.get_nth_weekday`)
+
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    """
+    recurrence_rule = RecurrenceRule(
+        frequency=frequency.MONTHLY,
+        interval=1,
+        weekdays_for_weekly=[],
+        weekday_for_monthly=0,
+        week_for_monthly=1,
+        recurrence_end_date=None,
+    )
+    start_date = datetime.date(1970, 1, 1)
+    today = datetime.date(2030, 1, 1)
+    calls = []
+
+    def get_nth_weekday(*args: Any) -> datetime.date:
+        r"""
+        Record the call and compute the nth weekday
+
+        :param \*args: The supplied arguments
+        :return: The nth weekday of the month
+        """
+        calls.append(args)
+        return original_get_nth_weekday(*args)
+
+    original_get_nth_weekday = recurrence_rule_module.get_nth_weekday
+    monkeypatch.setattr(recurrence_rule_module, "get_nth_weekday", get_nth_weekday)
+    expected = next(
+        recurrence_date
+        for recurrence_date in recurrence_rule.iter_after(start_date)
+        if recurrence_date >= today
+    )
+    steps_without_skipping = len(calls)
+    calls.clear()
+    assert next(recurrence_rule.iter_after(start_date, today)) == expected
+    assert steps_without_skipping > 700
+    assert len(calls) < 5
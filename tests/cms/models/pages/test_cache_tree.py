@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from integreat_cms.cms.models import Page
+
+
+@pytest.mark.django_db
+def test_cached_tree_matches_database(load_test_data: None) -> None:
+    """
+    Check that the cached ancestors, descendants and children of all pages match the tree in the database
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    pages = Page.objects.filter(region__slug="augsburg").cache_tree()
+    assert pages
+    for page in pages:
+        assert page.get_cached_ancestors() == list(page.get_ancestors())
+        assert page.get_cached_descendants() == list(page.get_descendants())
+        assert page.cached_children == list(page.get_children())
+        assert page.relative_depth == page.depth
+
+
+@pytest.mark.django_db
+def test_cached_tree_excludes_archived_subtrees(load_test_data: None) -> None:
+    """
+    Check that the descendants of archived pages are neither cached nor contained in the descendants of their ancestors
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    pages = {
+        page.id: page
+        for page in Page.objects.filter(region__slug="augsburg").cache_tree(
+            archived=False
+        )
+    }
+    # Page 24 is explicitly archived and page 25 is its child
+    assert 24 not in pages
+    assert 25 not in pages
+    descendant_ids = [page.id for page in pages[14].get_cached_descendants()]
+    assert 24 not in descendant_ids
+    assert 25 not in descendant_ids
+
+
+@pytest.mark.django_db
+def test_cached_tree_prefetches_only_requested_translations(
+    load_test_data: None,
+) -> None:
+    """
+    Check that only the requested kinds of translations in the requested languages are prefetched
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    pages = Page.objects.filter(region__slug="augsburg").cache_tree(
+        translations=("public_translations",), language_slugs=["de"]
+    )
+    for page in pages:
+        assert not hasattr(page, "prefetched_translations")
+        assert {
+            translation.language.slug
+            for translation in page.prefetched_public_translations
+        } <= {"de"}
+
+
+def test_cache_tree_rejects_unknown_translation_kinds() -> None:
+    """
+    Check that unknown kinds of translations are rejected
+    """
+    with pytest.raises(ValueError):
+        Page.objects.none().cache_tree(translations=("unknown_translations",))
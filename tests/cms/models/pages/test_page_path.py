@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from integreat_cms.cms.constants import position, status
+from integreat_cms.cms.models import Page, PagePath, PageTranslation
+
+
+def get_stored_path(page_id: int, language_slug: str) -> str:
+    """
+    Get the stored path of a page
+
+    :param page_id: The id of the page
+    :param language_slug: The slug of the language
+    :return: The stored path
+    """
+    return PagePath.objects.get(page_id=page_id, language__slug=language_slug).path
+
+
+@pytest.mark.django_db
+def test_stored_paths_match_ancestors(load_test_data: None) -> None:
+    """
+    Check that the stored paths of all pages match the paths calculated from their cached ancestors
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    pages = Page.objects.filter(region__slug="augsburg").cache_tree()
+    assert pages
+    for page in pages:
+        for translation in page.prefetched_translations_by_language_slug.values():
+            page_path = page.paths_by_language_id[translation.language_id]
+            assert page_path.ancestor_path == translation.ancestor_path
+
+
+@pytest.mark.django_db
+def test_paths_are_updated_on_slug_change(load_test_data: None) -> None:
+    """
+    Check that changing the slug of a page updates the paths of its descendants
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    assert (
+        get_stored_path(16, "de") == "behörden-und-beratung/behörden/ausländerbehörde"
+    )
+    translation = Page.objects.get(id=15).get_translation("de")
+    translation.pk = None
+    translation.version += 1
+    translation.slug = "ämter"
+    translation.status = status.PUBLIC
+    translation.save()
+    assert get_stored_path(15, "de") == "behörden-und-beratung/ämter"
+    assert get_stored_path(16, "de") == "behörden-und-beratung/ämter/ausländerbehörde"
+    # The url is generated from the stored path without querying the ancestors
+    assert (
+        PageTranslation.objects.filter(page_id=16, language__slug="de")
+        .first()
+        .get_absolute_url()
+        == "/augsburg/de/behörden-und-beratung/ämter/ausländerbehörde/"
+    )
+
+
+@pytest.mark.django_db
+def test_paths_are_updated_on_move(load_test_data: None) -> None:
+    """
+    Check that moving a page updates the paths of the page and its descendants
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    Page.objects.get(id=24).move(Page.objects.get(id=14), position.LAST_CHILD)
+    assert get_stored_path(24, "de") == "behörden-und-beratung/archiviertes-amt"
+    assert (
+        get_stored_path(25, "de")
+        == "behörden-und-beratung/archiviertes-amt/nicht-archivierte-details"
+    )
+
+
+@pytest.mark.django_db
+def test_paths_are_updated_on_move_to_other_tree(load_test_data: None) -> None:
+    """
+    Check that moving a page into another tree updates the paths of the page and its descendants, while the paths of
+    the remaining pages of both trees stay the same
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    page = Page.objects.get(id=24)
+    target = Page.objects.get(id=18)
+    assert page.tree_id != target.tree_id
+    page.move(target, position.LAST_CHILD)
+    assert page.tree_id == target.tree_id
+    assert get_stored_path(24, "de") == "deutsche-sprache/archiviertes-amt"
+    assert (
+        get_stored_path(25, "de")
+        == "deutsche-sprache/archiviertes-amt/nicht-archivierte-details"
+    )
+    # The paths of the other pages of the old tree
+    assert get_stored_path(15, "de") == "behörden-und-beratung/behörden"
+    assert (
+        get_stored_path(16, "de") == "behörden-und-beratung/behörden/ausländerbehörde"
+    )
+    # The paths of the other pages of the new tree
+    assert get_stored_path(18, "de") == "deutsche-sprache"
+    assert get_stored_path(19, "de") == "deutsche-sprache/deutsch-selber-lernen"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from integreat_cms.cms.constants import status
+from integreat_cms.cms.models import Page, PageTranslation
+
+
+def get_flagged_versions(translation: PageTranslation) -> dict[str, list[int]]:
+    """
+    Get the versions which are marked by the flags of the latest versions
+
+    :param translation: The page translation
+    :return: The marked versions by flag
+    """
+    return {
+        flag: sorted(
+            translation.all_versions.filter(**{flag: True}).values_list(
+                "version", flat=True
+            )
+        )
+        for flag in ["latest", "latest_public", "latest_major", "latest_major_public"]
+    }
+
+
+@pytest.mark.django_db
+def test_latest_versions_are_updated_on_save(load_test_data: None) -> None:
+    """
+    Check that saving a new version moves the flags of the latest versions
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    page = Page.objects.get(id=1)
+    translation = page.get_translation("de")
+    translation.status = status.PUBLIC
+    translation.minor_edit = False
+    translation.save()
+    version = translation.version
+
+    # Save a minor draft version
+    translation.pk = None
+    translation.version += 1
+    translation.status = status.DRAFT
+    translation.minor_edit = True
+    translation.save()
+    assert translation.latest
+    assert not translation.latest_public
+    assert get_flagged_versions(translation) == {
+        "latest": [version + 1],
+        "latest_public": [version],
+        "latest_major": [version],
+        "latest_major_public": [version],
+    }
+
+    # The prefetched translations use the flags
+    page = Page.objects.filter(id=1).prefetch_translations().get()
+    assert page.get_translation("de").version == version + 1
+    page = Page.objects.filter(id=1).prefetch_major_public_translations().get()
+    assert page.get_major_public_translation("de").version == version
+    assert Page.objects.get(id=1).get_public_translation("de").version == version
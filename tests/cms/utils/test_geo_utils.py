@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from integreat_cms.cms.utils.geo_utils import (
+    encode_geohash,
+    get_bounding_box_around,
+    get_distance,
+    get_geohash_prefixes,
+)
+from integreat_cms.nominatim_api.utils import BoundingBox
+
+
+def test_encode_geohash() -> None:
+    """
+    Check that coordinates are encoded like in the reference implementation
+    """
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert encode_geohash(48.3781092, 10.887578) == "u0xepybnf"
+    assert encode_geohash(-90, -180, 3) == "000"
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_geohash_prefixes_cover_bounding_box(seed: int) -> None:
+    """
+    Check that the geohashes of all coordinates within a bounding box start with one of its prefixes
+
+    :param seed: The seed of the random bounding box
+    """
+    rng = random.Random(seed)
+    latitude, longitude = rng.uniform(-80, 80), rng.uniform(-170, 170)
+    size = 10 ** rng.uniform(-4, 1)
+    bounding_box = BoundingBox(latitude, latitude + size, longitude, longitude + size)
+    prefixes = tuple(get_geohash_prefixes(bounding_box))
+    assert 0 < len(prefixes) <= 16
+    for _ in range(100):
+        geohash = encode_geohash(
+            rng.uniform(bounding_box.latitude_min, bounding_box.latitude_max),
+            rng.uniform(bounding_box.longitude_min, bounding_box.longitude_max),
+        )
+        assert geohash.startswith(prefixes)
+
+
+def test_bounding_box_around() -> None:
+    """
+    Check that the bounding box around a circle contains all points within the radius
+    """
+    bounding_box = get_bounding_box_around(48.37, 10.89, 1000)
+    for latitude, longitude in [
+        (bounding_box.latitude_min, 10.89),
+        (bounding_box.latitude_max, 10.89),
+        (48.37, bounding_box.longitude_min),
+        (48.37, bounding_box.longitude_max),
+    ]:
+        assert get_distance(48.37, 10.89, latitude, longitude) == pytest.approx(
+            1000, rel=1e-3
+        )
+    assert get_bounding_box_around(89.999, 0, 1000).longitude_min == -180
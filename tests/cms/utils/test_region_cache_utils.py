@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.test.client import Client
+
+from integreat_cms.cms.models import Region
+from integreat_cms.cms.utils.region_cache_utils import (
+    get_cached_region,
+    REGION_CACHE_VERSION_KEY,
+)
+from integreat_cms.core.utils.version_cache import get_version_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_get_cached_region(
+    load_test_data: None, django_assert_num_queries: Callable
+) -> None:
+    """
+    Check that regions and their languages are only queried once
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_assert_num_queries: The fixture providing the query assertion
+    """
+    # The region and its language tree
+    with django_assert_num_queries(2):
+        region = get_cached_region("augsburg")
+    with django_assert_num_queries(0):
+        cached_region = get_cached_region("augsburg")
+        assert cached_region.default_language.slug == "de"
+        assert cached_region.get_language_or_404("en", only_active=True)
+    assert cached_region == region
+    # Properties computed during a request are not shared with other requests
+    assert cached_region is not region
+    assert get_cached_region("non-existing") is None
+
+
+@pytest.mark.django_db
+def test_region_cache_invalidation(
+    load_test_data: None, django_assert_num_queries: Callable
+) -> None:
+    """
+    Check that the cached regions are invalidated when a region is changed in this or another process
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_assert_num_queries: The fixture providing the query assertion
+    """
+    get_cached_region("augsburg")
+    region = Region.objects.get(slug="augsburg")
+    region.name = "Changed name"
+    region.save()
+    assert get_cached_region("augsburg").name == "Changed name"
+    # Simulate the invalidation by another process
+    get_version_cache().set(REGION_CACHE_VERSION_KEY, "other-version")
+    with django_assert_num_queries(2):
+        get_cached_region("augsburg")
+
+
+@pytest.mark.django_db
+def test_region_cache_requires_shared_version(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_assert_num_queries: Callable,
+) -> None:
+    """
+    Check that the regions are not cached if the version cache is kept in the memory of each process, because the
+    cached regions would not be invalidated by changes made in other processes
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_assert_num_queries: The fixture providing the query assertion
+    """
+    settings.CACHES = {
+        **settings.CACHES,
+        "versions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    get_cached_region("augsburg")
+    with django_assert_num_queries(2):
+        assert get_cached_region("augsburg").slug == "augsburg"
+
+
+@pytest.mark.django_db
+def test_api_request_with_cached_region(
+    load_test_data: None, django_assert_num_queries: Callable
+) -> None:
+    """
+    Check that API requests of a cached region do not query the region and its languages
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_assert_num_queries: The fixture providing the query assertion
+    """
+    client = Client()
+    with django_assert_num_queries(2):
+        response = client.get("/api/augsburg/languages/")
+    assert response.status_code == 200
+    # The languages are taken from the cached region
+    with django_assert_num_queries(0):
+        assert client.get("/api/augsburg/languages/").status_code == 200
+    assert client.get("/api/non-existing/languages/").status_code == 404
@@ -137,6 +137,7 @@ VIEWS: list[
             ("region_feedback", STAFF_ROLES + [MANAGEMENT]),
             ("region_users", STAFF_ROLES + [MANAGEMENT]),
             ("translation_coverage", STAFF_ROLES + [MANAGEMENT, EDITOR]),
+            ("app_size", STAFF_ROLES + [MANAGEMENT, EDITOR]),
             ("organizations", STAFF_ROLES + [MANAGEMENT]),
             ("new_organization", STAFF_ROLES + [MANAGEMENT]),
             ("user_settings", ROLES),
@@ -246,6 +247,7 @@ VIEWS: list[
             ("organizations", STAFF_ROLES),
             ("new_organization", STAFF_ROLES),
             ("translation_coverage", STAFF_ROLES),
+            ("app_size", STAFF_ROLES),
             ("user_settings", STAFF_ROLES),
             ("authenticate_modify_mfa", STAFF_ROLES),
         ],
@@ -11,6 +11,7 @@ from django.contrib.auth import get_user_model
 from django.core.management import call_command
 from django.test.client import AsyncClient, Client
 
+from integreat_cms.api.utils.response_store_utils import get_response_cache
 from integreat_cms.cms.constants.roles import (
     APP_TEAM,
     AUTHOR,
@@ -22,6 +23,7 @@ from integreat_cms.cms.constants.roles import (
     OBSERVER,
     SERVICE_TEAM,
 )
+from integreat_cms.cms.utils.region_cache_utils import clear_local_region_cache
 
 if TYPE_CHECKING:
     from typing import Final
@@ -54,6 +56,22 @@ ALL_ROLES: Final = ROLES + [ANONYMOUS]
 pytest_plugins: Final = "aiohttp.pytest_plugin"
 
 
+@pytest.fixture(autouse=True)
+def clear_response_store() -> None:
+    """
+    Clear the stored API responses before each test, because the database changes of previous tests are rolled back
+    """
+    get_response_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_region_cache() -> None:
+    """
+    Clear the cached regions before each test, because the database changes of previous tests are rolled back
+    """
+    clear_local_region_cache()
+
+
 @pytest.fixture(scope="session")
 def load_test_data(django_db_setup: None, django_db_blocker: _DatabaseBlocker) -> None:
     """
@@ -64,6 +82,8 @@ def load_test_data(django_db_setup: None, django_db_blocker: _DatabaseBlocker) -
     """
     with django_db_blocker.unblock():
         call_command("loaddata", "integreat_cms/cms/fixtures/test_data.json")
+        # The fixtures are loaded without signals, so the paths of the pages have to be stored afterwards
+        call_command("update_page_paths")
 
 
 @pytest.fixture(scope="function")
@@ -79,6 +99,7 @@ def load_test_data_transactional(
     with django_db_blocker.unblock():
         call_command("loaddata", "integreat_cms/cms/fixtures/test_roles.json")
         call_command("loaddata", "integreat_cms/cms/fixtures/test_data.json")
+        call_command("update_page_paths")
 
 
 # pylint: disable=redefined-outer-name
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management.base import CommandError
+
+from integreat_cms.api.utils.app_size_utils import (
+    CONTENT_TYPES,
+    get_largest_pages,
+    is_thumbnail,
+)
+from integreat_cms.api.utils.offline_bundle_utils import bundle_storage
+from integreat_cms.cms.models import AppSizeMeasurement, Region
+
+from ..utils import get_command_output
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_calculate_app_size_non_existing_region() -> None:
+    """
+    Ensure that a non existing region slug throws an error
+    """
+    with pytest.raises(CommandError) as exc_info:
+        assert not any(get_command_output("calculate_app_size", "non-existing"))
+    assert str(exc_info.value) == "The following regions do not exist: {'non-existing'}"
+
+
+@pytest.mark.django_db
+def test_calculate_app_size(load_test_data: None) -> None:
+    """
+    Ensure that the size of every active language is measured
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    try:
+        out, err = get_command_output("calculate_app_size", "augsburg")
+    finally:
+        shutil.rmtree(bundle_storage.path("augsburg"), ignore_errors=True)
+    assert "✔ Measured the app size" in out
+    assert not err
+    measurements = AppSizeMeasurement.objects.filter(region=region)
+    assert {measurement.language for measurement in measurements} == set(
+        region.active_languages
+    )
+    for measurement in measurements:
+        assert list(measurement.sizes) == CONTENT_TYPES
+    german = measurements.get(language__slug="de")
+    assert german.sizes["pages"] > 0
+    assert [item["type"] for item in german.largest_items if item["type"] == "page"]
+
+
+def test_get_largest_pages(settings: SettingsWrapper, tmp_path: Path) -> None:
+    """
+    Ensure that the size of the largest pages includes their embedded media files
+
+    :param settings: The fixture providing the django settings
+    :param tmp_path: The fixture providing the directory for temporary files for this test case
+    """
+    settings.MEDIA_ROOT = str(tmp_path)
+    (tmp_path / "image.png").write_bytes(b"image")
+    pages = [
+        {"title": "Small", "url": "/small", "content": "Text"},
+        {
+            "title": "Image",
+            "url": "/image",
+            "content": '<img src="http://localhost:8000/media/image.png">',
+        },
+    ]
+    largest_pages = get_largest_pages(pages, {"media/image.png": 1000})
+    assert [page["title"] for page in largest_pages] == ["Image", "Small"]
+    assert largest_pages[0]["media_size"] == 1000
+    assert not largest_pages[1]["media_size"]
+    assert is_thumbnail("media/regions/1/image_thumbnail.png")
+    assert not is_thumbnail("media/regions/1/image.png")
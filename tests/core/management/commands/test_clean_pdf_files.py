@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+
+from integreat_cms.cms.models import Language, PdfDocument, Region
+from integreat_cms.cms.utils import pdf_utils
+
+from ..utils import get_command_output
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def create_document(
+    storage_path: Path, filename: str, size: int, last_accessed_days: int
+) -> PdfDocument:
+    """
+    Create a PDF document and its entry in the manifest
+
+    :param storage_path: The directory of the PDF storage
+    :param filename: The filename relative to the storage
+    :param size: The size of the document in bytes
+    :param last_accessed_days: The number of days since the last access of the document
+    :return: The manifest entry
+    """
+    path = storage_path / filename
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"0" * size)
+    return PdfDocument.objects.create(
+        region=Region.objects.get(slug="augsburg"),
+        language=Language.objects.get(slug="de"),
+        filename=filename,
+        size=size,
+        last_accessed=timezone.now() - timedelta(days=last_accessed_days),
+    )
+
+
+@pytest.mark.django_db
+def test_clean_pdf_files(
+    load_test_data: None, monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """
+    Ensure that outdated documents, the least recently accessed documents exceeding the maximum size and outdated
+    files which are not contained in the manifest are removed
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    :param tmp_path: The fixture providing the directory for temporary files for this test case
+    """
+    monkeypatch.setattr(pdf_utils, "pdf_storage", FileSystemStorage(tmp_path))
+    recent = create_document(tmp_path, "recent/Integreat - Deutsch.pdf", 600_000, 1)
+    create_document(tmp_path, "older/Integreat - Deutsch.pdf", 600_000, 2)
+    create_document(tmp_path, "outdated/Integreat - Deutsch.pdf", 1_000, 8)
+    part = tmp_path / "parts" / "0123456789abcdef.pdf"
+    part.parent.mkdir()
+    part.write_bytes(b"part")
+    eight_days_ago = time.time() - 8 * 24 * 60 * 60
+    os.utime(part, (eight_days_ago, eight_days_ago))
+    new_part = tmp_path / "parts" / "fedcba9876543210.pdf"
+    new_part.write_bytes(b"part")
+
+    out, err = get_command_output(
+        "clean_pdf_files", "--max-age", "7", "--max-size", "1"
+    )
+    assert "✔ Removed 2 PDF documents" in out
+    assert "and 1 outdated files." in out
+    assert not err
+    assert list(PdfDocument.objects.all()) == [recent]
+    assert sorted(
+        path.relative_to(tmp_path).as_posix()
+        for path in tmp_path.rglob("*")
+        if path.is_file()
+    ) == ["parts/fedcba9876543210.pdf", "recent/Integreat - Deutsch.pdf"]
+    assert not (tmp_path / "older").exists()
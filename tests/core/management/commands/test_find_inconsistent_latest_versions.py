@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+from django.core.management.base import CommandError
+
+from integreat_cms.cms.models import Page, PageTranslation
+
+from ..utils import get_command_output
+
+
+def test_find_inconsistent_latest_versions_invalid_model() -> None:
+    """
+    Ensure that an invalid model throws an error
+    """
+    with pytest.raises(CommandError) as exc_info:
+        assert not any(
+            get_command_output("find_inconsistent_latest_versions", "invalid")
+        )
+    assert "argument model: invalid choice: 'invalid'" in str(exc_info.value)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("model", ["page", "imprint", "event", "poi"])
+def test_find_inconsistent_latest_versions_success(
+    load_test_data: None, model: str
+) -> None:
+    """
+    Ensure no errors are found in default test data
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param model: The model to check
+    """
+    out, err = get_command_output("find_inconsistent_latest_versions", model)
+    assert "✔ All latest versions are consistent." in out
+    assert not err
+
+
+@pytest.mark.django_db
+def test_find_inconsistent_latest_versions_failure(load_test_data: None) -> None:
+    """
+    Ensure that inconsistencies are listed and fixed by update_latest_versions
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    translation = Page.objects.get(id=1).get_translation("de")
+    # Create an inconsistency without updating the flags
+    PageTranslation.objects.filter(id=translation.id).update(latest=False)
+    out, err = get_command_output("find_inconsistent_latest_versions", "page")
+    assert (
+        "Checking the model PageTranslation for inconsistent latest versions..." in out
+    )
+    assert err == (
+        f"The flag 'latest' of {translation!r} (version {translation.version}) is False, but should be True!\n"
+    )
+    out, err = get_command_output("update_latest_versions", "page")
+    assert "✔ Marked the latest versions of PageTranslation (1 changed flags)." in out
+    assert not err
+    out, err = get_command_output("find_inconsistent_latest_versions", "page")
+    assert "✔ All latest versions are consistent." in out
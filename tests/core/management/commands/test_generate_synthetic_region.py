@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management.base import CommandError
+
+from integreat_cms.cms.models import (
+    EventOccurrence,
+    Page,
+    PagePath,
+    PageTranslation,
+    POI,
+    Region,
+)
+
+from ..utils import get_command_output
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+#: The options of the generated test regions
+OPTIONS = [
+    "--pages=40",
+    "--max-depth=4",
+    "--languages=2",
+    "--versions=2",
+    "--events=10",
+    "--recurring-events=5",
+    "--pois=5",
+    "--categories=2",
+    "--mirrored-pages=3",
+    "--seed=1",
+]
+
+
+def get_tree_structure(region_slug: str) -> list[tuple[int, int, int, int]]:
+    """
+    Get the structure of the page trees of a region, independent of the tree ids
+
+    :param region_slug: The slug of the region
+    :return: The relative tree id and the nested set values of all pages
+    """
+    pages = list(
+        Page.objects.filter(region__slug=region_slug).order_by("tree_id", "lft")
+    )
+    first_tree_id = pages[0].tree_id
+    return [
+        (page.tree_id - first_tree_id, page.lft, page.rgt, page.depth) for page in pages
+    ]
+
+
+def test_generate_synthetic_region_prod() -> None:
+    """
+    Ensure that this command does not work in production mode
+    """
+    with pytest.raises(CommandError) as exc_info:
+        assert not any(get_command_output("generate_synthetic_region", "synthetic"))
+    assert str(exc_info.value) == "This command can only be used in DEBUG mode."
+
+
+@pytest.mark.django_db
+def test_generate_synthetic_region_existing_region(
+    settings: SettingsWrapper, load_test_data: None
+) -> None:
+    """
+    Ensure that an existing region is not overwritten
+    """
+    settings.DEBUG = True
+    with pytest.raises(CommandError) as exc_info:
+        assert not any(get_command_output("generate_synthetic_region", "augsburg"))
+    assert str(exc_info.value) == 'Region with slug "augsburg" already exists.'
+
+
+@pytest.mark.django_db
+def test_generate_synthetic_region(
+    settings: SettingsWrapper, load_test_data: None
+) -> None:
+    """
+    Ensure that the region is generated with the requested amount of content and reproducibly
+    """
+    settings.DEBUG = True
+    out, err = get_command_output("generate_synthetic_region", "synthetic", *OPTIONS)
+    assert "✔ Successfully generated region" in out
+    assert not err
+    region = Region.objects.get(slug="synthetic")
+    pages = region.pages.all()
+    assert pages.count() == 40
+    assert max(page.depth for page in pages) == 4
+    assert pages.filter(mirrored_page__isnull=False).count() == 3
+    # Every page has exactly one latest version per language
+    translations = PageTranslation.objects.filter(page__region=region)
+    assert (
+        translations.filter(latest=True).count()
+        == translations.values("page", "language").distinct().count()
+    )
+    assert PagePath.objects.filter(region=region).exists()
+    assert POI.objects.filter(region=region).count() == 5
+    assert EventOccurrence.objects.filter(region=region).exists()
+    # The same seed leads to the same structure
+    get_command_output("generate_synthetic_region", "synthetic-2", *OPTIONS)
+    assert get_tree_structure("synthetic") == get_tree_structure("synthetic-2")
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from integreat_cms.cms.models import PushNotification
+from integreat_cms.firebase_api import push_notification_scheduler
+from integreat_cms.firebase_api.push_notification_scheduler import (
+    CLAIM_TIMEOUT,
+    MAX_SLEEP,
+    PushNotificationScheduler,
+    send_push_notification,
+)
+
+from ..utils import get_command_output
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_django.fixtures import SettingsWrapper
+
+
+class FakeFirebaseApiClient:
+    """
+    A fake client which successfully sends every push notification
+    """
+
+    def __init__(self, push_notification: PushNotification) -> None:
+        """
+        Initialize the client
+
+        :param push_notification: The push notification
+        """
+        self.push_notification = push_notification
+
+    def is_valid(self) -> bool:
+        """
+        Check whether the push notification can be sent
+
+        :return: Always ``True``
+        """
+        return True
+
+    def send_all(self) -> bool:
+        """
+        Pretend to send the push notification
+
+        :return: Always ``True``
+        """
+        # The push notification is marked as being sent while the requests to FCM are running
+        assert PushNotification.objects.get(id=self.push_notification.id).sending_date
+        return True
+
+
+class FailingFirebaseApiClient(FakeFirebaseApiClient):
+    """
+    A fake client which fails to send every push notification
+    """
+
+    def send_all(self) -> bool:
+        """
+        Pretend to fail sending the push notification
+
+        :return: Always ``False``
+        """
+        return False
+
+
+# pylint: disable=too-few-public-methods
+class FakeExecutor:
+    """
+    A fake pool of workers which records the submitted tasks
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the executor
+        """
+        self.submitted: list[tuple[Callable, tuple[Any, ...]]] = []
+
+    def submit(self, function: Callable, *args: Any) -> None:
+        r"""
+        Record a submitted task
+
+        :param function: The function of the task
+        :param \*args: The arguments of the task
+        """
+        self.submitted.append((function, args))
+
+
+def schedule_push_notification(delay: timedelta) -> PushNotification:
+    """
+    Schedule the draft push notification of the test data
+
+    :param delay: The time until the push notification is due
+    :return: The scheduled push notification
+    """
+    push_notification = PushNotification.objects.get(id=2)
+    push_notification.draft = False
+    push_notification.scheduled_send_date = timezone.now() + delay
+    push_notification.save()
+    return push_notification
+
+
+@pytest.mark.django_db
+def test_send_push_notifications(
+    load_test_data: None, settings: SettingsWrapper, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Ensure that due push notifications are sent and push notifications which are not due yet are skipped
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    """
+    settings.FCM_ENABLED = True
+    monkeypatch.setattr(
+        push_notification_scheduler, "FirebaseApiClient", FakeFirebaseApiClient
+    )
+    push_notification = schedule_push_notification(timedelta(hours=1))
+    assert send_push_notification(push_notification.id) is None
+    push_notification.scheduled_send_date = timezone.now() - timedelta(minutes=1)
+    push_notification.save()
+    get_command_output("send_push_notifications")
+    push_notification.refresh_from_db()
+    assert push_notification.sent_date
+    assert not push_notification.sending_date
+    # The push notification is not sent again
+    assert send_push_notification(push_notification.id) is None
+
+
+@pytest.mark.django_db
+def test_send_push_notification_claim(
+    load_test_data: None, settings: SettingsWrapper, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Ensure that push notifications which are being sent by another process are skipped unless the claim is abandoned
+    and that failed push notifications are released for retries
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    """
+    settings.FCM_ENABLED = True
+    monkeypatch.setattr(
+        push_notification_scheduler, "FirebaseApiClient", FailingFirebaseApiClient
+    )
+    push_notification = schedule_push_notification(timedelta(minutes=-1))
+    assert send_push_notification(push_notification.id) is False
+    push_notification.refresh_from_db()
+    assert not push_notification.sending_date
+    assert not push_notification.sent_date
+
+    monkeypatch.setattr(
+        push_notification_scheduler, "FirebaseApiClient", FakeFirebaseApiClient
+    )
+    PushNotification.objects.filter(id=push_notification.id).update(
+        sending_date=timezone.now()
+    )
+    assert send_push_notification(push_notification.id) is None
+    PushNotification.objects.filter(id=push_notification.id).update(
+        sending_date=timezone.now() - CLAIM_TIMEOUT - timedelta(minutes=1)
+    )
+    assert send_push_notification(push_notification.id) is True
+    push_notification.refresh_from_db()
+    assert push_notification.sent_date
+
+
+@pytest.mark.django_db
+def test_send_push_notifications_invalid_workers(settings: SettingsWrapper) -> None:
+    """
+    Ensure that the daemon is not started without workers
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.FCM_ENABLED = True
+    with pytest.raises(CommandError) as exc_info:
+        get_command_output("send_push_notifications", "--daemon", "--workers", "0")
+    assert str(exc_info.value) == "The number of workers must be at least 1"
+
+
+@pytest.mark.django_db
+def test_push_notification_scheduler_dispatch(load_test_data: None) -> None:
+    """
+    Ensure that the scheduler submits due push notifications once and sleeps until the next one is due
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    scheduler = PushNotificationScheduler(workers=1)
+    executor = FakeExecutor()
+    assert scheduler.dispatch(executor) == MAX_SLEEP  # type: ignore[arg-type]
+    assert not executor.submitted
+
+    push_notification = schedule_push_notification(timedelta(minutes=1))
+    assert 55 < scheduler.dispatch(executor) <= 60  # type: ignore[arg-type]
+    assert not executor.submitted
+
+    push_notification.scheduled_send_date = timezone.now()
+    push_notification.save()
+    assert scheduler.dispatch(executor) == MAX_SLEEP  # type: ignore[arg-type]
+    assert executor.submitted == [(scheduler.send, (push_notification.id,))]
+    # The push notification is not submitted again while it is sent
+    assert scheduler.dispatch(executor) == MAX_SLEEP  # type: ignore[arg-type]
+    assert len(executor.submitted) == 1
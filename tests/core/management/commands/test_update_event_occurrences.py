@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from integreat_cms.cms.models import Event, EventOccurrence
+
+from ..utils import get_command_output
+
+
+@pytest.mark.django_db
+def test_update_event_occurrences_non_existing_region() -> None:
+    """
+    Ensure that a non existing region slug throws an error
+    """
+    with pytest.raises(CommandError) as exc_info:
+        assert not any(get_command_output("update_event_occurrences", "non-existing"))
+    assert str(exc_info.value) == "The following regions do not exist: {'non-existing'}"
+
+
+@pytest.mark.django_db
+def test_update_event_occurrences(load_test_data: None) -> None:
+    """
+    Ensure that past occurrences are removed and the occurrences of upcoming events are stored
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    event = Event.objects.filter(region__slug="augsburg").first()
+    past_occurrence = EventOccurrence.objects.create(
+        event=event,
+        region=event.region,
+        start=timezone.now() - datetime.timedelta(days=3),
+        end=timezone.now() - datetime.timedelta(days=2),
+    )
+    out, err = get_command_output("update_event_occurrences", "augsburg")
+    assert "✔ Stored" in out
+    assert not err
+    assert not EventOccurrence.objects.filter(id=past_occurrence.id).exists()
+    today = timezone.now().date()
+    upcoming_events = Event.objects.filter(
+        region__slug="augsburg", archived=False
+    ).filter_upcoming(today)
+    assert upcoming_events.exists()
+    for upcoming_event in upcoming_events:
+        assert list(upcoming_event.occurrences.values_list("start", "end")) == list(
+            EventOccurrence.get_occurrence_periods(upcoming_event, today)
+        )
@@ -1,20 +1,108 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from typing import Any
-    from pytest_django.fixtures import SettingsWrapper
-    from requests_mock.mocker import Mocker
-    from requests_mock.request import _RequestObjectProxy
-    from requests_mock.response import _Context
-    from _pytest.logging import LogCaptureFixture
-
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from django.core.exceptions import ImproperlyConfigured
+from werkzeug import Response
 
 from integreat_cms.cms.models import PushNotification, Region
-from integreat_cms.firebase_api.firebase_api_client import FirebaseApiClient
+from integreat_cms.firebase_api.firebase_api_client import (
+    FirebaseApiClient,
+    get_retry_delay,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.logging import LogCaptureFixture
+    from pytest_django.fixtures import SettingsWrapper
+    from pytest_httpserver.httpserver import HTTPServer
+    from werkzeug import Request
+
+#: The path of the send endpoint of the fake FCM server
+SEND_PATH = "/v1/projects/test-project/messages:send"
+
+
+@pytest.fixture(name="fake_fcm_server")
+def fixture_fake_fcm_server(
+    settings: SettingsWrapper, httpserver: HTTPServer, tmp_path: Path
+) -> HTTPServer:
+    """
+    Setup a fake FCM server which issues access tokens for a generated service account
+
+    :param settings: The fixture providing the django settings
+    :param httpserver: The fixture providing the dummy http server used for faking the FCM and OAuth servers
+    :param tmp_path: The fixture providing the directory for temporary files for this test case
+    :return: The fake server
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    credentials = tmp_path / "credentials.json"
+    credentials.write_text(
+        json.dumps(
+            {
+                "type": "service_account",
+                "project_id": "test-project",
+                "private_key_id": "test",
+                "private_key": private_key.private_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PrivateFormat.PKCS8,
+                    serialization.NoEncryption(),
+                ).decode(),
+                "client_email": "test@test-project.iam.gserviceaccount.com",
+                "client_id": "test",
+                "token_uri": httpserver.url_for("/token"),
+            }
+        )
+    )
+    settings.FCM_ENABLED = True
+    settings.FCM_CREDENTIALS = str(credentials)
+    settings.FCM_URL = httpserver.url_for("/v1/projects/{project_id}/messages:send")
+    settings.FCM_RETRY_DELAY = 0
+    httpserver.expect_request("/token", method="POST").respond_with_json(
+        {"access_token": "test-token", "expires_in": 3600, "token_type": "Bearer"}
+    )
+    return httpserver
+
+
+def send_all(fake_fcm_server: HTTPServer, responses: list[Response]) -> bool:
+    """
+    Fires a :meth:`~integreat_cms.firebase_api.firebase_api_client.FirebaseApiClient.send_all` and answers each
+    message with the given responses in order (the last response is repeated)
+
+    :param fake_fcm_server: The fake FCM server
+    :param responses: The responses to each attempt of a message
+    :return: Success status of the notification sending
+    """
+    attempts: dict[str, int] = {}
+
+    def handler(request: Request) -> Response:
+        assert request.headers["Authorization"] == "Bearer test-token"
+        topic = request.get_json()["message"]["topic"]
+        attempts[topic] = attempts.get(topic, 0) + 1
+        return responses[min(attempts[topic], len(responses)) - 1]
+
+    fake_fcm_server.expect_request(SEND_PATH, method="POST").respond_with_handler(
+        handler
+    )
+    return FirebaseApiClient(PushNotification.objects.first()).send_all()
+
+
+def get_topics(fake_fcm_server: HTTPServer) -> list[str]:
+    """
+    Get the topics of all messages which were sent to the fake FCM server
+
+    :param fake_fcm_server: The fake FCM server
+    :return: The topics of the messages
+    """
+    return [
+        request.get_json()["message"]["topic"]
+        for request, _ in fake_fcm_server.log
+        if request.path == SEND_PATH
+    ]
 
 
 class TestFirebaseApiClient:
@@ -25,15 +113,6 @@ class TestFirebaseApiClient:
     It does not test if firebase-api-server works/answers as expected.
     """
 
-    #: A set of response-data for the mocking-function
-    #: according to https://fcm.googleapis.com/fcm/send
-    response_mock_data = {
-        "200_success": {"message_id": 1, "reason": "", "status_code": 200},
-        "200_no_message_id": {"reason": "", "status_code": 200},
-        "401_invalid_key": {"reason": "invalid key", "status_code": 401},
-        "404": {"reason": "", "status_code": 404},
-    }
-
     @pytest.mark.django_db
     def test_client_throws_exception_when_fcm_disabled(
         self, settings: SettingsWrapper, load_test_data: None
@@ -99,178 +178,151 @@ class TestFirebaseApiClient:
     @pytest.mark.django_db
     def test_firebase_api_200_success(
         self,
-        settings: SettingsWrapper,
         load_test_data: None,
-        requests_mock: Mocker,
+        fake_fcm_server: HTTPServer,
         caplog: LogCaptureFixture,
     ) -> None:
         """
         Tests firebase-api-response handling, test a successful API call
 
-        :param settings: The Django settings
         :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
-        :param requests_mock: Fixture for mocking requests, see :doc:`requests-mock:pytest`
+        :param fake_fcm_server: The fixture providing the fake FCM server
         :param caplog: Fixture for asserting log messages in tests (see :fixture:`pytest:caplog`)
         """
-        status = self.send_all_with_mocked_response(
-            settings, requests_mock, self.response_mock_data["200_success"]
+        assert send_all(
+            fake_fcm_server,
+            [Response(json.dumps({"name": "projects/test-project/messages/1"}))],
         )
-        for record in caplog.records:
-            assert "sent, FCM id: 1" in record.message
-        assert status
+        assert "sent, FCM id: 'projects/test-project/messages/1'" in caplog.text
 
     @pytest.mark.django_db
     def test_firebase_api_200_unexpected_api_response(
         self,
-        settings: SettingsWrapper,
         load_test_data: None,
-        requests_mock: Mocker,
+        fake_fcm_server: HTTPServer,
         caplog: LogCaptureFixture,
     ) -> None:
         """
         Tests firebase-api-response handling,
-        test a partial successful api call - HTTP 200 but no message_id in response
+        test a partial successful api call - HTTP 200 but no message name in response
 
-        :param settings: The Django settings
         :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
-        :param requests_mock: Fixture for mocking requests, see :doc:`requests-mock:pytest`
+        :param fake_fcm_server: The fixture providing the fake FCM server
         :param caplog: Fixture for asserting log messages in tests (see :fixture:`pytest:caplog`)
         """
-        status = self.send_all_with_mocked_response(
-            settings, requests_mock, self.response_mock_data["200_no_message_id"]
-        )
-        for record in caplog.records:
-            assert "sent, but unexpected API response" in record.message
-        assert status
+        assert send_all(fake_fcm_server, [Response("{}")])
+        assert "sent, but unexpected API response" in caplog.text
 
     @pytest.mark.django_db
-    def test_firebase_api_403_wrong_token(
+    def test_firebase_api_403_permission_denied(
         self,
-        settings: SettingsWrapper,
         load_test_data: None,
-        requests_mock: Mocker,
+        fake_fcm_server: HTTPServer,
         caplog: LogCaptureFixture,
     ) -> None:
         """
         Tests firebase-api-response handling,
-        test a denied call - HTTP 403 because of wrong auth-token
+        test a denied call - HTTP 403 because of missing permissions, which must not be retried
 
-        :param settings: The Django settings
         :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
-        :param requests_mock: Fixture for mocking requests, see :doc:`requests-mock:pytest`
+        :param fake_fcm_server: The fixture providing the fake FCM server
         :param caplog: Fixture for asserting log messages in tests (see :fixture:`pytest:caplog`)
         """
-        status = self.send_all_with_mocked_response(
-            settings, requests_mock, self.response_mock_data["401_invalid_key"]
+        assert not send_all(fake_fcm_server, [Response("{}", status=403)])
+        assert (
+            "Received invalid response from FCM for" in caplog.text
+            and "after 1 attempts, status: 403" in caplog.text
         )
-        for record in caplog.records:
-            assert "Received invalid response from FCM for" in record.message
-        assert not status
+        assert len(get_topics(fake_fcm_server)) == len(set(get_topics(fake_fcm_server)))
 
     @pytest.mark.django_db
-    def test_firebase_api_404(
+    def test_firebase_api_retry(
         self,
-        settings: SettingsWrapper,
         load_test_data: None,
-        requests_mock: Mocker,
+        fake_fcm_server: HTTPServer,
         caplog: LogCaptureFixture,
     ) -> None:
         """
-        Tests firebase-api-response handling, test 404 response
+        Tests that messages are retried if FCM is overloaded or unavailable
 
-        :param settings: The Django settings
         :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
-        :param requests_mock: Fixture for mocking requests, see :doc:`requests-mock:pytest`
+        :param fake_fcm_server: The fixture providing the fake FCM server
         :param caplog: Fixture for asserting log messages in tests (see :fixture:`pytest:caplog`)
         """
-        status = self.send_all_with_mocked_response(
-            settings, requests_mock, self.response_mock_data["404"]
+        assert send_all(
+            fake_fcm_server,
+            [
+                Response("{}", status=429),
+                Response("{}", status=503),
+                Response(json.dumps({"name": "projects/test-project/messages/1"})),
+            ],
         )
-        for record in caplog.records:
-            assert "Received invalid response from FCM for" in record.message
-        assert not status
+        assert "retrying in 0 seconds" in caplog.text
+        topics = get_topics(fake_fcm_server)
+        assert len(topics) == 3 * len(set(topics))
 
     @pytest.mark.django_db
-    def send_all_with_mocked_response(
-        self,
-        settings: SettingsWrapper,
-        requests_mock: Mocker,
-        mocked_response: dict[str, Any],
-    ) -> bool:
+    def test_region_notification_send(
+        self, load_test_data: None, fake_fcm_server: HTTPServer
+    ) -> None:
         """
-        Fires a :meth:`~integreat_cms.firebase_api.firebase_api_client.FirebaseApiClient.send_all`
-        with mocked post
+        Tests that a message is sent to the topic of each language of the region
 
-        :param settings: The Django settings
-        :param requests_mock: Fixture for mocking requests, see :doc:`requests-mock:pytest`
-        :param mocked_response: Data for the mocked response, depending on test-scenario (given by
-                                :attr:`~tests.firebase_api.test_firebase_api_client.TestFirebaseApiClient.response_mock_data`)
-        :return: Success status of the notification sending
+        :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+        :param fake_fcm_server: The fixture providing the fake FCM server
         """
-        status_code = mocked_response.pop("status_code")
-        settings.FCM_ENABLED = True
-        requests_mock.post(
-            settings.FCM_URL, json=mocked_response, status_code=status_code
+        fake_fcm_server.expect_request(SEND_PATH, method="POST").respond_with_json(
+            {"name": "projects/test-project/messages/1"}
         )
-        notification = PushNotification.objects.first()
-        pns = FirebaseApiClient(notification)
-        return pns.send_all()
-
-    @pytest.mark.django_db
-    def test_region_notification_send(
-        self, settings: SettingsWrapper, load_test_data: None, requests_mock: Mocker
-    ) -> None:
-        targets = set()
-
-        def evaluate_request(
-            request: _RequestObjectProxy, context: _Context
-        ) -> dict[str, Any]:
-            targets.add(request.json()["to"])
-            return self.response_mock_data["200_success"]
-
-        requests_mock.post(settings.FCM_URL, json=evaluate_request, status_code=200)
-
-        settings.FCM_ENABLED = True
-
         notification = PushNotification.objects.get(pk=1)
 
         pns = FirebaseApiClient(notification)
-        pns.send_all()
+        assert pns.send_all()
 
-        assert targets == set(
-            [
-                "/topics/augsburg-en-news",
-                "/topics/augsburg-de-news",
-            ]
-        )
+        assert set(get_topics(fake_fcm_server)) == {
+            "augsburg-en-news",
+            "augsburg-de-news",
+        }
+        assert {result["topic"] for result in pns.results} == {
+            "augsburg-en-news",
+            "augsburg-de-news",
+        }
 
     @pytest.mark.django_db
     def test_multiple_regions_notification_send(
-        self, settings: SettingsWrapper, load_test_data: None, requests_mock: Mocker
+        self, load_test_data: None, fake_fcm_server: HTTPServer
     ) -> None:
-        targets = set()
-
-        def evaluate_request(
-            request: _RequestObjectProxy, context: _Context
-        ) -> dict[str, Any]:
-            targets.add(request.json()["to"])
-            return self.response_mock_data["200_success"]
-
-        requests_mock.post(settings.FCM_URL, json=evaluate_request, status_code=200)
-
-        settings.FCM_ENABLED = True
+        """
+        Tests that a message is sent to the topic of each language of all regions
 
+        :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+        :param fake_fcm_server: The fixture providing the fake FCM server
+        """
+        fake_fcm_server.expect_request(SEND_PATH, method="POST").respond_with_json(
+            {"name": "projects/test-project/messages/1"}
+        )
         notification = PushNotification.objects.get(pk=1)
         notification.regions.add(Region.objects.get(slug="nurnberg"))
 
         pns = FirebaseApiClient(notification)
-        pns.send_all()
+        assert pns.send_all()
 
-        assert targets == set(
-            [
-                "/topics/nurnberg-en-news",
-                "/topics/nurnberg-de-news",
-                "/topics/augsburg-en-news",
-                "/topics/augsburg-de-news",
-            ]
-        )
+        assert set(get_topics(fake_fcm_server)) == {
+            "nurnberg-en-news",
+            "nurnberg-de-news",
+            "augsburg-en-news",
+            "augsburg-de-news",
+        }
+
+
+def test_get_retry_delay(settings: SettingsWrapper) -> None:
+    """
+    Tests that the delay between the attempts grows exponentially and respects the ``Retry-After`` header
+
+    :param settings: The Django settings
+    """
+    settings.FCM_RETRY_DELAY = 1
+    assert [get_retry_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 8]
+    assert get_retry_delay(1, "30") == 30
+    assert get_retry_delay(4, "3") == 8
+    assert get_retry_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 1
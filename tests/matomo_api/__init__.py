@@ -0,0 +1,3 @@
+"""
+This package contains tests of the :mod:`integreat_cms.matomo_api` app
+"""
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from integreat_cms.matomo_api import matomo_tracking_dispatcher
+from integreat_cms.matomo_api.matomo_tracking_dispatcher import MatomoTrackingDispatcher
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_django.fixtures import SettingsWrapper
+    from pytest_httpserver.httpserver import HTTPServer
+
+
+def setup_fake_matomo_server(
+    settings: SettingsWrapper, httpserver: HTTPServer, status: int = 200
+) -> None:
+    """
+    Setup a mocked Matomo server which accepts bulk tracking requests
+
+    :param settings: The fixture providing the django settings
+    :param httpserver: The fixture providing the dummy http server used for faking the Matomo server
+    :param status: The status code of the responses
+    """
+    settings.MATOMO_URL = f"http://localhost:{httpserver.port}"
+    settings.MATOMO_TRACKING_RETRY_DELAY = 0
+    httpserver.expect_request("/matomo.php", method="POST").respond_with_json(
+        {"status": "success"}, status=status
+    )
+
+
+def test_matomo_tracking_dispatcher(
+    settings: SettingsWrapper, httpserver: HTTPServer
+) -> None:
+    """
+    Check that tracking requests are combined into bulk requests per access token
+
+    :param settings: The fixture providing the django settings
+    :param httpserver: The fixture providing the dummy http server used for faking the Matomo server
+    """
+    setup_fake_matomo_server(settings, httpserver)
+    dispatcher = MatomoTrackingDispatcher(workers=1, batch_size=10)
+    for i in range(5):
+        assert dispatcher.track(
+            {"idsite": i % 2, "token_auth": f"token-{i % 2}", "url": f"/page-{i}/"}
+        )
+    dispatcher.stop()
+    payloads = [request.get_json() for request, _ in httpserver.log]
+    assert {payload["token_auth"] for payload in payloads} == {"token-0", "token-1"}
+    tracking_requests = [
+        tracking_request
+        for payload in payloads
+        for tracking_request in payload["requests"]
+    ]
+    assert len(tracking_requests) == 5
+    assert "?idsite=0&url=%2Fpage-0%2F" in tracking_requests
+    assert all("token_auth" not in request for request in tracking_requests)
+    assert dispatcher.get_stats() == {
+        "queued": 0,
+        "sent": 5,
+        "dropped": 0,
+        "failed": 0,
+    }
+
+
+def test_matomo_tracking_dispatcher_backpressure(
+    settings: SettingsWrapper, httpserver: HTTPServer
+) -> None:
+    """
+    Check that tracking requests are dropped instead of blocking when the queue is full
+
+    :param settings: The fixture providing the django settings
+    :param httpserver: The fixture providing the dummy http server used for faking the Matomo server
+    """
+    setup_fake_matomo_server(settings, httpserver)
+    dispatcher = MatomoTrackingDispatcher(queue_size=2, workers=1)
+    # Pretend the workers are already running, so the queue is not consumed
+    dispatcher.pid = os.getpid()
+    results = [dispatcher.track({"idsite": 1, "token_auth": "token"}) for _ in range(5)]
+    assert results == [True, True, False, False, False]
+    assert dispatcher.get_stats()["dropped"] == 3
+    assert dispatcher.get_stats()["queued"] == 2
+
+
+def test_matomo_tracking_dispatcher_retry(
+    settings: SettingsWrapper, httpserver: HTTPServer
+) -> None:
+    """
+    Check that failed bulk requests are retried and counted as failed
+
+    :param settings: The fixture providing the django settings
+    :param httpserver: The fixture providing the dummy http server used for faking the Matomo server
+    """
+    setup_fake_matomo_server(settings, httpserver, status=500)
+    settings.MATOMO_TRACKING_RETRIES = 2
+    dispatcher = MatomoTrackingDispatcher(workers=1)
+    dispatcher.track({"idsite": 1, "token_auth": "token"})
+    dispatcher.stop()
+    assert len(httpserver.log) == 3
+    assert dispatcher.get_stats()["failed"] == 1
+    assert not dispatcher.get_stats()["sent"]
+
+
+def test_matomo_tracking_dispatcher_restart(
+    settings: SettingsWrapper, httpserver: HTTPServer, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Check that the exit handler is only registered once when the dispatcher is restarted
+
+    :param settings: The fixture providing the django settings
+    :param httpserver: The fixture providing the dummy http server used for faking the Matomo server
+    :param monkeypatch: The fixture providing the monkeypatch helper
+    """
+    setup_fake_matomo_server(settings, httpserver)
+    exit_handlers: list[Callable] = []
+    monkeypatch.setattr(
+        matomo_tracking_dispatcher.atexit, "register", exit_handlers.append
+    )
+    dispatcher = MatomoTrackingDispatcher(workers=1)
+    for i in range(3):
+        assert dispatcher.track({"idsite": 1, "token_auth": "token", "url": f"/{i}/"})
+        dispatcher.stop()
+    assert exit_handlers == [dispatcher.stop]
+    assert dispatcher.get_stats()["sent"] == 3
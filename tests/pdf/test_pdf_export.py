@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import io
-from urllib.parse import quote, urlencode
+import os
+from concurrent.futures import Future
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from urllib.parse import quote, unquote, urlencode
 
 import PyPDF3
 import pytest
+from django.core.files.storage import FileSystemStorage
 from django.test.client import Client
 from django.urls import reverse
 
+from integreat_cms.cms.models import Page
+from integreat_cms.cms.utils import pdf_job_utils, pdf_utils
+from integreat_cms.cms.utils.pdf_utils import pdf_storage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
 
 # pylint: disable=too-many-locals
 @pytest.mark.django_db
@@ -140,3 +154,144 @@ def test_pdf_export_invalid(
     for response in [response_cms, response_api]:
         print(response.headers)
         assert response.status_code == 404
+
+
+@pytest.mark.django_db
+# Override urls to serve PDF files
+@pytest.mark.urls("tests.pdf.dummy_django_app.static_urls")
+def test_pdf_export_job(
+    load_test_data: None,
+    client: Client,
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test whether the PDF export of the API is rendered by a background job and whether concurrent requests for the
+    same document are de-duplicated
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param client: The fixture providing the anonymous user
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture to replace the process pool
+    """
+    settings.PDF_JOB_WORKERS = 1
+    submitted_jobs = []
+    # Record the submitted jobs instead of executing them in another process, which cannot access the test transaction
+    monkeypatch.setattr(
+        pdf_job_utils,
+        "_executor",
+        SimpleNamespace(
+            submit=lambda function, job_id: submitted_jobs.append(job_id) or Future()
+        ),
+    )
+    kwargs = {"region_slug": "augsburg", "language_slug": "en"}
+    export_pdf_api = reverse("api:pdf_export", kwargs=kwargs)
+    url = f"{export_pdf_api}?{urlencode({'url': '/augsburg/en/welcome/'})}"
+    expected_filename = "e155c5e38b/Integreat - Englisch - Welcome.pdf"
+    job_url = reverse("api:pdf_job", kwargs={**kwargs, "job_id": "e155c5e38b"})
+    try:
+        for _ in range(2):
+            response = client.get(url)
+            assert response.status_code == 202
+            assert response.headers.get("Location") == job_url
+            assert response.json() == {"status": pdf_job_utils.PENDING, "url": job_url}
+        # The job is only submitted once
+        assert submitted_jobs == ["e155c5e38b"]
+        assert client.get(job_url).status_code == 202
+        pdf_job_utils.run_pdf_job("e155c5e38b")
+        for job_response in [client.get(job_url), client.get(url)]:
+            assert job_response.status_code == 302
+            assert (
+                job_response.headers.get("Location")
+                == f"/pdf/{quote(expected_filename)}"
+            )
+        # Jobs of other regions are not found
+        assert (
+            client.get(
+                reverse(
+                    "api:pdf_job",
+                    kwargs={
+                        "region_slug": "nurnberg",
+                        "language_slug": "en",
+                        "job_id": "e155c5e38b",
+                    },
+                )
+            ).status_code
+            == 404
+        )
+    finally:
+        pdf_storage.delete(expected_filename)
+        pdf_storage.delete(f"e155c5e38b/{pdf_job_utils.JOB_FILENAME}")
+
+
+@pytest.mark.django_db
+def test_pdf_export_parts(
+    load_test_data: None,
+    admin_client: Client,
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Test whether large documents are rendered in parts and whether only the parts with changed pages are rendered again
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param admin_client: The fixture providing the logged in admin
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture to record the rendered parts
+    :param tmp_path: The fixture providing a temporary directory for the PDF files
+    """
+    settings.PDF_CHUNK_SIZE = 4
+    settings.PDF_PART_WORKERS = 0
+    storage = FileSystemStorage(location=tmp_path, base_url=settings.PDF_URL)
+    monkeypatch.setattr(pdf_utils, "pdf_storage", storage)
+    rendered_parts = []
+    convert_html_to_pdf = pdf_utils.convert_html_to_pdf
+
+    def record_part(html: str, path: str) -> bool:
+        rendered_parts.append(path)
+        return convert_html_to_pdf(html, path)
+
+    monkeypatch.setattr(pdf_utils, "convert_html_to_pdf", record_part)
+    page_ids = [1, 2, 3, 4, 5, 6, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 26, 27]
+    export_pdf = reverse(
+        "export_pdf", kwargs={"region_slug": "augsburg", "language_slug": "de"}
+    )
+    response = admin_client.post(export_pdf, data={"selected_ids[]": page_ids})
+    assert response.status_code == 302
+    filename = unquote(response.headers["Location"]).split(settings.PDF_URL, 1)[-1]
+    parts = os.listdir(tmp_path / pdf_utils.PDF_PARTS_DIR)
+    assert len(rendered_parts) == len(parts) > 1
+    with storage.open(filename) as pdf_file:
+        result_pdf = PyPDF3.PdfFileReader(pdf_file)
+        # The merged document consists of the table of contents and all parts
+        assert result_pdf.numPages == 1 + sum(
+            PyPDF3.PdfFileReader(
+                str(tmp_path / pdf_utils.PDF_PARTS_DIR / part)
+            ).numPages
+            for part in parts
+        )
+        assert "Inhaltsverzeichnis" in result_pdf.getPage(0).extractText()
+        # The page numbers are consecutive across all parts
+        for page_number in range(1, result_pdf.numPages + 1):
+            assert str(page_number) in result_pdf.getPage(page_number - 1).extractText()
+        # All pages are contained in the outline of the merged document
+        outline_titles = {
+            title
+            for _, title, _ in pdf_utils.get_outline_entries(
+                result_pdf, result_pdf.getOutlines()
+            )
+        }
+    for page_id in page_ids:
+        page_translation = Page.objects.get(id=page_id).get_public_translation("de")
+        assert page_translation.title in outline_titles
+    # Change one page and make sure only its part is rendered again
+    page_translation = Page.objects.get(id=4).get_public_translation("de")
+    page_translation.pk = None
+    page_translation.version += 1
+    page_translation.content += "<p>Changed content</p>"
+    page_translation.save()
+    rendered_parts.clear()
+    response = admin_client.post(export_pdf, data={"selected_ids[]": page_ids})
+    assert response.status_code == 302
+    assert len(rendered_parts) == 1
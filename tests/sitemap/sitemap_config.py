@@ -19,41 +19,41 @@ SITEMAPS: Final[list[tuple[str, str, int]]] = [
     (
         "/augsburg/de/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-augsburg-de.xml",
-        142,
+        128,
     ),
     (
         "/augsburg/en/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-augsburg-en.xml",
-        128,
+        116,
     ),
     (
         "/augsburg/ar/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-augsburg-ar.xml",
-        104,
+        92,
     ),
     (
         "/augsburg/fa/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-augsburg-fa.xml",
-        83,
+        74,
     ),
     (
         "/nurnberg/de/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-nurnberg-de.xml",
-        73,
+        67,
     ),
     (
         "/nurnberg/en/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-nurnberg-en.xml",
-        52,
+        49,
     ),
     (
         "/nurnberg/ar/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-nurnberg-ar.xml",
-        31,
+        29,
     ),
     (
         "/nurnberg/fa/sitemap.xml",
         "tests/sitemap/expected-sitemaps/sitemap-nurnberg-fa.xml",
-        24,
+        23,
     ),
 ]
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from _pytest.logging import LogCaptureFixture
+    from django.http import HttpResponse
 
 
 def get_messages(caplog: LogCaptureFixture) -> list[str]:
@@ -64,3 +65,44 @@ def assert_message_in_log(message: str, caplog: LogCaptureFixture) -> None:
     ), f"The following message: \n\n{message}\n\nwas not found in the " + (
         "message log:\n\n" + "\n".join(messages) if messages else "empty message log."
     )
+
+
+def parse_server_timing(response: HttpResponse) -> dict[str, dict[str, str]]:
+    """
+    Parse the ``Server-Timing`` header of a response (see
+    :class:`~integreat_cms.api.middleware.ServerTimingMiddleware`)
+
+    :param response: The response
+    :raises AssertionError: When the response does not contain the header
+    :return: The parameters of all metrics in the header, by metric name
+    """
+    assert response.has_header(
+        "Server-Timing"
+    ), "The response does not contain a Server-Timing header, is SERVER_TIMING enabled?"
+    metrics = {}
+    # Split at all commas which are not part of quoted descriptions
+    for metric in re.split(
+        r',\s*(?=(?:[^"]*"[^"]*")*[^"]*$)', response["Server-Timing"]
+    ):
+        name, *params = metric.split(";")
+        metrics[name] = dict(
+            (key, value.strip('"'))
+            for key, value in (param.split("=", 1) for param in params)
+        )
+    return metrics
+
+
+def assert_query_budget(response: HttpResponse, budget: int) -> None:
+    """
+    Assert that a request did not execute more SQL queries than its budget allows
+
+    :param response: The response with a ``Server-Timing`` header
+    :param budget: The maximum number of SQL queries
+    :raises AssertionError: When the request exceeded its budget
+    """
+    metrics = parse_server_timing(response)
+    queries = int(metrics["sql"]["desc"].split()[0])
+    assert queries <= budget, (
+        f"The request to {response.request['PATH_INFO']} executed {queries} SQL queries, "
+        f"but its budget is {budget} ({response['Server-Timing']})"
+    )
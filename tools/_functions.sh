@@ -164,10 +164,10 @@ function require_installed {
             # Set debug mode for
             INTEGREAT_CMS_DEBUG=1
             export INTEGREAT_CMS_DEBUG
-            # Set dummy FCM key to test functionality
-            if [[ -z "${INTEGREAT_CMS_FCM_KEY}" ]]; then
-                INTEGREAT_CMS_FCM_KEY="dummy"
-                export INTEGREAT_CMS_FCM_KEY
+            # Set dummy FCM credentials to test functionality
+            if [[ -z "${INTEGREAT_CMS_FCM_CREDENTIALS}" ]]; then
+                INTEGREAT_CMS_FCM_CREDENTIALS="dummy"
+                export INTEGREAT_CMS_FCM_CREDENTIALS
             fi
         fi
     fi
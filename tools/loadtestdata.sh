@@ -11,5 +11,6 @@ require_database
 
 cp "${PACKAGE_DIR}/static/src/logos/integreat/integreat-icon.svg" "${PACKAGE_DIR}/media/global/integreat-icon.svg"
 deescalate_privileges integreat-cms-cli loaddata "${PACKAGE_DIR}/cms/fixtures/test_data.json" --verbosity "${SCRIPT_VERBOSITY}"
+deescalate_privileges integreat-cms-cli update_page_paths --verbosity "${SCRIPT_VERBOSITY}"
 
 echo "✔ Imported test data" | print_success
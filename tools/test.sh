@@ -41,7 +41,7 @@ while [[ $# -gt 0 ]]; do
 done
 
 # The default pytests args we use
-PYTEST_ARGS=("--disable-warnings" "--color=yes")
+PYTEST_ARGS=("--disable-warnings" "--color=yes" "--benchmark-skip")
 
 if [[ -n "${VERBOSITY}" ]]; then
     PYTEST_ARGS+=("$VERBOSITY")